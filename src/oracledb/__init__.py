@@ -76,9 +76,12 @@ from .dataframe import (
 )
 
 from .dbobject import (
+    clear_dbobject_type_cache as clear_dbobject_type_cache,
     DbObject as DbObject,
     DbObjectAttr as DbObjectAttr,
     DbObjectType as DbObjectType,
+    load_dbobject_type_cache as load_dbobject_type_cache,
+    save_dbobject_type_cache as save_dbobject_type_cache,
 )
 
 from .defaults import (
@@ -126,6 +129,8 @@ from .future import (
 from .lob import (
     LOB as LOB,
     AsyncLOB as AsyncLOB,
+    LOBStream as LOBStream,
+    AsyncLOBStream as AsyncLOBStream,
 )
 
 from .pipeline import (
@@ -144,10 +149,14 @@ from .secret_values import (
 
 from .soda import (
     SodaDatabase as SodaDatabase,
+    AsyncSodaDatabase as AsyncSodaDatabase,
     SodaCollection as SodaCollection,
+    AsyncSodaCollection as AsyncSodaCollection,
     SodaDocument as SodaDocument,
     SodaDocCursor as SodaDocCursor,
+    AsyncSodaDocCursor as AsyncSodaDocCursor,
     SodaOperation as SodaOperation,
+    AsyncSodaOperation as AsyncSodaOperation,
 )
 
 from .sparse_vector import (
@@ -1173,7 +1182,10 @@ from .pool import (  # noqa: E402
     get_pool as get_pool,
 )
 
+from .result_cache import ResultCache as ResultCache  # noqa: E402
+
 from .subscr import (  # noqa: E402
+    AsyncSubscription as AsyncSubscription,
     Subscription as Subscription,
     Message as Message,
     MessageQuery as MessageQuery,
@@ -1184,6 +1196,8 @@ from .subscr import (  # noqa: E402
 from .aq import (  # noqa: E402
     Queue as Queue,
     AsyncQueue as AsyncQueue,
+    DeqIterator as DeqIterator,
+    AsyncDeqIterator as AsyncDeqIterator,
     DeqOptions as DeqOptions,
     EnqOptions as EnqOptions,
     MessageProperties as MessageProperties,
@@ -1230,6 +1244,7 @@ del (
     pipeline,  # noqa
     pool,  # noqa
     pool_params,  # noqa
+    result_cache,  # noqa
     sparse_vector,  # noqa
     soda,  # noqa
     subscr,  # noqa
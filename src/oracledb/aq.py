@@ -26,11 +26,14 @@
 # aq.py
 #
 # Contains the classes used for handling Advanced Queuing (AQ): Queue,
-# DeqOptions, EnqOptions and MessageProperties.
+# DeqIterator, DeqOptions, EnqOptions and MessageProperties.
 # -----------------------------------------------------------------------------
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import concurrent.futures
 import datetime
 from typing import Any
 
@@ -221,6 +224,39 @@ class Queue(BaseQueue):
         """
         return self.enqone(message)
 
+    def iter_messages(
+        self,
+        batch_size: int = 100,
+        wait: int | None = None,
+        prefetch: int = 0,
+        commit: bool = False,
+    ) -> "DeqIterator":
+        """
+        Returns an iterator which dequeues messages from the queue in batches
+        of up to ``batch_size`` messages and returns them one at a time.
+        Iteration stops when a dequeue returns no messages.
+
+        The ``wait`` parameter specifies the number of seconds the database
+        waits for messages to arrive in each dequeue. If it is not specified,
+        the value of :attr:`DeqOptions.wait` is used; otherwise, that
+        attribute is set to this value until the iterator is closed.
+
+        The ``prefetch`` parameter specifies the number of batches that are
+        dequeued in advance on a background thread while the application
+        processes the messages that have already been returned. The default
+        value of *0* disables this. Each dequeue in advance uses the queue's
+        connection for its whole round-trip, so any other call made on that
+        connection in the meantime waits for it to complete. Messages dequeued
+        in advance become part of the transaction before they are returned;
+        see :meth:`DeqIterator.close()`.
+
+        If the ``commit`` parameter is *True*, the transaction is committed
+        after all of the messages in a batch have been returned and the
+        iterator is advanced. Batches are then not dequeued in advance since
+        the commit would also apply to them.
+        """
+        return DeqIterator._create(self, batch_size, wait, prefetch, commit)
+
 
 class AsyncQueue(BaseQueue):
 
@@ -269,6 +305,254 @@ class AsyncQueue(BaseQueue):
         self._verify_message(message)
         await self._impl.enq_one(message._impl)
 
+    def iter_messages(
+        self,
+        batch_size: int = 100,
+        wait: int | None = None,
+        prefetch: int = 0,
+        commit: bool = False,
+    ) -> "AsyncDeqIterator":
+        """
+        Returns an asynchronous iterator which dequeues messages from the queue
+        in batches of up to ``batch_size`` messages and returns them one at a
+        time. Iteration stops when a dequeue returns no messages.
+
+        The ``wait`` parameter specifies the number of seconds the database
+        waits for messages to arrive in each dequeue. If it is not specified,
+        the value of :attr:`DeqOptions.wait` is used; otherwise, that
+        attribute is set to this value until the iterator is closed.
+
+        The ``prefetch`` parameter specifies the number of batches that are
+        dequeued in advance in a background task while the application
+        processes the messages that have already been returned. The default
+        value of *0* disables this. Each dequeue in advance uses the queue's
+        connection for its whole round-trip, so any other call made on that
+        connection in the meantime waits for it to complete. Messages dequeued
+        in advance become part of the transaction before they are returned;
+        see :meth:`AsyncDeqIterator.close()`.
+
+        If the ``commit`` parameter is *True*, the transaction is committed
+        after all of the messages in a batch have been returned and the
+        iterator is advanced. Batches are then not dequeued in advance since
+        the commit would also apply to them.
+        """
+        return AsyncDeqIterator._create(
+            self, batch_size, wait, prefetch, commit
+        )
+
+
+class BaseDeqIterator(metaclass=BaseMetaClass):
+
+    def __repr__(self):
+        return f"<{self._public_name} on queue {self._queue.name!r}>"
+
+    @classmethod
+    def _create(cls, queue, batch_size, wait, prefetch, commit):
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            errors._raise_err(errors.ERR_INVALID_DEQ_BATCH_SIZE)
+        if not isinstance(prefetch, int) or prefetch < 0:
+            errors._raise_err(errors.ERR_INVALID_DEQ_PREFETCH)
+        iterator = cls.__new__(cls)
+        iterator._queue = queue
+        iterator._batch_size = batch_size
+        iterator._prefetch = 0 if commit else prefetch
+        iterator._commit = commit
+        iterator._messages = collections.deque()
+        iterator._pending = collections.deque()
+        iterator._needs_commit = False
+        iterator._closed = False
+        iterator._saved_wait = None
+        if wait is not None:
+            iterator._saved_wait = queue.deqoptions.wait
+            queue.deqoptions.wait = wait
+        return iterator
+
+    def _mark_closed(self, batches):
+        """
+        Marks the iterator as closed and restores the wait used by the queue.
+        The messages that were dequeued but not returned, including those in
+        the given batches dequeued in advance, are returned.
+        """
+        self._closed = True
+        messages = list(self._messages)
+        self._messages.clear()
+        for batch in batches:
+            messages.extend(batch)
+        if self._saved_wait is not None:
+            self._queue.deqoptions.wait = self._saved_wait
+            self._saved_wait = None
+        return messages
+
+    @property
+    def closed(self) -> bool:
+        """
+        This read-only attribute returns a boolean indicating if the iterator
+        has been closed, either explicitly or because a dequeue returned no
+        messages.
+        """
+        return self._closed
+
+    @property
+    def queue(self) -> BaseQueue:
+        """
+        This read-only attribute returns the queue from which the iterator
+        dequeues messages.
+        """
+        return self._queue
+
+
+class DeqIterator(BaseDeqIterator):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> "MessageProperties":
+        if not self._messages and not self._fill_messages():
+            raise StopIteration
+        return self._messages.popleft()
+
+    def _fill_messages(self):
+        """
+        Populates the messages with the next batch dequeued from the queue and
+        returns a boolean indicating if any messages were dequeued. When
+        prefetching is enabled, the batches following it are dequeued on a
+        background thread. Each of those dequeues holds the connection's
+        request lock until its response has been received, so only the
+        processing of the current batch by the caller that does not use the
+        connection runs concurrently with it; calls the caller makes on the
+        connection wait for the dequeue to complete.
+        """
+        if self._closed:
+            return False
+        if self._needs_commit:
+            self._needs_commit = False
+            self._queue.connection.commit()
+        if self._pending:
+            messages = self._pending.popleft().result()
+            while not messages and self._pending:
+                messages = self._pending.popleft().result()
+        else:
+            messages = self._queue.deqmany(self._batch_size)
+        if not messages:
+            self.close()
+            return False
+        self._messages.extend(messages)
+        self._needs_commit = self._commit
+        if self._prefetch > 0:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1
+                )
+            while len(self._pending) < self._prefetch:
+                future = self._executor.submit(
+                    self._queue.deqmany, self._batch_size
+                )
+                self._pending.append(future)
+        return True
+
+    @classmethod
+    def _create(cls, queue, batch_size, wait, prefetch, commit):
+        iterator = super()._create(queue, batch_size, wait, prefetch, commit)
+        iterator._executor = None
+        return iterator
+
+    def close(self) -> list["MessageProperties"]:
+        """
+        Closes the iterator and returns the messages that were dequeued but
+        not returned by the iterator, including those dequeued in advance. Any
+        dequeue that is still in progress on the background thread is
+        completed first. These messages are part of the current transaction so
+        they must either be processed by the caller before the transaction is
+        committed or the transaction must be rolled back to make them
+        available to be dequeued again.
+        """
+        if self._closed:
+            return []
+        batches = []
+        while self._pending:
+            future = self._pending.popleft()
+            if future.exception() is None:
+                batches.append(future.result())
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return self._mark_closed(batches)
+
+
+class AsyncDeqIterator(BaseDeqIterator):
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> "MessageProperties":
+        if not self._messages and not await self._fill_messages():
+            raise StopAsyncIteration
+        return self._messages.popleft()
+
+    async def _fill_messages(self):
+        """
+        Populates the messages with the next batch dequeued from the queue and
+        returns a boolean indicating if any messages were dequeued. When
+        prefetching is enabled, the batches following it are dequeued in a
+        background task. Each of those dequeues holds the connection's request
+        lock until its response has been received, so only the processing of
+        the current batch by the caller that does not use the connection runs
+        concurrently with it; calls the caller makes on the connection wait
+        for the dequeue to complete.
+        """
+        if self._closed:
+            return False
+        if self._needs_commit:
+            self._needs_commit = False
+            await self._queue.connection.commit()
+        if self._pending:
+            messages = await self._pending.popleft()
+            while not messages and self._pending:
+                messages = await self._pending.popleft()
+        else:
+            messages = await self._queue.deqmany(self._batch_size)
+        if not messages:
+            await self.close()
+            return False
+        self._messages.extend(messages)
+        self._needs_commit = self._commit
+        while len(self._pending) < self._prefetch:
+            task = asyncio.ensure_future(self._queue.deqmany(self._batch_size))
+            self._pending.append(task)
+        return True
+
+    async def close(self) -> list["MessageProperties"]:
+        """
+        Closes the iterator and returns the messages that were dequeued but
+        not returned by the iterator, including those dequeued in advance. Any
+        dequeue that is still in progress in the background task is completed
+        first. These messages are part of the current transaction so they must
+        either be processed by the caller before the transaction is committed
+        or the transaction must be rolled back to make them available to be
+        dequeued again.
+        """
+        if self._closed:
+            return []
+        batches = []
+        while self._pending:
+            task = self._pending.popleft()
+            await asyncio.wait([task])
+            if task.exception() is None:
+                batches.append(task.result())
+        return self._mark_closed(batches)
+
 
 class DeqOptions(metaclass=BaseMetaClass):
     @classmethod
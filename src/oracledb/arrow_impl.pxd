@@ -44,6 +44,7 @@ cdef extern from "nanoarrow.h":
         int64_t n_buffers
         int64_t n_children
         ArrowArray** children
+        ArrowArray* dictionary
         const void** buffers
         void (*release)(ArrowArray*)
         void *private_data
@@ -59,6 +60,7 @@ cdef extern from "nanoarrow.h":
         int64_t length
         ArrowBufferView *buffer_views
         ArrowArrayView **children
+        ArrowArrayView *dictionary
 
     cdef struct ArrowSchema:
         const char *format
@@ -79,6 +81,7 @@ cdef extern from "nanoarrow.h":
         NANOARROW_TYPE_DATE64
         NANOARROW_TYPE_DECIMAL128
         NANOARROW_TYPE_DECIMAL256
+        NANOARROW_TYPE_DICTIONARY
         NANOARROW_TYPE_DOUBLE
         NANOARROW_TYPE_FIXED_SIZE_BINARY
         NANOARROW_TYPE_FIXED_SIZE_LIST
@@ -121,6 +124,7 @@ cdef class ArrowSchemaImpl:
         ArrowSchema *arrow_schema
         ArrowType child_arrow_type
         int child_element_size
+        ArrowType dictionary_index_type
         list child_schemas
 
     cdef bint _is_sparse_vector(self) except*
@@ -139,7 +143,10 @@ cdef class ArrowArrayImpl:
         ArrowArray *arrow_array
         ArrowSchemaImpl schema_impl
         ArrowArrayView arrow_array_view
+        dict dictionary_indices
 
+    cdef int _append_dictionary_bytes(self, void* ptr,
+                                      int64_t num_bytes) except -1
     cdef int _get_list_info(self, int64_t index, ArrowArray* arrow_array,
                             int64_t* offset, int64_t* num_elements) except -1
     cdef int _populate_array_view(self) except -1
@@ -157,6 +164,8 @@ cdef class ArrowArrayImpl:
                                   array.array values) except -1
     cdef int append_uint(self, uint64_t value) except -1
     cdef int append_vector(self, array.array value) except -1
+    cdef void* append_vector_values(self, ArrowType child_arrow_type,
+                                    int64_t num_values) except NULL
     cdef int finish_building(self) except -1
     cdef int get_bool(self, int64_t index, bint* is_null,
                       bint* value) except -1
@@ -172,12 +181,16 @@ cdef class ArrowArrayImpl:
     cdef int get_interval_ds(self, int64_t index, bint* is_null, int32_t* days,
                              int64_t* ns) except -1
     cdef int get_length(self, int64_t* length) except -1
+    cdef int get_null_mask(self, uint8_t* mask) except -1
     cdef object get_sparse_vector(self, int64_t index, bint* is_null)
     cdef int get_uint(self, ArrowType arrow_type, int64_t index, bint* is_null,
                       uint64_t* value) except -1
     cdef object get_vector(self, int64_t index, bint* is_null)
     cdef int populate_from_array(self, ArrowSchemaImpl schema_impl,
                                  ArrowArray* array) except -1
+    cdef int populate_from_buffer(self, ArrowSchemaImpl schema_impl,
+                                  object owner, void* ptr,
+                                  int64_t num_bytes) except -1
     cdef int populate_from_schema(self, ArrowSchemaImpl schema_impl) except -1
 
 
@@ -35,6 +35,7 @@ from libc.stdint cimport int8_t, int16_t, int32_t, int64_t
 from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
 from libc.stdlib cimport abs
 from cpython cimport array
+cimport cpython
 cimport cpython.datetime as cydatetime
 
 ctypedef unsigned char char_type
@@ -297,6 +298,25 @@ cdef class DefaultsImpl:
 cdef DefaultsImpl C_DEFAULTS
 
 
+cdef class FetchIntoBuffer:
+    cdef:
+        readonly int64_t num_elements
+        ArrowSchemaImpl schema_impl
+        ArrowType arrow_type
+        cpython.Py_buffer _data_view
+        cpython.Py_buffer _mask_view
+
+    cdef int _get_view(self, object obj, cpython.Py_buffer *view,
+                       ssize_t column_num) except -1
+    cdef int _set_arrow_type(self, ssize_t column_num) except -1
+    @staticmethod
+    cdef list create_all(object buffers, object null_masks)
+    cdef ArrowArrayImpl create_array_impl(self, int64_t offset)
+    cdef int finish_array_impl(self, ArrowArrayImpl array_impl,
+                               int64_t offset) except -1
+    cdef int populate_schema_impl(self, OracleMetadata metadata) except -1
+
+
 cdef class BatchLoadManager:
     cdef:
         readonly uint32_t num_rows
@@ -390,6 +410,9 @@ cdef class Buffer:
     cdef inline int skip_ub2(self) except -1
     cdef inline int skip_ub4(self) except -1
     cdef inline int skip_ub8(self) except -1
+    cdef bint write_arrow_value(self, OracleMetadata metadata,
+                                ArrowArrayImpl array_impl,
+                                int64_t index) except -1
     cdef int write_binary_double(self, double value) except -1
     cdef int write_binary_float(self, float value) except -1
     cdef int write_bool(self, bint value) except -1
@@ -423,10 +446,22 @@ cdef class GrowableBuffer(Buffer):
                               ssize_t num_bytes_wanted) except -1
 
 
+cdef struct OsonFieldNamesInfo:
+    uint32_t num_fields
+    uint32_t seg_size
+    uint8_t hash_id_size
+    uint8_t offsets_size
+    ssize_t hash_ids_pos
+    ssize_t offsets_pos
+    ssize_t names_pos
+
+
 cdef class OsonDecoder(Buffer):
 
     cdef:
         uint16_t primary_flags, secondary_flags
+        OsonFieldNamesInfo short_fnames_info
+        OsonFieldNamesInfo long_fnames_info
         ssize_t field_id_length
         ssize_t tree_seg_pos
         list field_names
@@ -435,16 +470,22 @@ cdef class OsonDecoder(Buffer):
 
     cdef object _decode_container_node(self, uint8_t node_type)
     cdef object _decode_node(self)
-    cdef list _get_long_field_names(self, uint32_t num_fields,
-                                    ssize_t offsets_size,
-                                    uint32_t field_names_seg_size)
+    cdef int _decode_header(self, bytes data, bint* is_scalar) except -1
+    cdef uint32_t _find_field_id(self, str name) except? 0
+    cdef int _find_node(self, list path, bint* found) except -1
+    cdef str _get_field_name(self, uint32_t field_id)
+    cdef int _get_field_name_bytes(self, OsonFieldNamesInfo *info,
+                                   uint32_t index, const char_type **ptr,
+                                   uint16_t *name_len) except -1
+    cdef int _get_field_names_info(self, OsonFieldNamesInfo *info,
+                                   uint32_t num_fields, uint8_t hash_id_size,
+                                   uint8_t offsets_size,
+                                   uint32_t seg_size) except -1
     cdef int _get_num_children(self, uint8_t node_type, uint32_t* num_children,
                                bint* is_shared) except -1
     cdef int _get_offset(self, uint8_t node_type, uint32_t* offset) except -1
-    cdef list _get_short_field_names(self, uint32_t num_fields,
-                                     ssize_t offsets_size,
-                                     uint32_t field_names_seg_size)
     cdef object decode(self, bytes data)
+    cdef list decode_paths(self, bytes data, list paths)
 
 
 cdef class OsonFieldName:
@@ -482,9 +523,11 @@ cdef class OsonEncoder(GrowableBuffer):
         uint32_t num_field_names
         ssize_t max_fname_size
         dict field_names_dict
+        set unique_field_names
         uint8_t field_id_size
 
-    cdef int _add_field_name(self, str name) except -1
+    cdef int _add_field_name(self, OsonFieldName field_name) except -1
+    cdef int _build_field_names(self) except -1
     cdef int _determine_flags(self, object value, uint16_t *flags) except -1
     cdef int _examine_node(self, object value) except -1
     cdef int _write_extended_header(self) except -1
@@ -496,7 +539,16 @@ cdef class VectorDecoder(Buffer):
 
     cdef array.array _decode_values(self, uint32_t num_elements,
                                     uint8_t vector_format)
+    cdef int _decode_values_into(self, void *ptr, uint32_t num_values,
+                                 uint8_t vector_format) except -1
+    cdef int _decode_header(self, bytes data, uint8_t *vector_format,
+                            uint16_t *flags,
+                            uint32_t *num_elements) except -1
+    cdef object _decode_sparse(self, uint32_t num_dimensions,
+                               uint8_t vector_format)
     cdef object decode(self, bytes data)
+    cdef int decode_to_arrow(self, bytes data,
+                             ArrowArrayImpl array_impl) except -1
 
 
 cdef class VectorEncoder(GrowableBuffer):
@@ -634,6 +686,8 @@ cdef class ConnectParamsImpl:
         public list shardingkey
         public list supershardingkey
         public uint32_t stmtcachesize
+        public uint32_t result_cache_size
+        public bint adaptive_stmtcache
         public bint disable_oob
         public object ssl_context
         public DescriptionList description_list
@@ -694,6 +748,29 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         public bint soda_metadata_cache
         public int ping_interval
         public uint32_t ping_timeout
+        public uint32_t create_concurrency
+
+
+cdef class ResultCacheEntry:
+    cdef:
+        object key
+        list fetch_metadata
+        list rows
+        uint64_t size
+        double expires
+
+
+cdef class ResultCacheImpl:
+    cdef:
+        readonly uint64_t max_size
+        readonly uint64_t size
+        readonly uint64_t hits
+        readonly uint64_t misses
+        object _entries
+        object _lock
+
+    cdef int _add_entry(self, ResultCacheEntry entry) except -1
+    cdef ResultCacheEntry _get_entry(self, object key)
 
 
 cdef class BaseConnImpl:
@@ -712,6 +789,7 @@ cdef class BaseConnImpl:
         bint supports_oson_long_field_names
         bint _allow_bind_str_to_lob
         bint _in_request
+        ResultCacheImpl _result_cache
 
     cdef object _check_value(self, OracleMetadata type_info, object value,
                              bint* is_ok)
@@ -728,6 +806,7 @@ cdef class BasePoolImpl:
         readonly str username
         readonly str name
         ConnectParamsImpl connect_params
+        ResultCacheImpl _result_cache
 
 
 cdef class BaseCursorImpl:
@@ -736,6 +815,7 @@ cdef class BaseCursorImpl:
         readonly uint64_t rowcount
         public uint32_t arraysize
         public uint32_t prefetchrows
+        public uint32_t result_cache_ttl
         public object inputtypehandler
         public object outputtypehandler
         public object rowfactory
@@ -757,10 +837,18 @@ cdef class BaseCursorImpl:
         uint32_t _buffer_index
         uint32_t _fetch_array_size
         bint _more_rows_to_fetch
-
+        ResultCacheImpl _result_cache
+        object _result_cache_key
+        list _result_cache_rows
+        uint64_t _result_cache_rows_size
+        list _cached_rows
+
+    cdef int _add_result_cache_entry(self) except -1
+    cdef int _add_result_cache_row(self, object row) except -1
     cdef int _bind_values(self, object cursor, object type_handler,
                           object params, uint32_t num_rows, uint32_t row_num,
                           bint defer_type_assignment) except -1
+    cdef bint _check_result_cache(self, object cursor) except -1
     cdef int _bind_values_by_name(self, object cursor, object type_handler,
                                   dict params, uint32_t num_rows,
                                   uint32_t row_num,
@@ -1048,6 +1136,10 @@ cdef struct OracleIntervalYM:
 cdef struct OracleNumber:
     bint is_integer
     bint is_max_negative_value
+    bint has_int64_value
+    bint has_double_value
+    int64_t int64_value
+    double double_value
     uint8_t num_chars
     char_type chars[173]
 
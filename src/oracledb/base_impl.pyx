@@ -40,7 +40,7 @@ from libc.stdint cimport int8_t, int16_t, int32_t, int64_t
 from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
 from libc.stdint cimport UINT8_MAX, UINT16_MAX, UINT32_MAX, UINT64_MAX
 from libc.stdlib cimport strtod, strtof, strtoll, strtoull
-from libc.string cimport memcpy
+from libc.string cimport memcmp, memcpy
 from cpython cimport array
 from cpython.conversion cimport PyOS_snprintf
 
@@ -101,6 +101,7 @@ import socket
 import ssl
 import string
 import sys
+import threading
 import time
 import warnings
 
@@ -172,12 +173,14 @@ include "impl/base/oson.pyx"
 include "impl/base/vector.pyx"
 include "impl/base/connect_params.pyx"
 include "impl/base/pool_params.pyx"
+include "impl/base/result_cache.pyx"
 include "impl/base/connection.pyx"
 include "impl/base/pool.pyx"
 include "impl/base/cursor.pyx"
 include "impl/base/var.pyx"
 include "impl/base/bind_var.pyx"
 include "impl/base/batch_load_manager.pyx"
+include "impl/base/fetch_into_buffer.pyx"
 include "impl/base/dbobject.pyx"
 include "impl/base/lob.pyx"
 include "impl/base/soda.pyx"
@@ -85,6 +85,8 @@ class ConnectParams(metaclass=BaseMetaClass):
         mode: oracledb.AuthMode | None = None,
         disable_oob: bool | None = None,
         stmtcachesize: int | None = None,
+        result_cache_size: int | None = None,
+        adaptive_stmtcache: bool | None = None,
         edition: str | None = None,
         tag: str | None = None,
         matchanytag: bool | None = None,
@@ -261,6 +263,23 @@ class ConnectParams(metaclass=BaseMetaClass):
           (default: :attr:`oracledb.defaults.stmtcachesize
           <Defaults.stmtcachesize>`)
 
+        - ``result_cache_size``: the maximum size, in bytes, of the client-side
+          query result cache that is used in python-oracledb Thin mode. The
+          default value of 0 disables the cache. Rows are only cached for
+          queries executed by cursors that have a non-zero
+          Cursor.result_cache_ttl value. Cached rows are not discarded when the
+          data in the database changes. Connections acquired from a pool share
+          the cache of the pool
+          (default: 0)
+
+        - ``adaptive_stmtcache``: a boolean indicating whether the statement
+          cache used in python-oracledb Thin mode may grow beyond stmtcachesize
+          while statements are frequently being evicted from it and requested
+          again. The cache grows up to half of the maximum number of open
+          cursors permitted by the database and shrinks back to stmtcachesize
+          after the connection has not been used for some time
+          (default: False)
+
         - ``edition``: edition to use for the connection. This parameter cannot
           be used simultaneously with the cclass parameter
           (default: None)
@@ -435,6 +454,8 @@ class ConnectParams(metaclass=BaseMetaClass):
             f"mode={self.mode!r}, "
             f"disable_oob={self.disable_oob!r}, "
             f"stmtcachesize={self.stmtcachesize!r}, "
+            f"result_cache_size={self.result_cache_size!r}, "
+            f"adaptive_stmtcache={self.adaptive_stmtcache!r}, "
             f"edition={self.edition!r}, "
             f"tag={self.tag!r}, "
             f"matchanytag={self.matchanytag!r}, "
@@ -475,6 +496,18 @@ class ConnectParams(metaclass=BaseMetaClass):
 
         return wrapped
 
+    @property
+    def adaptive_stmtcache(self) -> bool:
+        """
+        A boolean indicating whether the statement cache used in python-
+        oracledb Thin mode may grow beyond stmtcachesize while statements are
+        frequently being evicted from it and requested again. The cache grows
+        up to half of the maximum number of open cursors permitted by the
+        database and shrinks back to stmtcachesize after the connection has not
+        been used for some time.
+        """
+        return self._impl.adaptive_stmtcache
+
     @property
     def appcontext(self) -> list:
         """
@@ -734,6 +767,18 @@ class ConnectParams(metaclass=BaseMetaClass):
             for d in self._impl.description_list.children
         ]
 
+    @property
+    def result_cache_size(self) -> int:
+        """
+        The maximum size, in bytes, of the client-side query result cache that
+        is used in python-oracledb Thin mode. The default value of 0 disables
+        the cache. Rows are only cached for queries executed by cursors that
+        have a non-zero Cursor.result_cache_ttl value. Cached rows are not
+        discarded when the data in the database changes. Connections acquired
+        from a pool share the cache of the pool.
+        """
+        return self._impl.result_cache_size
+
     @property
     @_flatten_value
     def retry_count(self) -> list | int:
@@ -1022,6 +1067,8 @@ class ConnectParams(metaclass=BaseMetaClass):
         mode: oracledb.AuthMode | None = None,
         disable_oob: bool | None = None,
         stmtcachesize: int | None = None,
+        result_cache_size: int | None = None,
+        adaptive_stmtcache: bool | None = None,
         edition: str | None = None,
         tag: str | None = None,
         matchanytag: bool | None = None,
@@ -1169,6 +1216,21 @@ class ConnectParams(metaclass=BaseMetaClass):
 
         - ``stmtcachesize``: the size of the statement cache
 
+        - ``result_cache_size``: the maximum size, in bytes, of the client-side
+          query result cache that is used in python-oracledb Thin mode. The
+          default value of 0 disables the cache. Rows are only cached for
+          queries executed by cursors that have a non-zero
+          Cursor.result_cache_ttl value. Cached rows are not discarded when the
+          data in the database changes. Connections acquired from a pool share
+          the cache of the pool
+
+        - ``adaptive_stmtcache``: a boolean indicating whether the statement
+          cache used in python-oracledb Thin mode may grow beyond stmtcachesize
+          while statements are frequently being evicted from it and requested
+          again. The cache grows up to half of the maximum number of open
+          cursors permitted by the database and shrinks back to stmtcachesize
+          after the connection has not been used for some time
+
         - ``edition``: edition to use for the connection. This parameter cannot
           be used simultaneously with the cclass parameter
 
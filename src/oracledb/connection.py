@@ -55,8 +55,9 @@ from .dbobject import DbObjectType, DbObject
 from .end_user_security_context import EndUserSecurityContext
 from .lob import AsyncLOB, LOB
 from .pipeline import Pipeline, PipelineOpResult
-from .soda import SodaDatabase
-from .subscr import Subscription
+from .result_cache import ResultCache
+from .soda import AsyncSodaDatabase, SodaDatabase
+from .subscr import AsyncSubscription, Subscription
 from .utils import normalize_sessionless_transaction_id
 
 # named tuple used for representing global transactions
@@ -284,16 +285,26 @@ class BaseConnection(metaclass=BaseMetaClass):
         self._verify_connected()
         self._impl.set_dbop(value)
 
-    def decode_oson(self, data: bytes) -> Any:
+    def decode_oson(
+        self, data: bytes, paths: list | tuple | None = None
+    ) -> Any:
         """
         Decodes `OSON-encoded
         <https://www.oracle.com/pls/topic/lookup?ctx=dblatest
         &id=GUID-911D302C-CFAF-406B-B6A5-4E99DD38ABAD>`__ bytes and returns the
         object encoded in those bytes.  This is useful for fetching columns
         which have the check constraint ``IS JSON FORMAT OSON`` enabled.
+
+        The ``paths`` parameter, if specified, is a list of paths to the
+        values that are required. Each path is either a string in simple dot
+        notation such as ``"$.items[0].name"`` or a sequence of field names
+        and array indices such as ``("items", 0, "name")``. Only the values
+        at those paths are decoded and they are returned in a list in the
+        same order as the paths; *None* is returned for any path that does
+        not exist in the document. See :ref:`osonpaths`.
         """
         self._verify_connected()
-        return self._impl.decode_oson(data)
+        return self._impl.decode_oson(data, paths)
 
     @property
     def dsn(self) -> str:
@@ -352,6 +363,21 @@ class BaseConnection(metaclass=BaseMetaClass):
         self._verify_connected()
         self._impl.set_external_name(value)
 
+    def get_statement_cache_stats(self) -> dict:
+        """
+        Returns a dictionary containing statistics about the statement cache of
+        the connection. The keys ``hits`` and ``misses`` contain the number of
+        times a statement was found or not found in the cache when it was
+        executed, ``evictions`` contains the number of statements that were
+        removed from the cache to make room for other statements and
+        ``parses`` contains the number of times a statement was sent to the
+        database to be parsed. The keys ``size`` and ``max_size`` contain the
+        number of statements currently in the cache and the maximum number of
+        statements that the cache may currently hold.
+        """
+        self._verify_connected()
+        return self._impl.get_statement_cache_stats()
+
     @property
     def host(self) -> str:
         """
@@ -615,6 +641,21 @@ class BaseConnection(metaclass=BaseMetaClass):
         self._verify_connected()
         return self._impl.proxy_user
 
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """
+        This read-only attribute returns the client-side query result cache
+        used by the connection. If the connection was acquired from a pool,
+        the cache is shared with the other connections in the pool. The value
+        is *None* if the ``result_cache_size`` parameter was not set when the
+        connection or pool was created. The cache is only available in
+        python-oracledb Thin mode.
+        """
+        self._verify_connected()
+        impl = self._impl.get_result_cache()
+        if impl is not None:
+            return ResultCache._from_impl(impl)
+
     @property
     def sdu(self) -> int:
         """
@@ -1289,6 +1330,66 @@ class Connection(BaseConnection):
         else:
             yield from cursor._impl.fetch_df_batches(cursor, batch_size=size)
 
+    def fetch_into(
+        self,
+        statement: str,
+        buffers: list | tuple,
+        parameters: list | tuple | dict | None = None,
+        *,
+        null_masks: list | tuple | None = None,
+        arraysize: int | None = None,
+    ) -> Iterator[int]:
+        """
+        Executes the SQL query ``statement`` and fetches its rows directly
+        into the writable, C-contiguous, one-dimensional ``buffers`` supplied
+        by the caller, such as NumPy arrays. One buffer must be supplied for
+        each column of the query. All buffers must have the same length. This
+        returns an iterator that fills the buffers in each iteration and
+        yields the number of rows placed in them. Each iteration overwrites
+        the values placed in the buffers by the previous iteration, starting
+        from the first element.
+
+        The ``parameters`` parameter can be a list of tuples, where each tuple
+        item maps to one :ref:`bind variable placeholder <bind>` in
+        ``statement``. It can also be a list of dictionaries, where the keys
+        match the bind variable placeholder names in ``statement``.
+
+        Each buffer must have a native floating point or integer format. The
+        values of ``NUMBER``, ``BINARY_FLOAT`` and ``BINARY_DOUBLE`` columns
+        are converted to the buffer's format. The values of ``DATE`` and
+        ``TIMESTAMP`` columns require 64-bit integer buffers. They are stored
+        as the number of seconds since the epoch for ``DATE`` columns. For
+        ``TIMESTAMP`` columns they are stored as milliseconds, microseconds
+        or nanoseconds since the epoch, depending on the precision of the
+        column's fractional seconds. This is the same time unit used by
+        :meth:`fetch_df_all()`.
+
+        The ``null_masks`` parameter is an optional sequence with one item for
+        each column. Each item is either None or a writable, one-dimensional
+        buffer with one byte per element and the same length as the buffers,
+        such as a NumPy array of type bool. It is populated with 1 for each
+        row where the column is null and 0 otherwise. Null values are stored
+        as zero in the column's buffer.
+
+        The ``arraysize`` parameter is the maximum number of rows fetched in
+        each :ref:`round-trip <roundtrips>`. It defaults to
+        :attr:`oracledb.defaults.arraysize <Defaults.arraysize>`. The number
+        of rows fetched is also limited by the space remaining in the buffers.
+
+        Values are decoded directly into the buffers without creating Python
+        objects. This is only supported in python-oracledb Thin mode.
+        """
+        cursor = self.cursor()
+        cursor._impl.fetching_arrow = True
+        if arraysize is not None:
+            cursor.arraysize = arraysize
+        cursor.prefetchrows = 0
+        cursor.execute(statement, parameters)
+        cursor._verify_fetch()
+        yield from cursor._impl.fetch_into(
+            cursor, buffers, null_masks, cursor.arraysize
+        )
+
     def getSodaDatabase(self) -> SodaDatabase:
         """
         Returns a SodaDatabase object for Simple Oracle Document Access (SODA).
@@ -1417,6 +1518,37 @@ class Connection(BaseConnection):
         self._verify_connected()
         self._impl.rollback()
 
+    def run_pipeline(
+        self,
+        pipeline: Pipeline,
+        continue_on_error: bool = False,
+    ) -> list[PipelineOpResult]:
+        """
+        Runs all of the operations in the pipeline and returns a list of
+        PipelineOpResult, each entry corresponding to an operation executed in
+        the pipeline. It is available only in python-oracledb Thin mode.
+
+        The ``continue_on_error`` parameter determines whether operations
+        should continue to run after an error has occurred. If this parameter
+        is set to *True*, then the :attr:`PipelineOpResult.error` attribute
+        will be populated with an :ref:`_Error <exchandling>` instance which
+        identifies the error that occurred. If this parameter is set to
+        *False*, then an exception will be raised as soon as an error is
+        detected and all subsequent operations will be terminated. The default
+        value is *False*.
+        """
+        self._verify_connected()
+        results = [op._create_result() for op in pipeline.operations]
+        if self._impl.supports_pipelining() and len(results) > 1:
+            self._impl.run_pipeline_with_pipelining(
+                self, results, continue_on_error
+            )
+        else:
+            self._impl.run_pipeline_without_pipelining(
+                self, results, continue_on_error
+            )
+        return results
+
     def shutdown(self, mode: int = 0) -> None:
         """
         Shuts down the database. In order to do this the connection must be
@@ -1885,6 +2017,8 @@ def connect(
     mode: oracledb.AuthMode | None = None,
     disable_oob: bool | None = None,
     stmtcachesize: int | None = None,
+    result_cache_size: int | None = None,
+    adaptive_stmtcache: bool | None = None,
     edition: str | None = None,
     tag: str | None = None,
     matchanytag: bool | None = None,
@@ -2082,6 +2216,22 @@ def connect(
       (default: :attr:`oracledb.defaults.stmtcachesize
       <Defaults.stmtcachesize>`)
 
+    - ``result_cache_size``: the maximum size, in bytes, of the client-side
+      query result cache that is used in python-oracledb Thin mode. The default
+      value of 0 disables the cache. Rows are only cached for queries executed
+      by cursors that have a non-zero Cursor.result_cache_ttl value. Cached
+      rows are not discarded when the data in the database changes. Connections
+      acquired from a pool share the cache of the pool
+      (default: 0)
+
+    - ``adaptive_stmtcache``: a boolean indicating whether the statement cache
+      used in python-oracledb Thin mode may grow beyond stmtcachesize while
+      statements are frequently being evicted from it and requested again. The
+      cache grows up to half of the maximum number of open cursors permitted by
+      the database and shrinks back to stmtcachesize after the connection has
+      not been used for some time
+      (default: False)
+
     - ``edition``: edition to use for the connection. This parameter cannot be
       used simultaneously with the cclass parameter
       (default: None)
@@ -2690,6 +2840,67 @@ class AsyncConnection(BaseConnection):
             async for df in cursor._impl.fetch_df_batches(cursor, size):
                 yield df
 
+    async def fetch_into(
+        self,
+        statement: str,
+        buffers: list | tuple,
+        parameters: list | tuple | dict | None = None,
+        *,
+        null_masks: list | tuple | None = None,
+        arraysize: int | None = None,
+    ) -> Iterator[int]:
+        """
+        Executes the SQL query ``statement`` and fetches its rows directly
+        into the writable, C-contiguous, one-dimensional ``buffers`` supplied
+        by the caller, such as NumPy arrays. One buffer must be supplied for
+        each column of the query. All buffers must have the same length. This
+        returns an iterator that fills the buffers in each iteration and
+        yields the number of rows placed in them. Each iteration overwrites
+        the values placed in the buffers by the previous iteration, starting
+        from the first element.
+
+        The ``parameters`` parameter can be a list of tuples, where each tuple
+        item maps to one :ref:`bind variable placeholder <bind>` in
+        ``statement``. It can also be a list of dictionaries, where the keys
+        match the bind variable placeholder names in ``statement``.
+
+        Each buffer must have a native floating point or integer format. The
+        values of ``NUMBER``, ``BINARY_FLOAT`` and ``BINARY_DOUBLE`` columns
+        are converted to the buffer's format. The values of ``DATE`` and
+        ``TIMESTAMP`` columns require 64-bit integer buffers. They are stored
+        as the number of seconds since the epoch for ``DATE`` columns. For
+        ``TIMESTAMP`` columns they are stored as milliseconds, microseconds
+        or nanoseconds since the epoch, depending on the precision of the
+        column's fractional seconds. This is the same time unit used by
+        :meth:`fetch_df_all()`.
+
+        The ``null_masks`` parameter is an optional sequence with one item for
+        each column. Each item is either None or a writable, one-dimensional
+        buffer with one byte per element and the same length as the buffers,
+        such as a NumPy array of type bool. It is populated with 1 for each
+        row where the column is null and 0 otherwise. Null values are stored
+        as zero in the column's buffer.
+
+        The ``arraysize`` parameter is the maximum number of rows fetched in
+        each :ref:`round-trip <roundtrips>`. It defaults to
+        :attr:`oracledb.defaults.arraysize <Defaults.arraysize>`. The number
+        of rows fetched is also limited by the space remaining in the buffers.
+
+        Values are decoded directly into the buffers without creating Python
+        objects. This is only supported in python-oracledb Thin mode.
+        """
+        cursor = self.cursor()
+        cursor._impl.fetching_arrow = True
+        if arraysize is not None:
+            cursor.arraysize = arraysize
+        cursor.prefetchrows = 0
+        await cursor.execute(statement, parameters)
+        cursor._verify_fetch()
+        async for num_rows in cursor._impl.fetch_into(
+            cursor, buffers, null_masks, cursor.arraysize
+        ):
+            yield num_rows
+
     async def fetchmany(
         self,
         statement: str,
@@ -2767,6 +2978,20 @@ class AsyncConnection(BaseConnection):
             cursor.rowfactory = rowfactory
             return await cursor.fetchone()
 
+    def getSodaDatabase(self) -> AsyncSodaDatabase:
+        """
+        Returns an AsyncSodaDatabase object for Simple Oracle Document Access
+        (SODA). All SODA operations are performed either on the returned
+        AsyncSodaDatabase object or from objects created by the returned
+        AsyncSodaDatabase object. See
+        `here <https://www.oracle.com/pls/topic/lookup?
+        ctx=dblatest&id=GUID-BE42F8D3-B86B-43B4-B2A3-5760A4DF79FB>`__ for
+        additional information on SODA.
+        """
+        self._verify_connected()
+        db_impl = self._impl.create_soda_database_impl(self)
+        return AsyncSodaDatabase._from_impl(self, db_impl)
+
     async def gettype(self, name: str) -> DbObjectType:
         """
         Returns a type object given its name. This can then be used to create
@@ -2875,6 +3100,53 @@ class AsyncConnection(BaseConnection):
             )
         return results
 
+    async def subscribe(
+        self,
+        namespace: int = oracledb.SUBSCR_NAMESPACE_DBCHANGE,
+        timeout: int = 0,
+        operations: int = oracledb.OPCODE_ALLOPS,
+        qos: int = oracledb.SUBSCR_QOS_DEFAULT,
+        grouping_class: int = oracledb.SUBSCR_GROUPING_CLASS_NONE,
+        grouping_value: int = 0,
+        grouping_type: int = oracledb.SUBSCR_GROUPING_TYPE_SUMMARY,
+        name: str | None = None,
+    ) -> AsyncSubscription:
+        """
+        Returns a new subscription object that receives notifications for
+        events that take place in the database that match the given parameters.
+        The notifications are returned by iterating over the subscription with
+        ``async for``. Iteration stops when the subscription is unsubscribed or
+        deregistered by the database.
+
+        Client initiated connections are always used, so Oracle Database 19.4
+        (or later) is required. Subscriptions to database and query changes
+        that are made by the same user on the same database share a single
+        connection for receiving notifications.
+
+        The parameters have the same meaning as the parameters of the same
+        name for :meth:`Connection.subscribe()`.
+        """
+        self._verify_connected()
+        impl = self._impl.create_subscr_impl(
+            self,
+            None,
+            namespace,
+            name,
+            oracledb.SUBSCR_PROTO_CALLBACK,
+            None,
+            0,
+            timeout,
+            operations,
+            qos,
+            grouping_class,
+            grouping_value,
+            grouping_type,
+            True,
+        )
+        subscr = AsyncSubscription._from_impl(impl)
+        await impl.subscribe(subscr, self._impl)
+        return subscr
+
     async def suspend_sessionless_transaction(self) -> None:
         """
         Suspends the currently active sessionless transaction immediately.
@@ -3054,6 +3326,23 @@ class AsyncConnection(BaseConnection):
             self._verify_xid(xid)
         await self._impl.tpc_rollback(xid)
 
+    async def unsubscribe(self, subscr: AsyncSubscription) -> None:
+        """
+        Unsubscribe from events in the database that were originally subscribed
+        to using :meth:`subscribe()`. The connection used to unsubscribe should
+        be the same one used to create the subscription, or should access the
+        same database and be connected as the same user name. Any iteration
+        over the subscription stops once the notifications that have already
+        been received have been returned.
+        """
+        self._verify_connected()
+        if not isinstance(subscr, AsyncSubscription):
+            raise TypeError("expecting subscription")
+        if subscr._impl is None:
+            errors._raise_err(errors.ERR_NOT_SUBSCRIBED)
+        await subscr._impl.unsubscribe(subscr, self._impl)
+        subscr._impl = None
+
 
 def _async_connection_factory(
     f: Callable[..., AsyncConnection],
@@ -3153,6 +3442,8 @@ def connect_async(
     mode: oracledb.AuthMode | None = None,
     disable_oob: bool | None = None,
     stmtcachesize: int | None = None,
+    result_cache_size: int | None = None,
+    adaptive_stmtcache: bool | None = None,
     edition: str | None = None,
     tag: str | None = None,
     matchanytag: bool | None = None,
@@ -3350,6 +3641,22 @@ def connect_async(
       (default: :attr:`oracledb.defaults.stmtcachesize
       <Defaults.stmtcachesize>`)
 
+    - ``result_cache_size``: the maximum size, in bytes, of the client-side
+      query result cache that is used in python-oracledb Thin mode. The default
+      value of 0 disables the cache. Rows are only cached for queries executed
+      by cursors that have a non-zero Cursor.result_cache_ttl value. Cached
+      rows are not discarded when the data in the database changes. Connections
+      acquired from a pool share the cache of the pool
+      (default: 0)
+
+    - ``adaptive_stmtcache``: a boolean indicating whether the statement cache
+      used in python-oracledb Thin mode may grow beyond stmtcachesize while
+      statements are frequently being evicted from it and requested again. The
+      cache grows up to half of the maximum number of open cursors permitted by
+      the database and shrinks back to stmtcachesize after the connection has
+      not been used for some time
+      (default: False)
+
     - ``edition``: edition to use for the connection. This parameter cannot be
       used simultaneously with the cclass parameter
       (default: None)
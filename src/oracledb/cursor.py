@@ -511,6 +511,34 @@ class BaseCursor(metaclass=BaseMetaClass):
         self._verify_open()
         self._prepare(statement, tag, cache_statement)
 
+    @property
+    def result_cache_ttl(self) -> int:
+        """
+        This read-write attribute specifies the time (in seconds) for which the
+        rows of queries executed by the cursor are kept in the client-side
+        query result cache of the connection. The default value of *0* means
+        that the cache is not used by the cursor.
+
+        When the value is greater than *0*, a query whose rows are found in
+        the cache is not sent to the database. Instead, the rows cached by an
+        earlier execution of the same statement with the same bind values are
+        returned. Otherwise, the query is executed and its rows are added to
+        the cache once all of them have been fetched. Cached rows are not
+        discarded when the data in the database changes, so they may be up to
+        this many seconds out of date.
+
+        The cache is only used when the ``result_cache_size`` parameter was
+        set when the connection or pool was created. It is only available in
+        python-oracledb Thin mode. See :ref:`resultcache`.
+        """
+        self._verify_open()
+        return self._impl.result_cache_ttl
+
+    @result_cache_ttl.setter
+    def result_cache_ttl(self, value: int) -> None:
+        self._verify_open()
+        self._impl.result_cache_ttl = value
+
     @property
     def rowcount(self) -> int:
         """
@@ -947,6 +975,7 @@ class Cursor(BaseCursor):
         arraydmlrowcounts: bool = False,
         suspend_on_success: bool = False,
         batch_size: int = 2**32 - 1,
+        pipeline_depth: int = 1,
     ) -> None:
         """
         Executes a SQL statement once using all bind value mappings or
@@ -999,6 +1028,16 @@ class Cursor(BaseCursor):
         ``Connection.autocommit`` is *True*, a commit will take place for each
         batch.
 
+        The ``pipeline_depth`` parameter is the maximum number of batches that
+        are sent to the database before waiting for the response to the first
+        of them. When it is greater than 1, each batch is encoded and sent
+        while the previous batches are still being executed by the database.
+        This requires Oracle Database 23ai, or later, and is only used for DML
+        statements that do not have a RETURNING INTO clause and do not bind
+        LOBs. In all other cases, including in python-oracledb Thick mode,
+        the batches are executed one at a time. See
+        :ref:`pipelinedexecutemany`.
+
         For maximum efficiency, it is best to use the :meth:`setinputsizes()`
         method to specify the bind value types and sizes. In particular, if the
         type is not explicitly specified, the value *None* is assumed to be a
@@ -1006,6 +1045,8 @@ class Cursor(BaseCursor):
         dates will raise a TypeError exception.
         """
         self._verify_open()
+        if not isinstance(pipeline_depth, int) or pipeline_depth <= 0:
+            errors._raise_err(errors.ERR_INVALID_PIPELINE_DEPTH)
         manager = self._impl._prepare_for_executemany(
             self,
             self._normalize_statement(statement),
@@ -1022,6 +1063,14 @@ class Cursor(BaseCursor):
                 manager.message_offset,
             )
             manager.next_batch()
+            if pipeline_depth > 1:
+                self._impl.executemany_with_pipelining(
+                    self,
+                    manager,
+                    batcherrors,
+                    arraydmlrowcounts,
+                    pipeline_depth,
+                )
 
     def fetchall(self) -> list:
         """
@@ -1304,6 +1353,7 @@ class AsyncCursor(BaseCursor):
         arraydmlrowcounts: bool = False,
         suspend_on_success: bool = False,
         batch_size: int = 2**32 - 1,
+        pipeline_depth: int = 1,
     ) -> None:
         """
         Executes a SQL statement once using all bind value mappings or
@@ -1355,6 +1405,15 @@ class AsyncCursor(BaseCursor):
         ``Connection.autocommit`` is *True*, a commit will take place for each
         batch. Do not set ``batch_size`` when ``suspend_on_success`` is *True*.
 
+        The ``pipeline_depth`` parameter is the maximum number of batches that
+        are sent to the database before waiting for the response to the first
+        of them. When it is greater than 1, each batch is encoded and sent
+        while the previous batches are still being executed by the database.
+        This requires Oracle Database 23ai, or later, and is only used for DML
+        statements that do not have a RETURNING INTO clause and do not bind
+        LOBs. In all other cases the batches are executed one at a time. See
+        :ref:`pipelinedexecutemany`.
+
         For maximum efficiency, it is best to use the :meth:`setinputsizes()`
         method to specify the parameter types and sizes ahead of time. In
         particular, the value *None* is assumed to be a string of length 1 so
@@ -1362,6 +1421,8 @@ class AsyncCursor(BaseCursor):
         TypeError exception.
         """
         self._verify_open()
+        if not isinstance(pipeline_depth, int) or pipeline_depth <= 0:
+            errors._raise_err(errors.ERR_INVALID_PIPELINE_DEPTH)
         manager = self._impl._prepare_for_executemany(
             self, self._normalize_statement(statement), parameters, batch_size
         )
@@ -1375,6 +1436,14 @@ class AsyncCursor(BaseCursor):
                 manager.message_offset,
             )
             manager.next_batch()
+            if pipeline_depth > 1:
+                await self._impl.executemany_with_pipelining(
+                    self,
+                    manager,
+                    batcherrors,
+                    arraydmlrowcounts,
+                    pipeline_depth,
+                )
 
     async def fetchall(self) -> list:
         """
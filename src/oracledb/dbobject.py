@@ -26,7 +26,9 @@
 # dbobject.py
 #
 # Contains the classes used for managing database objects and the database
-# object type metadata: DbObject, DbObjectType and DbObjectAttr.
+# object type metadata: DbObject, DbObjectType and DbObjectAttr. Also contains
+# the functions used for managing the cache of type metadata shared by all
+# connections in python-oracledb Thin mode.
 # -----------------------------------------------------------------------------
 
 from __future__ import annotations
@@ -34,7 +36,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any
 
-from . import errors
+from . import errors, thin_impl
 from .base import BaseMetaClass
 from .base_impl import DbType
 
@@ -393,3 +395,34 @@ class DbObjectType(metaclass=BaseMetaClass):
         type.
         """
         return self._impl.schema
+
+
+def clear_dbobject_type_cache() -> None:
+    """
+    Removes all entries from the cache of database object type metadata that
+    is shared by all connections in python-oracledb Thin mode. This should be
+    called after object types have been altered so that connections created
+    subsequently look up the new type definitions in the database. Types that
+    have already been looked up by existing connections are not affected.
+    """
+    thin_impl.clear_dbobject_type_cache()
+
+
+def load_dbobject_type_cache(file_name: str) -> None:
+    """
+    Loads database object type metadata from a file created by
+    :meth:`oracledb.save_dbobject_type_cache()` into the cache shared by all
+    connections in python-oracledb Thin mode. Connections to the same database
+    can then use the object types without looking up their metadata in the
+    database.
+    """
+    thin_impl.load_dbobject_type_cache(file_name)
+
+
+def save_dbobject_type_cache(file_name: str) -> None:
+    """
+    Saves the database object type metadata cached by python-oracledb Thin
+    mode connections to the specified file. The file can be loaded in another
+    process with :meth:`oracledb.load_dbobject_type_cache()`.
+    """
+    thin_impl.save_dbobject_type_cache(file_name)
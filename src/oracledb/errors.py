@@ -302,6 +302,21 @@ ERR_NAME_HAS_EMBEDDED_QUOTES = 2074
 ERR_PARAM_SIZE_TOO_LARGE = 2075
 ERR_TEMPLATE_WITH_DIRECT_PARAMETERS = 2076
 ERR_TEMPLATE_WITH_UNSUPPORTED_FORMAT = 2077
+ERR_WRONG_NUMBER_OF_FETCH_BUFFERS = 2078
+ERR_INVALID_FETCH_BUFFER = 2079
+ERR_WRONG_FETCH_BUFFER_LENGTH = 2080
+ERR_LOB_STREAM_CLOSED = 2081
+ERR_INVALID_OSON_PATH = 2082
+ERR_INVALID_DBOBJECT_TYPE_CACHE_FILE = 2083
+ERR_INVALID_DEQ_BATCH_SIZE = 2084
+ERR_INVALID_DEQ_PREFETCH = 2085
+ERR_INVALID_SODA_FILTER = 2086
+ERR_SODA_COUNT_WITH_SKIP_OR_LIMIT = 2087
+ERR_SODA_REPLACE_REQUIRES_KEY = 2088
+ERR_SODA_KEY_REQUIRED = 2089
+ERR_SODA_NO_DOCUMENTS = 2090
+ERR_INVALID_SODA_HINT = 2091
+ERR_INVALID_PIPELINE_DEPTH = 2092
 
 # error numbers that result in NotSupportedError
 ERR_TIME_NOT_SUPPORTED = 3000
@@ -346,6 +361,9 @@ ERR_CANNOT_CONVERT_FROM_ARROW_TYPE = 3039
 ERR_DB_CS_NOT_SUPPORTED = 3040
 ERR_UNSUPPORTED_DEEP_DATA_SECURITY_FEATURE = 3041
 ERR_ARROW_UNSUPPORTED_INTERVAL = 3042
+ERR_UNSUPPORTED_FETCH_BUFFER_FORMAT = 3043
+ERR_SODA_FILTER_OPERATOR_NOT_SUPPORTED = 3044
+ERR_SODA_METADATA_NOT_SUPPORTED = 3045
 
 # error numbers that result in DatabaseError
 ERR_TNS_ENTRY_NOT_FOUND = 4000
@@ -389,6 +407,11 @@ ERR_CANNOT_CONVERT_TO_ARROW_FLOAT = 4039
 ERR_ARROW_FIXED_SIZE_BINARY_VIOLATED = 4040
 ERR_DPL_TOO_MUCH_DATA = 4041
 ERR_CANNOT_CONVERT_TO_ARROW_DECIMAL = 4042
+ERR_ARROW_DICTIONARY_INDEX_OVERFLOW = 4043
+ERR_SODA_COLLECTION_READ_ONLY = 4044
+ERR_SODA_INVALID_JSON_CONTENT = 4045
+ERR_ARROW_FIXED_SIZE_LIST_VIOLATED = 4046
+ERR_ARROW_VECTOR_TYPE_MISMATCH = 4047
 
 # error numbers that result in InternalError
 ERR_MESSAGE_TYPE_UNKNOWN = 5000
@@ -596,10 +619,18 @@ ERR_MESSAGE_FORMATS = {
         "Apache Arrow C Data structure overflow detected. A larger structure "
         "is needed."
     ),
+    ERR_ARROW_DICTIONARY_INDEX_OVERFLOW: (
+        "the number of distinct values exceeds the number that can be "
+        "represented by the Apache Arrow dictionary index type {index_type}"
+    ),
     ERR_ARROW_FIXED_SIZE_BINARY_VIOLATED: (
         "value of length {actual_len} does not match the Apache Arrow fixed "
         "size binary length of {fixed_size_len}"
     ),
+    ERR_ARROW_FIXED_SIZE_LIST_VIOLATED: (
+        "vector with {num_values} values does not match the Apache Arrow "
+        "fixed size list length of {fixed_size}"
+    ),
     ERR_ARROW_SPARSE_VECTOR_NOT_ALLOWED: (
         "Apache Arrow format does not support sparse vectors with flexible "
         "dimensions"
@@ -624,6 +655,10 @@ ERR_MESSAGE_FORMATS = {
         "flexible vector formats are not supported. Only fixed 'FLOAT32', "
         "'FLOAT64', 'INT8' or 'BINARY' formats are supported"
     ),
+    ERR_ARROW_VECTOR_TYPE_MISMATCH: (
+        "vector values of Apache Arrow type {value_type} cannot be stored in "
+        "an Apache Arrow {arrow_type} array with child type {child_type}"
+    ),
     ERR_BUFFER_LENGTH_INSUFFICIENT: (
         "internal error: buffer of length {actual_buffer_len} "
         "insufficient to hold {required_buffer_len} bytes"
@@ -757,11 +792,25 @@ ERR_MESSAGE_FORMATS = {
         "given index {index} must be in the range of {min_index} to "
         "{max_index}"
     ),
+    ERR_INVALID_DBOBJECT_TYPE_CACHE_FILE: (
+        'file "{file_name}" does not contain a valid database object type '
+        "cache snapshot"
+    ),
+    ERR_INVALID_DEQ_BATCH_SIZE: (
+        "batch_size must be an integer greater than zero"
+    ),
+    ERR_INVALID_DEQ_PREFETCH: (
+        "prefetch must be an integer greater than or equal to zero"
+    ),
     ERR_INVALID_ENUM_VALUE: "invalid value for enumeration {name}: {value}",
     ERR_INVALID_END_USER_SECURITY_CONTEXT_LENGTH: (
         "Specified end-user security context exceeds the maximum supported "
         "size"
     ),
+    ERR_INVALID_FETCH_BUFFER: (
+        "buffer for column {column_num} must be one-dimensional and contain "
+        "at least one element"
+    ),
     ERR_INVALID_INTEGER: (
         "integer {value} cannot be represented as Apache Arrow type "
         "{arrow_type}"
@@ -775,7 +824,15 @@ ERR_MESSAGE_FORMATS = {
     ERR_INVALID_NUMBER: "invalid number",
     ERR_INVALID_OBJECT_TYPE_NAME: 'invalid object type name: "{name}"',
     ERR_INVALID_OCI_ATTR_TYPE: "invalid OCI attribute type {attr_type}",
+    ERR_INVALID_OSON_PATH: (
+        "path {path!r} is not valid: a path must be a string in simple dot "
+        'notation such as "$.items[0].name" or a sequence of field names and '
+        "array indices"
+    ),
     ERR_INVALID_PASSWORD_TYPE: 'invalid password type "{password_type}"',
+    ERR_INVALID_PIPELINE_DEPTH: (
+        "pipeline_depth must be an integer greater than zero"
+    ),
     ERR_INVALID_POOL_CLASS: "invalid connection pool class",
     ERR_INVALID_POOL_PARAMS: "invalid pool params",
     ERR_INVALID_PROTOCOL: 'invalid protocol "{protocol}"',
@@ -801,6 +858,8 @@ ERR_MESSAGE_FORMATS = {
         'SID "{sid}" is not registered with the listener at host "{host}" '
         "port {port}. (Similar to ORA-12505)"
     ),
+    ERR_INVALID_SODA_FILTER: "invalid SODA filter specification: {reason}",
+    ERR_INVALID_SODA_HINT: 'SODA hint cannot contain "*/"',
     ERR_INVALID_SSL_VERSION: 'invalid value for ssl_version: "{ssl_version}"',
     ERR_INVALID_TPC_BEGIN_FLAGS: "invalid flags for tpc_begin()",
     ERR_INVALID_TPC_END_FLAGS: "invalid flags for tpc_end()",
@@ -818,6 +877,7 @@ ERR_MESSAGE_FORMATS = {
         "LOB is of type {actual_type_name} but must be of type "
         "{expected_type_name}"
     ),
+    ERR_LOB_STREAM_CLOSED: "LOB stream has been closed",
     ERR_MESSAGE_HAS_NO_PAYLOAD: "message has no payload",
     ERR_MESSAGE_TYPE_UNKNOWN: (
         "internal error: unknown protocol message type {message_type} "
@@ -963,6 +1023,30 @@ ERR_MESSAGE_FORMATS = {
         "DBMS_TRANSACTION or with python-oracledb, but not both"
     ),
     ERR_SESSIONLESS_INACTIVE: ("no Sessionless Transaction is active"),
+    ERR_SODA_COLLECTION_READ_ONLY: 'SODA collection "{name}" is read-only',
+    ERR_SODA_COUNT_WITH_SKIP_OR_LIMIT: (
+        "count() cannot be used when skip() or limit() has been specified"
+    ),
+    ERR_SODA_FILTER_OPERATOR_NOT_SUPPORTED: (
+        'SODA filter operator "{operator}" is not supported by '
+        "python-oracledb in thin mode"
+    ),
+    ERR_SODA_INVALID_JSON_CONTENT: (
+        "SODA document content is not valid JSON: {reason}"
+    ),
+    ERR_SODA_KEY_REQUIRED: (
+        'documents inserted into SODA collection "{name}" must have a key '
+        "since the collection uses client-assigned keys"
+    ),
+    ERR_SODA_METADATA_NOT_SUPPORTED: (
+        'SODA collection "{name}" uses the value "{value}" for {item} which '
+        "is not supported by python-oracledb in thin mode"
+    ),
+    ERR_SODA_NO_DOCUMENTS: "at least one document must be specified",
+    ERR_SODA_REPLACE_REQUIRES_KEY: (
+        "a single document key must be specified with key() before "
+        "replacing a document"
+    ),
     ERR_SUBSCR_FAILED: "subscription could not be created",
     ERR_TDS_TYPE_NOT_SUPPORTED: "Oracle TDS data type {num} is not supported",
     ERR_TEMPLATE_WITH_DIRECT_PARAMETERS: (
@@ -1016,6 +1100,10 @@ ERR_MESSAGE_FORMATS = {
     ERR_UNSUPPORTED_DEEP_DATA_SECURITY_FEATURE: (
         "database does not support Oracle Deep Data Security"
     ),
+    ERR_UNSUPPORTED_FETCH_BUFFER_FORMAT: (
+        'buffer format "{buffer_format}" for column {column_num} is not '
+        "supported"
+    ),
     ERR_UNSUPPORTED_INBAND_NOTIFICATION: (
         "unsupported in-band notification with error number {err_num}"
     ),
@@ -1058,6 +1146,14 @@ ERR_MESSAGE_FORMATS = {
         "times to execute the statement, or an object implementing the Apache "
         "Arrow PyCapsule interface __arrow_c_stream__()"
     ),
+    ERR_WRONG_FETCH_BUFFER_LENGTH: (
+        "buffer for column {column_num} contains {actual_len} elements but "
+        "{expected_len} elements are required"
+    ),
+    ERR_WRONG_NUMBER_OF_FETCH_BUFFERS: (
+        "{num_buffers} buffers were supplied but {num_fetched_columns} "
+        "columns are being fetched"
+    ),
     ERR_WRONG_NUMBER_OF_POSITIONAL_BINDS: (
         "{expected_num} positional bind values are required but "
         "{actual_num} were provided"
@@ -41,6 +41,39 @@ cdef class ArrowArrayImpl:
             cpython.PyMem_Free(self.arrow_array)
             ArrowArrayViewReset(&self.arrow_array_view)
 
+    cdef int _append_dictionary_bytes(self, void* ptr,
+                                      int64_t num_bytes) except -1:
+        """
+        Append a value of type bytes to a dictionary-encoded array. The value
+        is only added to the dictionary the first time it is seen; after that
+        only its index in the dictionary is appended.
+        """
+        cdef:
+            bytes key = (<char*> ptr)[:num_bytes]
+            ArrowBufferView data
+            object index
+            str index_type
+            int result
+        if self.dictionary_indices is None:
+            self.dictionary_indices = {}
+        index = self.dictionary_indices.get(key)
+        if index is None:
+            index = len(self.dictionary_indices)
+            data.data.data = ptr
+            data.size_bytes = num_bytes
+            _check_nanoarrow(
+                ArrowArrayAppendBytes(self.arrow_array.dictionary, data)
+            )
+            self.dictionary_indices[key] = index
+        result = ArrowArrayAppendInt(self.arrow_array, index)
+        if result == EINVAL:
+            index_type = ArrowTypeString(
+                self.schema_impl.dictionary_index_type
+            ).decode()
+            errors._raise_err(errors.ERR_ARROW_DICTIONARY_INDEX_OVERFLOW,
+                              index_type=index_type)
+        _check_nanoarrow(result)
+
     cdef int _get_list_info(self, int64_t index, ArrowArray* arrow_array,
                             int64_t* offset, int64_t* num_elements) except -1:
         """
@@ -82,6 +115,9 @@ cdef class ArrowArrayImpl:
         Append a value of type bytes to the array.
         """
         cdef ArrowBufferView data
+        if self.schema_impl.dictionary_index_type \
+                != NANOARROW_TYPE_UNINITIALIZED:
+            return self._append_dictionary_bytes(ptr, num_bytes)
         data.data.data = ptr
         data.size_bytes = num_bytes
         if self.schema_impl.fixed_size > 0 \
@@ -164,6 +200,7 @@ cdef class ArrowArrayImpl:
             ArrowInterval interval
             uint64_t uint64_value
             ArrowDecimal decimal
+            int64_t dict_index
             int64_t index
             void* temp
             int i
@@ -186,6 +223,19 @@ cdef class ArrowArrayImpl:
 
         if ArrowArrayViewIsNull(&array.arrow_array_view, index):
             self.append_null()
+        elif array.schema_impl.dictionary_index_type \
+                != NANOARROW_TYPE_UNINITIALIZED:
+            dict_index = ArrowArrayViewGetIntUnsafe(&array.arrow_array_view,
+                                                    index)
+            if array is self:
+                _check_nanoarrow(
+                    ArrowArrayAppendInt(self.arrow_array, dict_index)
+                )
+            else:
+                buffer = ArrowArrayViewGetBytesUnsafe(
+                    array.arrow_array_view.dictionary, dict_index
+                )
+                self.append_bytes(<void*> buffer.data.data, buffer.size_bytes)
         elif array.schema_impl.arrow_type in (
                 NANOARROW_TYPE_BOOL,
                 NANOARROW_TYPE_INT8,
@@ -277,6 +327,57 @@ cdef class ArrowArrayImpl:
         elif self.schema_impl.child_arrow_type == NANOARROW_TYPE_UINT8:
             append_uint8_array(self.arrow_array, value)
 
+    cdef void* append_vector_values(self, ArrowType child_arrow_type,
+                                    int64_t num_values) except NULL:
+        """
+        Append a vector containing the given number of values to the array
+        and return a pointer to the location in the child data buffer where
+        the values are to be written. This allows the caller to decode the
+        values directly into the array without any intermediate objects. The
+        pointer is only valid until the next value is appended to the array.
+        """
+        cdef:
+            ArrowArray *child_array = self.arrow_array.children[0]
+            ArrowBuffer *data_buffer
+            ArrowBitmap *bitmap
+            int64_t num_bytes
+            void *ptr
+
+        # validate that the vector can be stored in the array
+        if child_arrow_type != self.schema_impl.child_arrow_type \
+                or self.schema_impl.arrow_type not in (
+                    NANOARROW_TYPE_FIXED_SIZE_LIST,
+                    NANOARROW_TYPE_LIST
+                ):
+            errors._raise_err(
+                errors.ERR_ARROW_VECTOR_TYPE_MISMATCH,
+                value_type=ArrowTypeString(child_arrow_type).decode(),
+                arrow_type=self.schema_impl.get_type_name(),
+                child_type=ArrowTypeString(
+                    self.schema_impl.child_arrow_type
+                ).decode()
+            )
+        if self.schema_impl.arrow_type == NANOARROW_TYPE_FIXED_SIZE_LIST \
+                and num_values != self.schema_impl.fixed_size:
+            errors._raise_err(errors.ERR_ARROW_FIXED_SIZE_LIST_VIOLATED,
+                              num_values=num_values,
+                              fixed_size=self.schema_impl.fixed_size)
+
+        # reserve space in the child data buffer for the values
+        num_bytes = num_values * self.schema_impl.child_element_size
+        data_buffer = ArrowArrayBuffer(child_array, 1)
+        _check_nanoarrow(ArrowBufferReserve(data_buffer, num_bytes))
+        ptr = data_buffer.data + data_buffer.size_bytes
+        data_buffer.size_bytes += num_bytes
+        bitmap = ArrowArrayValidityBitmap(child_array)
+        if bitmap.buffer.data != NULL:
+            _check_nanoarrow(ArrowBitmapAppend(bitmap, 1, num_values))
+        child_array.length += num_values
+
+        # finish the list element
+        _check_nanoarrow(ArrowArrayFinishElement(self.arrow_array))
+        return ptr
+
     cdef int append_sparse_vector(self,
                                   int64_t num_dims,
                                   array.array indices,
@@ -321,6 +422,7 @@ cdef class ArrowArrayImpl:
         _check_nanoarrow(ArrowArrayFinishBuildingDefault(self.arrow_array,
                                                          NULL))
         self._populate_array_view()
+        self.dictionary_indices = None
 
     cdef int get_bool(self, int64_t index, bint* is_null,
                       bint* value) except -1:
@@ -337,11 +439,23 @@ cdef class ArrowArrayImpl:
         """
         Return bytes at the specified index from the Arrow array.
         """
-        cdef ArrowBufferView buffer
+        cdef:
+            ArrowBufferView buffer
+            int64_t dict_index
         is_null[0] = ArrowArrayViewIsNull(&self.arrow_array_view, index)
         if not is_null[0]:
-            buffer = \
-                    ArrowArrayViewGetBytesUnsafe(&self.arrow_array_view, index)
+            if self.schema_impl.dictionary_index_type \
+                    != NANOARROW_TYPE_UNINITIALIZED:
+                dict_index = \
+                        ArrowArrayViewGetIntUnsafe(&self.arrow_array_view,
+                                                   index)
+                buffer = ArrowArrayViewGetBytesUnsafe(
+                    self.arrow_array_view.dictionary, dict_index
+                )
+            else:
+                buffer = ArrowArrayViewGetBytesUnsafe(
+                    &self.arrow_array_view, index
+                )
             ptr[0] = <char*> buffer.data.data
             num_bytes[0] = buffer.size_bytes
 
@@ -421,6 +535,15 @@ cdef class ArrowArrayImpl:
         """
         length[0] = self.arrow_array.length
 
+    cdef int get_null_mask(self, uint8_t* mask) except -1:
+        """
+        Populate the mask with one byte for each row in the array: 1 if the
+        value is null and 0 otherwise. The array must have been finished.
+        """
+        cdef int64_t i
+        for i in range(self.arrow_array.length):
+            mask[i] = ArrowArrayViewIsNull(&self.arrow_array_view, i)
+
     cdef object get_sparse_vector(self, int64_t index, bint* is_null):
         """
         Return a sparse vector value at the specified index from the Arrow
@@ -551,6 +674,29 @@ cdef class ArrowArrayImpl:
         ArrowArrayMove(array, self.arrow_array)
         self._populate_array_view()
 
+    cdef int populate_from_buffer(self, ArrowSchemaImpl schema_impl,
+                                  object owner, void* ptr,
+                                  int64_t num_bytes) except -1:
+        """
+        Populate the array from a schema, using the supplied memory as the
+        data buffer. The memory belongs to the owner, which is kept alive for
+        as long as the buffer is in use. Values are appended directly to that
+        memory; appending more than it can hold is an error since the buffer
+        cannot be reallocated.
+        """
+        cdef ArrowBuffer *data_buffer
+        self.populate_from_schema(schema_impl)
+        data_buffer = ArrowArrayBuffer(self.arrow_array, 1)
+        data_buffer.data = <uint8_t*> ptr
+        data_buffer.size_bytes = 0
+        data_buffer.capacity_bytes = num_bytes
+        data_buffer.allocator = ArrowBufferDeallocator(
+            <ArrowBufferDeallocatorCallback>
+            arrow_buffer_owner_dealloc_callback,
+            <void*> owner
+        )
+        cpython.Py_INCREF(owner)
+
     cdef int populate_from_schema(self, ArrowSchemaImpl schema_impl) except -1:
         """
         Populate the array from a schema.
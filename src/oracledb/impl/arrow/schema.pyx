@@ -134,7 +134,24 @@ cdef class ArrowSchemaImpl:
         self.precision = schema_view.decimal_precision
         self.scale = schema_view.decimal_scale
         self.fixed_size = schema_view.fixed_size
-        if schema_view.type == NANOARROW_TYPE_STRUCT:
+        if schema_view.type == NANOARROW_TYPE_DICTIONARY:
+
+            # dictionary encoding is only supported for strings; the indices
+            # are stored in the array itself and the distinct values are
+            # stored in the dictionary array
+            self.dictionary_index_type = schema_view.storage_type
+            _check_nanoarrow(
+                ArrowSchemaViewInit(&schema_view,
+                                    self.arrow_schema.dictionary, NULL)
+            )
+            if schema_view.type not in (NANOARROW_TYPE_STRING,
+                                        NANOARROW_TYPE_LARGE_STRING):
+                errors._raise_err(
+                    errors.ERR_ARROW_UNSUPPORTED_DATA_FORMAT,
+                    schema_format=self.arrow_schema.dictionary.format.decode()
+                )
+            self.arrow_type = schema_view.type
+        elif schema_view.type == NANOARROW_TYPE_STRUCT:
 
             # struct may refer to a sparse vector
             if self._is_sparse_vector():
@@ -48,6 +48,7 @@ cdef extern from "nanoarrow.c":
     cdef struct ArrowBuffer:
         uint8_t *data
         int64_t size_bytes
+        int64_t capacity_bytes
         ArrowBufferAllocator allocator
 
     cdef struct ArrowBitmap:
@@ -82,6 +83,7 @@ cdef extern from "nanoarrow.c":
 
     ArrowErrorCode ArrowArrayAllocateChildren(ArrowArray* arrow_array,
                                               int64_t n_children)
+    ArrowErrorCode ArrowArrayAllocateDictionary(ArrowArray* arrow_array)
     ArrowErrorCode ArrowArrayAppendBytes(ArrowArray* arrow_array,
                                          ArrowBufferView value)
     ArrowErrorCode ArrowArrayAppendDecimal(ArrowArray* arrow_array,
@@ -134,9 +136,13 @@ cdef extern from "nanoarrow.c":
                                              int64_t n_arrays)
     void ArrowBasicArrayStreamSetArray(ArrowArrayStream* array_stream,
                                        int64_t i, ArrowArray* arrow_array)
+    ArrowErrorCode ArrowBitmapAppend(ArrowBitmap* bitmap, uint8_t bits_are_set,
+                                     int64_t length)
     ArrowBufferAllocator ArrowBufferDeallocator(ArrowBufferDeallocatorCallback,
                                                 void *private_data)
     void ArrowBufferInit(ArrowBuffer* buffer)
+    ArrowErrorCode ArrowBufferReserve(ArrowBuffer* buffer,
+                                      int64_t additional_size_bytes)
     void ArrowBufferReset(ArrowBuffer* buffer)
     ArrowErrorCode ArrowDecimalAppendStringToBuffer(const ArrowDecimal* decimal,
                                                     ArrowBuffer* buffer)
@@ -268,6 +274,16 @@ cdef void arrow_buffer_dealloc_callback(ArrowBufferAllocator *allocator,
     cpython.Py_DECREF(<ArrowArrayImpl> allocator.private_data)
 
 
+cdef void arrow_buffer_owner_dealloc_callback(ArrowBufferAllocator *allocator,
+                                              uint8_t *ptr,
+                                              int64_t size) noexcept with gil:
+    """
+    ArrowBufferDeallocatorCallback for an ArrowBuffer whose memory belongs to
+    a Python object exposing the buffer protocol.
+    """
+    cpython.Py_DECREF(<object> allocator.private_data)
+
+
 cdef int copy_arrow_array(ArrowArrayImpl array_impl,
                           ArrowArray *src, ArrowArray *dest) except -1:
     """
@@ -316,6 +332,11 @@ cdef int copy_arrow_array(ArrowArrayImpl array_impl,
         for i in range(src.n_children):
             copy_arrow_array(array_impl, src.children[i], dest.children[i])
 
+    # shallow copy of dictionary (recursive call)
+    if src.dictionary != NULL:
+        _check_nanoarrow(ArrowArrayAllocateDictionary(dest))
+        copy_arrow_array(array_impl, src.dictionary, dest.dictionary)
+
 
 cdef int build_arrow_schema_for_sparse_vector(
     ArrowSchema *schema,
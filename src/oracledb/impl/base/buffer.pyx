@@ -516,6 +516,96 @@ cdef class Buffer:
         """
         return self._skip_int(8, NULL)
 
+    cdef bint write_arrow_value(self, OracleMetadata metadata,
+                                ArrowArrayImpl array_impl,
+                                int64_t index) except -1:
+        """
+        Writes the value at the specified index in the Arrow array to the
+        buffer, reading directly from the Arrow buffers and without creating
+        any intermediate Python objects. Null values are written as a zero
+        length value. If the combination of Arrow type and database type is
+        not handled here, False is returned and nothing is written; the caller
+        is then expected to use convert_arrow_to_oracle_data() instead.
+        """
+        cdef:
+            char_type buf[ORA_TYPE_SIZE_TIMESTAMP_TZ]
+            int64_t int_value, days, seconds
+            ArrowType arrow_type
+            uint32_t db_type_num
+            int64_t time_factor
+            uint64_t uint_value
+            uint32_t fsecond
+            ssize_t buflen
+            bint is_null
+        arrow_type = array_impl.schema_impl.arrow_type
+        db_type_num = metadata.dbtype.num
+        if db_type_num == DB_TYPE_NUM_NUMBER:
+            if arrow_type in (
+                NANOARROW_TYPE_INT8,
+                NANOARROW_TYPE_INT16,
+                NANOARROW_TYPE_INT32,
+                NANOARROW_TYPE_INT64,
+            ):
+                array_impl.get_int(arrow_type, index, &is_null, &int_value)
+                if not is_null:
+                    if int_value < 0:
+                        uint_value = <uint64_t> -(int_value + 1) + 1
+                    else:
+                        uint_value = <uint64_t> int_value
+                    encode_number_from_int(buf, &buflen, uint_value,
+                                           int_value < 0)
+            elif arrow_type in (
+                NANOARROW_TYPE_UINT8,
+                NANOARROW_TYPE_UINT16,
+                NANOARROW_TYPE_UINT32,
+                NANOARROW_TYPE_UINT64,
+            ):
+                array_impl.get_uint(arrow_type, index, &is_null, &uint_value)
+                if not is_null:
+                    encode_number_from_int(buf, &buflen, uint_value, False)
+            else:
+                return False
+        elif db_type_num in (DB_TYPE_NUM_DATE,
+                             DB_TYPE_NUM_TIMESTAMP,
+                             DB_TYPE_NUM_TIMESTAMP_LTZ,
+                             DB_TYPE_NUM_TIMESTAMP_TZ):
+            if arrow_type in (NANOARROW_TYPE_TIMESTAMP, NANOARROW_TYPE_DATE64):
+                array_impl.get_int(arrow_type, index, &is_null, &int_value)
+                if not is_null:
+                    time_factor = array_impl.schema_impl.time_factor
+                    seconds = int_value // time_factor
+                    fsecond = <uint32_t> (int_value % time_factor)
+                    if time_factor == 1_000:
+                        fsecond *= 1_000_000
+                    elif time_factor == 1_000_000:
+                        fsecond *= 1_000
+                    elif time_factor == 1_000_000_000:
+                        fsecond -= fsecond % 1_000
+                    days = seconds // (24 * 60 * 60)
+                    seconds = seconds % (24 * 60 * 60)
+            elif arrow_type == NANOARROW_TYPE_DATE32:
+                array_impl.get_int(arrow_type, index, &is_null, &days)
+                seconds = fsecond = 0
+            else:
+                return False
+            if not is_null:
+                encode_timestamp_from_epoch(buf, days, seconds, fsecond)
+                buflen = metadata.dbtype._buffer_size_factor
+                if buflen == ORA_TYPE_SIZE_TIMESTAMP_TZ:
+                    buf[11] = TZ_HOUR_OFFSET
+                    buf[12] = TZ_MINUTE_OFFSET
+                elif buflen == ORA_TYPE_SIZE_TIMESTAMP and fsecond == 0:
+                    # the protocol requires that if the fractional seconds
+                    # are zero that the value be transmitted as a date
+                    buflen = ORA_TYPE_SIZE_DATE
+        else:
+            return False
+        if is_null:
+            self.write_uint8(0)
+        else:
+            self._write_raw_bytes_and_length(buf, buflen)
+        return True
+
     cdef int write_binary_double(self, double value) except -1:
         """
         Writes a double value to the buffer in Oracle canonical double floating
@@ -791,10 +881,9 @@ cdef class GrowableBuffer(Buffer):
         Reserves the requested amount of space in the buffer by moving the
         pointer forward, allocating more space if necessary.
         """
+        if self._pos + num_bytes > self._max_size:
+            self._write_more_data(self._max_size - self._pos, num_bytes)
         self._pos += num_bytes
-        if self._pos > self._size:
-            self._write_more_data(self._size - self._pos + num_bytes,
-                                  num_bytes)
 
     cdef int _write_more_data(self, ssize_t num_bytes_available,
                               ssize_t num_bytes_wanted) except -1:
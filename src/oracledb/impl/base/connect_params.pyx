@@ -80,6 +80,8 @@ cdef class ConnectParamsImpl:
                 and other_impl.shardingkey == self.shardingkey \
                 and other_impl.supershardingkey == self.supershardingkey \
                 and other_impl.stmtcachesize == self.stmtcachesize \
+                and other_impl.result_cache_size == self.result_cache_size \
+                and other_impl.adaptive_stmtcache == self.adaptive_stmtcache \
                 and other_impl.disable_oob == self.disable_oob \
                 and other_impl.ssl_context is self.ssl_context \
                 and other_impl.description_list == self.description_list \
@@ -128,6 +130,8 @@ cdef class ConnectParamsImpl:
         _set_str_param(args, "tag", self)
         _set_bool_param(args, "matchanytag", &self.matchanytag)
         _set_uint_param(args, "stmtcachesize", &self.stmtcachesize)
+        _set_uint_param(args, "result_cache_size", &self.result_cache_size)
+        _set_bool_param(args, "adaptive_stmtcache", &self.adaptive_stmtcache)
         _set_bool_param(args, "disable_oob", &self.disable_oob)
         _set_obj_param(args, "ssl_context", self)
         _set_str_param(args, "debug_jdwp", self)
@@ -208,6 +212,8 @@ cdef class ConnectParamsImpl:
         self.shardingkey = other_params.shardingkey
         self.supershardingkey = other_params.supershardingkey
         self.stmtcachesize = other_params.stmtcachesize
+        self.result_cache_size = other_params.result_cache_size
+        self.adaptive_stmtcache = other_params.adaptive_stmtcache
         self.disable_oob = other_params.disable_oob
         self.debug_jdwp = other_params.debug_jdwp
         self.ssl_context = other_params.ssl_context
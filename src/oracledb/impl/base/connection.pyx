@@ -190,12 +190,18 @@ cdef class BaseConnImpl:
     def change_password(self, old_password, new_password):
         errors._raise_not_supported("changing a password")
 
-    def decode_oson(self, bytes data):
+    def decode_oson(self, bytes data, object paths=None):
         """
-        Decode OSON encoded bytes and return the object encoded in them.
+        Decode OSON encoded bytes and return the object encoded in them. If
+        paths are specified, only the values at those paths are decoded and
+        returned in a list.
         """
         cdef OsonDecoder decoder = OsonDecoder.__new__(OsonDecoder)
-        return decoder.decode(data)
+        if paths is None:
+            return decoder.decode(data)
+        return decoder.decode_paths(
+            data, [_parse_oson_path(p) for p in paths]
+        )
 
     def encode_oson(self, object value):
         """
@@ -306,6 +312,12 @@ cdef class BaseConnImpl:
     def get_protocol(self):
         errors._raise_not_supported("getting the protocol")
 
+    def get_result_cache(self):
+        """
+        Returns the result cache used by the connection, if one exists.
+        """
+        return self._result_cache
+
     def get_sdu(self):
         errors._raise_not_supported("getting the session data unit (SDU)")
 
@@ -318,6 +330,9 @@ cdef class BaseConnImpl:
     def get_session_id(self):
         errors._raise_not_supported("getting the session id")
 
+    def get_statement_cache_stats(self):
+        errors._raise_not_supported("getting the statement cache statistics")
+
     def get_stmt_cache_size(self):
         errors._raise_not_supported("getting the statement cache size")
 
@@ -333,6 +348,14 @@ cdef class BaseConnImpl:
     def rollback(self):
         errors._raise_not_supported("rolling back a transaction")
 
+    def run_pipeline_with_pipelining(self, object conn, list results,
+                                     bint continue_on_error):
+        errors._raise_not_supported("running a pipeline")
+
+    def run_pipeline_without_pipelining(self, object conn, list results,
+                                        bint continue_on_error):
+        errors._raise_not_supported("running a pipeline")
+
     def set_action(self, value):
         errors._raise_not_supported("setting the action")
 
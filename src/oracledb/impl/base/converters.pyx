@@ -339,6 +339,8 @@ cdef int convert_number_to_arrow_double(ArrowArrayImpl array_impl,
         double double_value
     if value.is_max_negative_value:
         array_impl.append_double(-1.0e126)
+    elif value.has_double_value:
+        array_impl.append_double(value.double_value)
     else:
         errno.errno = 0
         double_value = strtod((<const char*> value.chars), NULL)
@@ -375,6 +377,8 @@ cdef int convert_number_to_arrow_int(ArrowArrayImpl array_impl,
     cdef:
         OracleNumber *value = &buffer.as_number
         int64_t int64_value
+    if value.has_int64_value:
+        return array_impl.append_int(value.int64_value)
     errno.errno = 0
     int64_value = strtoll((<const char*> value.chars), NULL, 0)
     if errno.errno != 0:
@@ -391,6 +395,8 @@ cdef int convert_number_to_arrow_uint(ArrowArrayImpl array_impl,
     cdef:
         OracleNumber *value = &buffer.as_number
         uint64_t uint64_value
+    if value.has_int64_value and value.int64_value >= 0:
+        return array_impl.append_uint(<uint64_t> value.int64_value)
     errno.errno = 0
     uint64_value = strtoull((<const char*> value.chars), NULL, 0)
     if errno.errno != 0:
@@ -416,6 +422,8 @@ cdef object convert_number_to_python_float(OracleDataBuffer *buffer):
     cdef OracleNumber *value = &buffer.as_number
     if value.is_max_negative_value:
         return -1.0e126
+    elif value.has_double_value:
+        return value.double_value
     return float(value.chars[:value.num_chars])
 
 
@@ -427,8 +435,12 @@ cdef object convert_number_to_python_int(OracleDataBuffer *buffer):
     cdef OracleNumber *value = &buffer.as_number
     if value.is_max_negative_value:
         return -10 ** 126
+    elif value.has_int64_value:
+        return value.int64_value
     elif value.is_integer:
         return int(value.chars[:value.num_chars])
+    elif value.has_double_value:
+        return value.double_value
     return float(value.chars[:value.num_chars])
 
 
@@ -31,6 +31,47 @@
 
 cdef class BaseCursorImpl:
 
+    cdef int _add_result_cache_entry(self) except -1:
+        """
+        Called once all of the rows of a query have been fetched. If the rows
+        were collected for the result cache, they are added to it. Rows
+        fetched while a transaction is in progress are not added since they
+        may include changes that are not visible to other sessions and that
+        may yet be rolled back.
+        """
+        cdef:
+            OracleMetadata metadata
+            ResultCacheEntry entry
+        if self._result_cache_rows is None:
+            return 0
+        entry = ResultCacheEntry.__new__(ResultCacheEntry)
+        entry.key = self._result_cache_key
+        entry.fetch_metadata = []
+        for metadata in self.fetch_metadata:
+            entry.fetch_metadata.append(metadata.copy())
+        entry.rows = self._result_cache_rows
+        entry.size = self._result_cache_rows_size
+        entry.expires = time.monotonic() + self.result_cache_ttl
+        self._result_cache_rows = None
+        if _is_result_cacheable(self.fetch_var_impls) \
+                and not self._get_conn_impl().get_transaction_in_progress():
+            self._result_cache._add_entry(entry)
+
+    cdef int _add_result_cache_row(self, object row) except -1:
+        """
+        Adds a row to the list of rows collected for the result cache. The
+        size of the row is estimated and if the rows collected no longer fit
+        in the cache, collection is abandoned.
+        """
+        cdef object value
+        self._result_cache_rows_size += sys.getsizeof(row)
+        for value in row:
+            self._result_cache_rows_size += sys.getsizeof(value)
+        if self._result_cache_rows_size > self._result_cache.max_size:
+            self._result_cache_rows = None
+        else:
+            self._result_cache_rows.append(row)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cdef int _bind_values(self,
@@ -135,6 +176,59 @@ cdef class BaseCursorImpl:
                 return json.loads(value)
         return converter
 
+    cdef bint _check_result_cache(self, object cursor) except -1:
+        """
+        Called before a query is executed. If the cursor has a result cache
+        time to live and the connection has a result cache, the cache is
+        searched for the rows of the query. If they are found, the cursor is
+        set up to return them and True is returned. Otherwise, the rows that
+        are fetched will be collected and added to the cache once all of them
+        have been fetched. Implementations that execute the query after this
+        method returns False must first clear the cached rows of any previous
+        execution. The cache is not used while a transaction is in progress
+        since the session may see changes that other sessions cannot.
+        """
+        cdef:
+            OracleMetadata metadata
+            BaseConnImpl conn_impl
+            ResultCacheEntry entry
+            bint uses_metadata
+            object type_handler
+            ssize_t i
+        if self._result_cache_key is None or self.scrollable \
+                or self.fetching_arrow:
+            return False
+        conn_impl = self._get_conn_impl()
+        if conn_impl._result_cache is None \
+                or conn_impl.get_transaction_in_progress():
+            return False
+        type_handler = self._get_output_type_handler(&uses_metadata)
+        self._result_cache = conn_impl._result_cache
+        self._result_cache_key = (
+            self.statement,
+            self._result_cache_key,
+            conn_impl.username,
+            conn_impl.get_current_schema(),
+            conn_impl.get_edition(),
+            self.fetch_lobs,
+            self.fetch_decimals,
+            type_handler,
+        )
+        entry = self._result_cache._get_entry(self._result_cache_key)
+        if entry is None:
+            self._result_cache_rows = []
+            self._result_cache_rows_size = 0
+            return False
+        self._init_fetch_vars(len(entry.fetch_metadata))
+        for i, metadata in enumerate(entry.fetch_metadata):
+            self._create_fetch_var(cursor.connection, cursor, type_handler,
+                                   uses_metadata, i, metadata.copy())
+        self._cached_rows = entry.rows
+        self._buffer_index = 0
+        self._buffer_rowcount = len(entry.rows)
+        self._more_rows_to_fetch = False
+        return True
+
     cdef int _close(self, bint in_del) except -1:
         """
         Internal method for closing the cursor.
@@ -249,13 +343,18 @@ cdef class BaseCursorImpl:
             Py_ssize_t i, num_vars
             BaseVarImpl var_impl
             object row, value
-        num_vars = cpython.PyList_GET_SIZE(self.fetch_var_impls)
-        row = cpython.PyTuple_New(num_vars)
-        for i in range(num_vars):
-            var_impl = self.fetch_var_impls[i]
-            value = var_impl._get_scalar_value(self._buffer_index)
-            cpython.Py_INCREF(value)
-            cpython.PyTuple_SET_ITEM(row, i, value)
+        if self._cached_rows is not None:
+            row = self._cached_rows[self._buffer_index]
+        else:
+            num_vars = cpython.PyList_GET_SIZE(self.fetch_var_impls)
+            row = cpython.PyTuple_New(num_vars)
+            for i in range(num_vars):
+                var_impl = self.fetch_var_impls[i]
+                value = var_impl._get_scalar_value(self._buffer_index)
+                cpython.Py_INCREF(value)
+                cpython.PyTuple_SET_ITEM(row, i, value)
+            if self._result_cache_rows is not None:
+                self._add_result_cache_row(row)
         if self.rowfactory is not None:
             row = self.rowfactory(*row)
         self._buffer_index += 1
@@ -366,6 +465,8 @@ cdef class BaseCursorImpl:
         self.statement = statement
         self.rowfactory = None
         self.fetch_vars = None
+        self._result_cache_rows = None
+        self._cached_rows = None
         if not self.set_input_sizes:
             self.bind_vars = None
             self.bind_vars_by_name = None
@@ -420,6 +521,15 @@ cdef class BaseCursorImpl:
         self.fetch_lobs = C_DEFAULTS.fetch_lobs
         self.fetch_decimals = C_DEFAULTS.fetch_decimals
 
+        # determine the bind values portion of the result cache key; bind
+        # values retained from a previous execution are not known so the
+        # results cannot be cached in that case
+        self._result_cache_key = None
+        self._result_cache_rows = None
+        if self.result_cache_ttl > 0 \
+                and (parameters is not None or self.bind_vars is None):
+            self._result_cache_key = _get_result_cache_bind_key(parameters)
+
         # perform bind
         if parameters is not None:
             self.bind_one(cursor, parameters)
@@ -451,6 +561,7 @@ cdef class BaseCursorImpl:
         # clear any warning and reset rowcount
         self.warning = None
         self.rowcount = 0
+        self._result_cache_rows = None
 
         # return a batch load manager
         return BatchLoadManager.create_for_executemany(
@@ -570,6 +681,23 @@ cdef class BaseCursorImpl:
                     bint arraydmlrowcounts, uint32_t offset=0):
         errors._raise_not_supported("executing a statement in batch")
 
+    def executemany_with_pipelining(self, object cursor,
+                                    BatchLoadManager manager,
+                                    bint batcherrors, bint arraydmlrowcounts,
+                                    uint32_t pipeline_depth):
+        """
+        Internal method used for executing the remaining batches of a call to
+        executemany() using a pipeline. Implementations that do not support
+        pipelining, such as thick mode, leave all of the batches to be
+        executed one at a time, as documented for the pipeline_depth
+        parameter.
+        """
+        pass
+
+    def fetch_into(self, cursor, object buffers, object null_masks,
+                   uint32_t arraysize):
+        errors._raise_not_supported("fetching rows into buffers")
+
     def fetch_next_row(self, cursor):
         """
         Internal method used for fetching the next row from a cursor.
@@ -578,6 +706,7 @@ cdef class BaseCursorImpl:
             self._fetch_rows(cursor)
         if self._buffer_rowcount > 0:
             return self._create_row()
+        self._add_result_cache_entry()
 
     def fetch_df_all(self, cursor):
         """
@@ -163,9 +163,12 @@ cdef int decode_number(const uint8_t* ptr, ssize_t num_bytes,
         OracleNumber *output = &buffer.as_number
         uint8_t byte, digit, num_digits
         int16_t decimal_point_index
+        uint64_t mantissa = 0
+        double power = 1.0
         uint8_t digits[40]
         bint is_positive
         int8_t exponent
+        int16_t scale
 
     # the maximum length of an encoded number is 21 bytes (1 byte for the
     # exponent and 20 bytes for the mantissa)
@@ -185,6 +188,8 @@ cdef int decode_number(const uint8_t* ptr, ssize_t num_bytes,
     # initialize output structure
     output.is_max_negative_value = False
     output.is_integer = True
+    output.has_int64_value = False
+    output.has_double_value = False
     output.num_chars = 0
 
     # a mantissa length of 0 implies a value of 0 (if positive) or a value
@@ -194,6 +199,10 @@ cdef int decode_number(const uint8_t* ptr, ssize_t num_bytes,
             output.num_chars = 1
             output.chars[0] = 48                    # zero
             output.chars[1] = 0                     # null terminator
+            output.has_int64_value = True
+            output.int64_value = 0
+            output.has_double_value = True
+            output.double_value = 0
         else:
             output.is_max_negative_value = True
         return 0
@@ -215,6 +224,8 @@ cdef int decode_number(const uint8_t* ptr, ssize_t num_bytes,
             byte -= 1
         else:
             byte = 101 - byte
+        if num_bytes <= 10:
+            mantissa = mantissa * 100 + byte
 
         # process the first digit; leading zeroes are ignored
         digit = <uint8_t> byte // 10
@@ -235,6 +246,33 @@ cdef int decode_number(const uint8_t* ptr, ssize_t num_bytes,
             digits[num_digits] = digit
             num_digits += 1
 
+    # numbers with up to 9 mantissa bytes have a mantissa that fits in a
+    # 64-bit integer; if the value is an integer with no more than 18 digits
+    # it is retained as a 64-bit integer and if the mantissa has no more than
+    # 7 bytes (less than 2^53) and the scale is small enough that the power of
+    # 10 is exactly representable (no more than 10^22), it is retained as a
+    # correctly rounded double; this avoids having to parse the string of
+    # digits for the most common values
+    if num_bytes <= 10:
+        scale = exponent - num_bytes + 2
+        if scale >= 0 and num_bytes - 1 + scale <= 9:
+            output.has_int64_value = True
+            output.int64_value = <int64_t> mantissa
+            for i in range(scale):
+                output.int64_value *= 100
+            if not is_positive:
+                output.int64_value = -output.int64_value
+        if num_bytes <= 8 and scale >= -11 and scale <= 11:
+            output.has_double_value = True
+            for i in range(abs(scale)):
+                power *= 100
+            if scale < 0:
+                output.double_value = <double> mantissa / power
+            else:
+                output.double_value = <double> mantissa * power
+            if not is_positive:
+                output.double_value = -output.double_value
+
     # create string of digits for transformation to Python value
     # if negative, include the sign
     if not is_positive:
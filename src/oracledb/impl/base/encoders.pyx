@@ -157,26 +157,83 @@ cdef int encode_number(char_type *buf, ssize_t *buflen, bytes value) except -1:
     Encodes bytes representing numeric data in the format exepcted by the
     Oracle Database for NUMBER.
     """
+    encode_number_from_text(buf, buflen, value, len(value))
+
+
+cdef int encode_number_from_int(char_type *buf, ssize_t *buflen,
+                                uint64_t value, bint is_negative) except -1:
+    """
+    Encodes an integer, supplied as its absolute value and a sign, in the
+    format expected by the Oracle Database for NUMBER. The base 100 digits are
+    calculated directly so no intermediate text representation is required.
+    """
+    cdef:
+        uint8_t num_pairs = 0, first_pair = 0, pair_num
+        uint8_t pairs[10]
+        uint8_t exponent
+
+    # zero is a special case
+    if value == 0:
+        buf[0] = 128
+        buflen[0] = 1
+        return 0
+
+    # determine the base 100 digits, least significant first
+    while value > 0:
+        pairs[num_pairs] = <uint8_t> (value % 100)
+        value = value // 100
+        num_pairs += 1
+
+    # encode the exponent; trailing zero digits are not transmitted
+    exponent = num_pairs + 192
+    if is_negative:
+        exponent = ~exponent
+    buf[0] = exponent
+    while pairs[first_pair] == 0:
+        first_pair += 1
+
+    # encode the mantissa bytes, most significant first
+    buflen[0] = 1
+    pair_num = num_pairs
+    while pair_num > first_pair:
+        pair_num -= 1
+        if is_negative:
+            buf[buflen[0]] = 101 - pairs[pair_num]
+        else:
+            buf[buflen[0]] = pairs[pair_num] + 1
+        buflen[0] += 1
+
+    # append a sentinel 102 byte for negative numbers; a 64-bit integer never
+    # reaches the maximum number of digits so this is always required
+    if is_negative:
+        buf[buflen[0]] = 102
+        buflen[0] += 1
+
+
+cdef int encode_number_from_text(char_type *buf, ssize_t *buflen,
+                                 const char_type *ptr,
+                                 ssize_t value_length) except -1:
+    """
+    Encodes UTF-8 encoded text representing numeric data in the format
+    exepcted by the Oracle Database for NUMBER.
+    """
     cdef:
         uint8_t num_digits = 0, digit, num_pairs, pair_num, digits_pos
         bint is_negative = False, prepend_zero = False
-        ssize_t value_length, exponent_pos, pos = 0
         uint8_t digits[NUMBER_AS_TEXT_CHARS]
         bint exponent_is_negative = False
+        ssize_t exponent_pos, pos = 0
         int16_t decimal_point_index
         int8_t exponent_on_wire
-        const char_type *ptr
-        int16_t exponent
+        int16_t exponent = 0
 
     # zero length string cannot be converted
-    value_length = len(value)
     if value_length == 0:
         errors._raise_err(errors.ERR_NUMBER_STRING_OF_ZERO_LENGTH)
     elif value_length > NUMBER_AS_TEXT_CHARS:
         errors._raise_err(errors.ERR_NUMBER_STRING_TOO_LONG)
 
     # check to see if number is negative (first character is '-')
-    ptr = value
     if ptr[0] == b'-':
         is_negative = True
         pos += 1
@@ -222,10 +279,11 @@ cdef int encode_number(char_type *buf, ssize_t *buflen, bytes value) except -1:
         while pos < value_length:
             if ptr[pos] < b'0' or ptr[pos] > b'9':
                 errors._raise_err(errors.ERR_NUMBER_WITH_INVALID_EXPONENT)
+            if exponent < 1000:
+                exponent = exponent * 10 + ptr[pos] - <uint8_t> b'0'
             pos += 1
         if exponent_pos == pos:
             errors._raise_err(errors.ERR_NUMBER_WITH_EMPTY_EXPONENT)
-        exponent = <int16_t> int(ptr[exponent_pos:pos])
         if exponent_is_negative:
             exponent = -exponent
         decimal_point_index += exponent
@@ -313,6 +371,50 @@ cdef inline void encode_timestamp(char_type *buf, object value):
     encode_uint32be(&buf[7], fsecond)
 
 
+cdef int encode_timestamp_from_epoch(char_type *buf, int64_t days,
+                                     int64_t seconds,
+                                     uint32_t fsecond) except -1:
+    """
+    Encodes the number of days and seconds since the epoch (1970-01-01) along
+    with the fractional seconds (in nanoseconds) in the format expected by the
+    Oracle Database for TIMESTAMP. The first seven bytes are the format
+    expected for DATE. This avoids the creation of a datetime.datetime object.
+    """
+    cdef:
+        int64_t era, day_of_era, year_of_era, day_of_year, year
+        uint8_t month, day, shifted_month
+
+    # convert the number of days into a date in the proleptic Gregorian
+    # calendar; years are shifted to start in March so that the leap day is
+    # the last day of the year
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 -
+                   day_of_era // 146096) // 365
+    day_of_year = day_of_era - \
+            (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = <uint8_t> ((5 * day_of_year + 2) // 153)
+    day = <uint8_t> (day_of_year - (153 * shifted_month + 2) // 5 + 1)
+    if shifted_month < 10:
+        month = shifted_month + 3
+    else:
+        month = shifted_month - 9
+    year = year_of_era + era * 400 + (month <= 2)
+    if year < 1 or year > 9999:
+        raise OverflowError("date value out of range")
+
+    # encode the value
+    buf[0] = <uint8_t> ((year // 100) + 100)
+    buf[1] = <uint8_t> ((year % 100) + 100)
+    buf[2] = month
+    buf[3] = day
+    buf[4] = <uint8_t> (seconds // 3600) + 1
+    buf[5] = <uint8_t> ((seconds % 3600) // 60) + 1
+    buf[6] = <uint8_t> (seconds % 60) + 1
+    encode_uint32be(&buf[7], fsecond)
+
+
 cdef inline void encode_timestamp_tz(char_type *buf, object value):
     """
     Encodes a datetime.date or datetime.datetime object in the format exepcted
@@ -0,0 +1,195 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#------------------------------------------------------------------------------
+
+#------------------------------------------------------------------------------
+# fetch_into_buffer.pyx
+#
+# Cython file defining the FetchIntoBuffer implementation class (embedded in
+# base_impl.pyx).
+#------------------------------------------------------------------------------
+
+cdef class FetchIntoBuffer:
+
+    def __dealloc__(self):
+        if self._data_view.buf != NULL:
+            cpython.PyBuffer_Release(&self._data_view)
+        if self._mask_view.buf != NULL:
+            cpython.PyBuffer_Release(&self._mask_view)
+
+    cdef int _get_view(self, object obj, cpython.Py_buffer *view,
+                       ssize_t column_num) except -1:
+        """
+        Acquires a writable, C-contiguous view of the object supplied by the
+        caller and verifies that it is one-dimensional and not empty.
+        """
+        cpython.PyObject_GetBuffer(
+            obj,
+            view,
+            cpython.PyBUF_WRITABLE | cpython.PyBUF_FORMAT | \
+                    cpython.PyBUF_C_CONTIGUOUS
+        )
+        if view.ndim != 1 or view.shape[0] == 0:
+            errors._raise_err(errors.ERR_INVALID_FETCH_BUFFER,
+                              column_num=column_num)
+
+    cdef int _set_arrow_type(self, ssize_t column_num) except -1:
+        """
+        Sets the Arrow type that corresponds to the format of the data buffer.
+        Only native byte order formats are supported.
+        """
+        cdef:
+            ssize_t itemsize = self._data_view.itemsize
+            str buffer_format, type_code
+        buffer_format = (<bytes> self._data_view.format).decode()
+        type_code = buffer_format.lstrip("@=")
+        self.arrow_type = NANOARROW_TYPE_NA
+        if type_code == "d" and itemsize == 8:
+            self.arrow_type = NANOARROW_TYPE_DOUBLE
+        elif type_code == "f" and itemsize == 4:
+            self.arrow_type = NANOARROW_TYPE_FLOAT
+        elif type_code in ("b", "h", "i", "l", "q", "n"):
+            if itemsize == 1:
+                self.arrow_type = NANOARROW_TYPE_INT8
+            elif itemsize == 2:
+                self.arrow_type = NANOARROW_TYPE_INT16
+            elif itemsize == 4:
+                self.arrow_type = NANOARROW_TYPE_INT32
+            elif itemsize == 8:
+                self.arrow_type = NANOARROW_TYPE_INT64
+        elif type_code in ("B", "H", "I", "L", "Q", "N"):
+            if itemsize == 1:
+                self.arrow_type = NANOARROW_TYPE_UINT8
+            elif itemsize == 2:
+                self.arrow_type = NANOARROW_TYPE_UINT16
+            elif itemsize == 4:
+                self.arrow_type = NANOARROW_TYPE_UINT32
+            elif itemsize == 8:
+                self.arrow_type = NANOARROW_TYPE_UINT64
+        if self.arrow_type == NANOARROW_TYPE_NA:
+            errors._raise_err(errors.ERR_UNSUPPORTED_FETCH_BUFFER_FORMAT,
+                              buffer_format=buffer_format,
+                              column_num=column_num)
+
+    @staticmethod
+    cdef list create_all(object buffers, object null_masks):
+        """
+        Creates a fetch buffer for each of the buffers (and optional null
+        masks) supplied by the caller. All buffers and masks must contain the
+        same number of elements.
+        """
+        cdef:
+            cpython.Py_buffer *view
+            FetchIntoBuffer fetch_buf
+            ssize_t i, column_num
+            int64_t expected_len = 0
+            list fetch_bufs = []
+            str mask_format
+            object mask
+        for i, data in enumerate(buffers):
+            column_num = i + 1
+            mask = None if null_masks is None else null_masks[i]
+            fetch_buf = FetchIntoBuffer.__new__(FetchIntoBuffer)
+            fetch_buf._get_view(data, &fetch_buf._data_view, column_num)
+            fetch_buf._set_arrow_type(column_num)
+            fetch_buf.num_elements = fetch_buf._data_view.shape[0]
+            if fetch_bufs and fetch_buf.num_elements != expected_len:
+                errors._raise_err(errors.ERR_WRONG_FETCH_BUFFER_LENGTH,
+                                  column_num=column_num,
+                                  actual_len=fetch_buf.num_elements,
+                                  expected_len=expected_len)
+            expected_len = fetch_buf.num_elements
+            if mask is not None:
+                view = &fetch_buf._mask_view
+                fetch_buf._get_view(mask, view, column_num)
+                if view.itemsize != 1:
+                    mask_format = (<bytes> view.format).decode()
+                    errors._raise_err(
+                        errors.ERR_UNSUPPORTED_FETCH_BUFFER_FORMAT,
+                        buffer_format=mask_format,
+                        column_num=column_num
+                    )
+                if view.shape[0] != fetch_buf.num_elements:
+                    errors._raise_err(errors.ERR_WRONG_FETCH_BUFFER_LENGTH,
+                                      column_num=column_num,
+                                      actual_len=view.shape[0],
+                                      expected_len=fetch_buf.num_elements)
+            fetch_bufs.append(fetch_buf)
+        return fetch_bufs
+
+    cdef ArrowArrayImpl create_array_impl(self, int64_t offset):
+        """
+        Creates an Arrow array which appends values directly to the data
+        buffer, starting at the given offset.
+        """
+        cdef:
+            ArrowArrayImpl array_impl
+            char *ptr
+        ptr = <char*> self._data_view.buf + offset * self._data_view.itemsize
+        array_impl = ArrowArrayImpl.__new__(ArrowArrayImpl)
+        array_impl.populate_from_buffer(
+            self.schema_impl,
+            self,
+            ptr,
+            (self.num_elements - offset) * self._data_view.itemsize
+        )
+        return array_impl
+
+    cdef int finish_array_impl(self, ArrowArrayImpl array_impl,
+                               int64_t offset) except -1:
+        """
+        Called once the array created by create_array_impl() has been finished.
+        The null mask, if one was supplied, is populated from the validity
+        bitmap of the array.
+        """
+        if self._mask_view.buf != NULL:
+            array_impl.get_null_mask(<uint8_t*> self._mask_view.buf + offset)
+
+    cdef int populate_schema_impl(self, OracleMetadata metadata) except -1:
+        """
+        Populates the Arrow schema used for fetching the column described by
+        the metadata. Dates and timestamps are fetched into 64-bit integer
+        buffers using the same time unit that would be used for a data frame.
+        """
+        cdef:
+            ArrowTimeUnit time_unit = NANOARROW_TIME_UNIT_SECOND
+            ArrowType arrow_type = self.arrow_type
+            OracleMetadata default_metadata
+        if metadata.dbtype.num in (DB_TYPE_NUM_DATE,
+                                   DB_TYPE_NUM_TIMESTAMP,
+                                   DB_TYPE_NUM_TIMESTAMP_LTZ,
+                                   DB_TYPE_NUM_TIMESTAMP_TZ) \
+                and arrow_type == NANOARROW_TYPE_INT64:
+            default_metadata = metadata.copy()
+            default_metadata._create_arrow_schema()
+            arrow_type = NANOARROW_TYPE_TIMESTAMP
+            time_unit = default_metadata._schema_impl.time_unit
+        self.schema_impl = ArrowSchemaImpl.__new__(ArrowSchemaImpl)
+        self.schema_impl.populate_from_metadata(
+            arrow_type,
+            metadata.name,
+            metadata.precision,
+            metadata.scale,
+            time_unit,
+            NANOARROW_TYPE_NA
+        )
@@ -220,6 +220,8 @@ cdef class OracleMetadata:
         cdef:
             ArrowType arrow_type = schema_impl.arrow_type
             uint32_t db_type_num = self.dbtype.num
+            ArrowType child_arrow_type
+            uint32_t num_values
             bint ok = False
 
         if db_type_num == DB_TYPE_NUM_NUMBER:
@@ -285,6 +287,27 @@ cdef class OracleMetadata:
                 NANOARROW_TYPE_LARGE_STRING
             ):
                 ok = True
+        elif db_type_num == DB_TYPE_NUM_VECTOR:
+            num_values = self.vector_dimensions
+            child_arrow_type = schema_impl.child_arrow_type
+            if self.vector_format == VECTOR_FORMAT_FLOAT32:
+                ok = (child_arrow_type == NANOARROW_TYPE_FLOAT)
+            elif self.vector_format == VECTOR_FORMAT_FLOAT64:
+                ok = (child_arrow_type == NANOARROW_TYPE_DOUBLE)
+            elif self.vector_format == VECTOR_FORMAT_INT8:
+                ok = (child_arrow_type == NANOARROW_TYPE_INT8)
+            elif self.vector_format == VECTOR_FORMAT_BINARY:
+                ok = (child_arrow_type == NANOARROW_TYPE_UINT8)
+                num_values = num_values // 8
+            else:
+                ok = True
+            if self.vector_flags & VECTOR_META_FLAG_SPARSE_VECTOR:
+                ok = ok and arrow_type == NANOARROW_TYPE_STRUCT
+            elif arrow_type == NANOARROW_TYPE_FIXED_SIZE_LIST:
+                ok = ok and (num_values == 0
+                             or num_values == schema_impl.fixed_size)
+            else:
+                ok = ok and arrow_type == NANOARROW_TYPE_LIST
 
         if not ok:
             errors._raise_err(errors.ERR_CANNOT_CONVERT_TO_ARROW_TYPE,
@@ -29,6 +29,66 @@
 # OSON (Oracle's extensions to JSON) (embedded in base_impl.pyx).
 #------------------------------------------------------------------------------
 
+cdef enum:
+    OSON_FIELD_NAMES_CACHE_SIZE = 128
+    OSON_FIELD_NAMES_CACHE_MAX_NAMES = 1024
+
+# cache of the field name segments built by the OSON encoder, keyed by the set
+# of unique field names found in the value; values that share the same field
+# names (such as documents with the same schema) reuse the segments instead of
+# encoding, hashing and sorting the names again; the cached segments are never
+# modified after they have been built so they can be shared between threads
+cdef object oson_field_names_cache = collections.OrderedDict()
+cdef object oson_field_names_cache_lock = threading.Lock()
+
+cdef list _parse_oson_path(object path):
+    """
+    Parses a path supplied to decode_oson() and returns a list of field names
+    and array indices. The path is either a sequence of field names and array
+    indices or a string in simple dot notation such as "$.items[0].name"
+    where the leading "$" is optional.
+    """
+    cdef:
+        ssize_t pos = 0, end, path_len
+        list components = []
+        object component
+    if isinstance(path, str):
+        path_len = len(path)
+        if path_len > 0 and path[0] == "$":
+            pos = 1
+        while pos < path_len:
+            if path[pos] == "[":
+                end = path.find("]", pos)
+                if end < 0:
+                    errors._raise_err(errors.ERR_INVALID_OSON_PATH, path=path)
+                try:
+                    components.append(int(path[pos + 1:end]))
+                except ValueError:
+                    errors._raise_err(errors.ERR_INVALID_OSON_PATH, path=path)
+                pos = end + 1
+                continue
+            if path[pos] == ".":
+                pos += 1
+            elif pos > 0:
+                errors._raise_err(errors.ERR_INVALID_OSON_PATH, path=path)
+            end = pos
+            while end < path_len and path[end] not in ".[":
+                end += 1
+            if end == pos:
+                errors._raise_err(errors.ERR_INVALID_OSON_PATH, path=path)
+            components.append(path[pos:end])
+            pos = end
+    elif isinstance(path, (list, tuple)):
+        for component in path:
+            if not isinstance(component, (str, int)) \
+                    or isinstance(component, bool):
+                errors._raise_err(errors.ERR_INVALID_OSON_PATH, path=path)
+            components.append(component)
+    else:
+        errors._raise_err(errors.ERR_INVALID_OSON_PATH, path=path)
+    return components
+
+
 @cython.final
 cdef class OsonDecoder(Buffer):
 
@@ -73,13 +133,13 @@ cdef class OsonDecoder(Buffer):
                 self.skip_to(field_ids_pos)
                 if self.field_id_length == 1:
                     self.read_ub1(&temp8)
-                    name = self.field_names[temp8 - 1]
+                    name = self._get_field_name(temp8)
                 elif self.field_id_length == 2:
                     self.read_uint16be(&temp16)
-                    name = self.field_names[temp16 - 1]
+                    name = self._get_field_name(temp16)
                 else:
                     self.read_uint32be(&temp32)
-                    name = self.field_names[temp32 - 1]
+                    name = self._get_field_name(temp32)
                 field_ids_pos = self._pos
             self.skip_to(offsets_pos)
             self._get_offset(node_type, &offset)
@@ -204,139 +264,21 @@ cdef class OsonDecoder(Buffer):
         errors._raise_err(errors.ERR_OSON_NODE_TYPE_NOT_SUPPORTED,
                           node_type=node_type)
 
-    cdef list _get_long_field_names(self, uint32_t num_fields,
-                                    ssize_t offsets_size,
-                                    uint32_t field_names_seg_size):
-        """
-        Read the long field names from the buffer.
-        """
-        cdef:
-            ssize_t offsets_pos, final_pos
-            const char_type* ptr
-            uint32_t offset, i
-            list field_names
-            uint16_t temp16
-            uint8_t temp8
-
-        # skip the hash id array (2 bytes for each field)
-        self.skip_raw_bytes(num_fields * 2)
-
-        # skip the field name offsets array for now
-        offsets_pos = self._pos
-        self.skip_raw_bytes(num_fields * offsets_size)
-        ptr = self._get_raw(field_names_seg_size)
-        final_pos = self._pos
-
-        # determine the names of the fields
-        self.skip_to(offsets_pos)
-        field_names = [None] * num_fields
-        for i in range(num_fields):
-            if offsets_size == 2:
-                self.read_uint16be(&temp16)
-                offset = temp16
-            else:
-                self.read_uint32be(&offset)
-            check_min_length(field_names_seg_size, offset + 1)
-            temp16 = decode_uint16be(&ptr[offset])
-            check_min_length(field_names_seg_size, offset + temp16 + 2)
-            field_names[i] = ptr[offset + 2:offset + temp16 + 2].decode()
-        self.skip_to(final_pos)
-        return field_names
-
-    cdef int _get_num_children(self, uint8_t node_type, uint32_t* num_children,
-                               bint* is_shared) except -1:
-        """
-        Return the number of children the container has. This is determined by
-        examining the 4th and 5th signficant bits of the node type:
-
-            00 - number of children is uint8_t
-            01 - number of children is uint16_t
-            10 - number of children is uint32_t
-            11 - field ids are shared with another object whose offset follows
-
-        In the latter case the flag is_shared is set and the number of children
-        is read by the caller instead as it must examine the offset and then
-        retain the location for later use.
-        """
-        cdef:
-            uint8_t temp8, children_bits = (node_type & 0x18)
-            uint16_t temp16
-        is_shared[0] = (children_bits == 0x18)
-        if children_bits == 0:
-            self.read_ub1(&temp8)
-            num_children[0] = temp8
-        elif children_bits == 0x08:
-            self.read_uint16be(&temp16)
-            num_children[0] = temp16
-        elif children_bits == 0x10:
-            self.read_uint32be(num_children)
-
-    cdef int _get_offset(self, uint8_t node_type, uint32_t* offset) except -1:
-        """
-        Return an offset. The offset will be either a 16-bit or 32-bit value
-        depending on the value of the 3rd significant bit of the node type.
-        """
-        cdef uint16_t temp16
-        if node_type & 0x20:
-            self.read_uint32be(offset)
-        else:
-            self.read_uint16be(&temp16)
-            offset[0] = temp16
-
-    cdef list _get_short_field_names(self, uint32_t num_fields,
-                                     ssize_t offsets_size,
-                                     uint32_t field_names_seg_size):
+    cdef int _decode_header(self, bytes data, bint* is_scalar) except -1:
         """
-        Read the short field names from the buffer.
-        """
-        cdef:
-            ssize_t offsets_pos, final_pos
-            const char_type* ptr
-            uint32_t offset, i
-            list field_names
-            uint16_t temp16
-            uint8_t temp8
-
-        # skip the hash id array (1 byte for each field)
-        self.skip_raw_bytes(num_fields)
-
-        # skip the field name offsets array for now
-        offsets_pos = self._pos
-        self.skip_raw_bytes(num_fields * offsets_size)
-        ptr = self._get_raw(field_names_seg_size)
-        final_pos = self._pos
-
-        # determine the names of the fields
-        self.skip_to(offsets_pos)
-        field_names = [None] * num_fields
-        for i in range(num_fields):
-            if offsets_size == 2:
-                self.read_uint16be(&temp16)
-                offset = temp16
-            else:
-                self.read_uint32be(&offset)
-            check_min_length(field_names_seg_size, offset + 1)
-            temp8 = ptr[offset]
-            check_min_length(field_names_seg_size, offset + temp8 + 1)
-            field_names[i] = ptr[offset + 1:offset + temp8 + 1].decode()
-        self.skip_to(final_pos)
-        return field_names
-
-    cdef object decode(self, bytes data):
-        """
-        Returns a Python object corresponding to the encoded OSON bytes.
+        Parses the header of the OSON image and positions the buffer at the
+        start of the tree segment. The locations of the field names are
+        retained but the names themselves are only decoded when required.
         """
         cdef:
             uint32_t short_field_names_seg_size, long_field_names_seg_size = 0
             uint32_t num_short_field_names, num_long_field_names = 0
-            ssize_t hash_id_size, short_field_name_offsets_size
-            ssize_t long_field_name_offsets_size = 0
+            uint8_t short_field_name_offsets_size
+            uint8_t long_field_name_offsets_size = 0
             uint16_t num_tiny_nodes, temp16
-            ssize_t field_name_offsets_pos
-            uint32_t tree_seg_size, i
-            uint8_t version, temp8
             const char_type* ptr
-            uint32_t offset
+            uint32_t tree_seg_size
+            uint8_t temp8
 
         # populate the buffer with the data
         self._populate_from_bytes(data)
@@ -359,12 +301,14 @@ cdef class OsonDecoder(Buffer):
                 self.primary_flags & TNS_JSON_FLAG_REL_OFFSET_MODE
 
         # if value is a scalar value, the header is much smaller
-        if self.primary_flags & TNS_JSON_FLAG_IS_SCALAR:
+        is_scalar[0] = self.primary_flags & TNS_JSON_FLAG_IS_SCALAR
+        if is_scalar[0]:
             if self.primary_flags & TNS_JSON_FLAG_TREE_SEG_UINT32:
                 self.skip_raw_bytes(4)
             else:
                 self.skip_raw_bytes(2)
-            return self._decode_node()
+            self.tree_seg_pos = self._pos
+            return 0
 
         # determine the number of field names
         if self.primary_flags & TNS_JSON_FLAG_NUM_FNAMES_UINT32:
@@ -409,33 +353,274 @@ cdef class OsonDecoder(Buffer):
         # determine the number of "tiny" nodes
         self.read_uint16be(&num_tiny_nodes)
 
-        # if there are any short names, read them now
-        self.field_names = []
-        if num_short_field_names > 0:
-            self.field_names.extend(
-                self._get_short_field_names(
-                    num_short_field_names,
-                    short_field_name_offsets_size,
-                    short_field_names_seg_size
-                )
-            )
-
-        # if there are any long names, read them now
-        if num_long_field_names > 0:
-            self.field_names.extend(
-                self._get_long_field_names(
-                    num_long_field_names,
-                    long_field_name_offsets_size,
-                    long_field_names_seg_size
-                )
-            )
+        # determine the location of the short and long field names; the hash
+        # id array uses 1 byte for each short name and 2 bytes for each long
+        # name
+        self._get_field_names_info(&self.short_fnames_info,
+                                   num_short_field_names, 1,
+                                   short_field_name_offsets_size,
+                                   short_field_names_seg_size)
+        self._get_field_names_info(&self.long_fnames_info,
+                                   num_long_field_names, 2,
+                                   long_field_name_offsets_size,
+                                   long_field_names_seg_size)
+        self.field_names = \
+                [None] * (num_short_field_names + num_long_field_names)
 
         # get tree segment
         self.tree_seg_pos = self._pos
 
-        # return root node
+    cdef uint32_t _find_field_id(self, str name) except? 0:
+        """
+        Returns the field id of the field with the given name or 0 if no such
+        field exists in the OSON image. Only the names of fields with a
+        matching hash id are compared.
+        """
+        cdef:
+            OsonFieldNamesInfo *info = &self.short_fnames_info
+            uint32_t i, hash_id, field_id_offset = 0
+            OsonFieldName field_name
+            const char_type *ptr
+            uint16_t name_len
+        field_name = OsonFieldName.create(name, 65535)
+        if field_name.name_bytes_len <= 255:
+            hash_id = field_name.hash_id & 0xff
+        else:
+            field_id_offset = info.num_fields
+            info = &self.long_fnames_info
+            hash_id = field_name.hash_id & 0xffff
+        for i in range(info.num_fields):
+            ptr = &self._data[info.hash_ids_pos + i * info.hash_id_size]
+            if info.hash_id_size == 1 and ptr[0] != hash_id:
+                continue
+            elif info.hash_id_size == 2 and decode_uint16be(ptr) != hash_id:
+                continue
+            self._get_field_name_bytes(info, i, &ptr, &name_len)
+            if name_len == field_name.name_bytes_len \
+                    and memcmp(ptr, <const char_type*> field_name.name_bytes,
+                               name_len) == 0:
+                return field_id_offset + i + 1
+        return 0
+
+    cdef int _find_node(self, list path, bint* found) except -1:
+        """
+        Navigates from the root of the tree segment along the given path (a
+        list of field names and array indices). If the node exists, the
+        buffer is positioned at it and the found flag is set; no other nodes
+        are decoded.
+        """
+        cdef:
+            uint32_t container_offset, offset, num_children, field_id, temp32
+            ssize_t field_ids_pos, offsets_pos, index
+            bint is_shared, is_object
+            uint8_t node_type, temp8
+            uint16_t temp16
+            object component
+        found[0] = False
+        self.skip_to(self.tree_seg_pos)
+        for component in path:
+
+            # only containers have children
+            self.read_ub1(&node_type)
+            if not node_type & 0x80:
+                return 0
+            is_object = (node_type & 0x40) == 0
+            container_offset = self._pos - self.tree_seg_pos - 1
+            self._get_num_children(node_type, &num_children, &is_shared)
+
+            # for objects, search the field ids of the object for the one
+            # matching the field name
+            if isinstance(component, str):
+                if not is_object:
+                    return 0
+                field_id = self._find_field_id(component)
+                if field_id == 0:
+                    return 0
+                if is_shared:
+                    self._get_offset(node_type, &offset)
+                    offsets_pos = self._pos
+                    self.skip_to(self.tree_seg_pos + offset)
+                    self.read_ub1(&temp8)
+                    self._get_num_children(temp8, &num_children, &is_shared)
+                    field_ids_pos = self._pos
+                else:
+                    field_ids_pos = self._pos
+                    offsets_pos = \
+                            self._pos + self.field_id_length * num_children
+                self.skip_to(field_ids_pos)
+                for index in range(num_children):
+                    if self.field_id_length == 1:
+                        self.read_ub1(&temp8)
+                        temp32 = temp8
+                    elif self.field_id_length == 2:
+                        self.read_uint16be(&temp16)
+                        temp32 = temp16
+                    else:
+                        self.read_uint32be(&temp32)
+                    if temp32 == field_id:
+                        break
+                else:
+                    return 0
+
+            # for arrays, negative indices are relative to the end of the
+            # array, as with Python lists
+            else:
+                if is_object:
+                    return 0
+                index = component
+                if index < 0:
+                    index += num_children
+                if index < 0 or index >= num_children:
+                    return 0
+                offsets_pos = self._pos
+
+            # position the buffer at the child node
+            if node_type & 0x20:
+                self.skip_to(offsets_pos + index * 4)
+            else:
+                self.skip_to(offsets_pos + index * 2)
+            self._get_offset(node_type, &offset)
+            if self.relative_offsets:
+                offset += container_offset
+            self.skip_to(self.tree_seg_pos + offset)
+
+        found[0] = True
+
+    cdef str _get_field_name(self, uint32_t field_id):
+        """
+        Returns the name of the field with the given field id. Each name is
+        decoded the first time that it is required.
+        """
+        cdef:
+            OsonFieldNamesInfo *info = &self.short_fnames_info
+            uint32_t index = field_id - 1
+            const char_type *ptr
+            uint16_t name_len
+            str name
+        name = self.field_names[index]
+        if name is None:
+            if index >= info.num_fields:
+                index -= info.num_fields
+                info = &self.long_fnames_info
+            self._get_field_name_bytes(info, index, &ptr, &name_len)
+            name = ptr[:name_len].decode()
+            self.field_names[field_id - 1] = name
+        return name
+
+    cdef int _get_field_name_bytes(self, OsonFieldNamesInfo *info,
+                                   uint32_t index, const char_type **ptr,
+                                   uint16_t *name_len) except -1:
+        """
+        Returns a pointer to the UTF-8 encoded bytes of the field name at the
+        given index in the field names segment, along with its length.
+        """
+        cdef:
+            const char_type *names = &self._data[info.names_pos]
+            const char_type *offset_ptr
+            uint32_t offset
+        offset_ptr = &self._data[info.offsets_pos + index * info.offsets_size]
+        if info.offsets_size == 2:
+            offset = decode_uint16be(offset_ptr)
+        else:
+            offset = decode_uint32be(offset_ptr)
+        if info.hash_id_size == 1:
+            check_min_length(info.seg_size, offset + 1)
+            name_len[0] = names[offset]
+            offset += 1
+        else:
+            check_min_length(info.seg_size, offset + 2)
+            name_len[0] = decode_uint16be(&names[offset])
+            offset += 2
+        check_min_length(info.seg_size, offset + name_len[0])
+        ptr[0] = &names[offset]
+
+    cdef int _get_field_names_info(self, OsonFieldNamesInfo *info,
+                                   uint32_t num_fields, uint8_t hash_id_size,
+                                   uint8_t offsets_size,
+                                   uint32_t seg_size) except -1:
+        """
+        Retains the location of the hash id array, the field name offsets
+        array and the field names segment and skips over them.
+        """
+        info.num_fields = num_fields
+        info.seg_size = seg_size
+        info.hash_id_size = hash_id_size
+        info.offsets_size = offsets_size
+        info.hash_ids_pos = self._pos
+        self.skip_raw_bytes(num_fields * hash_id_size)
+        info.offsets_pos = self._pos
+        self.skip_raw_bytes(num_fields * offsets_size)
+        info.names_pos = self._pos
+        if num_fields > 0:
+            self.skip_raw_bytes(seg_size)
+
+    cdef int _get_num_children(self, uint8_t node_type, uint32_t* num_children,
+                               bint* is_shared) except -1:
+        """
+        Return the number of children the container has. This is determined by
+        examining the 4th and 5th signficant bits of the node type:
+
+            00 - number of children is uint8_t
+            01 - number of children is uint16_t
+            10 - number of children is uint32_t
+            11 - field ids are shared with another object whose offset follows
+
+        In the latter case the flag is_shared is set and the number of children
+        is read by the caller instead as it must examine the offset and then
+        retain the location for later use.
+        """
+        cdef:
+            uint8_t temp8, children_bits = (node_type & 0x18)
+            uint16_t temp16
+        is_shared[0] = (children_bits == 0x18)
+        if children_bits == 0:
+            self.read_ub1(&temp8)
+            num_children[0] = temp8
+        elif children_bits == 0x08:
+            self.read_uint16be(&temp16)
+            num_children[0] = temp16
+        elif children_bits == 0x10:
+            self.read_uint32be(num_children)
+
+    cdef int _get_offset(self, uint8_t node_type, uint32_t* offset) except -1:
+        """
+        Return an offset. The offset will be either a 16-bit or 32-bit value
+        depending on the value of the 3rd significant bit of the node type.
+        """
+        cdef uint16_t temp16
+        if node_type & 0x20:
+            self.read_uint32be(offset)
+        else:
+            self.read_uint16be(&temp16)
+            offset[0] = temp16
+
+    cdef object decode(self, bytes data):
+        """
+        Returns a Python object corresponding to the encoded OSON bytes.
+        """
+        cdef bint is_scalar
+        self._decode_header(data, &is_scalar)
         return self._decode_node()
 
+    cdef list decode_paths(self, bytes data, list paths):
+        """
+        Returns a list containing the Python objects found at each of the
+        given paths (each a list of field names and array indices) in the
+        encoded OSON bytes, or None if no value exists at that path. Only the
+        nodes at the requested paths (and their children) are decoded.
+        """
+        cdef:
+            list path, results = []
+            bint is_scalar, found
+        self._decode_header(data, &is_scalar)
+        for path in paths:
+            self._find_node(path, &found)
+            if found:
+                results.append(self._decode_node())
+            else:
+                results.append(None)
+        return results
+
 
 @cython.final
 cdef class OsonFieldName:
@@ -694,13 +879,11 @@ cdef class OsonTreeSegment(GrowableBuffer):
 @cython.final
 cdef class OsonEncoder(GrowableBuffer):
 
-    cdef int _add_field_name(self, str name) except -1:
+    cdef int _add_field_name(self, OsonFieldName field_name) except -1:
         """
-        Add a field with the given name.
+        Add a field name to the appropriate field names segment.
         """
-        cdef OsonFieldName field_name
-        field_name = OsonFieldName.create(name, self.max_fname_size)
-        self.field_names_dict[name] = field_name
+        self.field_names_dict[field_name.name] = field_name
         if field_name.name_bytes_len <= 255:
             self.short_fnames_seg.add_name(field_name)
         else:
@@ -708,6 +891,58 @@ cdef class OsonEncoder(GrowableBuffer):
                 self.long_fnames_seg = OsonFieldNamesSegment.create()
             self.long_fnames_seg.add_name(field_name)
 
+    cdef int _build_field_names(self) except -1:
+        """
+        Builds the field names segments for the unique set of field names
+        found in the value. The names are added to the segments in sorted
+        order so that the encoded value does not depend on the order in which
+        the names were found. The segments are retained in a cache and reused
+        when another value with the same set of field names is encoded.
+        """
+        cdef:
+            OsonFieldName field_name
+            list field_names
+            object key
+            tuple entry
+
+        # check the cache first
+        key = (frozenset(self.unique_field_names), self.max_fname_size)
+        with oson_field_names_cache_lock:
+            entry = oson_field_names_cache.get(key)
+            if entry is not None:
+                oson_field_names_cache.move_to_end(key)
+        if entry is not None:
+            self.short_fnames_seg, self.long_fnames_seg, \
+                    self.field_names_dict = entry
+            return 0
+
+        # build the segments
+        field_names = [
+            OsonFieldName.create(name, self.max_fname_size)
+            for name in self.unique_field_names
+        ]
+        field_names.sort(key=OsonFieldName.sort_key)
+        self.field_names_dict = {}
+        self.short_fnames_seg = OsonFieldNamesSegment.create()
+        for field_name in field_names:
+            self._add_field_name(field_name)
+        self.short_fnames_seg.process_field_names(0)
+        if self.long_fnames_seg is not None:
+            self.long_fnames_seg.process_field_names(
+                self.short_fnames_seg.num_field_names
+            )
+
+        # add the segments to the cache, discarding the least recently used
+        # entry if the cache is full; very large sets of field names are not
+        # cached as they are unlikely to be repeated
+        if len(field_names) <= OSON_FIELD_NAMES_CACHE_MAX_NAMES:
+            entry = (self.short_fnames_seg, self.long_fnames_seg,
+                     self.field_names_dict)
+            with oson_field_names_cache_lock:
+                oson_field_names_cache[key] = entry
+                if len(oson_field_names_cache) > OSON_FIELD_NAMES_CACHE_SIZE:
+                    oson_field_names_cache.popitem(last=False)
+
     cdef int _determine_flags(self, object value, uint16_t *flags) except -1:
         """
         Determine the flags to use for the OSON image.
@@ -720,19 +955,15 @@ cdef class OsonEncoder(GrowableBuffer):
             return 0
 
         # examine all values recursively to determine the unique set of field
-        # names and whether they need to be added to the long field names
-        # segment (> 255 bytes) or short field names segment (<= 255 bytes)
-        self.field_names_dict = {}
-        self.short_fnames_seg = OsonFieldNamesSegment.create()
+        # names and then build the short field names segment (<= 255 bytes)
+        # and long field names segment (> 255 bytes) from them
+        self.unique_field_names = set()
         self._examine_node(value)
+        self._build_field_names()
 
-        # perform processing of field names segments and determine the total
-        # number of unique field names in the value
-        if self.short_fnames_seg is not None:
-            self.short_fnames_seg.process_field_names(0)
-            self.num_field_names += self.short_fnames_seg.num_field_names
+        # determine the total number of unique field names in the value
+        self.num_field_names = self.short_fnames_seg.num_field_names
         if self.long_fnames_seg is not None:
-            self.long_fnames_seg.process_field_names(self.num_field_names)
             self.num_field_names += self.long_fnames_seg.num_field_names
 
         # determine remaining flags and field id size
@@ -762,8 +993,7 @@ cdef class OsonEncoder(GrowableBuffer):
                 self._examine_node(child_value)
         elif isinstance(value, dict):
             for key, child_value in (<dict> value).items():
-                if key not in self.field_names_dict:
-                    self._add_field_name(key)
+                self.unique_field_names.add(key)
                 self._examine_node(child_value)
 
     cdef int _write_extended_header(self) except -1:
@@ -131,6 +131,7 @@ EXTENDED_PARAM_PREFIX = "pyo."
 EXTENDED_PARAM_NAMES = set([
 
     # ConnectParams
+    "adaptive_stmtcache",
     "connection_id_prefix",
     "disable_oob",
     "driver_name",
@@ -141,11 +142,13 @@ EXTENDED_PARAM_NAMES = set([
     "mode",
     "osuser",
     "program",
+    "result_cache_size",
     "stmtcachesize",
     "terminal",
     "use_tcp_fast_open",
 
     # PoolParams
+    "create_concurrency",
     "getmode",
     "homogeneous",
     "increment",
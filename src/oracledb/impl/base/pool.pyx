@@ -68,11 +68,23 @@ cdef class BasePoolImpl:
     def get_ping_interval(self):
         errors._raise_not_supported("getting the ping interval of a pool")
 
+    def get_result_cache(self):
+        """
+        Returns the result cache shared by the connections in the pool, if one
+        exists.
+        """
+        return self._result_cache
+
     def get_soda_metadata_cache(self):
         errors._raise_not_supported(
             "getting whether the SODA metadata cache is enabled"
         )
 
+    def get_statement_cache_stats(self):
+        errors._raise_not_supported(
+            "getting the statement cache statistics of a pool"
+        )
+
     def get_stmt_cache_size(self):
         errors._raise_not_supported(
             "getting the size of the statement cache in a pool"
@@ -83,6 +95,11 @@ cdef class BasePoolImpl:
             "getting the timeout for idle connections in a pool"
         )
 
+    def get_wait_histograms(self):
+        errors._raise_not_supported(
+            "getting the acquire wait histograms of a pool"
+        )
+
     def get_wait_timeout(self):
         errors._raise_not_supported("getting the wait timeout for a pool")
 
@@ -123,3 +140,6 @@ cdef class BasePoolImpl:
 
     def set_wait_timeout(self, uint32_t value):
         errors._raise_not_supported("setting the wait timeout for a pool")
+
+    def wait_until_ready(self, uint32_t min_open, object timeout):
+        errors._raise_not_supported("waiting for a pool to be ready")
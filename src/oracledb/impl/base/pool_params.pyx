@@ -40,6 +40,7 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         self.homogeneous = True
         self.ping_interval = 60
         self.ping_timeout = 5000
+        self.create_concurrency = 1
 
     def __eq__(self, PoolParamsImpl other_impl):
         return other_impl.min == self.min \
@@ -59,6 +60,7 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
                         self.soda_metadata_cache \
                 and other_impl.ping_interval == self.ping_interval \
                 and other_impl.ping_timeout == self.ping_timeout \
+                and other_impl.create_concurrency == self.create_concurrency \
                 and ConnectParamsImpl.__eq__(self, other_impl)
 
     cdef int _copy(self, ConnectParamsImpl other_params) except -1:
@@ -81,6 +83,7 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         self.soda_metadata_cache = pool_params.soda_metadata_cache
         self.ping_interval = pool_params.ping_interval
         self.ping_timeout = pool_params.ping_timeout
+        self.create_concurrency = pool_params.create_concurrency
 
     def copy(self):
         """
@@ -113,6 +116,7 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         _set_bool_param(args, "soda_metadata_cache", &self.soda_metadata_cache)
         _set_int_param(args, "ping_interval", &self.ping_interval)
         _set_uint_param(args, "ping_timeout", &self.ping_timeout)
+        _set_uint_param(args, "create_concurrency", &self.create_concurrency)
 
         # verify that max >= min
         if self.max < self.min:
@@ -122,3 +126,7 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         # increment value is non-zero (as otherwise the pool would never grow!)
         if self.max != self.min and self.increment == 0:
             self.increment = 1
+
+        # at least one connection must be created at a time
+        if self.create_concurrency == 0:
+            self.create_concurrency = 1
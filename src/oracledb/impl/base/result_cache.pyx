@@ -0,0 +1,170 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#------------------------------------------------------------------------------
+
+#------------------------------------------------------------------------------
+# result_cache.pyx
+#
+# Cython file defining the client-side query result cache (embedded in
+# base_impl.pyx).
+#------------------------------------------------------------------------------
+
+# the types of values that may be bound to queries whose results are cached;
+# all of these are immutable and hashable
+cdef tuple RESULT_CACHE_BIND_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    decimal.Decimal,
+    datetime.date,
+    datetime.timedelta,
+)
+
+cdef object _get_result_cache_bind_key(object parameters):
+    """
+    Returns the portion of the result cache key that represents the bind
+    values, or None if the bind values prevent the results from being cached.
+    The type of each value is included in the key since values that compare
+    equal in Python, such as 1, 1.0 and True, are bound as different database
+    types.
+    """
+    cdef object name, value, values
+    if parameters is None:
+        return ()
+    if isinstance(parameters, dict):
+        values = parameters.values()
+    else:
+        values = parameters
+    for value in values:
+        if value is not None \
+                and not isinstance(value, RESULT_CACHE_BIND_TYPES):
+            return None
+    if isinstance(parameters, dict):
+        return tuple(sorted([(name, type(value), value)
+                             for name, value in parameters.items()]))
+    return tuple([(type(value), value) for value in parameters])
+
+
+cdef bint _is_result_cacheable(list fetch_var_impls):
+    """
+    Returns a boolean indicating if the rows fetched with the given variables
+    can be cached. Rows that contain LOB locators, cursors, objects or mutable
+    values such as JSON documents and vectors are not cached since the same row
+    objects are returned to every cursor that uses the entry.
+    """
+    cdef:
+        BaseVarImpl var_impl
+        uint32_t db_type_num
+    for var_impl in fetch_var_impls:
+        db_type_num = var_impl.metadata.dbtype.num
+        if db_type_num in (DB_TYPE_NUM_BFILE,
+                           DB_TYPE_NUM_BLOB,
+                           DB_TYPE_NUM_CLOB,
+                           DB_TYPE_NUM_NCLOB,
+                           DB_TYPE_NUM_CURSOR,
+                           DB_TYPE_NUM_JSON,
+                           DB_TYPE_NUM_OBJECT,
+                           DB_TYPE_NUM_VECTOR) \
+                or var_impl._fetch_metadata.is_json \
+                or var_impl._fetch_metadata.is_oson:
+            return False
+    return True
+
+
+cdef class ResultCacheEntry:
+    pass
+
+
+cdef class ResultCacheImpl:
+
+    def __init__(self, uint32_t max_size):
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    cdef int _add_entry(self, ResultCacheEntry entry) except -1:
+        """
+        Adds an entry to the cache, replacing any entry with the same key. The
+        least recently used entries are discarded until the cache fits within
+        its maximum size.
+        """
+        cdef ResultCacheEntry old_entry
+        if entry.size > self.max_size:
+            return 0
+        with self._lock:
+            old_entry = self._entries.pop(entry.key, None)
+            if old_entry is not None:
+                self.size -= old_entry.size
+            self._entries[entry.key] = entry
+            self.size += entry.size
+            while self.size > self.max_size:
+                old_entry = self._entries.popitem(last=False)[1]
+                self.size -= old_entry.size
+
+    cdef ResultCacheEntry _get_entry(self, object key):
+        """
+        Returns the entry with the given key, or None if there is no such entry
+        or the entry has expired. The entry is marked as the most recently
+        used.
+        """
+        cdef ResultCacheEntry entry
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                self.size -= entry.size
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def get_num_entries(self):
+        """
+        Returns the number of entries in the cache, including any that have
+        expired but have not yet been removed.
+        """
+        return len(self._entries)
+
+    def invalidate(self, str statement):
+        """
+        Removes all entries for the given statement from the cache, regardless
+        of the values that were bound when the statement was executed.
+        """
+        cdef ResultCacheEntry entry
+        with self._lock:
+            for entry in list(self._entries.values()):
+                if entry.key[0] == statement:
+                    del self._entries[entry.key]
+                    self.size -= entry.size
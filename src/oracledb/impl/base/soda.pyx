@@ -93,12 +93,18 @@ cdef class BaseSodaCollImpl:
             "inserting a single document into a SODA collection"
         )
 
+    def list_indexes(self):
+        errors._raise_not_supported(
+            "getting the list of indexes on a SODA collection"
+        )
+
     def remove(self, object op):
         errors._raise_not_supported(
             "removing documents from a SODA collection"
         )
 
-    def replace_one(self, BaseSodaDocImpl doc_impl, bint return_doc):
+    def replace_one(self, object op, BaseSodaDocImpl doc_impl,
+                    bint return_doc):
         errors._raise_not_supported(
             "replacing a document in a SODA collection"
         )
@@ -57,60 +57,64 @@ cdef class VectorDecoder(Buffer):
         """
         Returns an array containing the decoded values.
         """
-        cdef:
-            uint8_t *uint8_buf = NULL
-            double *double_buf = NULL
-            uint8_t element_size = 0
-            int8_t *int8_buf = NULL
-            float *float_buf = NULL
-            OracleDataBuffer buffer
-            array.array result
-            uint32_t i
+        cdef array.array result
 
-        # set up buffers based on vector storage format
+        # set up array based on vector storage format
         if vector_format == VECTOR_FORMAT_FLOAT32:
             result = array.clone(float_template, num_elements, False)
-            float_buf = result.data.as_floats
         elif vector_format == VECTOR_FORMAT_FLOAT64:
             result = array.clone(double_template, num_elements, False)
-            double_buf = result.data.as_doubles
         elif vector_format == VECTOR_FORMAT_INT8:
             result = array.clone(int8_template, num_elements, False)
-            int8_buf = result.data.as_schars
         elif vector_format == VECTOR_FORMAT_BINARY:
             num_elements = num_elements // 8
             result = array.clone(uint8_template, num_elements, False)
-            uint8_buf = result.data.as_uchars
         else:
             errors._raise_err(errors.ERR_VECTOR_FORMAT_NOT_SUPPORTED,
                               vector_format=vector_format)
 
         # parse data
-        for i in range(num_elements):
-            if vector_format == VECTOR_FORMAT_FLOAT32:
-                decode_binary_float(self._get_raw(4), 4, &buffer)
-                float_buf[i] = buffer.as_float
-            elif vector_format == VECTOR_FORMAT_FLOAT64:
-                decode_binary_double(self._get_raw(8), 8, &buffer)
-                double_buf[i] = buffer.as_double
-            elif vector_format == VECTOR_FORMAT_INT8:
-                self.read_sb1(&int8_buf[i])
-            else:
-                self.read_ub1(&uint8_buf[i])
-
+        self._decode_values_into(result.data.as_voidptr, num_elements,
+                                 vector_format)
         return result
 
-    cdef object decode(self, bytes data):
+    cdef int _decode_values_into(self, void *ptr, uint32_t num_values,
+                                 uint8_t vector_format) except -1:
         """
-        Returns a Python object corresponding to the encoded VECTOR bytes.
+        Decodes the values found in the image into the memory pointed to by
+        the given pointer, which must be large enough to hold them. For binary
+        vectors the number of values is the number of bytes.
         """
         cdef:
-            uint8_t magic_byte, version, vector_format
-            uint16_t flags, num_sparse_elements
-            SparseVectorImpl sparse_impl
-            array.array uint32_template
-            uint32_t* sparse_indices
-            uint32_t num_elements, i
+            const char_type *source
+            OracleDataBuffer buffer
+            double *double_buf
+            float *float_buf
+            uint32_t i
+        if vector_format == VECTOR_FORMAT_FLOAT32:
+            source = self._get_raw(num_values * 4)
+            float_buf = <float*> ptr
+            for i in range(num_values):
+                decode_binary_float(&source[i * 4], 4, &buffer)
+                float_buf[i] = buffer.as_float
+        elif vector_format == VECTOR_FORMAT_FLOAT64:
+            source = self._get_raw(num_values * 8)
+            double_buf = <double*> ptr
+            for i in range(num_values):
+                decode_binary_double(&source[i * 8], 8, &buffer)
+                double_buf[i] = buffer.as_double
+        else:
+            memcpy(ptr, self._get_raw(num_values), num_values)
+
+    cdef int _decode_header(self, bytes data, uint8_t *vector_format,
+                            uint16_t *flags,
+                            uint32_t *num_elements) except -1:
+        """
+        Populates the buffer with the encoded VECTOR bytes and parses the
+        header, returning the vector storage format, the flags and the number
+        of elements (dimensions) found in it.
+        """
+        cdef uint8_t magic_byte, version
 
         # populate the buffer with the data
         self._populate_from_bytes(data)
@@ -124,32 +128,85 @@ cdef class VectorDecoder(Buffer):
         if version > TNS_VECTOR_VERSION_WITH_SPARSE:
             errors._raise_err(errors.ERR_VECTOR_VERSION_NOT_SUPPORTED,
                               version=version)
-        self.read_uint16be(&flags)
-        self.read_ub1(&vector_format)
-        self.read_uint32be(&num_elements)
-        if flags & TNS_VECTOR_FLAG_NORM_RESERVED \
-                or flags & TNS_VECTOR_FLAG_NORM:
+        self.read_uint16be(flags)
+        self.read_ub1(vector_format)
+        self.read_uint32be(num_elements)
+        if flags[0] & TNS_VECTOR_FLAG_NORM_RESERVED \
+                or flags[0] & TNS_VECTOR_FLAG_NORM:
             self.skip_raw_bytes(8)
 
-        # for sparse vectors, only non-zero elements are found in the image
-        if flags & TNS_VECTOR_FLAG_SPARSE:
-            sparse_impl = SparseVectorImpl.__new__(SparseVectorImpl)
-            sparse_impl.num_dimensions = num_elements
-            self.read_uint16be(&num_sparse_elements)
-            num_elements = num_sparse_elements
-            uint32_template = array.array(ARRAY_TYPE_CODE_UINT32)
-            sparse_impl.indices = array.clone(uint32_template,
-                                              num_sparse_elements, False)
-            sparse_indices = <uint32_t*> sparse_impl.indices.data.as_voidptr
-            for i in range(num_sparse_elements):
-                self.read_uint32be(&sparse_indices[i])
-            sparse_impl.values = self._decode_values(num_sparse_elements,
-                                                     vector_format)
-            return PY_TYPE_SPARSE_VECTOR._from_impl(sparse_impl)
+    cdef object _decode_sparse(self, uint32_t num_dimensions,
+                               uint8_t vector_format):
+        """
+        Returns a sparse vector containing the decoded indices and values.
+        Only non-zero elements are found in the image.
+        """
+        cdef:
+            SparseVectorImpl sparse_impl
+            array.array uint32_template
+            uint16_t num_sparse_elements
+            uint32_t* sparse_indices
+            uint32_t i
+        sparse_impl = SparseVectorImpl.__new__(SparseVectorImpl)
+        sparse_impl.num_dimensions = num_dimensions
+        self.read_uint16be(&num_sparse_elements)
+        uint32_template = array.array(ARRAY_TYPE_CODE_UINT32)
+        sparse_impl.indices = array.clone(uint32_template,
+                                          num_sparse_elements, False)
+        sparse_indices = <uint32_t*> sparse_impl.indices.data.as_voidptr
+        for i in range(num_sparse_elements):
+            self.read_uint32be(&sparse_indices[i])
+        sparse_impl.values = self._decode_values(num_sparse_elements,
+                                                 vector_format)
+        return PY_TYPE_SPARSE_VECTOR._from_impl(sparse_impl)
 
-        # all other vectors have just the values
+    cdef object decode(self, bytes data):
+        """
+        Returns a Python object corresponding to the encoded VECTOR bytes.
+        """
+        cdef:
+            uint32_t num_elements
+            uint8_t vector_format
+            uint16_t flags
+        self._decode_header(data, &vector_format, &flags, &num_elements)
+        if flags & TNS_VECTOR_FLAG_SPARSE:
+            return self._decode_sparse(num_elements, vector_format)
         return self._decode_values(num_elements, vector_format)
 
+    cdef int decode_to_arrow(self, bytes data,
+                             ArrowArrayImpl array_impl) except -1:
+        """
+        Decodes the encoded VECTOR bytes and appends the result to the Arrow
+        array. The values of dense vectors are decoded directly into the
+        child buffer of the Arrow array so no intermediate Python objects are
+        created.
+        """
+        cdef:
+            uint32_t num_elements
+            uint8_t vector_format
+            ArrowType arrow_type
+            uint16_t flags
+            void *ptr
+        self._decode_header(data, &vector_format, &flags, &num_elements)
+        if flags & TNS_VECTOR_FLAG_SPARSE:
+            return convert_vector_to_arrow(
+                array_impl, self._decode_sparse(num_elements, vector_format)
+            )
+        if vector_format == VECTOR_FORMAT_FLOAT32:
+            arrow_type = NANOARROW_TYPE_FLOAT
+        elif vector_format == VECTOR_FORMAT_FLOAT64:
+            arrow_type = NANOARROW_TYPE_DOUBLE
+        elif vector_format == VECTOR_FORMAT_INT8:
+            arrow_type = NANOARROW_TYPE_INT8
+        elif vector_format == VECTOR_FORMAT_BINARY:
+            arrow_type = NANOARROW_TYPE_UINT8
+            num_elements = num_elements // 8
+        else:
+            errors._raise_err(errors.ERR_VECTOR_FORMAT_NOT_SUPPORTED,
+                              vector_format=vector_format)
+        ptr = array_impl.append_vector_values(arrow_type, num_elements)
+        self._decode_values_into(ptr, num_elements, vector_format)
+
 
 @cython.final
 cdef class VectorEncoder(GrowableBuffer):
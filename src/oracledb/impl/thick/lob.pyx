@@ -215,10 +215,19 @@ cdef class ThickLobImpl(BaseLobImpl):
         """
         cdef:
             StringBuffer buf = StringBuffer()
+            const char_type[::1] view
+            const char *ptr
+            uint64_t length
             int status
-        buf.set_value(value)
+        if isinstance(value, memoryview):
+            view = value
+            ptr = <const char*> &view[0]
+            length = view.shape[0]
+        else:
+            buf.set_value(value)
+            ptr = buf.ptr
+            length = buf.length
         with nogil:
-            status = dpiLob_writeBytes(self._handle, offset, buf.ptr,
-                                       buf.length)
+            status = dpiLob_writeBytes(self._handle, offset, ptr, length)
         if status < 0:
             _raise_from_odpi()
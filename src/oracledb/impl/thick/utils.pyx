@@ -435,6 +435,44 @@ cdef object _convert_vector_to_python(dpiVector *vector):
     return result
 
 
+cdef int _convert_vector_to_arrow(ArrowArrayImpl array_impl,
+                                  dpiVector *vector) except -1:
+    """
+    Converts a vector to the format required by the Arrow array. The values
+    of dense vectors are copied directly into the Arrow array without
+    creating any intermediate Python objects.
+    """
+    cdef:
+        uint32_t num_values, num_bytes
+        dpiVectorInfo vector_info
+        ArrowType arrow_type
+        void *ptr
+    if dpiVector_getValue(vector, &vector_info) < 0:
+        _raise_from_odpi()
+    if vector_info.isSparse:
+        return convert_vector_to_arrow(array_impl,
+                                       _convert_vector_to_python(vector))
+    num_values = vector_info.numDimensions
+    if vector_info.format == DPI_VECTOR_FORMAT_FLOAT32:
+        arrow_type = NANOARROW_TYPE_FLOAT
+        num_bytes = num_values * vector_info.dimensionSize
+    elif vector_info.format == DPI_VECTOR_FORMAT_FLOAT64:
+        arrow_type = NANOARROW_TYPE_DOUBLE
+        num_bytes = num_values * vector_info.dimensionSize
+    elif vector_info.format == DPI_VECTOR_FORMAT_INT8:
+        arrow_type = NANOARROW_TYPE_INT8
+        num_bytes = num_values
+    elif vector_info.format == DPI_VECTOR_FORMAT_BINARY:
+        arrow_type = NANOARROW_TYPE_UINT8
+        num_values = num_values // 8
+        num_bytes = num_values
+    else:
+        errors._raise_err(errors.ERR_VECTOR_FORMAT_NOT_SUPPORTED,
+                          vector_format=vector_info.format)
+    ptr = array_impl.append_vector_values(arrow_type, num_values)
+    memcpy(ptr, vector_info.dimensions.asPtr, num_bytes)
+
+
 cdef list _string_list_to_python(dpiStringList *str_list):
     """
     Converts the contents of dpiStringList to a Python list of strings.
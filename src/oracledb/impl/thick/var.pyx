@@ -438,7 +438,6 @@ cdef class ThickVarImpl(BaseVarImpl):
             OracleNumber *as_number
             OracleData ora_data
             dpiBytes *as_bytes
-            object vector
         ora_data.is_null = data.isNull
         if not data.isNull:
             native_type_num = self.metadata.dbtype._native_num
@@ -453,6 +452,8 @@ cdef class ThickVarImpl(BaseVarImpl):
                 if self._fetch_metadata.dbtype.num == DPI_ORACLE_TYPE_NUMBER:
                     as_number = &ora_data.buffer.as_number
                     as_number.is_max_negative_value = 0;
+                    as_number.has_int64_value = 0;
+                    as_number.has_double_value = 0;
                     as_number.is_integer = \
                             memchr(as_bytes.ptr, b'.', as_bytes.length) == NULL;
                     memcpy(as_number.chars, as_bytes.ptr, as_bytes.length)
@@ -490,8 +491,8 @@ cdef class ThickVarImpl(BaseVarImpl):
                 ora_data.buffer.as_interval_ym.months = \
                         data.value.asIntervalYM.months;
             elif native_type_num == DPI_NATIVE_TYPE_VECTOR:
-                vector = _convert_vector_to_python(data.value.asVector)
-                return convert_vector_to_arrow(self._arrow_array, vector)
+                return _convert_vector_to_arrow(self._arrow_array,
+                                                data.value.asVector)
             else:
                 errors._raise_err(errors.ERR_DB_TYPE_NOT_SUPPORTED,
                                   name=self._fetch_metadata.dbtype.name)
@@ -60,6 +60,7 @@ cdef class BaseThinConnImpl(BaseConnImpl):
 
     cdef:
         StatementCache _statement_cache
+        StatementCacheStats _pool_stmt_cache_stats
         BaseProtocol _protocol
         uint32_t _session_id
         uint16_t _serial_num
@@ -224,6 +225,109 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         message.context = self._transaction_context
         return message
 
+    cdef Message _create_message_for_pipeline_op(
+        self, object conn, PipelineOpImpl op_impl
+    ):
+        """
+        Creates a single message for a pipeline operation.
+        """
+        cdef:
+            BaseThinCursorImpl cursor_impl
+            MessageWithData message
+            uint32_t num_execs = 1
+            object cursor
+        if op_impl.op_type == PIPELINE_OP_TYPE_COMMIT:
+            return self._create_message(CommitMessage)
+        cursor = conn.cursor()
+        cursor_impl = <BaseThinCursorImpl> cursor._impl
+        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
+            execute_args = cursor._call_get_execute_args(
+                op_impl.name,
+                op_impl.parameters,
+                op_impl.keyword_parameters,
+                cursor.var(op_impl.return_type)
+            )
+            cursor._prepare_for_execute(*execute_args)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_CALL_PROC:
+            execute_args = cursor._call_get_execute_args(
+                op_impl.name,
+                op_impl.parameters,
+                op_impl.keyword_parameters
+            )
+            cursor._prepare_for_execute(*execute_args)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
+            op_impl.batch_load_manager = cursor_impl._prepare_for_executemany(
+                cursor,
+                op_impl.statement,
+                op_impl.parameters,
+                2 ** 32 - 1
+            )
+            op_impl.num_execs = op_impl.batch_load_manager.num_rows
+            if not cursor_impl._statement.requires_single_execute():
+                num_execs = op_impl.num_execs
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ONE:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+            cursor_impl.prefetchrows = 1
+            cursor_impl.arraysize = 1
+            cursor_impl.rowfactory = op_impl.rowfactory
+            cursor_impl.fetch_lobs = op_impl.fetch_lobs
+            cursor_impl.fetch_decimals = op_impl.fetch_decimals
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_MANY:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+            cursor_impl.prefetchrows = op_impl.num_rows
+            cursor_impl.arraysize = op_impl.num_rows
+            cursor_impl.rowfactory = op_impl.rowfactory
+            cursor_impl.fetch_lobs = op_impl.fetch_lobs
+            cursor_impl.fetch_decimals = op_impl.fetch_decimals
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ALL:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+            cursor_impl.prefetchrows = op_impl.arraysize
+            cursor_impl.arraysize = op_impl.arraysize
+            cursor_impl.rowfactory = op_impl.rowfactory
+            cursor_impl.fetch_lobs = op_impl.fetch_lobs
+            cursor_impl.fetch_decimals = op_impl.fetch_decimals
+        else:
+            errors._raise_err(errors.ERR_UNSUPPORTED_PIPELINE_OPERATION,
+                              op_type=op_impl.op_type)
+        cursor_impl._preprocess_execute(conn)
+        message = cursor_impl._create_message(ExecuteMessage, cursor)
+        message.num_execs = num_execs
+        return message
+
+    cdef list _create_messages_for_pipeline(
+        self, object conn, list results, bint continue_on_error
+    ):
+        """
+        Creates a list of messages for the pipeline and returns them after they
+        have been submitted to the database for processing.
+        """
+        cdef:
+            PipelineOpResultImpl result_impl
+            PipelineOpImpl op_impl
+            uint64_t token_num
+            Message message
+            object result
+            list messages
+        messages = []
+        token_num = 1
+        for result in results:
+            result_impl = result._impl
+            op_impl = result_impl.operation
+            try:
+                message = self._create_message_for_pipeline_op(conn, op_impl)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                result_impl._capture_err(e)
+                continue
+            message.pipeline_result_impl = result_impl
+            message.token_num = token_num
+            token_num += 1
+            messages.append(message)
+        return messages
+
     cdef Statement _get_statement(self, str sql = None,
                                   bint cache_statement = False):
         """
@@ -253,8 +357,12 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         """
         self._statement_cache = StatementCache.__new__(StatementCache)
         self._statement_cache.initialize(params.stmtcachesize,
-                                         self._max_open_cursors)
+                                         self._max_open_cursors,
+                                         params.adaptive_stmtcache,
+                                         self._pool_stmt_cache_stats)
         self._dbobject_type_cache_num = create_new_dbobject_type_cache(self)
+        if self._result_cache is None and params.result_cache_size > 0:
+            self._result_cache = ResultCacheImpl(params.result_cache_size)
         self.invoke_session_callback = True
         if self._protocol._caps.supports_ha_readiness:
             self._send_ha_readiness = True
@@ -272,6 +380,28 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         """
         self._statement_cache.return_statement(statement)
 
+    cdef int _send_messages_for_pipeline(
+        self, list messages, bint continue_on_error
+    ) except -1:
+        """
+        Sends the messages for the pipeline to the database for processing.
+        When not using asyncio, any responses that have already arrived are
+        read after each message is sent so that the database is not blocked
+        writing responses that the client is not yet reading.
+        """
+        cdef:
+            BaseProtocol protocol = self._protocol
+            Message message
+        for message in messages:
+            try:
+                message.send(protocol._write_buf)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                message.pipeline_result_impl._capture_err(e)
+            if not protocol._transport._is_async:
+                protocol._read_buf.read_available_packets()
+
     cdef TransactionSwitchMessage _start_sessionless_transaction(
         self,
         bytes transaction_id,
@@ -310,6 +440,45 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         impl._conn_impl = self
         return impl
 
+    def create_soda_database_impl(self, conn):
+        cdef BaseThinSodaDbImpl impl
+        if self._protocol._transport._is_async:
+            impl = AsyncThinSodaDbImpl.__new__(AsyncThinSodaDbImpl)
+        else:
+            impl = ThinSodaDbImpl.__new__(ThinSodaDbImpl)
+        impl.supports_json = True
+        impl._conn = conn
+        return impl
+
+    def create_subscr_impl(self, object conn, object callback,
+                           uint32_t namespace, str name, uint32_t protocol,
+                           str ip_address, uint32_t port, uint32_t timeout,
+                           uint32_t operations, uint32_t qos,
+                           uint8_t grouping_class, uint32_t grouping_value,
+                           uint8_t grouping_type, bint client_initiated):
+        cdef BaseThinSubscrImpl impl
+        if self._protocol._transport._is_async:
+            impl = AsyncThinSubscrImpl.__new__(AsyncThinSubscrImpl)
+        else:
+            impl = ThinSubscrImpl.__new__(ThinSubscrImpl)
+        impl.connection = conn
+        impl.callback = callback
+        impl.namespace = namespace
+        impl.name = name
+        impl.protocol = protocol
+        impl.ip_address = ip_address
+        impl.port = port
+        impl.timeout = timeout
+        impl.operations = operations
+        impl.qos = qos
+        impl.grouping_class = grouping_class
+        impl.grouping_value = grouping_value
+        impl.grouping_type = grouping_type
+        if not client_initiated:
+            errors._raise_not_supported("server initiated subscription")
+        impl.client_initiated = client_initiated
+        return impl
+
     def get_call_timeout(self):
         return self._call_timeout
 
@@ -371,6 +540,9 @@ cdef class BaseThinConnImpl(BaseConnImpl):
     def get_service_name(self):
         return self._service_name
 
+    def get_statement_cache_stats(self):
+        return self._statement_cache.get_stats()
+
     def get_stmt_cache_size(self):
         return self._statement_cache._max_size
 
@@ -445,6 +617,13 @@ cdef class BaseThinConnImpl(BaseConnImpl):
     def set_stmt_cache_size(self, uint32_t value):
         self._statement_cache.resize(value)
 
+    def supports_pipelining(self):
+        """
+        Returns whether the connection supports pipelining. Currently this is
+        only supported with Oracle Database version 23, and later.
+        """
+        return self._protocol._caps.supports_pipelining
+
 
 cdef class ThinConnImpl(BaseThinConnImpl):
 
@@ -459,6 +638,101 @@ cdef class ThinConnImpl(BaseThinConnImpl):
         cdef Protocol protocol = <Protocol> self._protocol
         protocol._close(self)
 
+    cdef int _complete_pipeline_op(self, Message message) except -1:
+        """
+        Completes a particular pipeline operation.
+        """
+        cdef:
+            Protocol protocol = <Protocol> self._protocol
+            PipelineOpResultImpl result_impl = message.pipeline_result_impl
+            MessageWithData fetch_message, message_with_data
+            PipelineOpImpl op_impl = result_impl.operation
+            uint8_t op_type = op_impl.op_type
+            ThinCursorImpl cursor_impl
+            BindVar bind_var
+
+        # all operations other than commit make use of a cursor
+        if op_type == PIPELINE_OP_TYPE_COMMIT:
+            return 0
+
+        # keep warning, if applicable
+        message_with_data = <MessageWithData> message
+        result_impl.warning = message_with_data.warning
+
+        # resend the message if that is required (for operations that fetch
+        # LOBS, for example)
+        cursor_impl = <ThinCursorImpl> message_with_data.cursor_impl
+        if message.resend:
+            with protocol._request_lock:
+                protocol._process_message(message)
+        message.postprocess()
+        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
+            bind_var = <BindVar> cursor_impl.bind_vars[0]
+            result_impl.return_value = bind_var.var_impl.get_value(0)
+        elif op_type in (
+            PIPELINE_OP_TYPE_FETCH_ONE,
+            PIPELINE_OP_TYPE_FETCH_MANY,
+            PIPELINE_OP_TYPE_FETCH_ALL,
+        ):
+            result_impl.rows = []
+            while cursor_impl._buffer_rowcount > 0:
+                result_impl.rows.append(cursor_impl._create_row())
+        result_impl.fetch_metadata = cursor_impl.fetch_metadata
+
+        # for fetchall(), perform as many round trips as are required to
+        # complete the fetch
+        if op_type == PIPELINE_OP_TYPE_FETCH_ALL \
+                and cursor_impl._more_rows_to_fetch:
+            fetch_message = cursor_impl._create_message(
+                FetchMessage, message_with_data.cursor
+            )
+            while cursor_impl._more_rows_to_fetch:
+                protocol._process_single_message(fetch_message)
+                while cursor_impl._buffer_rowcount > 0:
+                    result_impl.rows.append(cursor_impl._create_row())
+
+        # for PL/SQL blocks that required a single execute, perform any
+        # remaining executes now
+        if op_type == PIPELINE_OP_TYPE_EXECUTE_MANY \
+                and message_with_data.num_execs < op_impl.num_execs:
+            with protocol._request_lock:
+                while op_impl.num_execs > 0:
+                    op_impl.num_execs -= 1
+                    message_with_data.offset += 1
+                    if not cursor_impl._statement.requires_single_execute():
+                        break
+                    protocol._process_message(message)
+                if op_impl.num_execs > 0:
+                    message_with_data.num_execs = op_impl.num_execs
+                    protocol._process_message(message)
+
+        # populate the metadata for any partial types observed during the
+        # execution of the pipeline
+        if message_with_data.type_cache is not None:
+            conn = message_with_data.cursor.connection
+            message_with_data.type_cache.populate_partial_types(conn)
+
+    cdef int _complete_pipeline_ops(self, list messages,
+                                    bint continue_on_error) except -1:
+        """
+        Completes any pipeline operations that have not actually completed.
+        This could be due to the fact that LOBs were fetched or a fetch all
+        operation has more rows to fetch.
+        """
+        cdef:
+            PipelineOpResultImpl result_impl
+            Message message
+        for message in messages:
+            result_impl = message.pipeline_result_impl
+            if result_impl.error is not None:
+                continue
+            try:
+                self._complete_pipeline_op(message)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                result_impl._capture_err(e)
+
     cdef int _connect_with_address(self, Address address,
                                    Description description,
                                    ConnectParamsImpl params,
@@ -541,6 +815,52 @@ cdef class ThinConnImpl(BaseThinConnImpl):
         """
         return ThinCursorImpl.__new__(ThinCursorImpl, self)
 
+    cdef int _run_pipeline_op_without_pipelining(
+        self, object conn, PipelineOpResultImpl result_impl
+    ) except -1:
+        """
+        Runs a pipeline operation without the use of pipelining.
+        """
+        cdef:
+            PipelineOpImpl op_impl = result_impl.operation
+            object cursor
+        if op_impl.op_type == PIPELINE_OP_TYPE_COMMIT:
+            conn.commit()
+            return 0
+        cursor = conn.cursor()
+        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
+            result_impl.return_value = cursor.callfunc(
+                op_impl.name,
+                op_impl.return_type,
+                op_impl.parameters,
+                op_impl.keyword_parameters,
+            )
+        elif op_impl.op_type == PIPELINE_OP_TYPE_CALL_PROC:
+            cursor.callproc(
+                op_impl.name, op_impl.parameters, op_impl.keyword_parameters
+            )
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
+            cursor.executemany(op_impl.statement, op_impl.parameters)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ALL:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+            cursor.rowfactory = op_impl.rowfactory
+            result_impl.rows = cursor.fetchall()
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_MANY:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+            cursor.rowfactory = op_impl.rowfactory
+            result_impl.rows = cursor.fetchmany(op_impl.num_rows)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ONE:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+            cursor.rowfactory = op_impl.rowfactory
+            result_impl.rows = cursor.fetchmany(1)
+        else:
+            errors._raise_err(errors.ERR_UNSUPPORTED_PIPELINE_OPERATION,
+                              op_type=op_impl.op_type)
+        result_impl.warning = cursor.warning
+        result_impl.fetch_metadata = cursor._impl.fetch_metadata
+
     def begin_sessionless_transaction(
         self,
         bytes transaction_id,
@@ -601,31 +921,6 @@ cdef class ThinConnImpl(BaseThinConnImpl):
     def create_queue_impl(self):
         return ThinQueueImpl.__new__(ThinQueueImpl)
 
-    def create_subscr_impl(self, object conn, object callback,
-                           uint32_t namespace, str name, uint32_t protocol,
-                           str ip_address, uint32_t port, uint32_t timeout,
-                           uint32_t operations, uint32_t qos,
-                           uint8_t grouping_class, uint32_t grouping_value,
-                           uint8_t grouping_type, bint client_initiated):
-        cdef ThinSubscrImpl impl = ThinSubscrImpl.__new__(ThinSubscrImpl)
-        impl.connection = conn
-        impl.callback = callback
-        impl.namespace = namespace
-        impl.name = name
-        impl.protocol = protocol
-        impl.ip_address = ip_address
-        impl.port = port
-        impl.timeout = timeout
-        impl.operations = operations
-        impl.qos = qos
-        impl.grouping_class = grouping_class
-        impl.grouping_value = grouping_value
-        impl.grouping_type = grouping_type
-        if not client_initiated:
-            errors._raise_not_supported("server initiated subscription")
-        impl.client_initiated = client_initiated
-        return impl
-
     def create_temp_lob_impl(self, DbType dbtype):
         cdef ThinLobImpl lob_impl = self._create_lob_impl(dbtype)
         lob_impl.create_temp()
@@ -707,6 +1002,66 @@ cdef class ThinConnImpl(BaseThinConnImpl):
         message = self._create_message(RollbackMessage)
         protocol._process_single_message(message)
 
+    def run_pipeline_with_pipelining(
+        self, object conn, list results, bint continue_on_error
+    ):
+        """
+        Run the pipeline with pipelining when the database supports it. The
+        request lock is held while the messages are sent and their responses
+        are processed so that no other thread can use the connection during
+        that time. Call timeouts are disabled for consistency with asyncio.
+        """
+        cdef:
+            Protocol protocol = <Protocol> self._protocol
+            Transport transport
+            list messages
+        messages = self._create_messages_for_pipeline(
+            conn, results, continue_on_error
+        )
+        if messages:
+            with protocol._request_lock:
+                transport = protocol._transport
+                if self._call_timeout > 0:
+                    transport.set_timeout(0)
+                try:
+                    protocol.begin_pipeline()
+                    if continue_on_error:
+                        self.pipeline_mode = \
+                                TNS_PIPELINE_MODE_CONTINUE_ON_ERROR
+                    else:
+                        self.pipeline_mode = TNS_PIPELINE_MODE_ABORT_ON_ERROR
+                    try:
+                        self._send_messages_for_pipeline(messages,
+                                                         continue_on_error)
+                    except:
+                        protocol.abort_pipeline()
+                        raise
+                    protocol.end_pipeline(self, messages, continue_on_error)
+                finally:
+                    if self._call_timeout > 0 \
+                            and transport._transport is not None:
+                        transport.set_timeout(self._call_timeout / 1000)
+            self._complete_pipeline_ops(messages, continue_on_error)
+
+    def run_pipeline_without_pipelining(
+        self, object conn, list results, bint continue_on_error
+    ):
+        """
+        Run the pipeline without pipelining when the database doesn't support
+        pipelining.
+        """
+        cdef:
+            PipelineOpResultImpl result_impl
+            object result
+        for result in results:
+            result_impl = result._impl
+            try:
+                self._run_pipeline_op_without_pipelining(conn, result_impl)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                result_impl._capture_err(e)
+
     def set_call_timeout(self, uint32_t value):
         self._protocol._transport.set_timeout(value / 1000)
         self._call_timeout = value
@@ -967,109 +1322,6 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
             if not self._protocol._in_connect:
                 break
 
-    cdef Message _create_message_for_pipeline_op(
-        self, object conn, PipelineOpImpl op_impl
-    ):
-        """
-        Creates a single message for a pipeline operation.
-        """
-        cdef:
-            AsyncThinCursorImpl cursor_impl
-            MessageWithData message
-            uint32_t num_execs = 1
-            object cursor
-        if op_impl.op_type == PIPELINE_OP_TYPE_COMMIT:
-            return self._create_message(CommitMessage)
-        cursor = conn.cursor()
-        cursor_impl = <AsyncThinCursorImpl> cursor._impl
-        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
-            execute_args = cursor._call_get_execute_args(
-                op_impl.name,
-                op_impl.parameters,
-                op_impl.keyword_parameters,
-                cursor.var(op_impl.return_type)
-            )
-            cursor._prepare_for_execute(*execute_args)
-        elif op_impl.op_type == PIPELINE_OP_TYPE_CALL_PROC:
-            execute_args = cursor._call_get_execute_args(
-                op_impl.name,
-                op_impl.parameters,
-                op_impl.keyword_parameters
-            )
-            cursor._prepare_for_execute(*execute_args)
-        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
-            op_impl.batch_load_manager = cursor_impl._prepare_for_executemany(
-                cursor,
-                op_impl.statement,
-                op_impl.parameters,
-                2 ** 32 - 1
-            )
-            op_impl.num_execs = op_impl.batch_load_manager.num_rows
-            if not cursor_impl._statement.requires_single_execute():
-                num_execs = op_impl.num_execs
-        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ONE:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-            cursor_impl.prefetchrows = 1
-            cursor_impl.arraysize = 1
-            cursor_impl.rowfactory = op_impl.rowfactory
-            cursor_impl.fetch_lobs = op_impl.fetch_lobs
-            cursor_impl.fetch_decimals = op_impl.fetch_decimals
-        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_MANY:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-            cursor_impl.prefetchrows = op_impl.num_rows
-            cursor_impl.arraysize = op_impl.num_rows
-            cursor_impl.rowfactory = op_impl.rowfactory
-            cursor_impl.fetch_lobs = op_impl.fetch_lobs
-            cursor_impl.fetch_decimals = op_impl.fetch_decimals
-        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ALL:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-            cursor_impl.prefetchrows = op_impl.arraysize
-            cursor_impl.arraysize = op_impl.arraysize
-            cursor_impl.rowfactory = op_impl.rowfactory
-            cursor_impl.fetch_lobs = op_impl.fetch_lobs
-            cursor_impl.fetch_decimals = op_impl.fetch_decimals
-        else:
-            errors._raise_err(errors.ERR_UNSUPPORTED_PIPELINE_OPERATION,
-                              op_type=op_impl.op_type)
-        cursor_impl._preprocess_execute(conn)
-        message = cursor_impl._create_message(ExecuteMessage, cursor)
-        message.num_execs = num_execs
-        return message
-
-    cdef list _create_messages_for_pipeline(
-        self, object conn, list results, bint continue_on_error
-    ):
-        """
-        Creates a list of messages for the pipeline and returns them after they
-        have been submitted to the database for processing.
-        """
-        cdef:
-            PipelineOpResultImpl result_impl
-            PipelineOpImpl op_impl
-            uint64_t token_num
-            Message message
-            object result
-            list messages
-        messages = []
-        token_num = 1
-        for result in results:
-            result_impl = result._impl
-            op_impl = result_impl.operation
-            try:
-                message = self._create_message_for_pipeline_op(conn, op_impl)
-            except Exception as e:
-                if not continue_on_error:
-                    raise
-                result_impl._capture_err(e)
-                continue
-            message.pipeline_result_impl = result_impl
-            message.token_num = token_num
-            token_num += 1
-            messages.append(message)
-        return messages
-
     async def _run_pipeline_op_without_pipelining(
         self, object conn, PipelineOpResultImpl result_impl
     ):
@@ -1116,23 +1368,6 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
         result_impl.warning = cursor.warning
         result_impl.fetch_metadata = cursor._impl.fetch_metadata
 
-    cdef int _send_messages_for_pipeline(
-        self, list messages, bint continue_on_error
-    ) except -1:
-        """
-        Sends the messages for the pipeline to the database for processing.
-        """
-        cdef:
-            BaseAsyncProtocol protocol = <BaseAsyncProtocol> self._protocol
-            Message message
-        for message in messages:
-            try:
-                message.send(protocol._write_buf)
-            except Exception as e:
-                if not continue_on_error:
-                    raise
-                message.pipeline_result_impl._capture_err(e)
-
     async def begin_sessionless_transaction(
         self,
         bytes transaction_id,
@@ -1334,13 +1569,6 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
     def set_call_timeout(self, uint32_t value):
         self._call_timeout = value
 
-    def supports_pipelining(self):
-        """
-        Returns whether the connection supports pipelining. Currently this is
-        only supported with asyncio and Oracle Database version 23, and later.
-        """
-        return self._protocol._caps.supports_pipelining
-
     async def suspend_sessionless_transaction(self):
         cdef:
             BaseAsyncProtocol protocol = <BaseAsyncProtocol> self._protocol
@@ -728,6 +728,10 @@ cdef bytearray TNS_BASE64_ALPHABET_ARRAY = \
         bytearray(TNS_BASE64_ALPHABET)
 cdef bytes TNS_EXTENT_OID = bytes.fromhex('00000000000000000000000000010001')
 
+# number of worker threads used to invoke subscription callbacks
+cdef enum:
+    NOTIFICATION_NUM_WORKERS = 4
+
 # drcp release mode
 cdef enum:
     DRCP_DEAUTHENTICATE = 0x00000002
@@ -48,11 +48,59 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
     def __cinit__(self, conn_impl):
         self._conn_impl = conn_impl
 
+    cdef bint _can_pipeline_executemany(self, BatchLoadManager manager):
+        """
+        Returns a boolean indicating if the next batch of a call to
+        executemany() can be sent to the database as part of a pipeline. The
+        database must support pipelining and the statement must be a DML
+        statement that has already been executed (so that its cursor is known)
+        and that does not return any data. LOBs cannot be bound since creating
+        a temporary LOB requires a round trip.
+        """
+        cdef:
+            Statement stmt = self._statement
+            BindVar bind_var
+            uint8_t ora_type_num
+        if manager.num_rows == 0 \
+                or not self._conn_impl._protocol._caps.supports_pipelining \
+                or not stmt._is_dml \
+                or stmt._is_returning \
+                or stmt._cursor_id == 0 \
+                or self.suspend_on_success:
+            return False
+        if self.bind_vars is not None:
+            for bind_var in self.bind_vars:
+                if bind_var is None or bind_var.var_impl is None:
+                    continue
+                ora_type_num = bind_var.var_impl.metadata.dbtype._ora_type_num
+                if ora_type_num in (ORA_TYPE_NUM_BLOB, ORA_TYPE_NUM_CLOB):
+                    return False
+        return True
+
     cdef int _close(self, bint in_del) except -1:
         if self._statement is not None:
             self._conn_impl._return_statement(self._statement)
             self._statement = None
 
+    cdef int64_t _complete_fetch_into_round_trip(self, list fetch_bufs,
+                                                 int64_t offset) except -1:
+        """
+        Called after a round trip fetching rows into the buffers supplied by
+        the caller. The Arrow arrays wrapping the buffers are finished, the
+        null masks (if any) are populated and the number of rows fetched is
+        returned.
+        """
+        cdef:
+            ArrowArrayImpl array_impl = None
+            FetchIntoBuffer fetch_buf
+            ThinVarImpl var_impl
+            ssize_t i
+        for i, var_impl in enumerate(self.fetch_var_impls):
+            fetch_buf = fetch_bufs[i]
+            array_impl = var_impl._finish_building_arrow_array()
+            fetch_buf.finish_array_impl(array_impl, offset)
+        return array_impl.arrow_array.length
+
     cdef MessageWithData _create_message(self, type typ, object cursor):
         """
         Creates a message object that is used to send a request to the database
@@ -77,6 +125,29 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
             message.fetch_pos = self.rowcount + 1
         return message
 
+    cdef ExecuteMessage _create_executemany_message(
+        self,
+        object cursor,
+        BatchLoadManager manager,
+        bint batcherrors,
+        bint arraydmlrowcounts,
+        uint64_t token_num,
+    ):
+        """
+        Creates and returns the message used to execute the current batch of a
+        call to executemany() as part of a pipeline.
+        """
+        cdef ExecuteMessage message
+        self._preprocess_execute(cursor.connection)
+        message = self._create_message(ExecuteMessage, cursor)
+        message.num_execs = manager.num_rows
+        message.batcherrors = batcherrors
+        message.arraydmlrowcounts = arraydmlrowcounts
+        message.offset = <uint32_t> manager.message_offset
+        message.token_num = token_num
+        message.preprocess()
+        return message
+
     cdef ExecuteMessage _create_scroll_message(self, object cursor,
                                                object mode, int32_t offset):
         """
@@ -178,8 +249,39 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
         self.fetch_var_impls = self._statement._fetch_var_impls
         self._num_columns = self._statement._num_columns
 
+    cdef int _prepare_fetch_into(self, object cursor,
+                                 list fetch_bufs) except -1:
+        """
+        Called after a query has been executed in order to fetch its rows into
+        the buffers supplied by the caller. The fetch variables are recreated
+        using Arrow schemas that match the format of each of the buffers.
+        """
+        cdef:
+            ssize_t i, num_columns = len(self.fetch_var_impls)
+            FetchIntoBuffer fetch_buf
+            ThinVarImpl var_impl
+        if len(fetch_bufs) != num_columns:
+            errors._raise_err(errors.ERR_WRONG_NUMBER_OF_FETCH_BUFFERS,
+                              num_buffers=len(fetch_bufs),
+                              num_fetched_columns=num_columns)
+        self.schema_impl = ArrowSchemaImpl.__new__(ArrowSchemaImpl)
+        self.schema_impl.child_schemas = []
+        for i, var_impl in enumerate(self.fetch_var_impls):
+            fetch_buf = fetch_bufs[i]
+            fetch_buf.populate_schema_impl(var_impl._fetch_metadata)
+            self.schema_impl.child_schemas.append(fetch_buf.schema_impl)
+        for i, var_impl in enumerate(self.fetch_var_impls):
+            self._create_fetch_var(cursor.connection, cursor, None, False, i,
+                                   var_impl._fetch_metadata)
+        self._statement._last_schema_impl = self.schema_impl
+
     cdef int _preprocess_execute(self, object conn) except -1:
         cdef BindInfo bind_info
+        if self._cached_rows is not None:
+            self._cached_rows = None
+            self.fetch_metadata = self._statement._fetch_metadata
+            self.fetch_vars = self._statement._fetch_vars
+            self.fetch_var_impls = self._statement._fetch_var_impls
         if self.bind_vars is not None:
             self._perform_binds(conn, 0)
         for bind_info in self._statement._bind_info_list:
@@ -209,6 +311,18 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
             self._buffer_max_row = self._buffer_min_row + self._buffer_rowcount
             self._buffer_index = 0
 
+    cdef int _release_fetch_into_buffers(self) except -1:
+        """
+        Releases any Arrow arrays that refer to the buffers supplied by the
+        caller so that the buffers are not retained by the statement cache.
+        """
+        cdef ThinVarImpl var_impl
+        if self.fetch_var_impls is not None:
+            for var_impl in self.fetch_var_impls:
+                var_impl._arrow_array = None
+                var_impl._last_arrow_array = None
+                var_impl._saved_arrow_array = None
+
     cdef int _set_fetch_array_size(self, uint32_t value):
         """
         Internal method for setting the fetch array size. This also ensures
@@ -227,6 +341,25 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
                 var_impl.num_elements = self._fetch_array_size
                 var_impl._values.extend([None] * num_vals)
 
+    cdef int _start_fetch_into_round_trip(self, list fetch_bufs,
+                                          int64_t offset,
+                                          uint32_t num_rows) except -1:
+        """
+        Called before a round trip fetching rows into the buffers supplied by
+        the caller. The Arrow arrays of the fetch variables are replaced with
+        arrays that append directly to the buffers, starting at the given
+        offset, and the number of rows fetched is limited to the given value
+        so that the space remaining in the buffers is not exceeded.
+        """
+        cdef:
+            FetchIntoBuffer fetch_buf
+            ThinVarImpl var_impl
+            ssize_t i
+        for i, var_impl in enumerate(self.fetch_var_impls):
+            fetch_buf = fetch_bufs[i]
+            var_impl._arrow_array = fetch_buf.create_array_impl(offset)
+        self.arraysize = num_rows
+
     def get_array_dml_row_counts(self):
         if self._dmlrowcounts is None:
             errors._raise_err(errors.ERR_ARRAY_DML_ROW_COUNTS_NOT_ENABLED)
@@ -274,6 +407,8 @@ cdef class ThinCursorImpl(BaseThinCursorImpl):
             Protocol protocol = <Protocol> self._conn_impl._protocol
             object conn = cursor.connection
             MessageWithData message
+        if self._statement._is_query and self._check_result_cache(cursor):
+            return
         self._preprocess_execute(conn)
         message = self._create_execute_message(cursor)
         protocol._process_single_message(message)
@@ -319,6 +454,106 @@ cdef class ThinCursorImpl(BaseThinCursorImpl):
             protocol._process_single_message(message)
         self.warning = message.warning
 
+    def executemany_with_pipelining(self, object cursor,
+                                    BatchLoadManager manager,
+                                    bint batcherrors, bint arraydmlrowcounts,
+                                    uint32_t pipeline_depth):
+        """
+        Internal method used for executing the remaining batches of a call to
+        executemany() using a pipeline. Up to the specified number of batches
+        are sent to the database before the response to the oldest of them is
+        processed, so that each batch is encoded and sent while the previous
+        ones are being executed. This continues until all batches have been
+        executed or the next batch cannot be pipelined. The request lock is
+        held and call timeouts are disabled while the pipeline is in progress,
+        as is done by run_pipeline().
+        """
+        cdef:
+            Protocol protocol = <Protocol> self._conn_impl._protocol
+            BaseThinConnImpl conn_impl = self._conn_impl
+            ssize_t num_responses_to_discard = 0
+            ExecuteMessage message = None
+            uint64_t token_num = 0
+            list messages = []
+            Transport transport
+        if not self._can_pipeline_executemany(manager):
+            return
+        with protocol._request_lock:
+            transport = protocol._transport
+            if conn_impl._call_timeout > 0:
+                transport.set_timeout(0)
+            try:
+                protocol.begin_pipeline()
+                conn_impl.pipeline_mode = TNS_PIPELINE_MODE_ABORT_ON_ERROR
+                try:
+                    while self._can_pipeline_executemany(manager):
+                        token_num += 1
+                        message = self._create_executemany_message(
+                            cursor, manager, batcherrors, arraydmlrowcounts,
+                            token_num
+                        )
+                        message.send(protocol._write_buf)
+                        messages.append(message)
+                        num_responses_to_discard += 1
+                        manager.next_batch()
+                        protocol._read_buf.read_available_packets()
+                        if len(messages) == pipeline_depth:
+                            message = messages.pop(0)
+                            protocol.process_pipeline_response(conn_impl,
+                                                               message)
+                            num_responses_to_discard -= 1
+                            self.warning = message.warning
+                            message._check_and_raise_exception()
+                except:
+                    if conn_impl.pipeline_mode != 0:
+                        conn_impl.pipeline_mode = 0
+                        protocol.abort_pipeline()
+                    else:
+                        protocol.discard_pipeline(conn_impl,
+                                                  num_responses_to_discard)
+                    raise
+                protocol.end_pipeline(conn_impl, messages, False)
+                if messages:
+                    self.warning = (<Message> messages[-1]).warning
+            finally:
+                if conn_impl._call_timeout > 0 \
+                        and transport._transport is not None:
+                    transport.set_timeout(conn_impl._call_timeout / 1000)
+
+    def fetch_into(self, cursor, object buffers, object null_masks,
+                   uint32_t arraysize):
+        """
+        Internal method used for fetching rows directly into the buffers
+        supplied by the caller. The number of rows placed in the buffers is
+        returned each time they have been filled (or all rows have been
+        fetched).
+        """
+        cdef:
+            list fetch_bufs = FetchIntoBuffer.create_all(buffers, null_masks)
+            int64_t num_elements, num_rows
+            bint returned = False
+            uint32_t num_to_fetch
+        try:
+            self._prepare_fetch_into(cursor, fetch_bufs)
+            num_elements = (<FetchIntoBuffer> fetch_bufs[0]).num_elements
+            while True:
+                num_rows = 0
+                while num_rows < num_elements and self._more_rows_to_fetch:
+                    num_to_fetch = min(arraysize, num_elements - num_rows)
+                    self._start_fetch_into_round_trip(fetch_bufs, num_rows,
+                                                      num_to_fetch)
+                    self._fetch_rows(cursor)
+                    num_rows += self._complete_fetch_into_round_trip(
+                        fetch_bufs, num_rows
+                    )
+                if num_rows > 0 or not returned:
+                    returned = True
+                    yield num_rows
+                if not self._more_rows_to_fetch:
+                    break
+        finally:
+            self._release_fetch_into_buffers()
+
     def parse(self, cursor):
         cdef:
             Protocol protocol = <Protocol> self._conn_impl._protocol
@@ -387,6 +622,8 @@ cdef class AsyncThinCursorImpl(BaseThinCursorImpl):
             BaseAsyncProtocol protocol
             MessageWithData message
         protocol = <BaseAsyncProtocol> self._conn_impl._protocol
+        if self._statement._is_query and self._check_result_cache(cursor):
+            return
         await self._preprocess_execute_async(conn)
         message = self._create_execute_message(cursor)
         await protocol._process_single_message(message)
@@ -434,6 +671,63 @@ cdef class AsyncThinCursorImpl(BaseThinCursorImpl):
             await protocol._process_single_message(message)
         self.warning = message.warning
 
+    async def executemany_with_pipelining(self, object cursor,
+                                          BatchLoadManager manager,
+                                          bint batcherrors,
+                                          bint arraydmlrowcounts,
+                                          uint32_t pipeline_depth):
+        """
+        Internal method used for executing the remaining batches of a call to
+        executemany() using a pipeline. Up to the specified number of batches
+        are sent to the database before the response to the oldest of them is
+        processed, so that each batch is encoded and sent while the previous
+        ones are being executed. This continues until all batches have been
+        executed or the next batch cannot be pipelined.
+        """
+        cdef:
+            BaseAsyncProtocol protocol
+            BaseThinConnImpl conn_impl = self._conn_impl
+            ssize_t num_responses_to_discard = 0
+            ExecuteMessage message = None
+            uint64_t token_num = 0
+            list messages = []
+        if not self._can_pipeline_executemany(manager):
+            return
+        protocol = <BaseAsyncProtocol> conn_impl._protocol
+        async with protocol._request_lock:
+            protocol._read_buf.reset_packets()
+            protocol._read_buf._in_pipeline = True
+            conn_impl.pipeline_mode = TNS_PIPELINE_MODE_ABORT_ON_ERROR
+            try:
+                while self._can_pipeline_executemany(manager):
+                    token_num += 1
+                    message = self._create_executemany_message(
+                        cursor, manager, batcherrors, arraydmlrowcounts,
+                        token_num
+                    )
+                    message.send(protocol._write_buf)
+                    messages.append(message)
+                    num_responses_to_discard += 1
+                    manager.next_batch()
+                    if len(messages) == pipeline_depth:
+                        message = messages.pop(0)
+                        await protocol.process_pipeline_response(conn_impl,
+                                                                 message)
+                        num_responses_to_discard -= 1
+                        self.warning = message.warning
+                        message._check_and_raise_exception()
+            except:
+                if conn_impl.pipeline_mode != 0:
+                    conn_impl.pipeline_mode = 0
+                    protocol._read_buf._in_pipeline = False
+                else:
+                    await protocol.discard_pipeline(conn_impl,
+                                                    num_responses_to_discard)
+                raise
+            await protocol.end_pipeline(conn_impl, messages, False)
+            if messages:
+                self.warning = (<Message> messages[-1]).warning
+
     async def fetch_df_all(self, cursor):
         """
         Internal method used for fetching all data as DataFrame
@@ -455,6 +749,40 @@ cdef class AsyncThinCursorImpl(BaseThinCursorImpl):
             if self._buffer_rowcount > 0:
                 yield self._finish_building_arrow_arrays()
 
+    async def fetch_into(self, cursor, object buffers, object null_masks,
+                         uint32_t arraysize):
+        """
+        Internal method used for fetching rows directly into the buffers
+        supplied by the caller. The number of rows placed in the buffers is
+        returned each time they have been filled (or all rows have been
+        fetched).
+        """
+        cdef:
+            list fetch_bufs = FetchIntoBuffer.create_all(buffers, null_masks)
+            int64_t num_elements, num_rows
+            bint returned = False
+            uint32_t num_to_fetch
+        try:
+            self._prepare_fetch_into(cursor, fetch_bufs)
+            num_elements = (<FetchIntoBuffer> fetch_bufs[0]).num_elements
+            while True:
+                num_rows = 0
+                while num_rows < num_elements and self._more_rows_to_fetch:
+                    num_to_fetch = min(arraysize, num_elements - num_rows)
+                    self._start_fetch_into_round_trip(fetch_bufs, num_rows,
+                                                      num_to_fetch)
+                    await self._fetch_rows_async(cursor)
+                    num_rows += self._complete_fetch_into_round_trip(
+                        fetch_bufs, num_rows
+                    )
+                if num_rows > 0 or not returned:
+                    returned = True
+                    yield num_rows
+                if not self._more_rows_to_fetch:
+                    break
+        finally:
+            self._release_fetch_into_buffers()
+
     async def fetch_next_row(self, cursor):
         """
         Internal method used for fetching the next row from a cursor.
@@ -463,6 +791,7 @@ cdef class AsyncThinCursorImpl(BaseThinCursorImpl):
             await self._fetch_rows_async(cursor)
         if self._buffer_rowcount > 0:
             return self._create_row()
+        self._add_result_cache_entry()
 
     async def parse(self, cursor):
         cdef:
@@ -67,6 +67,10 @@ cdef str DBO_CACHE_SQL_GET_METADATA_FOR_NAME = """
             end if;
         end;"""
 
+cdef str DBO_CACHE_SQL_GET_DB_ID = """
+        select sys_context('userenv', 'con_dbid')
+        from dual"""
+
 cdef str DBO_CACHE_SQL_GET_COLUMNS = """
         select
             column_name,
@@ -132,6 +136,180 @@ cdef str DBO_CACHE_SQL_GET_ELEM_OBJTYPE_NO_PACKAGE = """
         where owner = :owner
           and type_name = :name"""
 
+cdef class DbObjectTypeMetadata:
+    """
+    Holds the information returned by the database when looking up a type. It
+    does not depend on the connection that performed the lookup so it can be
+    shared by all connections to the same database and used to populate the
+    connection-specific type objects without any round trips.
+    """
+    cdef:
+        bytes oid
+        int version
+        bytes tds
+        str schema
+        str package_name
+        str name
+        bint is_row_type
+        list attrs
+        str element_type_name
+        tuple element_objtype
+
+    cdef dict to_dict(self):
+        """
+        Returns the metadata as a dictionary suitable for storing as JSON.
+        """
+        cdef list attrs = []
+        for row in self.attrs:
+            attrs.append([{"hex": v.hex()} if isinstance(v, bytes) else v
+                          for v in row])
+        return dict(oid=self.oid.hex() if self.oid is not None else None,
+                    version=self.version,
+                    tds=self.tds.hex() if self.tds is not None else None,
+                    schema=self.schema, package_name=self.package_name,
+                    name=self.name, is_row_type=self.is_row_type,
+                    attrs=attrs, element_type_name=self.element_type_name,
+                    element_objtype=self.element_objtype)
+
+    @staticmethod
+    cdef DbObjectTypeMetadata from_dict(dict data):
+        """
+        Creates the metadata from a dictionary created by to_dict().
+        """
+        cdef:
+            DbObjectTypeMetadata metadata
+            object oid, tds, element_objtype
+        metadata = DbObjectTypeMetadata.__new__(DbObjectTypeMetadata)
+        oid = data["oid"]
+        if oid is not None:
+            metadata.oid = bytes.fromhex(oid)
+        metadata.version = data["version"]
+        tds = data["tds"]
+        if tds is not None:
+            metadata.tds = bytes.fromhex(tds)
+        metadata.schema = data["schema"]
+        metadata.package_name = data["package_name"]
+        metadata.name = data["name"]
+        metadata.is_row_type = data["is_row_type"]
+        metadata.attrs = [
+            tuple(bytes.fromhex(v["hex"]) if isinstance(v, dict) else v
+                  for v in row)
+            for row in data["attrs"]
+        ]
+        metadata.element_type_name = data["element_type_name"]
+        element_objtype = data["element_objtype"]
+        if element_objtype is not None:
+            metadata.element_objtype = tuple(element_objtype)
+        return metadata
+
+
+cdef class DbObjectTypeMetadataCache:
+    """
+    Process-wide cache of type metadata. Entries are keyed by the database,
+    the type OID and the type version. An additional index allows entries to
+    be found by the name used to look up the type. Since the resolution of a
+    name depends on the privileges of the user that performed the lookup, the
+    name index includes the user name.
+    """
+    cdef:
+        object lock
+        dict entries
+        dict entries_by_name
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.entries_by_name = {}
+
+    cdef int add_entry(self, tuple db_key, str user, str name,
+                       DbObjectTypeMetadata metadata) except -1:
+        """
+        Adds an entry to the cache. If the user is not known, the name index
+        is not updated.
+        """
+        with self.lock:
+            self.entries[db_key, metadata.oid, metadata.version] = metadata
+            if user is not None:
+                self.entries_by_name[db_key, user, name] = metadata
+
+    cdef int clear(self) except -1:
+        """
+        Removes all entries from the cache.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.entries_by_name.clear()
+
+    cdef DbObjectTypeMetadata get_entry(self, tuple db_key, str user,
+                                        str name, bytes oid, int version):
+        """
+        Returns the entry for the given OID and version (if both are known) or
+        the given name, or None if no such entry exists. An entry for the same
+        OID but a different version is never returned since the type has been
+        altered in the meantime.
+        """
+        with self.lock:
+            if oid is not None and version != 0:
+                return self.entries.get((db_key, oid, version))
+            elif user is not None:
+                return self.entries_by_name.get((db_key, user, name))
+
+    cdef int load(self, str file_name) except -1:
+        """
+        Loads entries from a file created by save(). Entries already present
+        in the cache are replaced.
+        """
+        cdef:
+            DbObjectTypeMetadata metadata
+            tuple db_key
+            object data
+            str text
+        with open(file_name, "r", encoding="utf-8") as f:
+            text = f.read()
+        try:
+            data = json.loads(text)
+            if data["format"] != 2:
+                raise ValueError()
+            for entry in data["entries"]:
+                db_key = tuple(entry["db_key"])
+                metadata = DbObjectTypeMetadata.from_dict(entry["metadata"])
+                self.add_entry(db_key, None, None, metadata)
+                for user, name in entry["names"]:
+                    self.add_entry(db_key, user, name, metadata)
+        except (KeyError, TypeError, ValueError):
+            errors._raise_err(errors.ERR_INVALID_DBOBJECT_TYPE_CACHE_FILE,
+                              file_name=file_name)
+
+    cdef int save(self, str file_name) except -1:
+        """
+        Saves the entries in the cache to the given file. The file is written
+        to a temporary location first and then renamed so that processes
+        loading the file never see a partially written snapshot.
+        """
+        cdef:
+            DbObjectTypeMetadata metadata
+            dict names = {}
+            list entries = []
+            str temp_name
+        with self.lock:
+            for (db_key, user, name), metadata in \
+                    self.entries_by_name.items():
+                names.setdefault((db_key, metadata.oid, metadata.version),
+                                 []).append([user, name])
+            for key, metadata in self.entries.items():
+                entries.append(dict(db_key=key[0], metadata=metadata.to_dict(),
+                                    names=names.get(key, [])))
+        temp_name = f"{file_name}.{os.getpid()}.tmp"
+        with open(temp_name, "w", encoding="utf-8") as f:
+            json.dump(dict(format=2, entries=entries), f)
+        os.replace(temp_name, file_name)
+
+
+# global cache of type metadata shared by all connections
+cdef DbObjectTypeMetadataCache dbobject_type_metadata_cache = \
+        DbObjectTypeMetadataCache()
+
+
 cdef class ThinDbObjectTypeSuperCache:
     cdef:
         dict caches
@@ -151,6 +329,8 @@ cdef class BaseThinDbObjectTypeCache:
         object return_value_var, full_name_var, oid_var, tds_var
         object schema_var, package_name_var, name_var
         BaseThinConnImpl conn_impl
+        tuple db_key
+        str user
         dict types_by_oid
         dict types_by_name
         list partial_types
@@ -194,11 +374,43 @@ cdef class BaseThinDbObjectTypeCache:
                f'"{typ_impl.package_name}".' + \
                f'"{name}"{suffix}'
 
+    cdef DbObjectTypeMetadata _create_metadata(self, str name, list attrs):
+        """
+        Creates the type metadata from the variables populated by the
+        metadata cursor and the attributes fetched for the type.
+        """
+        cdef DbObjectTypeMetadata metadata
+        metadata = DbObjectTypeMetadata.__new__(DbObjectTypeMetadata)
+        metadata.oid = self.oid_var.getvalue()
+        metadata.version = self.version_var.getvalue()
+        metadata.tds = self.tds_var.getvalue()
+        metadata.schema = self.schema_var.getvalue()
+        metadata.package_name = self.package_name_var.getvalue()
+        metadata.name = self.name_var.getvalue()
+        metadata.is_row_type = name.endswith("%ROWTYPE")
+        metadata.attrs = attrs
+        return metadata
+
     cdef int _initialize(self, BaseThinConnImpl conn_impl) except -1:
         self.types_by_oid = {}
         self.types_by_name = {}
         self.partial_types = []
         self.conn_impl = conn_impl
+        self.db_key = None
+        self.user = conn_impl.username
+
+    cdef int _set_db_key(self, object db_id) except -1:
+        """
+        Sets the key identifying the database in the cache shared by all
+        connections. The names supplied by the database when the connection
+        was established are not sufficient on their own since distinct
+        databases (such as those created from the same image) frequently share
+        them, so the id of the database (or pluggable database) is included
+        as well.
+        """
+        self.db_key = (db_id, self.conn_impl._db_name,
+                       self.conn_impl._db_domain,
+                       self.conn_impl._service_name)
 
     cdef int _init_columns_cursor(self, object conn) except -1:
         """
@@ -237,7 +449,8 @@ cdef class BaseThinDbObjectTypeCache:
         cursor.prepare(DBO_CACHE_SQL_GET_METADATA_FOR_NAME)
         self.meta_cursor = cursor
 
-    cdef object _parse_tds(self, ThinDbObjectTypeImpl typ_impl, bytes tds):
+    cdef object _parse_tds(self, ThinDbObjectTypeImpl typ_impl,
+                           DbObjectTypeMetadata metadata):
         """
         Parses the TDS for the type. This is only needed for collection types,
         so if the TDS is determined to be for an object type, the remaining
@@ -245,7 +458,7 @@ cdef class BaseThinDbObjectTypeCache:
         """
         cdef:
             ThinDbObjectAttrImpl attr_impl
-            OracleMetadata metadata
+            OracleMetadata attr_metadata
             uint16_t num_attrs, i
             uint8_t attr_type
             TDSBuffer buf
@@ -253,7 +466,7 @@ cdef class BaseThinDbObjectTypeCache:
 
         # parse initial TDS bytes
         buf = TDSBuffer.__new__(TDSBuffer)
-        buf._populate_from_bytes(tds)
+        buf._populate_from_bytes(metadata.tds)
         buf.skip_raw_bytes(4)               # end offset
         buf.skip_raw_bytes(2)               # version op code and version
         buf.skip_raw_bytes(2)               # unknown
@@ -284,19 +497,23 @@ cdef class BaseThinDbObjectTypeCache:
             typ_impl.element_metadata = self._parse_tds_attr(buf)
             typ_impl.element_metadata._finalize_init()
             if typ_impl.element_metadata.dbtype is DB_TYPE_CLOB:
-                return self._get_element_type_clob(typ_impl)
+                if metadata.element_type_name is None:
+                    return self._get_element_type_clob(typ_impl, metadata)
+                self._set_element_type_clob(typ_impl, metadata)
             elif typ_impl.element_metadata.dbtype is DB_TYPE_OBJECT:
-                return self._get_element_type_obj(typ_impl)
+                if metadata.element_objtype is None:
+                    return self._get_element_type_obj(typ_impl, metadata)
+                self._set_element_type_obj(typ_impl, metadata)
 
         # handle objects with attributes
         else:
             for i, attr_impl in enumerate(typ_impl.attrs):
-                metadata = self._parse_tds_attr(buf)
-                if metadata.precision != 0 or metadata.scale != 0:
-                    attr_impl.precision = metadata.precision
-                    attr_impl.scale = metadata.scale
-                attr_impl.max_size = metadata.max_size
-                metadata._finalize_init()
+                attr_metadata = self._parse_tds_attr(buf)
+                if attr_metadata.precision != 0 or attr_metadata.scale != 0:
+                    attr_impl.precision = attr_metadata.precision
+                    attr_impl.scale = attr_metadata.scale
+                attr_impl.max_size = attr_metadata.max_size
+                attr_metadata._finalize_init()
 
     cdef OracleMetadata _parse_tds_attr(self, TDSBuffer buf):
         """
@@ -393,7 +610,7 @@ cdef class BaseThinDbObjectTypeCache:
         attr_impl = ThinDbObjectAttrImpl.__new__(ThinDbObjectAttrImpl)
         attr_impl.name = name
         if type_owner is not None:
-            attr_typ_impl = self.get_type_for_info(oid, type_owner,
+            attr_typ_impl = self.get_type_for_info(oid, 0, type_owner,
                                                    type_package_name,
                                                    type_name)
             if attr_typ_impl.is_xml_type:
@@ -433,7 +650,8 @@ cdef class BaseThinDbObjectTypeCache:
         typ_impl.attrs.append(attr_impl)
         typ_impl.attrs_by_name[name] = attr_impl
 
-    cdef object _populate_type_info(self, str name, object attrs,
+    cdef object _populate_type_info(self, str name,
+                                    DbObjectTypeMetadata metadata,
                                     ThinDbObjectTypeImpl typ_impl):
         """
         Populate the type information given the name of the type.
@@ -442,24 +660,25 @@ cdef class BaseThinDbObjectTypeCache:
             ssize_t start_pos, end_pos, name_length
             ThinDbObjectAttrImpl attr_impl
             str data_type
-        typ_impl.version = self.version_var.getvalue()
+        typ_impl.version = metadata.version
         if typ_impl.oid is None:
-            typ_impl.oid = self.oid_var.getvalue()
+            typ_impl.oid = metadata.oid
             self.types_by_oid[typ_impl.oid] = typ_impl
         if typ_impl.schema is None:
-            typ_impl.schema = self.schema_var.getvalue()
-            typ_impl.package_name = self.package_name_var.getvalue()
-            typ_impl.name = self.name_var.getvalue()
+            typ_impl.schema = metadata.schema
+            typ_impl.package_name = metadata.package_name
+            typ_impl.name = metadata.name
             if typ_impl.name is None:
                 errors._raise_err(errors.ERR_INVALID_OBJECT_TYPE_NAME,
                                   name=name)
             typ_impl.is_xml_type = \
                     (typ_impl.schema == "SYS" and typ_impl.name == "XMLTYPE")
+        typ_impl.is_row_type = metadata.is_row_type
         typ_impl.attrs = []
         typ_impl.attrs_by_name = {}
         if typ_impl.is_row_type:
             for name, data_type, data_type_owner, max_size, precision, \
-                    scale in attrs:
+                    scale in metadata.attrs:
                 if data_type_owner is None:
                     start_pos = data_type.find("(")
                     if start_pos > 0:
@@ -473,21 +692,63 @@ cdef class BaseThinDbObjectTypeCache:
             for cursor_version, attr_name, attr_num, attr_type_name, \
                     attr_type_owner, attr_type_package, attr_type_oid, \
                     attr_instantiable, attr_super_type_owner, \
-                    attr_super_type_name in attrs:
+                    attr_super_type_name in metadata.attrs:
                 if attr_name is None:
                     continue
                 self._create_attr(typ_impl, attr_name, attr_type_name,
                                   attr_type_owner, attr_type_package,
                                   attr_type_oid)
-            return self._parse_tds(typ_impl, self.tds_var.getvalue())
+            return self._parse_tds(typ_impl, metadata)
+
+    cdef int _set_element_type_clob(self, ThinDbObjectTypeImpl typ_impl,
+                                    DbObjectTypeMetadata metadata) except -1:
+        """
+        Sets the element type of a collection of CLOB values, using the element
+        type name stored in the metadata.
+        """
+        if metadata.element_type_name == "NCLOB":
+            typ_impl.element_metadata.dbtype = DB_TYPE_NCLOB
 
-    cdef ThinDbObjectTypeImpl get_type_for_info(self, bytes oid, str schema,
+    cdef int _set_element_type_obj(self, ThinDbObjectTypeImpl typ_impl,
+                                   DbObjectTypeMetadata metadata) except -1:
+        """
+        Sets the element type of a collection of objects, using the element
+        object type information stored in the metadata.
+        """
+        cdef str schema, package_name, name
+        schema, package_name, name = metadata.element_objtype
+        typ_impl.element_metadata.objtype = \
+                self.get_type_for_info(None, 0, schema, package_name, name)
+
+    cdef DbObjectTypeMetadata _get_cached_metadata(
+        self, str name, ThinDbObjectTypeImpl typ_impl
+    ):
+        """
+        Returns the metadata for the type from the cache shared by all
+        connections, or None if the type has not been looked up yet.
+        """
+        return dbobject_type_metadata_cache.get_entry(self.db_key, self.user,
+                                                      name, typ_impl.oid,
+                                                      typ_impl.version)
+
+    cdef int _store_metadata(self, str name,
+                             DbObjectTypeMetadata metadata) except -1:
+        """
+        Stores the metadata for the type in the cache shared by all
+        connections.
+        """
+        dbobject_type_metadata_cache.add_entry(self.db_key, self.user, name,
+                                               metadata)
+
+    cdef ThinDbObjectTypeImpl get_type_for_info(self, bytes oid,
+                                                uint16_t version, str schema,
                                                 str package_name, str name):
         """
         Returns a type for the specified fetch info, if one has already been
         cached. If not, a new type object is created and cached. It is also
         added to the partial_types list which will be fully populated once the
-        current execute has completed.
+        current execute has completed. The version, if known, is used to find
+        the metadata in the cache shared by all connections.
         """
         cdef:
             ThinDbObjectTypeImpl typ_impl
@@ -504,6 +765,7 @@ cdef class BaseThinDbObjectTypeCache:
             typ_impl = ThinDbObjectTypeImpl.__new__(ThinDbObjectTypeImpl)
             typ_impl._conn_impl = self.conn_impl
             typ_impl.oid = oid
+            typ_impl.version = version
             typ_impl.schema = schema
             typ_impl.package_name = package_name
             typ_impl.name = name
@@ -517,7 +779,8 @@ cdef class BaseThinDbObjectTypeCache:
 
 cdef class ThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
 
-    def _get_element_type_clob(self, ThinDbObjectTypeImpl typ_impl):
+    def _get_element_type_clob(self, ThinDbObjectTypeImpl typ_impl,
+                               DbObjectTypeMetadata metadata):
         """
         Determine if the element type refers to an NCLOB or CLOB value. This
         must be fetched from the data dictionary since it is not included in
@@ -533,11 +796,11 @@ cdef class ThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
             cursor.execute(DBO_CACHE_SQL_GET_ELEM_TYPE_NO_PACKAGE,
                     owner=typ_impl.schema,
                     name=typ_impl.name)
-        type_name, = cursor.fetchone()
-        if type_name == "NCLOB":
-            typ_impl.element_metadata.dbtype = DB_TYPE_NCLOB
+        metadata.element_type_name, = cursor.fetchone()
+        self._set_element_type_clob(typ_impl, metadata)
 
-    def _get_element_type_obj(self, ThinDbObjectTypeImpl typ_impl):
+    def _get_element_type_obj(self, ThinDbObjectTypeImpl typ_impl,
+                              DbObjectTypeMetadata metadata):
         """
         Determine the element type's object type. This is needed when
         processing collections with object as the element type since this
@@ -558,16 +821,30 @@ cdef class ThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
                     owner=typ_impl.schema,
                     name=typ_impl.name)
             schema, name = cursor.fetchone()
-        typ_impl.element_metadata.objtype = \
-                self.get_type_for_info(None, schema, package_name, name)
+        metadata.element_objtype = (schema, package_name, name)
+        self._set_element_type_obj(typ_impl, metadata)
 
-    cdef list _lookup_type(self, object conn, str name,
-                           ThinDbObjectTypeImpl typ_impl):
+    cdef DbObjectTypeMetadata _lookup_type(self, object conn, str name,
+                                           ThinDbObjectTypeImpl typ_impl):
         """
-        Lookup the type given its name and return the list of attributes for
-        further processing. The metadata cursor execution will populate the
-        variables.
+        Lookup the type given its name and return its metadata for further
+        processing. The cache shared by all connections is searched first; if
+        the type is not found there, the metadata cursor is executed and the
+        metadata is created from the variables it populates. The first lookup
+        on the connection determines the id of the database, which is needed
+        to search the shared cache.
         """
+        cdef:
+            DbObjectTypeMetadata metadata
+            object cursor
+            list attrs
+        if self.db_key is None:
+            cursor = conn.cursor()
+            cursor.execute(DBO_CACHE_SQL_GET_DB_ID)
+            self._set_db_key(cursor.fetchone()[0])
+        metadata = self._get_cached_metadata(name, typ_impl)
+        if metadata is not None:
+            return metadata
         if self.meta_cursor is None:
             self._init_meta_cursor(conn)
         self.full_name_var.setvalue(0, name)
@@ -575,14 +852,14 @@ cdef class ThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
         if self.return_value_var.getvalue() != 0:
             errors._raise_err(errors.ERR_INVALID_OBJECT_TYPE_NAME, name=name)
         if name.endswith("%ROWTYPE"):
-            typ_impl.is_row_type = True
             if self.columns_cursor is None:
                 self._init_columns_cursor(conn)
             self.columns_cursor.execute(None)
-            return self.columns_cursor.fetchall()
+            attrs = self.columns_cursor.fetchall()
         else:
             attrs_rc = self.attrs_ref_cursor_var.getvalue()
-            return attrs_rc.fetchall()
+            attrs = attrs_rc.fetchall()
+        return self._create_metadata(name, attrs)
 
     cdef ThinDbObjectTypeImpl get_type(self, object conn, str name):
         """
@@ -591,14 +868,15 @@ cdef class ThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
         result stored in the cache.
         """
         cdef:
+            DbObjectTypeMetadata metadata
             ThinDbObjectTypeImpl typ_impl
-            bint is_rowtype
         typ_impl = self.types_by_name.get(name)
         if typ_impl is None:
             typ_impl = ThinDbObjectTypeImpl.__new__(ThinDbObjectTypeImpl)
             typ_impl._conn_impl = self.conn_impl
-            attrs = self._lookup_type(conn, name, typ_impl)
-            self._populate_type_info(name, attrs, typ_impl)
+            metadata = self._lookup_type(conn, name, typ_impl)
+            self._populate_type_info(name, metadata, typ_impl)
+            self._store_metadata(name, metadata)
             self.types_by_oid[typ_impl.oid] = typ_impl
             self.types_by_name[name] = typ_impl
             self.populate_partial_types(conn)
@@ -612,19 +890,21 @@ cdef class ThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
         the list is empty.
         """
         cdef:
+            DbObjectTypeMetadata metadata
             ThinDbObjectTypeImpl typ_impl
             str full_name
-            list attrs
         while self.partial_types:
             typ_impl = self.partial_types.pop()
             full_name = self._get_full_name(typ_impl)
-            attrs = self._lookup_type(conn, full_name, typ_impl)
-            self._populate_type_info(full_name, attrs, typ_impl)
+            metadata = self._lookup_type(conn, full_name, typ_impl)
+            self._populate_type_info(full_name, metadata, typ_impl)
+            self._store_metadata(full_name, metadata)
 
 
 cdef class AsyncThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
 
-    async def _get_element_type_clob(self, ThinDbObjectTypeImpl typ_impl):
+    async def _get_element_type_clob(self, ThinDbObjectTypeImpl typ_impl,
+                                     DbObjectTypeMetadata metadata):
         """
         Determine if the element type refers to an NCLOB or CLOB value. This
         must be fetched from the data dictionary since it is not included in
@@ -640,11 +920,11 @@ cdef class AsyncThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
             await cursor.execute(DBO_CACHE_SQL_GET_ELEM_TYPE_NO_PACKAGE,
                     owner=typ_impl.schema,
                     name=typ_impl.name)
-        type_name, = await cursor.fetchone()
-        if type_name == "NCLOB":
-            typ_impl.element_metadata.dbtype = DB_TYPE_NCLOB
+        metadata.element_type_name, = await cursor.fetchone()
+        self._set_element_type_clob(typ_impl, metadata)
 
-    async def _get_element_type_obj(self, ThinDbObjectTypeImpl typ_impl):
+    async def _get_element_type_obj(self, ThinDbObjectTypeImpl typ_impl,
+                                    DbObjectTypeMetadata metadata):
         """
         Determine the element type's object type. This is needed when
         processing collections with object as the element type since this
@@ -665,16 +945,30 @@ cdef class AsyncThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
                     owner=typ_impl.schema,
                     name=typ_impl.name)
             schema, name = await cursor.fetchone()
-        typ_impl.element_metadata.objtype = \
-                self.get_type_for_info(None, schema, package_name, name)
+        metadata.element_objtype = (schema, package_name, name)
+        self._set_element_type_obj(typ_impl, metadata)
 
     async def _lookup_type(self, object conn, str name,
                            ThinDbObjectTypeImpl typ_impl):
         """
-        Lookup the type given its name and return the list of attributes for
-        further processing. The metadata cursor execution will populate the
-        variables.
+        Lookup the type given its name and return its metadata for further
+        processing. The cache shared by all connections is searched first; if
+        the type is not found there, the metadata cursor is executed and the
+        metadata is created from the variables it populates. The first lookup
+        on the connection determines the id of the database, which is needed
+        to search the shared cache.
         """
+        cdef:
+            DbObjectTypeMetadata metadata
+            object cursor
+            list attrs
+        if self.db_key is None:
+            cursor = conn.cursor()
+            await cursor.execute(DBO_CACHE_SQL_GET_DB_ID)
+            self._set_db_key((await cursor.fetchone())[0])
+        metadata = self._get_cached_metadata(name, typ_impl)
+        if metadata is not None:
+            return metadata
         if self.meta_cursor is None:
             self._init_meta_cursor(conn)
         self.full_name_var.setvalue(0, name)
@@ -682,14 +976,14 @@ cdef class AsyncThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
         if self.return_value_var.getvalue() != 0:
             errors._raise_err(errors.ERR_INVALID_OBJECT_TYPE_NAME, name=name)
         if name.endswith("%ROWTYPE"):
-            typ_impl.is_row_type = True
             if self.columns_cursor is None:
                 self._init_columns_cursor(conn)
             await self.columns_cursor.execute(None)
-            return await self.columns_cursor.fetchall()
+            attrs = await self.columns_cursor.fetchall()
         else:
             attrs_rc = self.attrs_ref_cursor_var.getvalue()
-            return await attrs_rc.fetchall()
+            attrs = await attrs_rc.fetchall()
+        return self._create_metadata(name, attrs)
 
     async def get_type(self, object conn, str name):
         """
@@ -697,15 +991,18 @@ cdef class AsyncThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
         searched and if it is not found, the database is searched and the
         result stored in the cache.
         """
-        cdef ThinDbObjectTypeImpl typ_impl
+        cdef:
+            DbObjectTypeMetadata metadata
+            ThinDbObjectTypeImpl typ_impl
         typ_impl = self.types_by_name.get(name)
         if typ_impl is None:
             typ_impl = ThinDbObjectTypeImpl.__new__(ThinDbObjectTypeImpl)
             typ_impl._conn_impl = self.conn_impl
-            attrs = await self._lookup_type(conn, name, typ_impl)
-            coroutine = self._populate_type_info(name, attrs, typ_impl)
+            metadata = await self._lookup_type(conn, name, typ_impl)
+            coroutine = self._populate_type_info(name, metadata, typ_impl)
             if coroutine is not None:
                 await coroutine
+            self._store_metadata(name, metadata)
             self.types_by_oid[typ_impl.oid] = typ_impl
             self.types_by_name[name] = typ_impl
             await self.populate_partial_types(conn)
@@ -719,16 +1016,18 @@ cdef class AsyncThinDbObjectTypeCache(BaseThinDbObjectTypeCache):
         the list is empty.
         """
         cdef:
+            DbObjectTypeMetadata metadata
             ThinDbObjectTypeImpl typ_impl
             str full_name
-            list attrs
         while self.partial_types:
             typ_impl = self.partial_types.pop()
             full_name = self._get_full_name(typ_impl)
-            attrs = await self._lookup_type(conn, full_name, typ_impl)
-            coroutine = self._populate_type_info(full_name, attrs, typ_impl)
+            metadata = await self._lookup_type(conn, full_name, typ_impl)
+            coroutine = self._populate_type_info(full_name, metadata,
+                                                 typ_impl)
             if coroutine is not None:
                 await coroutine
+            self._store_metadata(full_name, metadata)
 
 
 # global cache of database object types
@@ -770,3 +1069,25 @@ cdef int remove_dbobject_type_cache(int cache_num) except -1:
     Removes the sub cache given its identifier.
     """
     del DB_OBJECT_TYPE_SUPER_CACHE.caches[cache_num]
+
+
+def clear_dbobject_type_cache():
+    """
+    Removes all entries from the cache of type metadata shared by all
+    connections.
+    """
+    dbobject_type_metadata_cache.clear()
+
+
+def load_dbobject_type_cache(str file_name):
+    """
+    Loads type metadata from a file created by save_dbobject_type_cache().
+    """
+    dbobject_type_metadata_cache.load(file_name)
+
+
+def save_dbobject_type_cache(str file_name):
+    """
+    Saves the type metadata shared by all connections to a file.
+    """
+    dbobject_type_metadata_cache.save(file_name)
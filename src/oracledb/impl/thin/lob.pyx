@@ -143,7 +143,7 @@ cdef class BaseThinLobImpl(BaseLobImpl):
         message.source_lob_impl = self
         message.source_offset = offset
         if self.dbtype._ora_type_num == ORA_TYPE_NUM_BLOB:
-            if not isinstance(value, bytes):
+            if not isinstance(value, (bytes, memoryview)):
                 raise TypeError("only bytes can be written to BLOBs")
             message.data = value
         else:
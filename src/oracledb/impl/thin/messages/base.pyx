@@ -318,6 +318,7 @@ cdef class Message:
             uint8_t ora_type_num, csfrm
             OracleMetadata metadata
             uint8_t nulls_allowed
+            uint16_t type_version
             int cache_num
             bytes oid
         buf.read_ub1(&ora_type_num)
@@ -329,7 +330,7 @@ cdef class Message:
         buf.skip_ub4()                      # max number of array elements
         buf.skip_ub8()                      # cont flags
         oid = buf.read_bytes_with_length()
-        buf.skip_ub2()                      # version
+        buf.read_ub2(&type_version)
         buf.skip_ub2()                      # character set id
         buf.read_ub1(&csfrm)                # character set form
         # in some cases the metadata returned contains an invalid character
@@ -381,8 +382,8 @@ cdef class Message:
             if self.type_cache is None:
                 cache_num = self.conn_impl._dbobject_type_cache_num
                 self.type_cache = get_dbobject_type_cache(cache_num)
-            typ_impl = self.type_cache.get_type_for_info(oid, schema, None,
-                                                         name)
+            typ_impl = self.type_cache.get_type_for_info(oid, type_version,
+                                                         schema, None, name)
             if typ_impl.is_xml_type:
                 metadata.dbtype = DB_TYPE_XMLTYPE
             else:
@@ -866,7 +867,7 @@ cdef class Message:
     cdef int send(self, WriteBuffer buf) except -1:
         buf.start_request(TNS_PACKET_TYPE_DATA)
         self._write_message(buf)
-        if self.pipeline_result_impl is not None:
+        if self.token_num != 0:
             buf._data_flags |= TNS_DATA_FLAGS_END_OF_REQUEST
         buf.end_request()
 
@@ -1155,11 +1156,10 @@ cdef class MessageWithData(Message):
         elif ora_type_num == ORA_TYPE_NUM_JSON:
             column_value = buf.read_oson()
         elif ora_type_num == ORA_TYPE_NUM_VECTOR:
-            column_value = buf.read_vector()
             if self.cursor_impl.fetching_arrow:
-                convert_vector_to_arrow(
-                    var_impl._arrow_array, column_value
-                )
+                buf.read_vector_to_arrow(var_impl._arrow_array)
+            else:
+                column_value = buf.read_vector()
         elif ora_type_num == ORA_TYPE_NUM_OBJECT:
             typ_impl = metadata.objtype
             if typ_impl is None:
@@ -1521,6 +1521,8 @@ cdef class MessageWithData(Message):
             object value
         metadata = var_impl.metadata
         if var_impl._arrow_array is not None:
+            if buf.write_arrow_value(metadata, var_impl._arrow_array, offset):
+                return 0
             value = convert_arrow_to_oracle_data(metadata, &data,
                                                  var_impl._arrow_array, offset)
         else:
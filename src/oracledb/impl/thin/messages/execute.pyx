@@ -87,6 +87,7 @@ cdef class ExecuteMessage(MessageWithData):
             exec_flags |= TNS_EXEC_FLAGS_NO_CANCEL_ON_EOF
         if stmt._cursor_id == 0 or stmt._is_ddl:
             options |= TNS_EXEC_OPTION_PARSE
+            self.conn_impl._statement_cache.record_parse()
         if stmt._is_query:
             if self.parse_only:
                 options |= TNS_EXEC_OPTION_DESCRIBE
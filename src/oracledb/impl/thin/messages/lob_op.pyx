@@ -87,7 +87,9 @@ cdef class LobOpMessage(Message):
             self.bool_flag = temp8 > 0
 
     cdef int _write_message(self, WriteBuffer buf) except -1:
-        cdef int i
+        cdef:
+            const char_type[::1] view
+            int i
         self._write_function_code(buf)
         if self.source_lob_impl is None:
             buf.write_uint8(0)              # source pointer
@@ -132,6 +134,10 @@ cdef class LobOpMessage(Message):
                 buf.write_ub4(TNS_CHARSET_UTF8)
         if self.data is not None:
             buf.write_uint8(TNS_MSG_TYPE_LOB_DATA)
-            buf.write_bytes_with_length(self.data)
+            if isinstance(self.data, bytes):
+                buf.write_bytes_with_length(self.data)
+            else:
+                view = self.data
+                buf._write_raw_bytes_and_length(&view[0], view.shape[0])
         if self.send_amount:
             buf.write_ub8(self.amount)      # LOB amount
@@ -36,7 +36,8 @@ cdef class NotifyMessage(AqBaseMessage):
     cdef:
         uint32_t namespace
         bytes client_id
-        object subscr
+        BaseNotificationListener listener
+        bint in_notifications
 
     cdef int _initialize_hook(self) except -1:
         """
@@ -48,12 +49,11 @@ cdef class NotifyMessage(AqBaseMessage):
                               uint8_t message_type) except -1:
         """
         Processes a single TTC message. In this case, notification only
-        supports one message type and all others will result in an error.
+        supports one message type and all others will result in an error. The
+        notifications themselves are processed by process().
         """
         if message_type == TNS_MSG_TYPE_OAC:
-            while not self.end_of_response:
-                self._process_oac(buf)
-            self.subscr._impl = None
+            self.in_notifications = True
         else:
             errors._raise_err(errors.ERR_MESSAGE_TYPE_UNKNOWN,
                               message_type=message_type,
@@ -64,13 +64,16 @@ cdef class NotifyMessage(AqBaseMessage):
         Processes the record returned by the server.
         """
         cdef:
-            uint32_t message_type, num_props
+            uint32_t message_type, num_props, registration_id
             ThinMsgPropsImpl props_impl
+            bint deregistered
             object py_message
+            object subscr
 
-        # create a new message that will be supplied as the argument to the
-        # user's callback
-        py_message = PY_TYPE_MESSAGE(self.subscr)
+        # create a new message that will be supplied to the subscription; the
+        # subscription itself is only known once the registration id has been
+        # determined
+        py_message = PY_TYPE_MESSAGE(None)
         py_message._dbname = self.conn_impl._db_name
 
         # first part is the notification header
@@ -79,7 +82,7 @@ cdef class NotifyMessage(AqBaseMessage):
             self.end_of_response = True
             return 0
         buf.skip_ub4()                  # error code
-        buf.skip_ub4()                  # registration ID
+        buf.read_ub4(&registration_id)
         py_message._queue_name = buf.read_str_with_length()
         py_message._consumer_name = buf.read_str_with_length()
 
@@ -101,21 +104,46 @@ cdef class NotifyMessage(AqBaseMessage):
             buf.skip_ub4()                  # chunk number
             payload = buf.read_bytes_with_length()
             buf.skip_bytes_with_length()    # DbObject/JSON payload
-        self._process_notification_payload(payload, py_message)
+        self._process_notification_payload(payload, py_message,
+                                           &registration_id)
+
+        # determine the subscription to which the notification belongs;
+        # notifications for unknown registrations are discarded
+        subscr = self.listener.get_subscr(registration_id)
+        if subscr is None:
+            return 0
+        py_message._subscription = subscr
 
-        # invoke the callback with the message that was created
-        self.subscr.callback(py_message)
+        # if the payload is empty for database/query change notification, the
+        # registration has been discarded; the same is true if the
+        # subscription requested deregistration after the first notification
+        deregistered = False
+        if self.namespace != SUBSCR_NAMESPACE_AQ:
+            if payload is None or subscr.qos & SUBSCR_QOS_DEREG_NFY:
+                deregistered = True
+            else:
+                py_message._registered = True
+
+        # deliver the message that was created; once all of the subscriptions
+        # sharing the listener have been deregistered, terminate the loop
+        self.listener.dispatch(subscr, py_message, deregistered)
+        if deregistered \
+                and self.listener.remove_subscr(registration_id) == 0:
+            self.end_of_response = True
 
     cdef int _process_notification_payload(self, bytes payload,
-                                           object py_message) except -1:
+                                           object py_message,
+                                           uint32_t *registration_id) \
+                                           except -1:
         """
         Processes the payload and populates the message that will be sent to
-        the callback.
+        the subscription. The registration id found in the payload (if any)
+        replaces the one found in the notification header.
         """
         cdef:
-            uint32_t registration_id, event_type
             uint16_t version, dbname_length
             const char_type* dbname_ptr
+            uint32_t event_type
             Buffer buf
 
         # the payload is ignored for AQ notification
@@ -123,24 +151,17 @@ cdef class NotifyMessage(AqBaseMessage):
             py_message._type = EVENT_AQ
 
         # if the payload is empty for database/query change notification, the
-        # registration has been discarded so mark the subscription as invalid
-        # and cause the loop to terminate
+        # registration has been discarded
         elif payload is None:
             py_message._type = EVENT_DEREG
-            self.end_of_response = True
 
         # process the payload which contains information about the
         # database/query change notification
         else:
-            if self.subscr.qos & SUBSCR_QOS_DEREG_NFY:
-                py_message._registered = False
-                self.end_of_response = True
-            else:
-                py_message._registered = True
             buf = Buffer.__new__(Buffer)
             buf._populate_from_bytes(payload)
             buf.read_uint16be(&version)
-            buf.read_uint32be(&registration_id)
+            buf.read_uint32be(registration_id)
             buf.read_uint32be(&event_type)
             py_message._type = event_type
             buf.read_uint16be(&dbname_length)
@@ -152,6 +173,25 @@ cdef class NotifyMessage(AqBaseMessage):
             elif event_type == EVENT_QUERYCHANGE:
                 self._process_queries(buf, py_message._queries)
 
+    cdef int process(self, ReadBuffer buf) except -1:
+        """
+        Processes the stream of notifications sent by the server. A point is
+        saved before each notification so that processing can be restarted
+        with that notification when using asyncio and further packets are
+        required; packets that precede that point are no longer needed and are
+        discarded.
+        """
+        cdef uint8_t message_type
+        self.end_of_response = False
+        while not self.end_of_response:
+            buf.save_point()
+            buf.discard_packets_before_saved_point()
+            if self.in_notifications:
+                self._process_oac(buf)
+            else:
+                buf.read_ub1(&message_type)
+                self._process_message(buf, message_type)
+
     cdef int _process_queries(self, Buffer buf, list queries) except -1:
         """
         Processes the queries found in the notification.
@@ -33,7 +33,7 @@
 @cython.final
 cdef class SubscrMessage(Message):
     cdef:
-        ThinSubscrImpl subscr_impl
+        BaseThinSubscrImpl subscr_impl
         uint64_t registration_id
         bytes subscriber_name
         bytes client_id
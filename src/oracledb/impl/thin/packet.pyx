@@ -402,10 +402,10 @@ cdef class ReadBuffer(Buffer):
             if data_flags == TNS_DATA_FLAGS_EOF:
                 self._pending_error_num = TNS_ERR_SESSION_SHUTDOWN
 
-    async def discard_pipeline_responses(self, ssize_t num_responses):
+    async def discard_pipeline_responses_async(self, ssize_t num_responses):
         """
         Discards the specified number of responses after the pipeline has
-        encountered an exception.
+        encountered an exception (using asyncio).
         """
         while num_responses > 0:
             if not self.has_response():
@@ -417,6 +417,35 @@ cdef class ReadBuffer(Buffer):
             num_responses -= 1
         self.reset_packets()
 
+    cdef int discard_processed_packets(self) except -1:
+        """
+        Discards the packets that have already been processed. This is used
+        when the responses to a pipeline are processed while further messages
+        are still being sent, so that the list of saved packets does not grow
+        without bound.
+        """
+        if self._next_packet_pos > 0:
+            del self._saved_packets[:self._next_packet_pos]
+            self._next_packet_pos = 0
+            self._saved_packet_pos = 0
+
+    cdef int discard_pipeline_responses_sync(
+        self, ssize_t num_responses
+    ) except -1:
+        """
+        Discards the specified number of responses after the pipeline has
+        encountered an exception (synchronously).
+        """
+        while num_responses > 0:
+            if not self.has_response():
+                self.wait_for_response_sync()
+            while True:
+                self._start_packet()
+                if self._current_packet.has_end_of_response():
+                    break
+            num_responses -= 1
+        self.reset_packets()
+
     cdef int notify_packet_received(self) except -1:
         """
         Notify the registered waiter that a packet has been received. This is
@@ -594,15 +623,13 @@ cdef class ReadBuffer(Buffer):
 
         return bytes(output_value).decode()
 
-    cdef object read_vector(self):
+    cdef bytes _read_vector_data(self):
         """
-        Read a VECTOR value from the buffer and return the converted value.
-        VECTOR is sent as a LOB value with all of the data prefetched. Since
-        the LOB locator is not required it is simply discarded.
-        it.
+        Read the encoded bytes of a VECTOR value from the buffer. VECTOR is
+        sent as a LOB value with all of the data prefetched. Since the LOB
+        locator is not required it is simply discarded.
         """
         cdef:
-            VectorDecoder decoder
             uint32_t num_bytes
             bytes data
         self.read_ub4(&num_bytes)
@@ -612,8 +639,34 @@ cdef class ReadBuffer(Buffer):
             data = self.read_bytes()
             self.read_bytes()           # LOB locator (unused)
             if data:
-                decoder = VectorDecoder.__new__(VectorDecoder)
-                return decoder.decode(data)
+                return data
+
+    cdef object read_vector(self):
+        """
+        Read a VECTOR value from the buffer and return the converted value.
+        """
+        cdef:
+            VectorDecoder decoder
+            bytes data
+        data = self._read_vector_data()
+        if data is not None:
+            decoder = VectorDecoder.__new__(VectorDecoder)
+            return decoder.decode(data)
+
+    cdef int read_vector_to_arrow(self, ArrowArrayImpl array_impl) except -1:
+        """
+        Read a VECTOR value from the buffer and append it directly to the
+        Arrow array without first converting it to a Python object.
+        """
+        cdef:
+            VectorDecoder decoder
+            bytes data
+        data = self._read_vector_data()
+        if data is None:
+            array_impl.append_null()
+        else:
+            decoder = VectorDecoder.__new__(VectorDecoder)
+            decoder.decode_to_arrow(data, array_impl)
 
     cdef object read_xmltype(self, BaseThinConnImpl conn_impl):
         """
@@ -665,6 +718,23 @@ cdef class ReadBuffer(Buffer):
                 return True
         return False
 
+    cdef int read_available_packets(self) except -1:
+        """
+        Reads all packets that are available on the transport without waiting
+        and adds them to the list of saved packets. This is used when sending
+        a pipeline synchronously in order to ensure that the database is never
+        blocked writing responses while the client is still sending requests.
+        """
+        cdef:
+            bint data_ready, notify_waiter
+            Packet packet
+        while True:
+            self._transport.has_data_ready(&data_ready)
+            if not data_ready:
+                break
+            packet = self._transport.read_packet()
+            self._process_packet(packet, &notify_waiter, True)
+
     cdef int reset_packets(self) except -1:
         """
         Resets the list of saved packets and the saved position (called when a
@@ -697,14 +767,39 @@ cdef class ReadBuffer(Buffer):
         self._saved_packet_pos = self._next_packet_pos - 1
         self._saved_pos = self._pos
 
+    cdef int discard_packets_before_saved_point(self) except -1:
+        """
+        Discards the saved packets that precede the packet containing the last
+        saved point. This is needed when a response is processed indefinitely
+        (such as the stream of notifications sent for subscriptions) since
+        otherwise the list of saved packets would grow without bound.
+        """
+        if self._saved_packet_pos > 0:
+            del self._saved_packets[:self._saved_packet_pos]
+            self._next_packet_pos -= self._saved_packet_pos
+            self._saved_packet_pos = 0
+
+    cdef object get_packets_waiter(self):
+        """
+        Returns a future that is completed when packets arrive in response to
+        the request that was sent to the database or None if packets are
+        already available (using asyncio). Callers await the future directly
+        instead of awaiting a coroutine, which avoids creating a coroutine for
+        each round trip.
+        """
+        if self._next_packet_pos < len(self._saved_packets):
+            return None
+        self._waiter = self._loop.create_future()
+        return self._waiter
+
     async def wait_for_packets_async(self):
         """
         Wait for packets to arrive in response to the request that was sent to
         the database (using asyncio).
         """
-        if self._next_packet_pos >= len(self._saved_packets):
-            self._waiter = self._loop.create_future()
-            await self._waiter
+        waiter = self.get_packets_waiter()
+        if waiter is not None:
+            await waiter
         self._start_packet()
 
     cdef int wait_for_packets_sync(self, bint check_marker=False) except -1:
@@ -750,6 +845,24 @@ cdef class ReadBuffer(Buffer):
         finally:
             self._check_request_boundary = False
 
+    cdef int wait_for_response_sync(self) except -1:
+        """
+        Wait for packets to arrive in response to the request that was sent
+        to the database (synchronously). This method will not return until the
+        complete response has been received. This requires the "end of
+        response" capability available in Oracle Database version 23, and
+        later. This method also assumes that the current list of saved packets
+        does not contain a full response.
+        """
+        cdef:
+            bint notify_waiter
+            Packet packet
+        while True:
+            packet = self._transport.read_packet()
+            self._process_packet(packet, &notify_waiter, True)
+            if notify_waiter:
+                break
+
 
 @cython.final
 cdef class WriteBuffer(Buffer):
@@ -29,14 +29,25 @@
 # thin_impl.pyx).
 #------------------------------------------------------------------------------
 
+# upper bounds (in milliseconds) of the buckets used for the histograms of the
+# time spent waiting to acquire connections from the pool; a final bucket
+# holds all waits that exceed the last bound
+cdef tuple POOL_WAIT_HISTOGRAM_BOUNDS = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000
+)
+
 cdef class BaseThinPoolImpl(BasePoolImpl):
 
     cdef:
-        list _free_new_conn_impls
-        list _free_used_conn_impls
-        list _busy_conn_impls
+        object _free_new_conn_impls
+        dict _free_used_conn_impls
+        set _busy_conn_impls
         list _conn_impls_to_drop
-        list _requests
+        object _requests
+        dict _waiting_requests
+        dict _wait_histograms
+        StatementCacheStats _stmt_cache_stats
+        uint64_t _request_seq_num
         uint32_t _getmode
         uint32_t _stmt_cache_size
         uint32_t _timeout
@@ -44,6 +55,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         uint32_t _auth_mode
         uint32_t _open_count
         uint32_t _num_to_create
+        uint32_t _create_concurrency
         int _ping_interval
         uint32_t _ping_timeout
         object _wait_timeout
@@ -51,7 +63,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         object _bg_task_event
         object _condition
         object _timeout_task
-        object _ssl_session
+        object _create_error
         bytes _pool_id
         bint _force_get
         bint _open
@@ -73,11 +85,18 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         self._max_lifetime_session = params.max_lifetime_session
         self._ping_interval = params.ping_interval
         self._ping_timeout = params.ping_timeout
-        self._free_new_conn_impls = []
-        self._free_used_conn_impls = []
-        self._busy_conn_impls = []
+        self._create_concurrency = params.create_concurrency
+        if params.result_cache_size > 0:
+            self._result_cache = ResultCacheImpl(params.result_cache_size)
+        self._free_new_conn_impls = collections.deque()
+        self._free_used_conn_impls = {}
+        self._busy_conn_impls = set()
         self._conn_impls_to_drop = []
-        self._requests = []
+        self._requests = collections.OrderedDict()
+        self._waiting_requests = {}
+        self._wait_histograms = {}
+        self._stmt_cache_stats = \
+                StatementCacheStats.__new__(StatementCacheStats)
         self._num_to_create = self.min
         self._auth_mode = AUTH_MODE_DEFAULT
         uuid_val = uuid.uuid4()
@@ -88,13 +107,38 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
                     f"DPY:{base64.b64encode(uuid_val.bytes).decode()}"
         self._open = True
 
+    cdef int _add_free_used_conn_impl(self,
+                                      BaseThinConnImpl conn_impl) except -1:
+        """
+        Adds a connection to the queue of free used connections with the same
+        connection class.
+        """
+        queue = self._free_used_conn_impls.get(conn_impl._cclass)
+        if queue is None:
+            queue = collections.deque()
+            self._free_used_conn_impls[conn_impl._cclass] = queue
+        queue.append(conn_impl)
+
     cdef int _add_request(self, PooledConnRequest request) except -1:
         """
-        Adds a request for the background task to process.
+        Adds a request for the background task to process. Requests that are
+        waiting for a connection are also indexed by connection class and
+        purity so that returned connections can be matched to them without
+        scanning all outstanding requests.
         """
+        cdef object key, requests
         request.bg_processing = True
         request.completed = False
-        self._requests.append(request)
+        self._request_seq_num += 1
+        request.seq_num = self._request_seq_num
+        self._requests[request] = None
+        if request.waiting and request.conn_impl is None:
+            key = (request.cclass, request.wants_new)
+            requests = self._waiting_requests.get(key)
+            if requests is None:
+                requests = collections.OrderedDict()
+                self._waiting_requests[key] = requests
+            requests[request] = None
         self._notify_bg_task()
 
     cdef int _check_satisfy_request(self, BaseThinConnImpl conn_impl,
@@ -106,33 +150,49 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         connection doesn't match the request and the pool is full, the
         connection is replaced and the background task is notified to complete
         this work.
+
+        All of the waiting requests with the same connection class and purity
+        are treated the same way, so only the first eligible request of each
+        group needs to be examined; of those, the one that was made first is
+        chosen.
         """
-        cdef PooledConnRequest request
-        for request in self._requests:
-            if request.in_progress \
-                    or (not is_new and request.wants_new) \
-                    or request.conn_impl is not None \
-                    or not request.waiting:
+        cdef:
+            PooledConnRequest request, selected_request = None
+            bint wants_new
+            object requests
+            str cclass
+        for (cclass, wants_new), requests in self._waiting_requests.items():
+            if wants_new and not is_new:
                 continue
-            if request.cclass is None \
-                    or request.cclass == conn_impl._cclass:
-                request.conn_impl = conn_impl
-                request.completed = True
-                self._requests.remove(request)
-                self._condition.notify_all()
-                break
-            elif not request.cclass_matches \
-                    and self._open_count >= self.max:
-                request.conn_impl = conn_impl
-                request.is_replacing = True
-                if not is_new:
-                    self._notify_bg_task()
+            for request in requests:
+                if request.in_progress \
+                        or request.conn_impl is not None \
+                        or not request.waiting:
+                    continue
+                if cclass is None or cclass == conn_impl._cclass \
+                        or (not request.cclass_matches
+                            and self._open_count >= self.max):
+                    if selected_request is None \
+                            or request.seq_num < selected_request.seq_num:
+                        selected_request = request
                 break
-        else:
+        if selected_request is None:
             if is_new:
                 self._free_new_conn_impls.append(conn_impl)
             else:
-                self._free_used_conn_impls.append(conn_impl)
+                self._add_free_used_conn_impl(conn_impl)
+        elif selected_request.cclass is None \
+                or selected_request.cclass == conn_impl._cclass:
+            selected_request.conn_impl = conn_impl
+            selected_request.completed = True
+            self._remove_request(selected_request)
+            self._condition.notify_all()
+        else:
+            selected_request.conn_impl = conn_impl
+            selected_request.is_replacing = True
+            self._remove_waiting_request(selected_request)
+            if not is_new:
+                self._notify_bg_task()
 
     cdef int _check_timeout(self) except -1:
         """
@@ -146,21 +206,41 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
                 and self._open_count > self.min:
             self._start_timeout_task()
 
+    cdef bint _check_ready(self, uint32_t min_open) except -1:
+        """
+        Returns whether the pool has at least the specified number of open
+        connections. If the pool was closed while waiting, or if the pool has
+        stopped creating connections because the last attempt to create one
+        failed, an exception is raised instead.
+        """
+        if not self._open:
+            errors._raise_err(errors.ERR_POOL_NOT_OPEN)
+        elif self._open_count >= min_open:
+            return True
+        elif self._create_error is not None and self._num_to_create == 0:
+            raise self._create_error
+        return False
+
     cdef int _close_all_connections(self) except -1:
         """
         Closes all connections in the pool and marks the pool as closed. The
         background task is notified to perform the work of closing the
         connections, if applicable.
         """
-        cdef BaseThinConnImpl conn_impl
+        cdef:
+            BaseThinConnImpl conn_impl
+            list conn_impls = []
         self._open = False
-        for lst in (self._free_used_conn_impls,
-                    self._free_new_conn_impls,
-                    self._busy_conn_impls):
-            self._conn_impls_to_drop.extend(lst)
-            for conn_impl in lst:
-                conn_impl._is_pooled = False
-            lst.clear()
+        for queue in self._free_used_conn_impls.values():
+            conn_impls.extend(queue)
+        conn_impls.extend(self._free_new_conn_impls)
+        conn_impls.extend(self._busy_conn_impls)
+        self._free_used_conn_impls.clear()
+        self._free_new_conn_impls.clear()
+        self._busy_conn_impls.clear()
+        for conn_impl in conn_impls:
+            conn_impl._is_pooled = False
+        self._conn_impls_to_drop.extend(conn_impls)
         self._notify_bg_task()
         self._condition.notify_all()
 
@@ -199,6 +279,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         request.cclass_matches = \
                 (request.cclass is None or request.cclass == pool_cclass)
         request.waiting = True
+        request.start_time = time.monotonic()
         return request
 
     cdef int _drop_conn_impl(self, BaseThinConnImpl conn_impl) except -1:
@@ -222,6 +303,41 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
                                       self.min - self._open_count)
             self._notify_bg_task()
 
+    cdef object _get_free_used_queue(self, str cclass, bint any_cclass,
+                                     bint oldest):
+        """
+        Returns the queue of free used connections from which the next
+        connection should be taken, or None if there is no such connection. If
+        any connection class is acceptable, the queue containing the most
+        recently returned connection (or the least recently returned
+        connection, if the oldest connection is desired) is returned.
+        """
+        cdef:
+            BaseThinConnImpl conn_impl, selected_conn_impl = None
+            object queue, selected_queue = None
+        if not any_cclass:
+            return self._free_used_conn_impls.get(cclass)
+        for queue in self._free_used_conn_impls.values():
+            conn_impl = queue[0] if oldest else queue[-1]
+            if selected_conn_impl is None \
+                    or (oldest and conn_impl._time_returned
+                        < selected_conn_impl._time_returned) \
+                    or (not oldest and conn_impl._time_returned
+                        > selected_conn_impl._time_returned):
+                selected_conn_impl = conn_impl
+                selected_queue = queue
+        return selected_queue
+
+    cdef bint _is_ready(self, uint32_t min_open):
+        """
+        Returns whether a caller waiting for the pool to be ready can stop
+        waiting.
+        """
+        return not self._open \
+                or self._open_count >= min_open \
+                or (self._create_error is not None
+                    and self._num_to_create == 0)
+
     cdef PooledConnRequest _get_next_request(self):
         """
         Get the next request to process.
@@ -237,34 +353,75 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
                 return request
             break
 
-    cdef BaseThinConnImpl _post_acquire(self, BaseThinConnImpl conn_impl):
+    cdef BaseThinConnImpl _pop_free_used_conn_impl(self, str cclass,
+                                                   bint any_cclass,
+                                                   bint oldest=False):
+        """
+        Removes and returns a connection from the free used connections with
+        the given connection class (or with any connection class). The most
+        recently returned connection is chosen unless the oldest connection is
+        desired. None is returned if no such connection is available.
+        """
+        cdef:
+            BaseThinConnImpl conn_impl
+            object queue
+        queue = self._get_free_used_queue(cclass, any_cclass, oldest)
+        if queue is None:
+            return None
+        conn_impl = queue.popleft() if oldest else queue.pop()
+        if not queue:
+            del self._free_used_conn_impls[conn_impl._cclass]
+        return conn_impl
+
+    cdef BaseThinConnImpl _post_acquire(self, PooledConnRequest request):
         """
-        Called after an acquire has succeeded. The connection is added to the
-        list of busy connections and is marked as being in a request.
+        Called after an acquire has succeeded. The time spent waiting for the
+        connection is recorded, the connection is added to the set of busy
+        connections and is marked as being in a request.
         """
-        self._busy_conn_impls.append(conn_impl)
+        cdef:
+            BaseThinConnImpl conn_impl = request.conn_impl
+            double elapsed_ms
+            list counts
+            str cclass
+        elapsed_ms = (time.monotonic() - request.start_time) * 1000
+        cclass = request.cclass
+        if cclass is None:
+            cclass = self.connect_params._default_description.cclass
+        counts = self._wait_histograms.get(cclass)
+        if counts is None:
+            counts = [0] * (len(POOL_WAIT_HISTOGRAM_BOUNDS) + 1)
+            self._wait_histograms[cclass] = counts
+        counts[bisect.bisect_left(POOL_WAIT_HISTOGRAM_BOUNDS, elapsed_ms)] += 1
+        self._busy_conn_impls.add(conn_impl)
         if conn_impl._protocol._caps.supports_request_boundaries:
             conn_impl._session_state_desired = TNS_SESSION_STATE_REQUEST_BEGIN
             conn_impl._in_request = True
         return conn_impl
 
-    cdef int _post_create_conn_impl(self,
-                                    BaseThinConnImpl conn_impl) except -1:
+    cdef int _post_create_conn_impl(self, object result) except -1:
         """
         Called after a connection has been created without an associated
-        request.
+        request. The result is either the connection that was created or the
+        exception that was raised when the connection could not be created.
+        Any callers waiting for the pool to be ready are notified.
         """
-        cdef PooledConnRequest request
-        if conn_impl is None:
+        cdef BaseThinConnImpl conn_impl
+        if isinstance(result, BaseException):
+            self._create_error = result
             self._num_to_create = 0
         elif not self._open:
+            conn_impl = <BaseThinConnImpl> result
             conn_impl._protocol._disconnect()
         else:
+            conn_impl = <BaseThinConnImpl> result
+            self._create_error = None
             self._open_count += 1
             if self._num_to_create > 0:
                 self._num_to_create -= 1
             self._check_satisfy_request(conn_impl, is_new=True)
             self._check_timeout()
+        self._condition.notify_all()
 
     cdef int _post_process_request(self, PooledConnRequest request) except -1:
         """
@@ -287,15 +444,17 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
             self._open_count -= 1
             if self._num_to_create == 0 and self._open_count < self.min:
                 self._num_to_create = self.min - self._open_count
-        self._requests.remove(request)
+        self._remove_request(request)
         self._condition.notify_all()
 
     cdef int _pre_connect(self, BaseThinConnImpl conn_impl,
                           ConnectParamsImpl params) except -1:
         """
         Called before the connection is connected. The connection class and
-        pool attributes are updated and the TLS session is stored on the
-        transport for reuse. The timestamps are also retained for later use.
+        pool attributes are updated. The timestamps are also retained for
+        later use and the result cache of the pool, if any, is shared with the
+        connection. The statistics of the statement cache of the connection
+        are also added to those of the pool.
         """
         if params is not None:
             conn_impl._cclass = params._default_description.cclass
@@ -305,6 +464,8 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         conn_impl._pool_id = self._pool_id
         conn_impl._time_created = time.monotonic()
         conn_impl._time_returned = conn_impl._time_created
+        conn_impl._result_cache = self._result_cache
+        conn_impl._pool_stmt_cache_stats = self._stmt_cache_stats
 
     def _process_timeout(self):
         """
@@ -313,10 +474,30 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         connections in the pool).
         """
         self._timeout_task = None
-        self._timeout_helper(self._free_new_conn_impls)
-        self._timeout_helper(self._free_used_conn_impls)
+        self._timeout_helper()
         self._check_timeout()
 
+    cdef int _remove_request(self, PooledConnRequest request) except -1:
+        """
+        Removes a request from the set of requests being processed.
+        """
+        del self._requests[request]
+        self._remove_waiting_request(request)
+
+    cdef int _remove_waiting_request(self,
+                                     PooledConnRequest request) except -1:
+        """
+        Removes a request from the index of requests waiting for a connection,
+        if it is present.
+        """
+        cdef object key, requests
+        key = (request.cclass, request.wants_new)
+        requests = self._waiting_requests.get(key)
+        if requests is not None:
+            requests.pop(request, None)
+            if not requests:
+                del self._waiting_requests[key]
+
     cdef int _return_connection_helper(self,
                                        BaseThinConnImpl conn_impl) except -1:
         """
@@ -340,7 +521,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
             conn_impl._is_pool_extra = False
             if is_open and self._open_count >= self.max:
                 if self._free_new_conn_impls and self._open_count == self.max:
-                    self._drop_conn_impl(self._free_new_conn_impls.pop(0))
+                    self._drop_conn_impl(self._free_new_conn_impls.popleft())
                 else:
                     self._open_count -= 1
                     self._drop_conn_impl(conn_impl)
@@ -366,6 +547,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         cdef BaseThinConnImpl conn_impl
         with self._condition:
             self._requests.clear()
+            self._waiting_requests.clear()
             self._close_all_connections()
         self._bg_task.join()
 
@@ -375,19 +557,29 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         """
         pass
 
-    cdef int _timeout_helper(self, list conn_impls_to_check) except -1:
+    cdef int _timeout_helper(self) except -1:
         """
-        Helper method which checks the list of connections to see if any
+        Helper method which checks the free connections to see if any
         connections have expired (while maintaining the minimum number of
         connections in the pool).
         """
-        cdef BaseThinConnImpl conn_impl
+        cdef:
+            BaseThinConnImpl conn_impl
+            object queue
         current_time = time.monotonic()
-        while conn_impls_to_check and self._open_count > self.min:
-            conn_impl = conn_impls_to_check[0]
+        while self._free_new_conn_impls and self._open_count > self.min:
+            conn_impl = self._free_new_conn_impls[0]
             if current_time - conn_impl._time_returned < self._timeout:
                 break
-            conn_impls_to_check.pop(0)
+            self._free_new_conn_impls.popleft()
+            self._drop_conn_impl(conn_impl)
+            self._open_count -= 1
+        while self._free_used_conn_impls and self._open_count > self.min:
+            queue = self._get_free_used_queue(None, True, True)
+            conn_impl = queue[0]
+            if current_time - conn_impl._time_returned < self._timeout:
+                break
+            self._pop_free_used_conn_impl(None, True, True)
             self._drop_conn_impl(conn_impl)
             self._open_count -= 1
 
@@ -422,6 +614,13 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         """
         return self._ping_interval
 
+    def get_statement_cache_stats(self):
+        """
+        Internal method for getting the statistics of the statement caches of
+        all connections created by the pool.
+        """
+        return self._stmt_cache_stats.as_dict()
+
     def get_stmt_cache_size(self):
         """
         Internal method for getting the size of the statement cache.
@@ -434,6 +633,17 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         """
         return self._timeout
 
+    def get_wait_histograms(self):
+        """
+        Internal method for getting the histograms of the time spent waiting
+        to acquire connections, for each connection class.
+        """
+        cdef tuple bounds = POOL_WAIT_HISTOGRAM_BOUNDS + (float("inf"),)
+        return {
+            cclass: dict(zip(bounds, counts))
+            for cclass, counts in self._wait_histograms.items()
+        }
+
     def get_wait_timeout(self):
         """
         Internal method for getting the wait timeout for acquiring sessions.
@@ -525,6 +735,7 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
             PooledConnRequest request = None
             ThinConnImpl conn_impl
             uint32_t num_to_create
+            object result
 
         # add to the list of pools that require closing
         pool_closer.add_pool(self)
@@ -543,16 +754,15 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
                     request = self._get_next_request()
                     continue
 
-            # check to see if there is a connection that needs to be built
+            # check to see if there are connections that need to be built
             with self._condition:
-                num_to_create = self._num_to_create
+                num_to_create = min(self._num_to_create,
+                                    self._create_concurrency)
             if num_to_create > 0 and self._open:
-                try:
-                    conn_impl = self._create_conn_impl()
-                except:
-                    conn_impl = None
+                results = self._create_conn_impls(num_to_create)
                 with self._condition:
-                    self._post_create_conn_impl(conn_impl)
+                    for result in results:
+                        self._post_create_conn_impl(result)
                     continue
 
             # check to see if there are any connections to drop
@@ -588,6 +798,36 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
         conn_impl.connect(self.connect_params)
         return conn_impl
 
+    cdef list _create_conn_impls(self, uint32_t num_to_create):
+        """
+        Creates the specified number of connections for the pool. Each
+        connection after the first is created in its own thread so that the
+        time spent establishing the connections overlaps. A list containing
+        each connection that was created (or the exception that was raised
+        when a connection could not be created) is returned.
+        """
+        cdef:
+            list results = [None] * num_to_create
+            list threads
+            uint32_t i
+
+        def create_conn_impl(i):
+            try:
+                results[i] = self._create_conn_impl()
+            except Exception as e:
+                results[i] = e
+
+        threads = [
+            threading.Thread(target=create_conn_impl, args=(i,))
+            for i in range(1, num_to_create)
+        ]
+        for thread in threads:
+            thread.start()
+        create_conn_impl(0)
+        for thread in threads:
+            thread.join()
+        return results
+
     def _notify_bg_task(self):
         """
         Notify the background task that work needs to be done.
@@ -654,7 +894,7 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
                 request.waiting = False
             if not request.completed:
                 errors._raise_err(errors.ERR_POOL_NO_CONNECTION_AVAILABLE)
-            return self._post_acquire(request.conn_impl)
+            return self._post_acquire(request)
 
     def close(self, bint force):
         """
@@ -677,6 +917,16 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
             self._drop_conn_impl(conn_impl)
             self._condition.notify()
 
+    def wait_until_ready(self, uint32_t min_open, object timeout):
+        """
+        Internal method for waiting until the pool has at least the specified
+        number of open connections.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._is_ready(min_open),
+                                     timeout)
+            return self._check_ready(min_open)
+
 
 cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
 
@@ -716,6 +966,7 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
             BaseThinConnImpl conn_impl
             list conn_impls_to_drop
             uint32_t num_to_create
+            object result
 
         # perform task until pool is closed
         while self._open or self._conn_impls_to_drop:
@@ -731,18 +982,20 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
                     request = self._get_next_request()
                     continue
 
-            # check to see if there is a connection that needs to be built
+            # check to see if there are connections that need to be built
             async with self._condition:
-                num_to_create = self._num_to_create
+                num_to_create = min(self._num_to_create,
+                                    self._create_concurrency)
             if num_to_create > 0 and self._open:
-                try:
-                    conn_impl = await self._create_conn_impl()
-                except asyncio.CancelledError:
-                    raise
-                except:
-                    conn_impl = None
+                results = await asyncio.gather(
+                    *[self._create_conn_impl() for i in range(num_to_create)],
+                    return_exceptions=True
+                )
                 async with self._condition:
-                    self._post_create_conn_impl(conn_impl)
+                    for result in results:
+                        if isinstance(result, asyncio.CancelledError):
+                            raise result
+                        self._post_create_conn_impl(result)
                     continue
 
             # check to see if there are any connections to drop
@@ -842,7 +1095,7 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
             )
         except asyncio.TimeoutError:
             errors._raise_err(errors.ERR_POOL_NO_CONNECTION_AVAILABLE)
-        return self._post_acquire(request.conn_impl)
+        return self._post_acquire(request)
 
     async def close(self, bint force):
         """
@@ -877,6 +1130,22 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
                     raise
             self._return_connection_helper(conn_impl)
 
+    async def wait_until_ready(self, uint32_t min_open, object timeout):
+        """
+        Internal method for waiting until the pool has at least the specified
+        number of open connections.
+        """
+        async def helper():
+            async with self._condition:
+                await self._condition.wait_for(
+                    lambda: self._is_ready(min_open)
+                )
+        try:
+            await asyncio.wait_for(helper(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._check_ready(min_open)
+
 
 @cython.freelist(20)
 cdef class PooledConnRequest:
@@ -886,6 +1155,8 @@ cdef class PooledConnRequest:
         ConnectParamsImpl params
         str cclass
         object exception
+        uint64_t seq_num
+        double start_time
         bint cclass_matches
         bint requires_ping
         bint wants_new
@@ -947,8 +1218,6 @@ cdef class PooledConnRequest:
         cdef:
             BaseThinPoolImpl pool = self.pool_impl
             BaseThinConnImpl conn_impl
-            ssize_t ix
-            object exc
 
         # if an exception was raised in the background thread, raise it now
         if self.exception is not None:
@@ -970,15 +1239,16 @@ cdef class PooledConnRequest:
         # check for an available used connection (only permitted if a new
         # connection is not required); in addition, ensure that the connection
         # class matches
-        if not self.wants_new and pool._free_used_conn_impls:
-            ix = len(pool._free_used_conn_impls) - 1
-            for conn_impl in reversed(pool._free_used_conn_impls):
-                if self.cclass is None or conn_impl._cclass == self.cclass:
-                    pool._free_used_conn_impls.pop(ix)
-                    self._check_connection(conn_impl)
-                    if self.completed or self.requires_ping:
-                        return self.completed
-                ix -= 1
+        if not self.wants_new:
+            while pool._free_used_conn_impls:
+                conn_impl = pool._pop_free_used_conn_impl(
+                    self.cclass, self.cclass is None
+                )
+                if conn_impl is None:
+                    break
+                self._check_connection(conn_impl)
+                if self.completed or self.requires_ping:
+                    return self.completed
 
         # check for an available new connection (only permitted if the
         # connection class matches)
@@ -1002,7 +1272,7 @@ cdef class PooledConnRequest:
                 return False
             elif pool._free_used_conn_impls:
                 self.is_replacing = True
-                conn_impl = pool._free_used_conn_impls.pop()
+                conn_impl = pool._pop_free_used_conn_impl(None, True)
                 pool._conn_impls_to_drop.append(conn_impl)
                 pool._add_request(self)
                 return False
@@ -1053,7 +1323,7 @@ cdef class PooledConnRequest:
             elif conn_impl.invoke_session_callback:
                 pool_impl._free_new_conn_impls.append(conn_impl)
             else:
-                pool_impl._free_used_conn_impls.append(conn_impl)
+                pool_impl._add_free_used_conn_impl(conn_impl)
 
 
 cdef class PoolCloser:
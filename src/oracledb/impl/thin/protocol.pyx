@@ -200,6 +200,7 @@ cdef class BaseProtocol:
         conn_impl.warning = auth_message.warning
         buf._pending_error_num = 0
         self._in_connect = False
+        self._transport.save_tls_session()
 
     cdef int _send_marker(self, WriteBuffer buf, uint8_t marker_type):
         """
@@ -562,6 +563,24 @@ cdef class Protocol(BaseProtocol):
             packet_type = self._read_buf._current_packet.packet_type
         self._break_in_progress = False
 
+    cdef int abort_pipeline(self) except -1:
+        """
+        Called when the messages for a pipeline could not be sent to the
+        database. The read buffer is restored to its normal state.
+        """
+        self._read_buf._check_request_boundary = False
+        self._read_buf._in_pipeline = False
+
+    cdef int begin_pipeline(self) except -1:
+        """
+        Called before the messages for a pipeline are sent to the database.
+        All packets received from this point on are retained until the
+        responses for the pipeline are processed by end_pipeline().
+        """
+        self._read_buf.reset_packets()
+        self._read_buf._check_request_boundary = True
+        self._read_buf._in_pipeline = True
+
     cdef int close(self, ThinConnImpl conn_impl, bint in_del) except -1:
         """
         Closes the connection. If a transaction is in progress it will be
@@ -576,6 +595,86 @@ cdef class Protocol(BaseProtocol):
                 if not in_del:
                     raise
 
+    cdef int discard_pipeline(self, BaseThinConnImpl conn_impl,
+                              ssize_t num_responses) except -1:
+        """
+        Called when an error has occurred before all of the messages for the
+        pipeline have been sent to the database. An end pipeline message is
+        sent to the database and the specified number of responses (as well as
+        the response to the end pipeline message) are discarded.
+        """
+        cdef:
+            ReadBuffer buf = self._read_buf
+            Message end_message
+        end_message = conn_impl._create_message(EndPipelineMessage)
+        try:
+            end_message.send(self._write_buf)
+            buf.discard_pipeline_responses_sync(num_responses + 1)
+        finally:
+            buf._check_request_boundary = False
+            buf._in_pipeline = False
+
+    cdef int end_pipeline(self, BaseThinConnImpl conn_impl, list messages,
+                          bint continue_on_error) except -1:
+        """
+        Called when all messages for the pipeline have been sent to the
+        database. An end pipeline message is sent to the database and then
+        the responses to all of the messages are processed.
+        """
+        cdef:
+            ssize_t num_responses_to_discard
+            ReadBuffer buf = self._read_buf
+            Message message, end_message
+        end_message = conn_impl._create_message(EndPipelineMessage)
+        try:
+            end_message.send(self._write_buf)
+        except:
+            self.abort_pipeline()
+            raise
+        try:
+            num_responses_to_discard = len(messages) + 1
+            for message in messages:
+                try:
+                    if not buf.has_response():
+                        buf.wait_for_response_sync()
+                    buf._start_packet()
+                    message.preprocess()
+                    message.process(buf)
+                    num_responses_to_discard -= 1
+                    self._process_call_status(conn_impl, message.call_status)
+                    message._check_and_raise_exception()
+                except Exception as e:
+                    if not continue_on_error:
+                        raise
+                    message.pipeline_result_impl._capture_err(e)
+            self._receive_packet(end_message, check_request_boundary=True)
+            end_message.process(buf)
+            num_responses_to_discard = 0
+            end_message._check_and_raise_exception()
+        except:
+            buf.discard_pipeline_responses_sync(num_responses_to_discard)
+            raise
+        finally:
+            buf._check_request_boundary = False
+            buf._in_pipeline = False
+
+    cdef int process_pipeline_response(self, BaseThinConnImpl conn_impl,
+                                       Message message) except -1:
+        """
+        Processes the response to a message that was sent as part of a
+        pipeline while further messages for the pipeline are still being sent
+        to the database. The packets of the response are discarded once it
+        has been processed. Any error returned by the database is left for the
+        caller to raise.
+        """
+        cdef ReadBuffer buf = self._read_buf
+        if not buf.has_response():
+            buf.wait_for_response_sync()
+        buf._start_packet()
+        message.process(buf)
+        buf.discard_processed_packets()
+        self._process_call_status(conn_impl, message.call_status)
+
 
 cdef class BaseAsyncProtocol(BaseProtocol):
 
@@ -815,8 +914,11 @@ cdef class BaseAsyncProtocol(BaseProtocol):
             uint32_t timeout = message.conn_impl._call_timeout
             object timeout_obj = (timeout / 1000) or None
         try:
-            coroutine = self._process_message_helper(message)
-            await asyncio.wait_for(coroutine, timeout_obj)
+            if timeout_obj is None:
+                await self._process_message_helper(message)
+            else:
+                coroutine = self._process_message_helper(message)
+                await asyncio.wait_for(coroutine, timeout_obj)
         except asyncio.TimeoutError:
             try:
                 coroutine = self._process_timeout_helper(message, timeout)
@@ -906,7 +1008,10 @@ cdef class BaseAsyncProtocol(BaseProtocol):
             const char_type* ptr
         buf._check_request_boundary = \
                 check_request_boundary and self._caps.supports_end_of_response
-        await buf.wait_for_packets_async()
+        waiter = buf.get_packets_waiter()
+        if waiter is not None:
+            await waiter
+        buf._start_packet()
         buf._check_request_boundary = False
         if buf._current_packet.packet_type == TNS_PACKET_TYPE_MARKER:
             if in_pipeline:
@@ -952,6 +1057,28 @@ cdef class BaseAsyncProtocol(BaseProtocol):
             packet_type = self._read_buf._current_packet.packet_type
         self._break_in_progress = False
 
+    def buffer_updated(self, ssize_t nbytes):
+        """
+        Called when the event loop has written data received on the transport
+        into the buffer returned by get_buffer().
+        """
+        cdef:
+            bint notify_waiter = False
+            Packet packet
+        if self._transport is None:
+            return
+        self._transport._recv_end += nbytes
+        if self._proxy_waiter is not None:
+            self._proxy_waiter.set_result(self._transport.get_received_bytes())
+            self._proxy_waiter = None
+        else:
+            packet = self._transport.extract_packet()
+            while packet is not None:
+                self._read_buf._process_packet(packet, &notify_waiter, False)
+                if notify_waiter:
+                    self._read_buf.notify_packet_received()
+                packet = self._transport.extract_packet()
+
     async def close(self, AsyncThinConnImpl conn_impl, bint in_del):
         """
         Closes the connection. If a transaction is in progress it will be
@@ -992,23 +1119,24 @@ cdef class BaseAsyncProtocol(BaseProtocol):
             error = errors._create_err(errors.ERR_CONNECTION_CLOSED)
             self._read_buf._waiter.set_exception(error.exc_type(error))
 
-    def data_received(self, data):
+    async def discard_pipeline(self, BaseThinConnImpl conn_impl,
+                               ssize_t num_responses):
         """
-        Called when data has been received on the transport.
+        Called when an error has occurred before all of the messages for the
+        pipeline have been sent to the database. An end pipeline message is
+        sent to the database and the specified number of responses (as well as
+        the response to the end pipeline message) are discarded.
         """
         cdef:
-            bint notify_waiter = False
-            Packet packet
-        if self._proxy_waiter is not None:
-            self._proxy_waiter.set_result(data)
-            self._proxy_waiter = None
-        else:
-            packet = self._transport.extract_packet(data)
-            while packet is not None:
-                self._read_buf._process_packet(packet, &notify_waiter, False)
-                if notify_waiter:
-                    self._read_buf.notify_packet_received()
-                packet = self._transport.extract_packet()
+            ReadBuffer buf = self._read_buf
+            Message end_message
+        end_message = conn_impl._create_message(EndPipelineMessage)
+        try:
+            end_message.send(self._write_buf)
+            await buf.discard_pipeline_responses_async(num_responses + 1)
+        finally:
+            buf._check_request_boundary = False
+            buf._in_pipeline = False
 
     async def end_pipeline(self, BaseThinConnImpl conn_impl, list messages,
                            bint continue_on_error):
@@ -1047,12 +1175,44 @@ cdef class BaseAsyncProtocol(BaseProtocol):
             num_responses_to_discard = 0
             end_message._check_and_raise_exception()
         except:
-            await buf.discard_pipeline_responses(num_responses_to_discard)
+            await buf.discard_pipeline_responses_async(
+                num_responses_to_discard
+            )
             raise
         finally:
             buf._check_request_boundary = False
             buf._in_pipeline = False
 
 
-class AsyncProtocol(BaseAsyncProtocol, asyncio.Protocol):
+    def get_buffer(self, ssize_t sizehint):
+        """
+        Called by the event loop to acquire the buffer into which data received
+        on the transport is written. The receive buffer of the transport is
+        returned so that data does not need to be copied before packets are
+        extracted from it. Data that arrives after the transport has been
+        disconnected (such as the TLS close notification) is discarded.
+        """
+        if self._transport is None:
+            return bytearray(MIN_RECEIVE_BUFFER_SPACE)
+        return self._transport.get_receive_buffer()
+
+    async def process_pipeline_response(self, BaseThinConnImpl conn_impl,
+                                        Message message):
+        """
+        Processes the response to a message that was sent as part of a
+        pipeline while further messages for the pipeline are still being sent
+        to the database. The packets of the response are discarded once it
+        has been processed. Any error returned by the database is left for the
+        caller to raise.
+        """
+        cdef ReadBuffer buf = self._read_buf
+        if not buf.has_response():
+            await buf.wait_for_response_async()
+        buf._start_packet()
+        message.process(buf)
+        buf.discard_processed_packets()
+        self._process_call_status(conn_impl, message.call_status)
+
+
+class AsyncProtocol(BaseAsyncProtocol, asyncio.BufferedProtocol):
     pass
@@ -0,0 +1,1653 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#------------------------------------------------------------------------------
+
+#------------------------------------------------------------------------------
+# soda.pyx
+#
+# Cython file defining the thin implementation SODA classes (embedded in
+# thin_impl.pyx). Collections are managed with the PL/SQL package DBMS_SODA
+# and documents are accessed with SQL statements generated from the metadata
+# of each collection.
+#------------------------------------------------------------------------------
+
+cdef str SODA_SQL_GET_COLLECTION_NAMES = """
+        select uri_name
+        from user_soda_collections
+        where uri_name >= nvl(:start_name, uri_name)
+        order by uri_name"""
+
+cdef str SODA_SQL_GET_METADATA = """
+        select json_descriptor
+        from user_soda_collections
+        where uri_name = :name"""
+
+cdef str SODA_SQL_CREATE_COLLECTION = """
+        declare
+            c soda_collection_t;
+        begin
+            c := dbms_soda.create_collection(:name, :metadata);
+            :descriptor := c.get_metadata();
+        end;"""
+
+cdef str SODA_SQL_CREATE_COLLECTION_MAP = """
+        declare
+            c soda_collection_t;
+        begin
+            c := dbms_soda.create_collection(:name, :metadata,
+                    dbms_soda.create_mode_map);
+            :descriptor := c.get_metadata();
+        end;"""
+
+cdef str SODA_SQL_DROP_COLLECTION = """
+        begin
+            :status := dbms_soda.drop_collection(:name);
+        end;"""
+
+cdef str SODA_SQL_CREATE_INDEX = """
+        declare
+            c soda_collection_t;
+        begin
+            c := dbms_soda.open_collection(:name);
+            :status := c.create_index(:spec);
+        end;"""
+
+cdef str SODA_SQL_DROP_INDEX = """
+        declare
+            c soda_collection_t;
+        begin
+            c := dbms_soda.open_collection(:name);
+            :status := c.drop_index(:index_name, :force = 1);
+        end;"""
+
+cdef str SODA_SQL_GET_DATA_GUIDE = """
+        declare
+            c soda_collection_t;
+        begin
+            c := dbms_soda.open_collection(:name);
+            :data_guide := c.get_data_guide();
+        end;"""
+
+# the format used for the timestamps stored in a collection
+cdef str SODA_TIMESTAMP_FORMAT = """'YYYY-MM-DD"T"HH24:MI:SS.FF6"Z"'"""
+
+# the expression used for setting the timestamps stored in a collection
+cdef str SODA_CURRENT_TIMESTAMP = "sys_extract_utc(systimestamp)"
+
+# the default number of documents fetched in each round-trip
+cdef uint32_t SODA_DEFAULT_FETCH_ARRAY_SIZE = 100
+
+# the methods of key assignment and versioning that are supported
+cdef tuple SODA_KEY_METHODS = (
+    "CLIENT", "EMBEDDED_OID", "GUID", "IDENTITY", "SEQUENCE", "UUID"
+)
+cdef tuple SODA_VERSION_METHODS = (
+    "MD5", "NONE", "SEQUENTIAL", "SHA256", "TIMESTAMP", "UUID"
+)
+cdef tuple SODA_CONTENT_TYPES = (
+    "BLOB", "CLOB", "JSON", "NCLOB", "NVARCHAR2", "RAW", "VARCHAR2"
+)
+cdef tuple SODA_TEXT_CONTENT_TYPES = ("CLOB", "NCLOB", "NVARCHAR2", "VARCHAR2")
+
+# the QBE operators that are translated into SQL/JSON path expressions
+cdef dict SODA_COMPARISON_OPERATORS = {
+    "$eq": "==",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+}
+cdef dict SODA_ITEM_METHODS = {
+    "$abs": ".abs()",
+    "$boolean": ".boolean()",
+    "$ceiling": ".ceiling()",
+    "$date": ".date()",
+    "$double": ".double()",
+    "$floor": ".floor()",
+    "$length": ".length()",
+    "$lower": ".lower()",
+    "$number": ".number()",
+    "$size": ".size()",
+    "$string": ".string()",
+    "$timestamp": ".timestamp()",
+    "$type": ".type()",
+    "$upper": ".upper()",
+}
+cdef dict SODA_ORDER_BY_TYPES = {
+    "date": "date",
+    "datetime": "timestamp",
+    "number": "number",
+}
+
+cdef object SODA_ARRAY_STEP_PATTERN = re.compile(r"\[[0-9a-z ,*\-]+\]")
+
+
+cdef str _soda_quote_name(str name):
+    """
+    Returns the name quoted for use as an identifier in a SQL statement.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+cdef str _soda_get_hint(str hint):
+    """
+    Returns the hint formatted for inclusion in a SQL statement. Hints that
+    would terminate the comment early are rejected.
+    """
+    if hint is None:
+        return ""
+    if "*/" in hint:
+        errors._raise_err(errors.ERR_INVALID_SODA_HINT)
+    return " /*+ " + hint + " */"
+
+
+cdef str _soda_get_json_path(str path):
+    """
+    Returns the SQL/JSON path steps equivalent to the path found in a QBE. The
+    field names are quoted and the array steps are validated so that the path
+    can be safely embedded in a SQL statement.
+    """
+    cdef:
+        ssize_t pos = 0, end, length = len(path)
+        list steps = []
+        str step
+    while pos < length:
+        if path[pos] == ".":
+            pos += 1
+            continue
+        if path[pos] == "`":
+            end = path.find("`", pos + 1)
+            if end < 0:
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason=f"invalid path {path!r}")
+            step = path[pos + 1:end]
+            end += 1
+        elif path[pos] == "[":
+            end = path.find("]", pos) + 1
+            if end == 0 \
+                    or not SODA_ARRAY_STEP_PATTERN.fullmatch(path[pos:end]):
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason=f"invalid path {path!r}")
+            steps.append(path[pos:end])
+            pos = end
+            continue
+        else:
+            end = pos
+            while end < length and path[end] not in ".[`":
+                end += 1
+            step = path[pos:end]
+        step = step.replace("\\", "\\\\").replace('"', '\\"')
+        steps.append('."' + step + '"')
+        pos = end
+    if not steps:
+        errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                          reason=f"invalid path {path!r}")
+    return "".join(steps)
+
+
+cdef str _soda_get_string_literal(str op, object value):
+    """
+    Returns a SQL/JSON path string literal for the value. This is used for the
+    operators which require the pattern to be a literal.
+    """
+    if not isinstance(value, str):
+        errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                          reason=f"{op} requires a string operand")
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+cdef class SodaQueryBuilder:
+    """
+    Builds the SQL conditions, ordering and bind values for the criteria of a
+    SODA operation. Filter specifications (QBEs) are translated into
+    SQL/JSON conditions on the content column of the collection.
+    """
+    cdef:
+        BaseThinSodaCollImpl coll_impl
+        list conditions
+        list order_by
+        dict params
+
+    @staticmethod
+    cdef SodaQueryBuilder create(BaseThinSodaCollImpl coll_impl, object op):
+        """
+        Creates a builder for the criteria of the given operation.
+        """
+        cdef SodaQueryBuilder builder
+        builder = SodaQueryBuilder.__new__(SodaQueryBuilder)
+        builder.coll_impl = coll_impl
+        builder.conditions = []
+        builder.order_by = []
+        builder.params = {}
+        if op is not None:
+            builder._add_operation(op)
+        return builder
+
+    cdef str _add_bind(self, object value):
+        """
+        Adds a bind value and returns the name of the bind variable.
+        """
+        cdef str name = f"qbe_{len(self.params)}"
+        self.params[name] = value
+        return name
+
+    cdef int _add_filter(self, str filter_spec) except -1:
+        """
+        Adds the conditions and ordering found in the filter specification.
+        """
+        cdef:
+            object order_by, query
+            str condition
+            dict spec
+        try:
+            spec = json.loads(filter_spec)
+        except (TypeError, ValueError) as e:
+            errors._raise_err(errors.ERR_INVALID_SODA_FILTER, reason=str(e))
+        if not isinstance(spec, dict):
+            errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                              reason="expecting a JSON object")
+        order_by = spec.pop("$orderby", None)
+        query = spec.pop("$query", None)
+        if query is not None:
+            if not isinstance(query, dict):
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason="$query requires an object")
+            spec.update(query)
+        condition = self._get_conditions(spec)
+        if condition is not None:
+            self.conditions.append(condition)
+        if order_by is not None:
+            self._add_order_by(order_by)
+
+    cdef int _add_operation(self, object op) except -1:
+        """
+        Adds the criteria specified on the operation.
+        """
+        cdef BaseThinSodaCollImpl coll_impl = self.coll_impl
+        if op._key is not None:
+            self.params["key"] = op._key
+            self.conditions.append(
+                f"{coll_impl._key_column} = {coll_impl._key_bind('key')}"
+            )
+        elif op._keys is not None:
+            self.conditions.append(self._get_key_condition(op._keys))
+        if op._version is not None \
+                and coll_impl._version_column is not None:
+            self.conditions.append(
+                f"{coll_impl._version_column} = "
+                f":{self._add_bind(op._version)}"
+            )
+        if op._filter is not None:
+            self._add_filter(op._filter)
+
+    cdef int _add_order_by(self, object spec) except -1:
+        """
+        Adds the ordering found in the $orderby clause of a filter
+        specification.
+        """
+        cdef object item
+        if isinstance(spec, dict) and "$fields" in spec:
+            spec = spec["$fields"]
+        if isinstance(spec, dict):
+            for path, direction in spec.items():
+                self._add_order_by_field(path, None, direction, None)
+        elif isinstance(spec, list):
+            for item in spec:
+                if not isinstance(item, dict) or "path" not in item:
+                    errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                      reason="$orderby requires a path")
+                self._add_order_by_field(item["path"], item.get("datatype"),
+                                         item.get("order", "asc"),
+                                         item.get("maxLength"))
+        else:
+            errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                              reason="$orderby requires an object or array")
+
+    cdef int _add_order_by_field(self, object path, object data_type,
+                                 object direction,
+                                 object max_length) except -1:
+        """
+        Adds a single field to the ordering.
+        """
+        cdef str sql_type, path_expr
+        if not isinstance(path, str):
+            errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                              reason="$orderby requires a string path")
+        if isinstance(data_type, str) \
+                and data_type.lower() in SODA_ORDER_BY_TYPES:
+            sql_type = SODA_ORDER_BY_TYPES[data_type.lower()]
+        elif isinstance(max_length, int) and max_length > 0:
+            sql_type = f"varchar2({max_length})"
+        else:
+            sql_type = "varchar2(2000)"
+        if direction in (1, -1):
+            direction = "asc" if direction == 1 else "desc"
+        elif not isinstance(direction, str) \
+                or direction.lower() not in ("asc", "desc"):
+            errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                              reason=f"invalid order {direction!r}")
+        path_expr = ("$" + _soda_get_json_path(path)).replace("'", "''")
+        self.order_by.append(
+            f"json_value({self.coll_impl._content_expr}, '{path_expr}' "
+            f"returning {sql_type}) {direction.lower()}"
+        )
+
+    cdef object _convert_value(self, str op, str method, object value):
+        """
+        Converts the operand of a date or timestamp comparison to a Python
+        value that can be bound.
+        """
+        if not isinstance(value, str):
+            return value
+        try:
+            if method.endswith(".date()"):
+                return datetime.date.fromisoformat(value[:10])
+            elif method.endswith(".timestamp()"):
+                value = datetime.datetime.fromisoformat(
+                    value.replace("Z", "+00:00")
+                )
+                if value.tzinfo is not None:
+                    value = value.astimezone(datetime.timezone.utc)
+                    value = value.replace(tzinfo=None)
+        except ValueError:
+            errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                              reason=f"invalid operand for {op}: {value!r}")
+        return value
+
+    cdef str _get_conditions(self, dict spec):
+        """
+        Returns the SQL condition equivalent to the object found in a filter
+        specification or None if the object contains no conditions.
+        """
+        cdef:
+            list conditions = [], sub_conditions
+            object key, value, item
+            str condition
+        for key, value in spec.items():
+            if key in ("$and", "$or", "$nor"):
+                if not isinstance(value, list) or not value:
+                    errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                      reason=f"{key} requires an array")
+                sub_conditions = []
+                for item in value:
+                    if not isinstance(item, dict):
+                        errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                          reason=f"{key} requires objects")
+                    condition = self._get_conditions(item)
+                    sub_conditions.append(condition or "1 = 1")
+                if key == "$and":
+                    condition = " and ".join(sub_conditions)
+                else:
+                    condition = " or ".join(sub_conditions)
+                if key == "$nor":
+                    condition = f"not ({condition})"
+                conditions.append(f"({condition})")
+            elif key == "$id":
+                if isinstance(value, str):
+                    value = [value]
+                conditions.append(self._get_key_condition(value))
+            elif key.startswith("$"):
+                errors._raise_err(
+                    errors.ERR_SODA_FILTER_OPERATOR_NOT_SUPPORTED,
+                    operator=key
+                )
+            else:
+                conditions.append(self._get_field_condition(key, value))
+        if len(conditions) == 1:
+            return conditions[0]
+        elif conditions:
+            return "(" + " and ".join(conditions) + ")"
+
+    cdef str _get_field_condition(self, str path, object value):
+        """
+        Returns the SQL condition for the value associated with a field in a
+        filter specification.
+        """
+        cdef:
+            list conditions, operators
+            object key
+        if isinstance(value, dict):
+            operators = [k for k in value if k.startswith("$")]
+            if not operators:
+                conditions = [
+                    self._get_field_condition(f"{path}.{key}", value[key])
+                    for key in value
+                ]
+            elif len(operators) != len(value):
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason="operators and fields cannot be "
+                                         "mixed")
+            else:
+                conditions = [
+                    self._get_operator_condition(path, "", key, value[key])
+                    for key in value
+                ]
+            if len(conditions) == 1:
+                return conditions[0]
+            return "(" + " and ".join(conditions) + ")"
+        return self._get_operator_condition(path, "", "$eq", value)
+
+    cdef str _get_json_exists(self, str path_filter, list passing):
+        """
+        Returns a json_exists() condition on the content column for the given
+        SQL/JSON path filter and variables.
+        """
+        cdef str sql
+        path_filter = path_filter.replace("'", "''")
+        sql = f"json_exists({self.coll_impl._content_expr}, " + \
+              f"'$?({path_filter})'"
+        if passing:
+            sql += " passing " + ", ".join(passing)
+        return sql + ")"
+
+    cdef str _get_key_condition(self, object keys):
+        """
+        Returns the SQL condition for a set of document keys.
+        """
+        cdef:
+            BaseThinSodaCollImpl coll_impl = self.coll_impl
+            list names = []
+            object key
+        for key in keys:
+            if not isinstance(key, str):
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason="keys must be strings")
+            names.append(coll_impl._key_bind(self._add_bind(key)))
+        if not names:
+            return "1 = 0"
+        return f"{coll_impl._key_column} in ({', '.join(names)})"
+
+    cdef str _get_operator_condition(self, str path, str method, str op,
+                                     object value):
+        """
+        Returns the SQL condition for an operator applied to a field in a
+        filter specification. Any item methods that have been applied to the
+        field are supplied in the method parameter.
+        """
+        cdef:
+            list conditions, passing = []
+            str lhs, rhs, name
+            object item
+        lhs = "@" + _soda_get_json_path(path) + method
+        if op in SODA_COMPARISON_OPERATORS:
+            rhs = self._get_path_value(op, method, value, passing)
+            return self._get_json_exists(
+                f"{lhs} {SODA_COMPARISON_OPERATORS[op]} {rhs}", passing
+            )
+        elif op == "$ne":
+            return "not " + \
+                    self._get_operator_condition(path, method, "$eq", value)
+        elif op in ("$in", "$nin", "$all"):
+            if not isinstance(value, list) or not value:
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason=f"{op} requires a non-empty array")
+            if op == "$all":
+                conditions = [
+                    self._get_operator_condition(path, method, "$eq", item)
+                    for item in value
+                ]
+                return "(" + " and ".join(conditions) + ")"
+            conditions = [
+                f"{lhs} == {self._get_path_value(op, method, item, passing)}"
+                for item in value
+            ]
+            rhs = self._get_json_exists(" || ".join(conditions), passing)
+            return rhs if op == "$in" else f"not {rhs}"
+        elif op == "$exists":
+            rhs = self._get_json_exists(f"exists({lhs})", passing)
+            return rhs if value else f"not {rhs}"
+        elif op == "$like":
+            rhs = _soda_get_string_literal(op, value)
+            return self._get_json_exists(f"{lhs} like {rhs}", passing)
+        elif op == "$regex":
+            rhs = _soda_get_string_literal(op, value)
+            return self._get_json_exists(f"{lhs} like_regex {rhs}", passing)
+        elif op == "$startsWith":
+            rhs = self._get_path_value(op, method, value, passing)
+            return self._get_json_exists(f"{lhs} starts with {rhs}", passing)
+        elif op in ("$hasSubstring", "$instr"):
+            rhs = self._get_path_value(op, method, value, passing)
+            return self._get_json_exists(f"{lhs} has substring {rhs}",
+                                         passing)
+        elif op == "$contains" and not method:
+            if not isinstance(value, str):
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason=f"{op} requires a string operand")
+            name = self._add_bind(value)
+            rhs = ("$" + _soda_get_json_path(path)).replace("'", "''")
+            return (f"json_textcontains({self.coll_impl._content_column}, "
+                    f"'{rhs}', :{name})")
+        elif op == "$not":
+            if not isinstance(value, dict) or not value:
+                errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                                  reason=f"{op} requires an object")
+            conditions = [
+                self._get_operator_condition(path, method, key, value[key])
+                for key in value
+            ]
+            return "not (" + " and ".join(conditions) + ")"
+        elif op in SODA_ITEM_METHODS:
+            method = method + SODA_ITEM_METHODS[op]
+            if not isinstance(value, dict):
+                return self._get_operator_condition(path, method, "$eq",
+                                                    value)
+            conditions = [
+                self._get_operator_condition(path, method, key, value[key])
+                for key in value
+            ]
+            if len(conditions) == 1:
+                return conditions[0]
+            return "(" + " and ".join(conditions) + ")"
+        errors._raise_err(errors.ERR_SODA_FILTER_OPERATOR_NOT_SUPPORTED,
+                          operator=op)
+
+    cdef str _get_path_value(self, str op, str method, object value,
+                             list passing):
+        """
+        Returns the SQL/JSON path expression for an operand. Scalar values
+        other than null and booleans are passed as variables.
+        """
+        cdef str name
+        if value is None:
+            return "null"
+        elif value is True:
+            return "true"
+        elif value is False:
+            return "false"
+        elif not isinstance(value, (str, int, float, decimal.Decimal)):
+            errors._raise_err(errors.ERR_INVALID_SODA_FILTER,
+                              reason=f"{op} requires a scalar operand")
+        name = self._add_bind(self._convert_value(op, method, value))
+        passing.append(f':{name} as "{name.upper()}"')
+        return "$" + name.upper()
+
+    cdef str get_order_by_clause(self, object op):
+        """
+        Returns the ORDER BY clause for the operation. When documents are
+        skipped or limited without an explicit ordering, the documents are
+        ordered by key so that the results are deterministic.
+        """
+        if self.order_by:
+            return "\norder by " + ", ".join(self.order_by)
+        elif op is not None and (op._skip or op._limit):
+            return f"\norder by {self.coll_impl._key_column}"
+        return ""
+
+    cdef str get_where_clause(self):
+        """
+        Returns the WHERE clause for the operation.
+        """
+        if self.conditions:
+            return "\nwhere " + "\n  and ".join(self.conditions)
+        return ""
+
+
+cdef class BaseThinSodaDbImpl(BaseSodaDbImpl):
+
+    cdef int _init_coll_impl(self, BaseThinSodaCollImpl coll_impl, str name,
+                             object metadata) except -1:
+        """
+        Initializes the collection implementation with the given name and
+        metadata.
+        """
+        if isinstance(metadata, dict):
+            metadata = json.dumps(metadata)
+        coll_impl._db_impl = self
+        coll_impl.name = name
+        coll_impl._parse_metadata(metadata)
+
+    cdef str _get_collection_names_sql(self, uint32_t limit):
+        """
+        Returns the SQL used for getting the names of the collections.
+        """
+        if limit > 0:
+            return SODA_SQL_GET_COLLECTION_NAMES + \
+                    "\n        fetch next :limit rows only"
+        return SODA_SQL_GET_COLLECTION_NAMES
+
+    def create_document(self, bytes content, str key, str media_type):
+        """
+        Internal method for creating a document containing binary or encoded
+        text data.
+        """
+        cdef ThinSodaDocImpl doc_impl
+        doc_impl = ThinSodaDocImpl.__new__(ThinSodaDocImpl)
+        doc_impl._content = content
+        doc_impl._encoding = "UTF-8"
+        doc_impl._key = key
+        doc_impl._media_type = media_type
+        return doc_impl
+
+    def create_json_document(self, object content, str key):
+        """
+        Internal method for creating a document containing JSON.
+        """
+        cdef ThinSodaDocImpl doc_impl
+        doc_impl = ThinSodaDocImpl.__new__(ThinSodaDocImpl)
+        doc_impl._content = content
+        doc_impl._key = key
+        doc_impl._media_type = "application/json"
+        return doc_impl
+
+
+cdef class ThinSodaDbImpl(BaseThinSodaDbImpl):
+
+    def create_collection(self, str name, str metadata, bint map_mode):
+        """
+        Internal method for creating a collection.
+        """
+        cdef ThinSodaCollImpl coll_impl
+        cursor = self._conn.cursor()
+        descriptor_var = cursor.var(str, 32767)
+        cursor.execute(
+            SODA_SQL_CREATE_COLLECTION_MAP if map_mode \
+                    else SODA_SQL_CREATE_COLLECTION,
+            name=name, metadata=metadata, descriptor=descriptor_var
+        )
+        coll_impl = ThinSodaCollImpl.__new__(ThinSodaCollImpl)
+        self._init_coll_impl(coll_impl, name, descriptor_var.getvalue())
+        return coll_impl
+
+    def get_collection_names(self, str start_name, uint32_t limit):
+        """
+        Internal method for getting the list of collection names.
+        """
+        cdef dict params = dict(start_name=start_name)
+        if limit > 0:
+            params["limit"] = limit
+        cursor = self._conn.cursor()
+        cursor.execute(self._get_collection_names_sql(limit), params)
+        return [name for name, in cursor]
+
+    def open_collection(self, str name):
+        """
+        Internal method for opening a collection.
+        """
+        cdef ThinSodaCollImpl coll_impl
+        cursor = self._conn.cursor()
+        cursor.execute(SODA_SQL_GET_METADATA, name=name, fetch_lobs=False)
+        row = cursor.fetchone()
+        if row is not None:
+            coll_impl = ThinSodaCollImpl.__new__(ThinSodaCollImpl)
+            self._init_coll_impl(coll_impl, name, row[0])
+            return coll_impl
+
+
+cdef class AsyncThinSodaDbImpl(BaseThinSodaDbImpl):
+
+    async def create_collection(self, str name, str metadata, bint map_mode):
+        """
+        Internal method for creating a collection.
+        """
+        cdef AsyncThinSodaCollImpl coll_impl
+        cursor = self._conn.cursor()
+        descriptor_var = cursor.var(str, 32767)
+        await cursor.execute(
+            SODA_SQL_CREATE_COLLECTION_MAP if map_mode \
+                    else SODA_SQL_CREATE_COLLECTION,
+            name=name, metadata=metadata, descriptor=descriptor_var
+        )
+        coll_impl = AsyncThinSodaCollImpl.__new__(AsyncThinSodaCollImpl)
+        self._init_coll_impl(coll_impl, name, descriptor_var.getvalue())
+        return coll_impl
+
+    async def get_collection_names(self, str start_name, uint32_t limit):
+        """
+        Internal method for getting the list of collection names.
+        """
+        cdef dict params = dict(start_name=start_name)
+        if limit > 0:
+            params["limit"] = limit
+        cursor = self._conn.cursor()
+        await cursor.execute(self._get_collection_names_sql(limit), params)
+        return [name for name, in await cursor.fetchall()]
+
+    async def open_collection(self, str name):
+        """
+        Internal method for opening a collection.
+        """
+        cdef AsyncThinSodaCollImpl coll_impl
+        cursor = self._conn.cursor()
+        await cursor.execute(SODA_SQL_GET_METADATA, name=name,
+                             fetch_lobs=False)
+        row = await cursor.fetchone()
+        if row is not None:
+            coll_impl = AsyncThinSodaCollImpl.__new__(AsyncThinSodaCollImpl)
+            self._init_coll_impl(coll_impl, name, row[0])
+            return coll_impl
+
+
+cdef class BaseThinSodaCollImpl(BaseSodaCollImpl):
+    cdef:
+        BaseThinSodaDbImpl _db_impl
+        str _metadata
+        str _table_name
+        str _key_column
+        str _key_sql_type
+        str _key_method
+        str _key_sequence
+        str _content_column
+        str _content_sql_type
+        str _content_expr
+        object _content_bind_type
+        bint _content_is_oson
+        str _version_column
+        str _version_method
+        str _last_modified_column
+        str _creation_time_column
+        str _media_type_column
+        bint _read_only
+        str _select_list
+        str _insert_columns
+        str _insert_values
+        str _update_values
+        str _returning_clause
+        list _returning_names
+
+    cdef str _key_bind(self, str name):
+        """
+        Returns the expression used for binding a key with the given name.
+        """
+        if self._key_sql_type == "RAW":
+            return f"hextoraw(:{name})"
+        return f":{name}"
+
+    cdef str _key_expr(self):
+        """
+        Returns the expression used for returning the key as a string.
+        """
+        if self._key_sql_type == "RAW":
+            return f"rawtohex({self._key_column})"
+        elif self._key_sql_type == "NUMBER":
+            return f"to_char({self._key_column})"
+        return self._key_column
+
+    cdef int _build_statements(self) except -1:
+        """
+        Builds the fragments of the SQL statements used for accessing the
+        documents in the collection.
+        """
+        cdef:
+            list select_items, columns, values, updates, returning
+            str key_expr, version_expr = "null", expr
+        key_expr = self._key_expr()
+        columns = []
+        values = []
+        updates = []
+        returning = [key_expr]
+        self._returning_names = ["key"]
+
+        # key column
+        if self._key_method in ("UUID", "CLIENT"):
+            columns.append(self._key_column)
+            values.append(self._key_bind("key"))
+        elif self._key_method == "GUID":
+            columns.append(self._key_column)
+            if self._key_sql_type == "RAW":
+                values.append("sys_guid()")
+            else:
+                values.append("rawtohex(sys_guid())")
+        elif self._key_method == "SEQUENCE":
+            columns.append(self._key_column)
+            values.append(f"{self._key_sequence}.nextval")
+
+        # content column
+        columns.append(self._content_column)
+        values.append(":content")
+        updates.append(f"{self._content_column} = :content")
+
+        # version column; the version of collections with embedded keys is
+        # maintained by the database
+        if self._version_column is not None:
+            if self._key_method == "EMBEDDED_OID":
+                version_expr = f"rawtohex({self._version_column})"
+            else:
+                version_expr = f"to_char({self._version_column})"
+            returning.append(version_expr)
+            self._returning_names.append("version")
+            if self._key_method == "EMBEDDED_OID" \
+                    or self._version_method == "NONE":
+                pass
+            elif self._version_method == "SEQUENTIAL":
+                columns.append(self._version_column)
+                values.append("1")
+                updates.append(f"{self._version_column} = "
+                               f"{self._version_column} + 1")
+            else:
+                columns.append(self._version_column)
+                values.append(":version")
+                updates.append(f"{self._version_column} = :version")
+
+        # timestamp columns
+        select_items = [key_expr, self._content_column, version_expr]
+        for expr in (self._last_modified_column, self._creation_time_column):
+            if expr is None:
+                select_items.append("null")
+                continue
+            columns.append(expr)
+            values.append(SODA_CURRENT_TIMESTAMP)
+            expr = f"to_char({expr}, {SODA_TIMESTAMP_FORMAT})"
+            select_items.append(expr)
+            returning.append(expr)
+        if self._last_modified_column is not None:
+            updates.append(f"{self._last_modified_column} = "
+                           f"{SODA_CURRENT_TIMESTAMP}")
+            self._returning_names.append("last_modified")
+        if self._creation_time_column is not None:
+            self._returning_names.append("created_on")
+
+        # media type column
+        if self._media_type_column is not None:
+            columns.append(self._media_type_column)
+            values.append(":media_type")
+            updates.append(f"{self._media_type_column} = :media_type")
+            select_items.append(self._media_type_column)
+        else:
+            select_items.append("null")
+
+        self._select_list = ", ".join(select_items)
+        self._insert_columns = ", ".join(columns)
+        self._insert_values = ", ".join(values)
+        self._update_values = ", ".join(updates)
+        self._returning_clause = \
+                "\nreturning " + ", ".join(returning) + " into " + \
+                ", ".join([f":ret_{n}" for n in self._returning_names])
+
+    cdef int _check_writable(self) except -1:
+        """
+        Checks that the collection is not read-only.
+        """
+        if self._read_only:
+            errors._raise_err(errors.ERR_SODA_COLLECTION_READ_ONLY,
+                              name=self.name)
+
+    cdef ThinSodaDocImpl _create_doc_impl(self, tuple row):
+        """
+        Creates a document implementation object from a row fetched from the
+        collection.
+        """
+        cdef:
+            ThinSodaDocImpl doc_impl
+            OsonDecoder decoder
+            object content
+        doc_impl = ThinSodaDocImpl.__new__(ThinSodaDocImpl)
+        doc_impl._key, content, doc_impl._version, \
+                doc_impl._last_modified, doc_impl._created_on, \
+                doc_impl._media_type = row
+        if doc_impl._media_type is None:
+            doc_impl._media_type = "application/json"
+        if content is None or self._content_sql_type == "JSON":
+            doc_impl._content = content
+        elif self._content_is_oson:
+            decoder = OsonDecoder.__new__(OsonDecoder)
+            doc_impl._content = decoder.decode(content)
+        else:
+            if isinstance(content, str):
+                content = content.encode()
+            doc_impl._content = content
+            doc_impl._encoding = "UTF-8"
+        return doc_impl
+
+    cdef ThinSodaDocImpl _create_returned_doc_impl(self, list ret_vars,
+                                                   uint32_t pos,
+                                                   ThinSodaDocImpl doc_impl):
+        """
+        Creates a document implementation object from the values returned by
+        a write operation. As with the documents returned by the thick
+        implementation, the content is not included.
+        """
+        cdef:
+            ThinSodaDocImpl ret_doc_impl
+            object value
+            str name
+        ret_doc_impl = ThinSodaDocImpl.__new__(ThinSodaDocImpl)
+        ret_doc_impl._media_type = doc_impl._media_type or "application/json"
+        for name, var in zip(self._returning_names, ret_vars):
+            value = var.getvalue(pos)
+            if isinstance(value, list):
+                value = value[0] if value else None
+            if name == "key":
+                ret_doc_impl._key = value
+            elif name == "version":
+                ret_doc_impl._version = value
+            elif name == "last_modified":
+                ret_doc_impl._last_modified = value
+            else:
+                ret_doc_impl._created_on = value
+        return ret_doc_impl
+
+    cdef list _prepare_write(self, object cursor, uint32_t num_rows,
+                             bint return_doc):
+        """
+        Sets the input sizes on the cursor used for writing documents to the
+        collection and returns the variables used for the values returned by
+        the write, if any.
+        """
+        cdef:
+            list ret_vars = None
+            dict input_sizes = {}
+            str name
+        if self._content_bind_type is not None:
+            input_sizes["content"] = self._content_bind_type
+        if return_doc:
+            ret_vars = []
+            for name in self._returning_names:
+                var = cursor.var(str, arraysize=num_rows)
+                input_sizes[f"ret_{name}"] = var
+                ret_vars.append(var)
+        if input_sizes:
+            cursor.setinputsizes(**input_sizes)
+        return ret_vars
+
+    cdef object _get_content_value(self, ThinSodaDocImpl doc_impl):
+        """
+        Returns the value that is bound for the content of the document when
+        it is written to the collection.
+        """
+        cdef object content = doc_impl._content
+        if self._content_sql_type == "JSON" or self._content_is_oson:
+            if isinstance(content, bytes):
+                try:
+                    content = json.loads(
+                        content.decode(doc_impl._encoding or "UTF-8")
+                    )
+                except ValueError as e:
+                    errors._raise_err(errors.ERR_SODA_INVALID_JSON_CONTENT,
+                                      reason=str(e))
+            if self._content_is_oson:
+                content = self._db_impl._conn.encode_oson(content)
+            return content
+        if not isinstance(content, bytes):
+            content = json.dumps(content).encode()
+        if self._content_sql_type in SODA_TEXT_CONTENT_TYPES:
+            return content.decode(doc_impl._encoding or "UTF-8")
+        return content
+
+    cdef str _get_insert_sql(self, str hint, bint return_doc):
+        """
+        Returns the SQL used for inserting documents into the collection.
+        """
+        cdef str sql
+        sql = f"insert{_soda_get_hint(hint)} into {self._table_name} " \
+              f"({self._insert_columns})\nvalues ({self._insert_values})"
+        if return_doc:
+            sql += self._returning_clause
+        return sql
+
+    cdef str _get_replace_sql(self, SodaQueryBuilder builder,
+                              bint return_doc):
+        """
+        Returns the SQL used for replacing a document in the collection.
+        """
+        cdef str sql
+        sql = f"update {self._table_name} set {self._update_values}" + \
+              builder.get_where_clause()
+        if return_doc:
+            sql += self._returning_clause
+        return sql
+
+    cdef str _get_save_sql(self, str hint, bint return_doc):
+        """
+        Returns the PL/SQL used for saving a document into a collection with
+        client-assigned keys: the document is replaced if a document with the
+        same key exists; otherwise, it is inserted.
+        """
+        cdef str returning = ""
+        if return_doc:
+            returning = self._returning_clause
+        return f"""
+            begin
+                update{_soda_get_hint(hint)} {self._table_name}
+                set {self._update_values}
+                where {self._key_column} = {self._key_bind('key')}
+                {returning};
+                if sql%rowcount = 0 then
+                    {self._get_insert_sql(hint, return_doc)};
+                end if;
+            end;"""
+
+    cdef str _get_select_sql(self, SodaQueryBuilder builder, object op):
+        """
+        Returns the SQL used for fetching documents from the collection.
+        """
+        cdef str sql
+        sql = f"select{_soda_get_hint(op._hint)} {self._select_list}\n" \
+              f"from {self._table_name}" + builder.get_where_clause() + \
+              builder.get_order_by_clause(op)
+        if op._skip:
+            builder.params["skip"] = op._skip
+            sql += "\noffset :skip rows"
+        if op._limit:
+            builder.params["limit"] = op._limit
+            sql += "\nfetch next :limit rows only"
+        if op._lock:
+            sql += "\nfor update"
+        return sql
+
+    cdef str _get_version_value(self, object content):
+        """
+        Returns the version for a document with the given content, if the
+        version is generated by the client.
+        """
+        if self._version_method == "UUID":
+            return uuid.uuid4().hex.upper()
+        elif self._version_method in ("MD5", "SHA256"):
+            if isinstance(content, str):
+                content = content.encode()
+            elif not isinstance(content, bytes):
+                content = self._db_impl._conn.encode_oson(content)
+            return hashlib.new(self._version_method.lower(),
+                               content).hexdigest().upper()
+        elif self._version_method == "TIMESTAMP":
+            return str(time.time_ns() // 1000)
+
+    cdef dict _get_write_params(self, ThinSodaDocImpl doc_impl,
+                                bint include_key):
+        """
+        Returns the bind values used for writing the document to the
+        collection.
+        """
+        cdef:
+            dict params = {}
+            object content
+        content = self._get_content_value(doc_impl)
+        params["content"] = content
+        if include_key and self._key_method == "UUID":
+            params["key"] = uuid.uuid4().hex.upper()
+        elif include_key and self._key_method == "CLIENT":
+            if doc_impl._key is None:
+                errors._raise_err(errors.ERR_SODA_KEY_REQUIRED,
+                                  name=self.name)
+            params["key"] = doc_impl._key
+        if ":version" in self._insert_values:
+            params["version"] = self._get_version_value(content)
+        if self._media_type_column is not None:
+            params["media_type"] = doc_impl._media_type or "application/json"
+        return params
+
+    cdef int _parse_metadata(self, str metadata) except -1:
+        """
+        Parses the collection metadata and builds the SQL statements used for
+        accessing the collection.
+        """
+        cdef:
+            dict info = json.loads(metadata), column
+            str schema
+        self._metadata = metadata
+        self._table_name = _soda_quote_name(info["tableName"])
+        schema = info.get("schemaName")
+        if schema is not None:
+            self._table_name = f"{_soda_quote_name(schema)}.{self._table_name}"
+        self._read_only = info.get("readOnly", False)
+
+        # key column
+        column = info.get("keyColumn") or {}
+        self._key_column = _soda_quote_name(column.get("name", "ID"))
+        self._key_sql_type = column.get("sqlType", "VARCHAR2").upper()
+        self._key_method = column.get("assignmentMethod", "UUID").upper()
+        if self._key_method not in SODA_KEY_METHODS:
+            errors._raise_err(errors.ERR_SODA_METADATA_NOT_SUPPORTED,
+                              name=self.name, value=self._key_method,
+                              item="keyColumn.assignmentMethod")
+        if self._key_method == "SEQUENCE":
+            self._key_sequence = _soda_quote_name(column["sequenceName"])
+
+        # content column
+        column = info.get("contentColumn") or {}
+        self._content_column = _soda_quote_name(
+            column.get("name", "JSON_DOCUMENT")
+        )
+        self._content_sql_type = column.get("sqlType", "BLOB").upper()
+        if self._content_sql_type not in SODA_CONTENT_TYPES:
+            errors._raise_err(errors.ERR_SODA_METADATA_NOT_SUPPORTED,
+                              name=self.name, value=self._content_sql_type,
+                              item="contentColumn.sqlType")
+        self._content_is_oson = \
+                str(column.get("jsonFormat", "")).upper() == "OSON"
+        if self._content_sql_type == "JSON":
+            self._content_bind_type = DB_TYPE_JSON
+        elif self._content_sql_type == "BLOB":
+            self._content_bind_type = DB_TYPE_LONG_RAW
+        elif self._content_sql_type == "CLOB":
+            self._content_bind_type = DB_TYPE_LONG
+        elif self._content_sql_type == "NCLOB":
+            self._content_bind_type = DB_TYPE_LONG_NVARCHAR
+        if self._content_sql_type == "JSON":
+            self._content_expr = self._content_column
+        elif self._content_is_oson:
+            self._content_expr = f"{self._content_column} format oson"
+        else:
+            self._content_expr = f"{self._content_column} format json"
+
+        # version column
+        column = info.get("versionColumn")
+        if column is not None:
+            self._version_column = _soda_quote_name(column["name"])
+            self._version_method = column.get("method", "SHA256").upper()
+            if self._version_method not in SODA_VERSION_METHODS:
+                errors._raise_err(errors.ERR_SODA_METADATA_NOT_SUPPORTED,
+                                  name=self.name, value=self._version_method,
+                                  item="versionColumn.method")
+
+        # remaining optional columns
+        column = info.get("lastModifiedColumn")
+        if column is not None:
+            self._last_modified_column = _soda_quote_name(column["name"])
+        column = info.get("creationTimeColumn")
+        if column is not None:
+            self._creation_time_column = _soda_quote_name(column["name"])
+        column = info.get("mediaTypeColumn")
+        if column is not None:
+            self._media_type_column = _soda_quote_name(column["name"])
+
+        self._build_statements()
+
+    cdef object _prepare_cursor(self, object op, uint32_t default_size):
+        """
+        Creates a cursor for fetching documents using the fetch array size of
+        the operation. The same value is used for prefetching so that the
+        first batch of documents is returned with the execute.
+        """
+        cdef uint32_t array_size = default_size
+        if op._fetch_array_size is not None:
+            array_size = op._fetch_array_size
+        cursor = self._db_impl._conn.cursor()
+        cursor.arraysize = array_size
+        cursor.prefetchrows = array_size
+        return cursor
+
+    cdef SodaQueryBuilder _prepare_replace(self, object op):
+        """
+        Validates the replace operation and returns the builder for it.
+        """
+        self._check_writable()
+        if op._key is None:
+            errors._raise_err(errors.ERR_SODA_REPLACE_REQUIRES_KEY)
+        return SodaQueryBuilder.create(self, op)
+
+    cdef str _get_count_sql(self, SodaQueryBuilder builder, object op):
+        """
+        Returns the SQL used for counting the documents matching the
+        criteria.
+        """
+        if op._skip or op._limit:
+            errors._raise_err(errors.ERR_SODA_COUNT_WITH_SKIP_OR_LIMIT)
+        return f"select{_soda_get_hint(op._hint)} count(*)\n" \
+               f"from {self._table_name}" + builder.get_where_clause()
+
+    cdef str _get_remove_sql(self, SodaQueryBuilder builder, object op):
+        """
+        Returns the SQL used for removing the documents matching the criteria.
+        """
+        self._check_writable()
+        return f"delete{_soda_get_hint(op._hint)} from {self._table_name}" + \
+               builder.get_where_clause()
+
+    def get_metadata(self):
+        """
+        Internal method for getting the metadata for a collection.
+        """
+        return self._metadata
+
+
+cdef class ThinSodaCollImpl(BaseThinSodaCollImpl):
+
+    def create_index(self, str spec):
+        """
+        Internal method for creating an index on a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        status_var = cursor.var(int)
+        cursor.execute(SODA_SQL_CREATE_INDEX, name=self.name, spec=spec,
+                       status=status_var)
+
+    def drop(self):
+        """
+        Internal method for dropping a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        status_var = cursor.var(int)
+        cursor.execute(SODA_SQL_DROP_COLLECTION, name=self.name,
+                       status=status_var)
+        return status_var.getvalue() == 1
+
+    def drop_index(self, str name, bint force):
+        """
+        Internal method for dropping an index on a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        status_var = cursor.var(int)
+        cursor.execute(SODA_SQL_DROP_INDEX, name=self.name, index_name=name,
+                       force=int(force), status=status_var)
+        return status_var.getvalue() == 1
+
+    def get_count(self, object op):
+        """
+        Internal method for getting the count of documents matching the
+        criteria.
+        """
+        cdef SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+        cursor = self._db_impl._conn.cursor()
+        cursor.execute(self._get_count_sql(builder, op), builder.params)
+        count, = cursor.fetchone()
+        return count
+
+    def get_cursor(self, object op):
+        """
+        Internal method for getting a cursor which will return the documents
+        matching the criteria.
+        """
+        cdef:
+            SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+            ThinSodaDocCursorImpl cursor_impl
+        cursor = self._prepare_cursor(op, SODA_DEFAULT_FETCH_ARRAY_SIZE)
+        cursor.execute(self._get_select_sql(builder, op),
+                       builder.params, fetch_lobs=False)
+        cursor_impl = ThinSodaDocCursorImpl.__new__(ThinSodaDocCursorImpl)
+        cursor_impl._coll_impl = self
+        cursor_impl._cursor = cursor
+        return cursor_impl
+
+    def get_data_guide(self):
+        """
+        Internal method for getting the data guide for a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        data_guide_var = cursor.var(DB_TYPE_CLOB)
+        cursor.execute(SODA_SQL_GET_DATA_GUIDE, name=self.name,
+                       data_guide=data_guide_var)
+        data_guide = data_guide_var.getvalue()
+        if data_guide is not None:
+            return self._db_impl.create_json_document(
+                json.loads(data_guide.read()), None
+            )
+
+    def get_one(self, object op):
+        """
+        Internal method for getting a document matching the criteria.
+        """
+        cdef SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+        cursor = self._prepare_cursor(op, 1)
+        cursor.execute(self._get_select_sql(builder, op),
+                       builder.params, fetch_lobs=False)
+        row = cursor.fetchone()
+        if row is not None:
+            return self._create_doc_impl(row)
+
+    def insert_many(self, list doc_impls, str hint, bint return_docs):
+        """
+        Internal method for inserting many documents into a collection at once.
+        The documents are inserted with a single array DML execution.
+        """
+        cdef:
+            list rows, ret_vars
+            uint32_t i
+        self._check_writable()
+        if not doc_impls:
+            errors._raise_err(errors.ERR_SODA_NO_DOCUMENTS)
+        rows = [self._get_write_params(d, True) for d in doc_impls]
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, len(rows), return_docs)
+        cursor.executemany(self._get_insert_sql(hint, return_docs), rows)
+        if return_docs:
+            return [
+                self._create_returned_doc_impl(ret_vars, i, doc_impls[i])
+                for i in range(len(doc_impls))
+            ]
+
+    def insert_one(self, ThinSodaDocImpl doc_impl, str hint,
+                   bint return_doc):
+        """
+        Internal method for inserting a single document into a collection.
+        """
+        cdef:
+            list ret_vars
+            dict params
+        self._check_writable()
+        params = self._get_write_params(doc_impl, True)
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, 1, return_doc)
+        cursor.execute(self._get_insert_sql(hint, return_doc), params)
+        if return_doc:
+            return self._create_returned_doc_impl(ret_vars, 0, doc_impl)
+
+    def remove(self, object op):
+        """
+        Internal method for removing all of the documents matching the
+        criteria.
+        """
+        cdef SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+        cursor = self._db_impl._conn.cursor()
+        cursor.execute(self._get_remove_sql(builder, op), builder.params)
+        return cursor.rowcount
+
+    def replace_one(self, object op, ThinSodaDocImpl doc_impl,
+                    bint return_doc):
+        """
+        Internal method for replacing the document matching the criteria with
+        the supplied document.
+        """
+        cdef:
+            SodaQueryBuilder builder = self._prepare_replace(op)
+            list ret_vars
+            dict params
+        params = self._get_write_params(doc_impl, False)
+        params.update(builder.params)
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, 1, return_doc)
+        cursor.execute(self._get_replace_sql(builder, return_doc), params)
+        if not return_doc:
+            return cursor.rowcount > 0
+        elif cursor.rowcount > 0:
+            return self._create_returned_doc_impl(ret_vars, 0, doc_impl)
+
+    def save(self, ThinSodaDocImpl doc_impl, str hint, bint return_doc):
+        """
+        Internal method for saving a document into the collection.
+        """
+        cdef:
+            list ret_vars
+            dict params
+        if self._key_method != "CLIENT":
+            return self.insert_one(doc_impl, hint, return_doc)
+        self._check_writable()
+        params = self._get_write_params(doc_impl, True)
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, 1, return_doc)
+        cursor.execute(self._get_save_sql(hint, return_doc), params)
+        if return_doc:
+            return self._create_returned_doc_impl(ret_vars, 0, doc_impl)
+
+    def truncate(self):
+        """
+        Internal method for truncating the collection (removing all documents
+        from it).
+        """
+        self._check_writable()
+        cursor = self._db_impl._conn.cursor()
+        cursor.execute(f"truncate table {self._table_name}")
+
+
+cdef class AsyncThinSodaCollImpl(BaseThinSodaCollImpl):
+
+    async def create_index(self, str spec):
+        """
+        Internal method for creating an index on a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        status_var = cursor.var(int)
+        await cursor.execute(SODA_SQL_CREATE_INDEX, name=self.name,
+                             spec=spec, status=status_var)
+
+    async def drop(self):
+        """
+        Internal method for dropping a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        status_var = cursor.var(int)
+        await cursor.execute(SODA_SQL_DROP_COLLECTION, name=self.name,
+                             status=status_var)
+        return status_var.getvalue() == 1
+
+    async def drop_index(self, str name, bint force):
+        """
+        Internal method for dropping an index on a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        status_var = cursor.var(int)
+        await cursor.execute(SODA_SQL_DROP_INDEX, name=self.name,
+                             index_name=name, force=int(force),
+                             status=status_var)
+        return status_var.getvalue() == 1
+
+    async def get_count(self, object op):
+        """
+        Internal method for getting the count of documents matching the
+        criteria.
+        """
+        cdef SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+        cursor = self._db_impl._conn.cursor()
+        await cursor.execute(self._get_count_sql(builder, op), builder.params)
+        count, = await cursor.fetchone()
+        return count
+
+    async def get_cursor(self, object op):
+        """
+        Internal method for getting a cursor which will return the documents
+        matching the criteria.
+        """
+        cdef:
+            SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+            AsyncThinSodaDocCursorImpl cursor_impl
+        cursor = self._prepare_cursor(op, SODA_DEFAULT_FETCH_ARRAY_SIZE)
+        await cursor.execute(self._get_select_sql(builder, op),
+                             builder.params, fetch_lobs=False)
+        cursor_impl = \
+                AsyncThinSodaDocCursorImpl.__new__(AsyncThinSodaDocCursorImpl)
+        cursor_impl._coll_impl = self
+        cursor_impl._cursor = cursor
+        return cursor_impl
+
+    async def get_data_guide(self):
+        """
+        Internal method for getting the data guide for a collection.
+        """
+        cursor = self._db_impl._conn.cursor()
+        data_guide_var = cursor.var(DB_TYPE_CLOB)
+        await cursor.execute(SODA_SQL_GET_DATA_GUIDE, name=self.name,
+                             data_guide=data_guide_var)
+        data_guide = data_guide_var.getvalue()
+        if data_guide is not None:
+            return self._db_impl.create_json_document(
+                json.loads(await data_guide.read()), None
+            )
+
+    async def get_one(self, object op):
+        """
+        Internal method for getting a document matching the criteria.
+        """
+        cdef SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+        cursor = self._prepare_cursor(op, 1)
+        await cursor.execute(self._get_select_sql(builder, op),
+                             builder.params, fetch_lobs=False)
+        row = await cursor.fetchone()
+        if row is not None:
+            return self._create_doc_impl(row)
+
+    async def insert_many(self, list doc_impls, str hint, bint return_docs):
+        """
+        Internal method for inserting many documents into a collection at once.
+        The documents are inserted with a single array DML execution.
+        """
+        cdef:
+            list rows, ret_vars
+            uint32_t i
+        self._check_writable()
+        if not doc_impls:
+            errors._raise_err(errors.ERR_SODA_NO_DOCUMENTS)
+        rows = [self._get_write_params(d, True) for d in doc_impls]
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, len(rows), return_docs)
+        await cursor.executemany(self._get_insert_sql(hint, return_docs),
+                                 rows)
+        if return_docs:
+            return [
+                self._create_returned_doc_impl(ret_vars, i, doc_impls[i])
+                for i in range(len(doc_impls))
+            ]
+
+    async def insert_one(self, ThinSodaDocImpl doc_impl, str hint,
+                         bint return_doc):
+        """
+        Internal method for inserting a single document into a collection.
+        """
+        cdef:
+            list ret_vars
+            dict params
+        self._check_writable()
+        params = self._get_write_params(doc_impl, True)
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, 1, return_doc)
+        await cursor.execute(self._get_insert_sql(hint, return_doc), params)
+        if return_doc:
+            return self._create_returned_doc_impl(ret_vars, 0, doc_impl)
+
+    async def remove(self, object op):
+        """
+        Internal method for removing all of the documents matching the
+        criteria.
+        """
+        cdef SodaQueryBuilder builder = SodaQueryBuilder.create(self, op)
+        cursor = self._db_impl._conn.cursor()
+        await cursor.execute(self._get_remove_sql(builder, op),
+                             builder.params)
+        return cursor.rowcount
+
+    async def replace_one(self, object op, ThinSodaDocImpl doc_impl,
+                          bint return_doc):
+        """
+        Internal method for replacing the document matching the criteria with
+        the supplied document.
+        """
+        cdef:
+            SodaQueryBuilder builder = self._prepare_replace(op)
+            list ret_vars
+            dict params
+        params = self._get_write_params(doc_impl, False)
+        params.update(builder.params)
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, 1, return_doc)
+        await cursor.execute(self._get_replace_sql(builder, return_doc),
+                             params)
+        if not return_doc:
+            return cursor.rowcount > 0
+        elif cursor.rowcount > 0:
+            return self._create_returned_doc_impl(ret_vars, 0, doc_impl)
+
+    async def save(self, ThinSodaDocImpl doc_impl, str hint,
+                   bint return_doc):
+        """
+        Internal method for saving a document into the collection.
+        """
+        cdef:
+            list ret_vars
+            dict params
+        if self._key_method != "CLIENT":
+            return await self.insert_one(doc_impl, hint, return_doc)
+        self._check_writable()
+        params = self._get_write_params(doc_impl, True)
+        cursor = self._db_impl._conn.cursor()
+        ret_vars = self._prepare_write(cursor, 1, return_doc)
+        await cursor.execute(self._get_save_sql(hint, return_doc), params)
+        if return_doc:
+            return self._create_returned_doc_impl(ret_vars, 0, doc_impl)
+
+    async def truncate(self):
+        """
+        Internal method for truncating the collection (removing all documents
+        from it).
+        """
+        self._check_writable()
+        cursor = self._db_impl._conn.cursor()
+        await cursor.execute(f"truncate table {self._table_name}")
+
+
+cdef class ThinSodaDocImpl(BaseSodaDocImpl):
+    cdef:
+        object _content
+        str _encoding
+        str _key
+        str _media_type
+        str _version
+        str _created_on
+        str _last_modified
+
+    def get_content(self):
+        """
+        Internal method for returning the content of the document.
+        """
+        return (self._content, self._encoding)
+
+    def get_created_on(self):
+        """
+        Internal method for getting the date the document was created.
+        """
+        return self._created_on
+
+    def get_key(self):
+        """
+        Internal method for getting the key of the document.
+        """
+        return self._key
+
+    def get_last_modified(self):
+        """
+        Internal method for getting the date the document was last modified.
+        """
+        return self._last_modified
+
+    def get_media_type(self):
+        """
+        Internal method for getting the media type of the document.
+        """
+        return self._media_type
+
+    def get_version(self):
+        """
+        Internal method for getting the version of the document.
+        """
+        return self._version
+
+
+cdef class BaseThinSodaDocCursorImpl(BaseSodaDocCursorImpl):
+    cdef:
+        BaseThinSodaCollImpl _coll_impl
+        object _cursor
+
+    def close(self):
+        """
+        Internal method for closing the cursor.
+        """
+        self._cursor.close()
+
+
+cdef class ThinSodaDocCursorImpl(BaseThinSodaDocCursorImpl):
+
+    def get_next_doc(self):
+        """
+        Internal method for getting the next document from the cursor.
+        """
+        row = self._cursor.fetchone()
+        if row is not None:
+            return self._coll_impl._create_doc_impl(row)
+
+
+cdef class AsyncThinSodaDocCursorImpl(BaseThinSodaDocCursorImpl):
+
+    async def get_next_doc(self):
+        """
+        Internal method for getting the next document from the cursor.
+        """
+        row = await self._cursor.fetchone()
+        if row is not None:
+            return self._coll_impl._create_doc_impl(row)
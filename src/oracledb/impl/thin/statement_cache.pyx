@@ -26,9 +26,71 @@
 # statement_cache.pyx
 #
 # Cython file defining the StatementCache class used to manage cached
-# statements (embedded in thin_impl.pyx).
+# statements and the SharedParseCache class used to share the results of
+# parsing SQL among all connections (embedded in thin_impl.pyx).
 #------------------------------------------------------------------------------
 
+cdef enum:
+    STMT_CACHE_ADAPTIVE_WINDOW = 100        # lookups
+    STMT_CACHE_ADAPTIVE_MISS_PCT = 20       # percent of lookups in window
+    STMT_CACHE_ADAPTIVE_IDLE = 300          # seconds
+
+
+cdef class SharedParseCache:
+
+    cdef:
+        object _statements
+        object _lock
+        uint32_t _max_size
+
+    def __init__(self, uint32_t max_size):
+        self._statements = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    cdef Statement get_statement(self, str sql):
+        """
+        Returns a new statement for the given SQL. The results of parsing the
+        SQL (the statement type and the bind variables) do not depend on the
+        connection, so a parsed statement is retained and copied for any
+        connection that subsequently needs the same SQL; only the cursor id
+        and execution state are connection specific. The parse itself is
+        performed without holding the lock so that connections using
+        different SQL do not contend.
+        """
+        cdef Statement template
+        with self._lock:
+            template = self._statements.get(sql)
+            if template is not None:
+                self._statements.move_to_end(sql)
+        if template is None:
+            template = Statement.__new__(Statement)
+            template._prepare(sql)
+            if template._is_ddl or self._max_size == 0:
+                return template
+            with self._lock:
+                self._statements[sql] = template
+                while len(self._statements) > self._max_size:
+                    self._statements.popitem(last=False)
+        return template.copy()
+
+
+cdef class StatementCacheStats:
+
+    cdef:
+        uint64_t hits
+        uint64_t misses
+        uint64_t evictions
+        uint64_t parses
+
+    cdef dict as_dict(self):
+        """
+        Returns the statistics as a dictionary.
+        """
+        return dict(hits=self.hits, misses=self.misses,
+                    evictions=self.evictions, parses=self.parses)
+
+
 cdef class StatementCache:
 
     cdef:
@@ -39,6 +101,15 @@ cdef class StatementCache:
         array.array _cursors_to_close
         ssize_t _num_cursors_to_close
         set _open_cursors
+        StatementCacheStats _stats
+        StatementCacheStats _pool_stats
+        bint _adaptive
+        uint32_t _base_size
+        uint32_t _max_adaptive_size
+        uint32_t _window_lookups
+        uint32_t _window_misses
+        uint32_t _window_evictions
+        double _last_lookup_time
 
     cdef int _add_cursor_to_close(self, Statement stmt) except -1:
         """
@@ -59,11 +130,64 @@ cdef class StatementCache:
         cdef Statement stmt
         while len(self._cached_statements) > self._max_size:
             stmt = <Statement> self._cached_statements.popitem(last=False)[1]
+            self._stats.evictions += 1
+            if self._pool_stats is not None:
+                self._pool_stats.evictions += 1
+            self._window_evictions += 1
             if stmt._in_use:
                 stmt._return_to_cache = False
             else:
                 self._add_cursor_to_close(stmt)
 
+    cdef int _adapt_size(self) except -1:
+        """
+        Called at the end of each window of lookups when the cache is
+        adaptive. If statements were evicted during the window and a large
+        proportion of the lookups missed, the cache is too small for the
+        working set of the application and its size is doubled, up to the
+        maximum size permitted.
+        """
+        if self._window_evictions > 0 \
+                and self._window_misses * 100 >= \
+                    self._window_lookups * STMT_CACHE_ADAPTIVE_MISS_PCT \
+                and self._max_size < self._max_adaptive_size:
+            self._max_size = min(self._max_size * 2, self._max_adaptive_size)
+        self._window_lookups = 0
+        self._window_misses = 0
+        self._window_evictions = 0
+
+    cdef int _record_lookup(self, bint hit) except -1:
+        """
+        Records the result of looking up a statement in the cache. When the
+        cache is adaptive and has not been used for some time, it is first
+        shrunk back to its configured size so that the cursors it holds open
+        are released.
+        """
+        cdef double now
+        if hit:
+            self._stats.hits += 1
+            if self._pool_stats is not None:
+                self._pool_stats.hits += 1
+        else:
+            self._stats.misses += 1
+            if self._pool_stats is not None:
+                self._pool_stats.misses += 1
+        if self._adaptive:
+            now = time.monotonic()
+            if self._max_size > self._base_size and \
+                    now - self._last_lookup_time > STMT_CACHE_ADAPTIVE_IDLE:
+                self._max_size = self._base_size
+                self._adjust_cache()
+                self._window_lookups = 0
+                self._window_misses = 0
+                self._window_evictions = 0
+            self._last_lookup_time = now
+            self._window_lookups += 1
+            if not hit:
+                self._window_misses += 1
+            if self._window_lookups >= STMT_CACHE_ADAPTIVE_WINDOW:
+                self._adapt_size()
+
     cdef int clear_cursor(self, Statement stmt) except -1:
         """
         Clears the particular cursor but retains it in the list of open
@@ -101,14 +225,17 @@ cdef class StatementCache:
         supposed to be cached, a copy will be made (and not returned to the
         cache).
         """
-        cdef Statement stmt = None
+        cdef:
+            Statement stmt = None
+            bint hit = False
         with self._lock:
             if sql is not None:
                 stmt = self._cached_statements.get(sql)
             if stmt is None:
-                stmt = Statement.__new__(Statement)
                 if sql is not None:
-                    stmt._prepare(sql)
+                    stmt = shared_parse_cache.get_statement(sql)
+                else:
+                    stmt = Statement.__new__(Statement)
                 if cache_statement and not stmt._is_ddl and self._max_size > 0:
                     stmt._return_to_cache = True
                     self._cached_statements[sql] = stmt
@@ -125,13 +252,34 @@ cdef class StatementCache:
                 stmt._return_to_cache = False
             else:
                 self._cached_statements.move_to_end(sql)
+                hit = True
+            if sql is not None and cache_statement:
+                self._record_lookup(hit)
         stmt._in_use = True
         return stmt
 
-    cdef int initialize(self, uint32_t max_size,
-                         uint32_t max_cursors) except -1:
+    cdef dict get_stats(self):
         """
-        Initialize the statement cache.
+        Returns the statistics of the statement cache as a dictionary.
+        """
+        cdef dict stats
+        with self._lock:
+            stats = self._stats.as_dict()
+            stats["size"] = len(self._cached_statements)
+            stats["max_size"] = self._max_size
+        return stats
+
+    cdef int initialize(self, uint32_t max_size, uint32_t max_cursors,
+                        bint adaptive=False,
+                        StatementCacheStats pool_stats=None) except -1:
+        """
+        Initialize the statement cache. If the cache is adaptive, it may grow
+        beyond the requested size while the application is executing more
+        distinct statements than fit in the cache. It never grows beyond half
+        of the maximum number of open cursors permitted by the database so that
+        cursors remain available for statements that are not cached. The
+        statistics of the cache are also added to the pool statistics, if
+        supplied.
         """
         if max_cursors == 0:
             self._max_size = 0
@@ -139,6 +287,11 @@ cdef class StatementCache:
         else:
             self._max_size = max_size
             self._max_cursors = max_cursors
+        self._base_size = self._max_size
+        self._max_adaptive_size = max(self._max_size, max_cursors // 2)
+        self._adaptive = adaptive
+        self._stats = StatementCacheStats.__new__(StatementCacheStats)
+        self._pool_stats = pool_stats
         self._cached_statements = collections.OrderedDict()
         self._lock = threading.Lock()
         self._open_cursors = set()
@@ -152,8 +305,18 @@ cdef class StatementCache:
         """
         with self._lock:
             self._max_size = new_size
+            self._base_size = new_size
+            self._max_adaptive_size = max(new_size, self._max_cursors // 2)
             self._adjust_cache()
 
+    cdef int record_parse(self) except -1:
+        """
+        Records that a statement is being parsed by the database.
+        """
+        self._stats.parses += 1
+        if self._pool_stats is not None:
+            self._pool_stats.parses += 1
+
     cdef int return_statement(self, Statement stmt) except -1:
         """
         Return the statement to the statement cache, if applicable. If the
@@ -190,3 +353,8 @@ cdef class StatementCache:
             for i in range(self._num_cursors_to_close):
                 buf.write_ub4(cursor_ids[i])
             self._num_cursors_to_close = 0
+
+
+# parsed statements shared by all connections in the process; the size is
+# bounded so that applications generating unique SQL do not grow it forever
+cdef SharedParseCache shared_parse_cache = SharedParseCache(1000)
@@ -22,37 +22,141 @@
 # limitations under the License.
 #------------------------------------------------------------------------------
 
+
 #------------------------------------------------------------------------------
 # subscr.pyx
 #
-# Cython file defining the thin Subscription implementation class (embedded in
-# thin_impl.pyx).
+# Cython file defining the thin Subscription implementation classes and the
+# listeners that receive notifications for them (embedded in thin_impl.pyx).
 #------------------------------------------------------------------------------
 
-cdef class BaseThinSubscrImpl(BaseSubscrImpl):
+cdef class NotificationDispatcher:
+    """
+    Bounded pool of worker threads used to invoke the callbacks of
+    subscriptions, so that the number of threads does not depend on the
+    number of subscriptions. The notifications for a subscription are always
+    handled by the same worker so that callbacks are invoked in the order in
+    which the notifications were received.
+    """
 
     cdef:
-        ThinConnImpl _conn_impl
-        bytes _client_id
-        object _bg_task
-        object _bg_task_exc
+        object lock
+        list queues
 
-    cdef SubscrMessage _create_subscr_message(self, BaseThinConnImpl conn_impl,
-                                              uint8_t opcode):
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def _worker_func(self, object work_queue):
         """
-        Create the message for creating the subscription.
+        Method which runs in each worker thread and invokes the callbacks for
+        the notifications placed on its queue. Exceptions raised by callbacks
+        are reported but do not stop the worker.
         """
-        cdef SubscrMessage message
-        message = conn_impl._create_message(SubscrMessage)
-        message.subscr_impl = self
-        message.opcode = opcode
-        return message
+        while True:
+            subscr, message, deregistered = work_queue.get()
+            try:
+                if subscr.callback is not None:
+                    subscr.callback(message)
+            except BaseException:
+                sys.excepthook(*sys.exc_info())
+            if deregistered:
+                subscr._impl = None
 
+    cdef int dispatch(self, object subscr, object message, bint deregistered,
+                      uint32_t registration_id) except -1:
+        """
+        Places the notification on the queue of the worker responsible for the
+        subscription, starting the workers if needed.
+        """
+        cdef ssize_t i
+        if self.queues is None:
+            with self.lock:
+                if self.queues is None:
+                    queues = []
+                    for i in range(NOTIFICATION_NUM_WORKERS):
+                        work_queue = queue.SimpleQueue()
+                        thread = threading.Thread(target=self._worker_func,
+                                                  args=(work_queue,),
+                                                  daemon=True)
+                        thread.start()
+                        queues.append(work_queue)
+                    self.queues = queues
+        i = registration_id % NOTIFICATION_NUM_WORKERS
+        self.queues[i].put((subscr, message, deregistered))
 
-cdef class ThinSubscrImpl(BaseThinSubscrImpl):
 
-    def _bg_task_func(self, object subscr, ThinConnImpl conn_impl,
-                      object event):
+cdef class BaseNotificationListener:
+    """
+    Receives the notifications for one or more subscriptions that share the
+    same client id over a single connection to the database (which uses the
+    EMON process). Subscriptions to database and query changes made by the
+    same user on the same database share a listener; AQ subscriptions each
+    have their own listener.
+    """
+
+    cdef:
+        object key
+        bytes client_id
+        uint32_t namespace
+        dict subscrs
+        object lock
+        bint closed
+
+    cdef int add_subscr(self, uint64_t registration_id,
+                        object subscr) except -1:
+        """
+        Adds a subscription to the listener.
+        """
+        with self.lock:
+            self.subscrs[registration_id] = subscr
+
+    cdef int dispatch(self, object subscr, object message,
+                      bint deregistered) except -1:
+        raise NotImplementedError()
+
+    cdef object get_subscr(self, uint32_t registration_id):
+        """
+        Returns the subscription for the given registration id or None if no
+        such subscription exists. If the listener is not shared, its only
+        subscription is returned.
+        """
+        with self.lock:
+            if self.key is None and len(self.subscrs) == 1:
+                return next(iter(self.subscrs.values()))
+            return self.subscrs.get(registration_id)
+
+    cdef int initialize(self, object key, bytes client_id,
+                        uint32_t namespace) except -1:
+        """
+        Initializes the listener.
+        """
+        self.key = key
+        self.client_id = client_id
+        self.namespace = namespace
+        self.subscrs = {}
+        self.lock = threading.Lock()
+
+    cdef ssize_t remove_subscr(self, uint64_t registration_id) except -1:
+        """
+        Removes a subscription from the listener and returns the number of
+        subscriptions that remain.
+        """
+        with self.lock:
+            if self.key is None:
+                self.subscrs.clear()
+            else:
+                self.subscrs.pop(registration_id, None)
+            return len(self.subscrs)
+
+
+cdef class NotificationListener(BaseNotificationListener):
+
+    cdef:
+        ThinConnImpl _conn_impl
+        object _thread
+        object _thread_exc
+
+    def _thread_func(self, BaseThinConnImpl conn_impl, object event):
         """
         Method which runs in a dedicated thread and is used to establish a
         separate connection to the database (which uses the EMON process) and
@@ -60,7 +164,7 @@ cdef class ThinSubscrImpl(BaseThinSubscrImpl):
         message sent to the database. The database never sends back a
         notification that no further messages will be sent, so the background
         wait is interrupted by forcing the socket closed. This results in an
-        exception which is ignored if unsubscription is in progress.
+        exception which is ignored.
         """
         cdef:
             ConnectParamsImpl params
@@ -75,19 +179,211 @@ cdef class ThinSubscrImpl(BaseThinSubscrImpl):
             self._conn_impl.connect(params)
             protocol = <Protocol> self._conn_impl._protocol
             message = self._conn_impl._create_message(NotifyMessage)
-            message.client_id = self._client_id
-            message.subscr = subscr
+            message.client_id = self.client_id
+            message.listener = self
             message.namespace = self.namespace
             message.send(protocol._write_buf)
             event.set()
             protocol._receive_packet(message, check_request_boundary=False)
             message.process(protocol._read_buf)
         except BaseException as e:
-            self._bg_task_exc = e
+            self._thread_exc = e
             event.set()
+        self.closed = True
         if self._conn_impl is not None:
             self._conn_impl._protocol._disconnect()
 
+    cdef int dispatch(self, object subscr, object message,
+                      bint deregistered) except -1:
+        """
+        Dispatches the notification to the pool of worker threads which invoke
+        the callbacks of subscriptions.
+        """
+        notification_dispatcher.dispatch(subscr, message, deregistered,
+                                         <uint32_t> subscr.id)
+
+    cdef int start(self, BaseThinConnImpl conn_impl) except -1:
+        """
+        Starts the thread that waits for notifications and waits for the
+        request for notifications to be sent.
+        """
+        event = threading.Event()
+        self._thread = threading.Thread(target=self._thread_func,
+                                        args=(conn_impl, event), daemon=True)
+        self._thread.start()
+        event.wait()
+        if self._thread_exc is not None:
+            errors._raise_err(errors.ERR_SUBSCR_FAILED,
+                              cause=self._thread_exc)
+
+    cdef int stop(self) except -1:
+        """
+        Stops the listener by forcing its connection closed and waiting for
+        the thread to terminate.
+        """
+        cdef ThinConnImpl conn_impl = self._conn_impl
+        self._conn_impl = None
+        if conn_impl is not None and not self.closed:
+            conn_impl._close_socket()
+        self.closed = True
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+
+cdef class AsyncNotificationListener(BaseNotificationListener):
+
+    cdef:
+        AsyncThinConnImpl _conn_impl
+        object _task
+
+    async def _run(self, NotifyMessage message):
+        """
+        Processes notifications until the listener is stopped, the connection
+        is lost or all subscriptions have been deregistered. The subscriptions
+        that remain are then informed that no further notifications will be
+        sent.
+        """
+        cdef:
+            AsyncThinSubscrImpl subscr_impl
+            BaseAsyncProtocol protocol
+            ReadBuffer buf
+        protocol = <BaseAsyncProtocol> self._conn_impl._protocol
+        buf = protocol._read_buf
+        try:
+            await protocol._receive_packet(message)
+            while True:
+                try:
+                    message.process(buf)
+                    break
+                except OutOfPackets:
+                    await protocol._receive_packet(message)
+                    buf.restore_point()
+        except Exception:
+            pass
+        finally:
+            self.closed = True
+            with self.lock:
+                subscrs = list(self.subscrs.values())
+                self.subscrs.clear()
+            for subscr in subscrs:
+                subscr_impl = subscr._impl
+                if subscr_impl is not None:
+                    subscr_impl._queue.put_nowait(None)
+            if self._conn_impl is not None:
+                self._conn_impl._protocol._disconnect()
+
+    cdef int dispatch(self, object subscr, object message,
+                      bint deregistered) except -1:
+        """
+        Places the notification on the queue of the subscription, from which
+        it is returned by iterating over the subscription.
+        """
+        cdef AsyncThinSubscrImpl subscr_impl = subscr._impl
+        if subscr_impl is None:
+            return 0
+        subscr_impl._queue.put_nowait(message)
+        if deregistered:
+            subscr_impl._queue.put_nowait(None)
+            subscr._impl = None
+
+    async def start(self, BaseThinConnImpl conn_impl):
+        """
+        Establishes a separate connection to the database (which uses the EMON
+        process), sends the request for notifications and starts the task that
+        processes them.
+        """
+        cdef:
+            ConnectParamsImpl params
+            Description description
+            BaseAsyncProtocol protocol
+            NotifyMessage message
+        params = conn_impl._connect_params.copy()
+        for description in params.description_list.children:
+            description.server_type = "emon"
+        self._conn_impl = AsyncThinConnImpl(conn_impl.dsn, params)
+        try:
+            await self._conn_impl.connect(params)
+            protocol = <BaseAsyncProtocol> self._conn_impl._protocol
+            message = self._conn_impl._create_message(NotifyMessage)
+            message.client_id = self.client_id
+            message.listener = self
+            message.namespace = self.namespace
+            protocol._read_buf.reset_packets()
+            message.send(protocol._write_buf)
+        except Exception as e:
+            self.closed = True
+            errors._raise_err(errors.ERR_SUBSCR_FAILED, cause=e)
+        self._task = asyncio.create_task(self._run(message))
+
+    async def stop(self):
+        """
+        Stops the listener by cancelling the task that processes notifications
+        and closing its connection.
+        """
+        self.closed = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+cdef class BaseThinSubscrImpl(BaseSubscrImpl):
+
+    cdef:
+        bytes _client_id
+        BaseNotificationListener _listener
+
+    cdef SubscrMessage _create_subscr_message(self, BaseThinConnImpl conn_impl,
+                                              uint8_t opcode):
+        """
+        Create the message for creating the subscription.
+        """
+        cdef SubscrMessage message
+        message = conn_impl._create_message(SubscrMessage)
+        message.subscr_impl = self
+        message.opcode = opcode
+        return message
+
+    cdef object _get_listener_key(self, BaseThinConnImpl conn_impl):
+        """
+        Returns the key used to find a listener that can be shared with other
+        subscriptions, or None if the subscription requires its own listener.
+        Subscriptions to database and query changes made by the same user on
+        the same database share a listener. AQ notifications do not identify
+        the registration reliably, so each AQ subscription has its own
+        listener.
+        """
+        if self.namespace == SUBSCR_NAMESPACE_AQ:
+            if not self.qos:
+                self.qos = TNS_SUBSCR_QOS_SECURE
+            return None
+        return (conn_impl.dsn, conn_impl.username)
+
+    cdef int _on_register(self, SubscrMessage message) except -1:
+        """
+        Called after the registration message has been processed.
+        """
+        self._client_id = message.client_id
+        self.id = message.registration_id
+
+    cdef SubscrMessage _create_unregister_message(
+        self, BaseThinConnImpl conn_impl
+    ):
+        """
+        Creates the message used to destroy the subscription.
+        """
+        cdef SubscrMessage message
+        message = self._create_subscr_message(conn_impl,
+                                              TNS_SUBSCR_OP_UNREGISTER)
+        message.registration_id = self.id
+        message.client_id = self._client_id
+        return message
+
+
+cdef class ThinSubscrImpl(BaseThinSubscrImpl):
+
     def register_query(self, str sql, object args):
         """
         Internal method for registering a query.
@@ -104,46 +400,200 @@ cdef class ThinSubscrImpl(BaseThinSubscrImpl):
         cursor_impl.execute(cursor)
         return cursor_impl._query_id
 
+    cdef NotificationListener _get_shared_listener(self, object key):
+        """
+        Returns the listener that can be shared by the subscription or None if
+        no such listener exists. If another thread is starting a listener for
+        the same key, the method waits for that to complete first. When None
+        is returned, the caller is responsible for starting the listener and
+        must call _end_listener_start() when done.
+        """
+        cdef NotificationListener listener
+        while True:
+            with notification_listeners_lock:
+                listener = notification_listeners.get(key)
+                if listener is not None and not listener.closed:
+                    return listener
+                event = notification_listeners_starting.get(key)
+                if event is None:
+                    notification_listeners_starting[key] = threading.Event()
+                    return None
+            event.wait()
+
+    cdef int _end_listener_start(self, object key) except -1:
+        """
+        Called when the thread that was starting a listener for the given key
+        has finished doing so (successfully or not), so that other threads
+        waiting to subscribe can proceed.
+        """
+        with notification_listeners_lock:
+            event = notification_listeners_starting.pop(key)
+        event.set()
+
     def subscribe(self, object subscr, BaseThinConnImpl conn_impl):
         """
-        Internal method for creating the subscription.
+        Internal method for creating the subscription. If a listener that can
+        be shared already exists, the subscription is registered with its
+        client id so that notifications are sent over its connection;
+        otherwise, a new listener is started. The global lock is only held
+        while the listeners are examined or modified, not while communicating
+        with the database.
         """
         cdef:
             Protocol protocol = <Protocol> conn_impl._protocol
+            NotificationListener listener = None
+            bint starting = False
             SubscrMessage message
-        if self.namespace == SUBSCR_NAMESPACE_AQ and not self.qos:
-            self.qos = TNS_SUBSCR_QOS_SECURE
+            object key
+        key = self._get_listener_key(conn_impl)
+        if key is not None:
+            listener = self._get_shared_listener(key)
+            starting = listener is None
+        try:
+            message = self._create_subscr_message(conn_impl,
+                                                  TNS_SUBSCR_OP_REGISTER)
+            if listener is not None:
+                message.client_id = listener.client_id
+            protocol._process_single_message(message)
+            self._on_register(message)
+            if listener is not None:
+                with notification_listeners_lock:
+                    if not listener.closed \
+                            and listener.client_id == self._client_id \
+                            and notification_listeners.get(key) is listener:
+                        listener.add_subscr(self.id, subscr)
+                        self._listener = listener
+                        return
+            listener = NotificationListener.__new__(NotificationListener)
+            listener.initialize(key, self._client_id, self.namespace)
+            listener.add_subscr(self.id, subscr)
+            listener.start(conn_impl)
+            if key is not None:
+                with notification_listeners_lock:
+                    notification_listeners[key] = listener
+            self._listener = listener
+        finally:
+            if starting:
+                self._end_listener_start(key)
+
+    def unsubscribe(self, object subscr, BaseThinConnImpl conn_impl):
+        """
+        Internal method for destroying the subscription. The listener is
+        stopped once it no longer has any subscriptions.
+        """
+        cdef:
+            Protocol protocol = <Protocol> conn_impl._protocol
+            NotificationListener listener
+            SubscrMessage message
+            bint stop_listener
+        message = self._create_unregister_message(conn_impl)
+        protocol._process_single_message(message)
+        listener = <NotificationListener> self._listener
+        self._listener = None
+        with notification_listeners_lock:
+            stop_listener = (listener.remove_subscr(self.id) == 0)
+            if stop_listener and listener.key is not None \
+                    and notification_listeners.get(listener.key) is listener:
+                del notification_listeners[listener.key]
+        if stop_listener:
+            listener.stop()
+
+
+cdef class AsyncThinSubscrImpl(BaseThinSubscrImpl):
+
+    cdef:
+        object _queue
+
+    async def get_message(self):
+        """
+        Internal method for returning the next message for the subscription.
+        None is returned when no further messages will be sent.
+        """
+        return await self._queue.get()
+
+    async def register_query(self, str sql, object args):
+        """
+        Internal method for registering a query.
+        """
+        cdef:
+            AsyncThinCursorImpl cursor_impl
+            object cursor
+        cursor = self.connection.cursor()
+        cursor._prepare_for_execute(sql, args)
+        cursor_impl = <AsyncThinCursorImpl> cursor._impl
+        if not cursor_impl._statement._is_query:
+            errors._raise_err(errors.ERR_NOT_A_QUERY)
+        cursor_impl._registration_id = self.id
+        await cursor_impl.execute(cursor)
+        return cursor_impl._query_id
+
+    async def subscribe(self, object subscr, BaseThinConnImpl conn_impl):
+        """
+        Internal method for creating the subscription. Listeners are shared in
+        the same way as for synchronous subscriptions but are specific to the
+        event loop that is running.
+        """
+        cdef:
+            BaseAsyncProtocol protocol
+            AsyncNotificationListener listener = None
+            SubscrMessage message
+            object key
+        protocol = <BaseAsyncProtocol> conn_impl._protocol
+        self._queue = asyncio.Queue()
+        key = self._get_listener_key(conn_impl)
+        if key is not None:
+            key = (asyncio.get_running_loop(),) + key
+            listener = async_notification_listeners.get(key)
+            if listener is not None and listener.closed:
+                listener = None
         message = self._create_subscr_message(conn_impl,
                                               TNS_SUBSCR_OP_REGISTER)
-        protocol._process_single_message(message)
-        self._client_id = message.client_id
-        self.id = message.registration_id
-        event = threading.Event()
-        self._bg_task = threading.Thread(target=self._bg_task_func,
-                                         args=(subscr, conn_impl, event))
-        self._bg_task.daemon = True
-        self._bg_task.start()
-        event.wait()
-        if self._bg_task_exc is not None:
-            errors._raise_err(
-                errors.ERR_SUBSCR_FAILED,
-                cause=self._bg_task_exc
+        if listener is not None:
+            message.client_id = listener.client_id
+        await protocol._process_single_message(message)
+        self._on_register(message)
+        if listener is not None and not listener.closed \
+                and listener.client_id == self._client_id:
+            listener.add_subscr(self.id, subscr)
+        else:
+            listener = AsyncNotificationListener.__new__(
+                AsyncNotificationListener
             )
+            listener.initialize(key, self._client_id, self.namespace)
+            listener.add_subscr(self.id, subscr)
+            await listener.start(conn_impl)
+            if key is not None:
+                async_notification_listeners[key] = listener
+        self._listener = listener
 
-    def unsubscribe(self, object subscr, ThinConnImpl conn_impl):
+    async def unsubscribe(self, object subscr, BaseThinConnImpl conn_impl):
         """
-        Internal method for destroying the subscription.
+        Internal method for destroying the subscription. Iteration over the
+        subscription stops and the listener is stopped once it no longer has
+        any subscriptions.
         """
         cdef:
-            Protocol protocol = <Protocol> conn_impl._protocol
-            ThinConnImpl notification_conn_impl
+            BaseAsyncProtocol protocol
+            AsyncNotificationListener listener
             SubscrMessage message
-        message = self._create_subscr_message(conn_impl,
-                                              TNS_SUBSCR_OP_UNREGISTER)
-        message.registration_id = self.id
-        message.client_id = self._client_id
-        protocol._process_single_message(message)
-        notification_conn_impl = self._conn_impl
-        self._conn_impl = None
-        notification_conn_impl._close_socket()
-        self._bg_task.join()
+        protocol = <BaseAsyncProtocol> conn_impl._protocol
+        message = self._create_unregister_message(conn_impl)
+        await protocol._process_single_message(message)
+        listener = <AsyncNotificationListener> self._listener
+        self._listener = None
+        self._queue.put_nowait(None)
+        if listener.remove_subscr(self.id) == 0:
+            if listener.key is not None and \
+                    async_notification_listeners.get(listener.key) \
+                    is listener:
+                del async_notification_listeners[listener.key]
+            await listener.stop()
+
+
+# global pool of workers for invoking subscription callbacks and the listeners
+# that can be shared by subscriptions
+cdef NotificationDispatcher notification_dispatcher = NotificationDispatcher()
+cdef dict notification_listeners = {}
+cdef dict notification_listeners_starting = {}
+cdef object notification_listeners_lock = threading.Lock()
+cdef dict async_notification_listeners = {}
@@ -31,17 +31,116 @@
 
 cdef bint DEBUG_PACKETS = ("PYO_DEBUG_PACKETS" in os.environ)
 
+cdef enum:
+    MIN_RECEIVE_BUFFER_SPACE = 65536
+    TLS_SESSION_CACHE_MAX_ENTRIES = 256
+    TLS_SESSION_CACHE_LIFETIME = 600        # seconds
+
+
+cdef class TLSSessionCacheEntry:
+    cdef:
+        object ssl_context
+        object session
+        double expiry_time
+
+
+cdef class TLSSessionCache:
+    """
+    Process-wide cache of the SSL contexts used to establish TLS connections
+    and of the TLS sessions negotiated with each database address. Reusing the
+    SSL context avoids building it (and loading certificates) for each
+    connection and reusing the TLS session allows the server to resume it
+    instead of performing a full handshake. Entries are discarded after a fixed
+    lifetime so that changes to wallets and certificates are eventually seen.
+    """
+    cdef:
+        object lock
+        object entries
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+
+    cdef int add_entry(self, object key, object ssl_context) except -1:
+        """
+        Adds an entry to the cache for the given key and SSL context, replacing
+        any entry that already exists. The least recently used entries are
+        discarded if the cache is full.
+        """
+        cdef TLSSessionCacheEntry entry = TLSSessionCacheEntry.__new__(
+            TLSSessionCacheEntry
+        )
+        entry.ssl_context = ssl_context
+        entry.expiry_time = time.monotonic() + TLS_SESSION_CACHE_LIFETIME
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > TLS_SESSION_CACHE_MAX_ENTRIES:
+                self.entries.popitem(last=False)
+
+    cdef TLSSessionCacheEntry get_entry(self, object key):
+        """
+        Returns the entry for the given key, or None if no entry exists or the
+        entry has expired.
+        """
+        cdef TLSSessionCacheEntry entry
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry.expiry_time <= time.monotonic():
+                    del self.entries[key]
+                    return None
+                self.entries.move_to_end(key)
+            return entry
+
+    cdef object get_session(self, object key, object ssl_context):
+        """
+        Returns the TLS session stored for the given key, if one exists, was
+        negotiated with the given SSL context and has not yet expired.
+        """
+        cdef TLSSessionCacheEntry entry = self.get_entry(key)
+        if entry is not None and entry.ssl_context is ssl_context \
+                and entry.session is not None \
+                and entry.session.time + entry.session.timeout > time.time():
+            return entry.session
+
+    cdef int remove_entry(self, object key) except -1:
+        """
+        Removes the entry for the given key, if one exists.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    cdef int save_session(self, object key, object ssl_context,
+                          object session) except -1:
+        """
+        Stores the TLS session negotiated with the given SSL context in the
+        entry for the given key, if that entry still exists.
+        """
+        cdef TLSSessionCacheEntry entry
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.ssl_context is ssl_context:
+                entry.session = session
+
+
+cdef TLSSessionCache tls_session_cache = TLSSessionCache()
+
+
 cdef class Transport:
 
     cdef:
         object _transport
         object _ssl_context
+        object _tls_session_key
         str _ssl_sni_data
         Address _address
         uint32_t _transport_num
         ssize_t _max_packet_size
         uint32_t _op_num
-        bytes _partial_buf
+        bytearray _recv_buf
+        ssize_t _recv_start
+        ssize_t _recv_end
         bint _full_packet_size
         bint _is_async
 
@@ -130,8 +229,40 @@ cdef class Transport:
                                 Address address) except -1:
         """
         Creates the SSL context used for establishing TLS communications
-        between the database and the client.
+        between the database and the client. If a context was already created
+        for the same address and TLS settings, it is reused instead. The wallet
+        password is part of those settings since it determines whether the
+        client certificate can be loaded; only a digest of it is retained.
         """
+        cdef:
+            TLSSessionCacheEntry entry
+            str wallet_password
+            bytes password_digest = None
+
+        # calculate the SNI data to send to the server, if applicable
+        if description.use_sni:
+            self._ssl_sni_data = self._calc_sni_data(description)
+        else:
+            self._ssl_sni_data = None
+
+        # use the cached SSL context, if one exists
+        wallet_password = params._get_wallet_password()
+        if wallet_password is not None:
+            password_digest = \
+                    hashlib.sha256(wallet_password.encode()).digest()
+        self._tls_session_key = (
+            address.host,
+            address.port,
+            params.ssl_context,
+            description.ssl_version,
+            description.wallet_location,
+            password_digest,
+            self._ssl_sni_data,
+        )
+        entry = tls_session_cache.get_entry(self._tls_session_key)
+        if entry is not None:
+            self._ssl_context = entry.ssl_context
+            return 0
 
         # start with a default SSL context, unless a custom one is supplied
         self._ssl_context = params.ssl_context
@@ -167,7 +298,6 @@ cdef class Transport:
                 errors._raise_err(errors.ERR_WALLET_FILE_MISSING,
                                   name=pem_file_name)
             self._ssl_context.load_verify_locations(pem_file_name)
-            wallet_password = params._get_wallet_password()
             try:
                 self._ssl_context.load_cert_chain(pem_file_name,
                                                   password=wallet_password)
@@ -179,63 +309,102 @@ cdef class Transport:
         # established
         self._ssl_context.check_hostname = False
 
-        # calculate the SNI data to send to the server, if applicable
-        if description.use_sni:
-            self._ssl_sni_data = self._calc_sni_data(description)
-        else:
-            self._ssl_sni_data = None
+        # retain the SSL context for subsequent connections
+        tls_session_cache.add_entry(self._tls_session_key, self._ssl_context)
 
-    cdef Packet extract_packet(self, bytes data=None):
+    cdef Packet extract_packet(self):
         """
-        Extracts a packet from the data, if possible (after first appending it
-        to the partial buffer, if applicable). Any extra data not needed by the
-        packet is stored in the partial buffer for a later call to this
-        function.
+        Extracts a packet from the data in the receive buffer, if possible. Any
+        extra data not needed by the packet is retained in the receive buffer
+        for a later call to this function.
         """
         cdef:
             ssize_t size, packet_size
+            const char_type *ptr
             Packet packet
-            char_type *ptr
-
-        # update the partial buffer with the new data
-        if data is not None:
-            if self._partial_buf is None:
-                self._partial_buf = data
-            else:
-                self._partial_buf += data
-        size = 0 if self._partial_buf is None else len(self._partial_buf)
 
         # if enough bytes for the packet header, extract the packet size
+        size = self._recv_end - self._recv_start
         if size >= PACKET_HEADER_SIZE:
 
             # extract the packet size
-            ptr = <char_type*> self._partial_buf
+            ptr = <const char_type*> self._recv_buf + self._recv_start
             if self._full_packet_size:
                 packet_size = decode_uint32be(ptr)
             else:
                 packet_size = decode_uint16be(ptr)
 
-            # if enough bytes are available for the packet, return it
+            # if enough bytes are available for the packet, copy it out of the
+            # receive buffer and return it
             if size >= packet_size:
                 packet = Packet.__new__(Packet)
                 packet.packet_size = packet_size
                 packet.packet_type = ptr[4]
                 packet.packet_flags = ptr[5]
-
-                # store the packet buffer and adjust the partial buffer, as
-                # needed
-                if size == packet_size:
-                    packet.buf = self._partial_buf
-                    self._partial_buf = None
-                else:
-                    packet.buf = self._partial_buf[:packet_size]
-                    self._partial_buf = self._partial_buf[packet_size:]
+                packet.buf = cpython.PyBytes_FromStringAndSize(
+                    <const char*> ptr, packet_size
+                )
+                self._recv_start += packet_size
+                if self._recv_start == self._recv_end:
+                    self._recv_start = self._recv_end = 0
 
                 # display packet, if requested
                 if DEBUG_PACKETS:
                     self._print_packet("Receiving packet", packet.buf)
                 return packet
 
+    cdef object get_receive_buffer(self):
+        """
+        Returns a writable view of the free space at the end of the receive
+        buffer. The space is large enough for the remainder of the packet
+        currently being received and for a packet of the maximum size. Data
+        that has been received but not yet extracted is first moved to the
+        start of the buffer or to a larger buffer, if needed.
+        """
+        cdef:
+            ssize_t num_pending, packet_size = 0, space_needed
+            bytearray new_buf
+            char *ptr
+
+        # determine the amount of free space that is needed
+        num_pending = self._recv_end - self._recv_start
+        if num_pending >= PACKET_HEADER_SIZE:
+            ptr = <char*> self._recv_buf + self._recv_start
+            if self._full_packet_size:
+                packet_size = decode_uint32be(<const char_type*> ptr)
+            else:
+                packet_size = decode_uint16be(<const char_type*> ptr)
+        space_needed = max(packet_size - num_pending, self._max_packet_size,
+                           MIN_RECEIVE_BUFFER_SPACE)
+
+        # make room for the data, if needed; the buffer is never resized in
+        # place as views returned earlier may still exist
+        if self._recv_buf is None:
+            self._recv_buf = bytearray(space_needed)
+        elif len(self._recv_buf) - self._recv_end < space_needed:
+            ptr = <char*> self._recv_buf
+            if len(self._recv_buf) - num_pending >= space_needed:
+                memmove(ptr, ptr + self._recv_start, num_pending)
+            else:
+                new_buf = bytearray(2 * (num_pending + space_needed))
+                memcpy(<char*> new_buf, ptr + self._recv_start, num_pending)
+                self._recv_buf = new_buf
+            self._recv_start = 0
+            self._recv_end = num_pending
+
+        return memoryview(self._recv_buf)[self._recv_end:]
+
+    cdef bytes get_received_bytes(self):
+        """
+        Returns all of the data in the receive buffer that has not yet been
+        extracted and empties the receive buffer.
+        """
+        cdef bytes data = bytes(
+            self._recv_buf[self._recv_start:self._recv_end]
+        )
+        self._recv_start = self._recv_end = 0
+        return data
+
     cdef tuple get_host_info(self):
         """
         Return a 2-tuple supplying the host and port to which the transport is
@@ -261,11 +430,18 @@ cdef class Transport:
         """
         Negotiate TLS on the socket.
         """
+        cdef object session
         if DEBUG_PACKETS:
             self._print_output(self._get_debugging_header("Negotiate TLS"))
-        self._transport = self._ssl_context.wrap_socket(
-            sock, server_hostname=self._ssl_sni_data
-        )
+        session = tls_session_cache.get_session(self._tls_session_key,
+                                                self._ssl_context)
+        try:
+            self._transport = self._ssl_context.wrap_socket(
+                sock, server_hostname=self._ssl_sni_data, session=session
+            )
+        except:
+            tls_session_cache.remove_entry(self._tls_session_key)
+            raise
         if description.ssl_server_dn_match:
             check_server_dn(self._transport, description.ssl_server_cert_dn,
                             address.host)
@@ -289,16 +465,36 @@ cdef class Transport:
             self._print_output(self._get_debugging_header("Negotiate TLS"))
         orig_transport = self._transport
         loop = protocol._read_buf._loop
-        self._transport = await loop.start_tls(
-            self._transport, protocol,
-            self._ssl_context,
-            server_hostname=self._ssl_sni_data
-        )
+        try:
+            self._transport = await loop.start_tls(
+                self._transport, protocol,
+                self._ssl_context,
+                server_hostname=self._ssl_sni_data
+            )
+        except:
+            tls_session_cache.remove_entry(self._tls_session_key)
+            raise
         if description.ssl_server_dn_match:
             sock = self._transport.get_extra_info("ssl_object")
             check_server_dn(sock, description.ssl_server_cert_dn, address.host)
         return orig_transport
 
+    cdef int save_tls_session(self) except -1:
+        """
+        Saves the TLS session negotiated on the transport so that subsequent
+        connections to the same address can resume it. This is called once the
+        connection has been established since with TLS 1.3 the session is only
+        available after the server has sent a session ticket. The asyncio
+        event loop does not permit a session to be supplied when negotiating
+        TLS so nothing is saved for asyncio transports.
+        """
+        cdef object session
+        if self._tls_session_key is not None and not self._is_async:
+            session = self._transport.session
+            if session is not None:
+                tls_session_cache.save_session(self._tls_session_key,
+                                               self._ssl_context, session)
+
     cdef int send_oob_break(self) except -1:
         """
         Sends an out-of-band break on the transport.
@@ -336,30 +532,33 @@ cdef class Transport:
         self._transport = transport
         self._address = address
         self._transport_num = sock.fileno()
+        self._tls_session_key = None
 
     cdef Packet read_packet(self, bint raise_exc=True):
         """
         Reads a packet from the transport.
         """
         cdef:
+            ssize_t num_bytes
             Packet packet
-            bytes data
         packet = self.extract_packet()
         while packet is None:
             try:
-                data = self._transport.recv(self._max_packet_size)
+                num_bytes = \
+                        self._transport.recv_into(self.get_receive_buffer())
             except ConnectionResetError as e:
                 self._transport = None
                 if not raise_exc:
                     return None
                 errors._raise_err(errors.ERR_CONNECTION_CLOSED, str(e),
                                   cause=e)
-            if len(data) == 0:
+            if num_bytes == 0:
                 self.disconnect()
                 if not raise_exc:
                     return None
                 errors._raise_err(errors.ERR_CONNECTION_CLOSED)
-            packet = self.extract_packet(data)
+            self._recv_end += num_bytes
+            packet = self.extract_packet()
         return packet
 
     cdef int set_timeout(self, double value) except -1:
@@ -28,10 +28,20 @@
 # Contains the LOB class for managing BLOB, CLOB, NCLOB and BFILE data.
 # -----------------------------------------------------------------------------
 
+import asyncio
+import concurrent.futures
+import io
+from typing import AsyncIterator, Iterator
+
 from .base import BaseMetaClass
 from .base_impl import DbType, DB_TYPE_BFILE, DB_TYPE_BLOB
 from . import errors
 
+# the minimum amount of data requested from the database in each round-trip
+# when reading from a LOB stream without an explicit chunk size; the LOB chunk
+# size is used as a multiple so that reads remain aligned with LOB chunks
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class BaseLOB(metaclass=BaseMetaClass):
 
@@ -51,18 +61,32 @@ class BaseLOB(metaclass=BaseMetaClass):
         Checks the value to write and returns the actual value to write.
         Character LOBs must write strings but can accept UTF-8 encoded bytes
         (which will be decoded to strings). Binary LOBs must write bytes but
-        can accept strings (which will be encoded in UTF-8).
+        can accept strings (which will be encoded in UTF-8) and any object
+        that supports the buffer protocol (which will be written directly
+        from the object's memory without being copied to bytes first).
         """
         if self.type is DB_TYPE_BLOB:
             if isinstance(value, str):
                 return value.encode()
             elif isinstance(value, bytes):
                 return value
+            try:
+                view = memoryview(value)
+            except TypeError:
+                pass
+            else:
+                if view.nbytes == 0:
+                    return b""
+                elif not view.c_contiguous:
+                    return view.tobytes()
+                return view.cast("B")
         else:
             if isinstance(value, str):
                 return value
             elif isinstance(value, bytes):
                 return value.decode()
+            elif isinstance(value, (bytearray, memoryview)):
+                return str(value, "utf-8")
         raise TypeError("expecting string or bytes")
 
     @classmethod
@@ -73,6 +97,20 @@ class BaseLOB(metaclass=BaseMetaClass):
         lob._impl = impl
         return lob
 
+    def _get_stream_chunk_size(self, chunk_size, lob_chunk_size):
+        """
+        Returns the amount of data to request from the database in each
+        round-trip when reading from a stream opened on the LOB.
+        """
+        if chunk_size is not None:
+            if chunk_size <= 0:
+                errors._raise_err(errors.ERR_INVALID_LOB_AMOUNT)
+            return chunk_size
+        if not lob_chunk_size:
+            return STREAM_CHUNK_SIZE
+        num_chunks = (STREAM_CHUNK_SIZE + lob_chunk_size - 1) // lob_chunk_size
+        return num_chunks * lob_chunk_size
+
     def getfilename(self) -> tuple:
         """
         Returns a two-tuple consisting of the directory alias and file name for
@@ -137,6 +175,23 @@ class LOB(BaseLOB):
         """
         return self._impl.get_is_open()
 
+    def iter_chunks(
+        self,
+        offset: int = 1,
+        chunk_size: int | None = None,
+        read_ahead: bool = True,
+    ) -> Iterator[str | bytes]:
+        """
+        Returns an iterator over the data in the LOB, starting at the given
+        offset. Each chunk is read from the database in a single round-trip
+        and the next chunk is requested on a background thread while the
+        current one is being processed, unless read_ahead is False. See
+        open_stream() for the meaning of chunk_size.
+        """
+        with self.open_stream(chunk_size, read_ahead) as stream:
+            stream.seek(offset - 1)
+            yield from stream
+
     def open(self) -> None:
         """
         Opens the LOB for writing. This will improve performance when writing
@@ -147,6 +202,25 @@ class LOB(BaseLOB):
         """
         self._impl.open()
 
+    def open_stream(
+        self, chunk_size: int | None = None, read_ahead: bool = True
+    ) -> "LOBStream":
+        """
+        Returns a file-like stream for reading and writing the data in the
+        LOB. The chunk_size is the amount of data requested from the database
+        in each round-trip, in bytes for BLOB and BFILE type LOBs and in UCS-2
+        code points for CLOB and NCLOB type LOBs. If it is not specified, a
+        multiple of the LOB chunk size of at least 1 MB is used. If read_ahead
+        is True, the next chunk is requested on a background thread while the
+        current one is being processed. Reads are not pipelined, so at most
+        one read is outstanding at a time.
+        """
+        lob_chunk_size = None
+        if chunk_size is None and self._impl.dbtype is not DB_TYPE_BFILE:
+            lob_chunk_size = self._impl.get_chunk_size()
+        chunk_size = self._get_stream_chunk_size(chunk_size, lob_chunk_size)
+        return LOBStream._create(self, chunk_size, read_ahead)
+
     def read(self, offset: int = 1, amount: int | None = None) -> str | bytes:
         """
         Returns a portion (or all) of the data in the LOB. Note that the amount
@@ -240,6 +314,24 @@ class AsyncLOB(BaseLOB):
         """
         return await self._impl.get_is_open()
 
+    async def iter_chunks(
+        self,
+        offset: int = 1,
+        chunk_size: int | None = None,
+        read_ahead: bool = True,
+    ) -> AsyncIterator[str | bytes]:
+        """
+        Returns an asynchronous iterator over the data in the LOB, starting at
+        the given offset. Each chunk is read from the database in a single
+        round-trip and the next chunk is requested in a background task while
+        the current one is being processed, unless read_ahead is False. See
+        open_stream() for the meaning of chunk_size.
+        """
+        async with await self.open_stream(chunk_size, read_ahead) as stream:
+            await stream.seek(offset - 1)
+            async for chunk in stream:
+                yield chunk
+
     async def open(self) -> None:
         """
         Opens the LOB for writing. This will improve performance when writing
@@ -250,6 +342,25 @@ class AsyncLOB(BaseLOB):
         """
         await self._impl.open()
 
+    async def open_stream(
+        self, chunk_size: int | None = None, read_ahead: bool = True
+    ) -> "AsyncLOBStream":
+        """
+        Returns a file-like stream for reading and writing the data in the
+        LOB. The chunk_size is the amount of data requested from the database
+        in each round-trip, in bytes for BLOB and BFILE type LOBs and in UCS-2
+        code points for CLOB and NCLOB type LOBs. If it is not specified, a
+        multiple of the LOB chunk size of at least 1 MB is used. If read_ahead
+        is True, the next chunk is requested in a background task while the
+        current one is being processed. Reads are not pipelined, so at most
+        one read is outstanding at a time.
+        """
+        lob_chunk_size = None
+        if chunk_size is None and self._impl.dbtype is not DB_TYPE_BFILE:
+            lob_chunk_size = await self._impl.get_chunk_size()
+        chunk_size = self._get_stream_chunk_size(chunk_size, lob_chunk_size)
+        return AsyncLOBStream._create(self, chunk_size, read_ahead)
+
     async def read(
         self, offset: int = 1, amount: int | None = None
     ) -> str | bytes:
@@ -310,3 +421,424 @@ class AsyncLOB(BaseLOB):
         """
         self._check_not_bfile()
         await self._impl.write(self._check_value_to_write(data), offset)
+
+
+class BaseLOBStream(metaclass=BaseMetaClass):
+
+    def __repr__(self):
+        typ = self.__class__
+        return (
+            f"<{typ._public_name} lob_type={self._impl.dbtype.name} "
+            f"position={self.tell()}>"
+        )
+
+    def _check_open(self):
+        """
+        Checks to ensure that the stream has not been closed.
+        """
+        if self._closed:
+            errors._raise_err(errors.ERR_LOB_STREAM_CLOSED)
+
+    def _consume(self, amount):
+        """
+        Returns up to the given number of bytes or characters from the data
+        that has been read from the LOB but not yet returned to the caller and
+        advances the position of the stream. A negative amount returns all of
+        the data.
+        """
+        data = self._buffer
+        if amount < 0 or amount >= len(data):
+            self._buffer = None
+            self._pos = self._read_offset
+            return data
+        self._buffer = data[amount:]
+        data = data[:amount]
+        self._pos += self._get_length(data)
+        return data
+
+    @classmethod
+    def _create(cls, lob, chunk_size, read_ahead):
+        stream = cls.__new__(cls)
+        stream._lob = lob
+        stream._impl = lob._impl
+        stream._chunk_size = chunk_size
+        stream._read_ahead = read_ahead
+        stream._pending_read = None
+        stream._buffer = None
+        stream._pos = 1
+        stream._read_offset = 1
+        stream._size = None
+        stream._should_close_file = False
+        stream._closed = False
+        return stream
+
+    def _get_length(self, value):
+        """
+        Returns the length of the value in the units used by the LOB: bytes
+        for BLOB and BFILE type LOBs and UCS-2 code points for CLOB and NCLOB
+        type LOBs.
+        """
+        if isinstance(value, str) and not value.isascii():
+            return len(value.encode("utf-16-le")) // 2
+        return len(value)
+
+    def _get_next_read_offset(self, offset):
+        """
+        Returns the offset of the block following the block that starts at the
+        given offset.
+        """
+        return min(offset + self._chunk_size, self._size + 1)
+
+    def _join(self, parts):
+        """
+        Joins the parts of the data read from the LOB into a single value.
+        """
+        if self._impl.dbtype in (DB_TYPE_BLOB, DB_TYPE_BFILE):
+            return b"".join(parts)
+        return "".join(parts)
+
+    def _seek(self, offset, whence, size):
+        """
+        Sets the position of the stream. Any data that was read from the LOB
+        but not yet returned is discarded if the position changes.
+        """
+        if whence == io.SEEK_SET:
+            pos = offset + 1
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = size + offset + 1
+        else:
+            raise ValueError(f"invalid whence value: {whence}")
+        if pos <= 0:
+            errors._raise_err(errors.ERR_INVALID_LOB_OFFSET)
+        if pos != self._pos:
+            self._buffer = None
+            self._pos = self._read_offset = pos
+        return pos - 1
+
+    def _written(self, value):
+        """
+        Updates the state of the stream after the value has been written to
+        the LOB at the current position and returns the length of the value.
+        """
+        length = self._get_length(value)
+        self._buffer = None
+        self._pos = self._read_offset = self._pos + length
+        self._size = None
+        return length
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        This read-only attribute returns the amount of data that is requested
+        from the database in each round-trip when reading from the stream.
+        """
+        return self._chunk_size
+
+    @property
+    def closed(self) -> bool:
+        """
+        This read-only attribute returns a boolean indicating if the stream
+        has been closed.
+        """
+        return self._closed
+
+    @property
+    def lob(self) -> BaseLOB:
+        """
+        This read-only attribute returns the LOB that the stream reads from
+        and writes to.
+        """
+        return self._lob
+
+    def readable(self) -> bool:
+        """
+        Returns a boolean indicating if data can be read from the stream. This
+        is always True.
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """
+        Returns a boolean indicating if the position of the stream can be
+        changed. This is always True.
+        """
+        return True
+
+    def tell(self) -> int:
+        """
+        Returns the current position of the stream. The position is zero-based
+        and is in bytes for BLOB and BFILE type LOBs and in UCS-2 code points
+        for CLOB and NCLOB type LOBs.
+        """
+        return self._pos - 1
+
+    def writable(self) -> bool:
+        """
+        Returns a boolean indicating if data can be written to the stream.
+        This is False for streams opened on BFILE type LOBs.
+        """
+        return self._impl.dbtype is not DB_TYPE_BFILE
+
+
+class LOBStream(BaseLOBStream):
+
+    def __enter__(self):
+        self._check_open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        self._check_open()
+        while self._buffer or self._fill_buffer():
+            yield self._consume(-1)
+
+    def _discard_pending_read(self):
+        """
+        Waits for any read that was started on the background thread to
+        complete and discards its data.
+        """
+        if self._pending_read is not None:
+            self._pending_read[1].exception()
+            self._pending_read = None
+
+    def _fill_buffer(self):
+        """
+        Populates the buffer with the next block of data from the LOB and
+        returns a boolean indicating if any data was read. When read-ahead is
+        enabled, the block following it is requested on a background thread
+        so that the next round-trip to the database overlaps with the
+        processing of the current block by the caller.
+        """
+        if self._size is None:
+            if (
+                self._impl.dbtype is DB_TYPE_BFILE
+                and not self._should_close_file
+                and not self._impl.get_is_open()
+            ):
+                self._impl.open()
+                self._should_close_file = True
+            self._size = self._impl.get_size()
+        offset = self._read_offset
+        if offset > self._size:
+            return False
+        data = None
+        if self._pending_read is not None:
+            pending_offset, future = self._pending_read
+            self._pending_read = None
+            if pending_offset == offset:
+                data = future.result()
+            else:
+                future.exception()
+        if data is None:
+            data = self._impl.read(offset, self._chunk_size)
+        self._read_offset = self._get_next_read_offset(offset)
+        if self._read_ahead and self._read_offset <= self._size:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1
+                )
+            future = self._executor.submit(
+                self._impl.read, self._read_offset, self._chunk_size
+            )
+            self._pending_read = (self._read_offset, future)
+        self._buffer = data
+        return len(data) > 0
+
+    @classmethod
+    def _create(cls, lob, chunk_size, read_ahead):
+        stream = super()._create(lob, chunk_size, read_ahead)
+        stream._executor = None
+        return stream
+
+    def close(self) -> None:
+        """
+        Closes the stream. Any read that is still in progress on the
+        background thread is completed and its data discarded. If the stream
+        opened a BFILE type LOB in order to read from it, the BFILE is closed
+        as well. The LOB itself remains usable.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._discard_pending_read()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._buffer = None
+        if self._should_close_file:
+            self._should_close_file = False
+            self._impl.close()
+
+    def read(self, size: int = -1) -> str | bytes:
+        """
+        Reads and returns up to the given number of bytes (for BLOB and BFILE
+        type LOBs) or characters (for CLOB and NCLOB type LOBs) from the
+        current position of the stream. If the size is negative, all of the
+        remaining data in the LOB is returned. An empty value is returned when
+        the end of the LOB has been reached.
+        """
+        self._check_open()
+        parts = []
+        while size != 0:
+            if not self._buffer and not self._fill_buffer():
+                break
+            data = self._consume(size)
+            parts.append(data)
+            size -= len(data)
+        return self._join(parts)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Changes the position of the stream to the given offset, interpreted
+        relative to the position indicated by whence (the start of the LOB,
+        the current position or the end of the LOB), and returns the new
+        position.
+        """
+        self._check_open()
+        size = self._impl.get_size() if whence == io.SEEK_END else None
+        return self._seek(offset, whence, size)
+
+    def write(self, data: str | bytes) -> int:
+        """
+        Writes the data to the LOB at the current position of the stream and
+        returns the length of the data that was written, in bytes for BLOB
+        type LOBs and in UCS-2 code points for CLOB and NCLOB type LOBs. For
+        BLOB type LOBs, the data may be any object that supports the buffer
+        protocol and it is written without being copied to bytes first.
+        """
+        self._check_open()
+        self._lob._check_not_bfile()
+        value = self._lob._check_value_to_write(data)
+        self._discard_pending_read()
+        self._impl.write(value, self._pos)
+        return self._written(value)
+
+
+class AsyncLOBStream(BaseLOBStream):
+
+    async def __aenter__(self):
+        self._check_open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
+
+    async def __aiter__(self):
+        self._check_open()
+        while self._buffer or await self._fill_buffer():
+            yield self._consume(-1)
+
+    async def _discard_pending_read(self):
+        """
+        Waits for any read that was started in a background task to complete
+        and discards its data.
+        """
+        if self._pending_read is not None:
+            await asyncio.wait([self._pending_read[1]])
+            self._pending_read[1].exception()
+            self._pending_read = None
+
+    async def _fill_buffer(self):
+        """
+        Populates the buffer with the next block of data from the LOB and
+        returns a boolean indicating if any data was read. When read-ahead is
+        enabled, the block following it is requested in a background task so
+        that the next round-trip to the database overlaps with the processing
+        of the current block by the caller.
+        """
+        if self._size is None:
+            if (
+                self._impl.dbtype is DB_TYPE_BFILE
+                and not self._should_close_file
+                and not await self._impl.get_is_open()
+            ):
+                await self._impl.open()
+                self._should_close_file = True
+            self._size = await self._impl.get_size()
+        offset = self._read_offset
+        if offset > self._size:
+            return False
+        data = None
+        if self._pending_read is not None:
+            pending_offset, task = self._pending_read
+            if pending_offset == offset:
+                self._pending_read = None
+                data = await task
+            else:
+                await self._discard_pending_read()
+        if data is None:
+            data = await self._impl.read(offset, self._chunk_size)
+        self._read_offset = self._get_next_read_offset(offset)
+        if self._read_ahead and self._read_offset <= self._size:
+            task = asyncio.ensure_future(
+                self._impl.read(self._read_offset, self._chunk_size)
+            )
+            self._pending_read = (self._read_offset, task)
+        self._buffer = data
+        return len(data) > 0
+
+    async def close(self) -> None:
+        """
+        Closes the stream. Any read that is still in progress in the
+        background task is completed and its data discarded. If the stream
+        opened a BFILE type LOB in order to read from it, the BFILE is closed
+        as well. The LOB itself remains usable.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await self._discard_pending_read()
+        self._buffer = None
+        if self._should_close_file:
+            self._should_close_file = False
+            await self._impl.close()
+
+    async def read(self, size: int = -1) -> str | bytes:
+        """
+        Reads and returns up to the given number of bytes (for BLOB and BFILE
+        type LOBs) or characters (for CLOB and NCLOB type LOBs) from the
+        current position of the stream. If the size is negative, all of the
+        remaining data in the LOB is returned. An empty value is returned when
+        the end of the LOB has been reached.
+        """
+        self._check_open()
+        parts = []
+        while size != 0:
+            if not self._buffer and not await self._fill_buffer():
+                break
+            data = self._consume(size)
+            parts.append(data)
+            size -= len(data)
+        return self._join(parts)
+
+    async def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Changes the position of the stream to the given offset, interpreted
+        relative to the position indicated by whence (the start of the LOB,
+        the current position or the end of the LOB), and returns the new
+        position.
+        """
+        self._check_open()
+        size = None
+        if whence == io.SEEK_END:
+            size = await self._impl.get_size()
+        return self._seek(offset, whence, size)
+
+    async def write(self, data: str | bytes) -> int:
+        """
+        Writes the data to the LOB at the current position of the stream and
+        returns the length of the data that was written, in bytes for BLOB
+        type LOBs and in UCS-2 code points for CLOB and NCLOB type LOBs. For
+        BLOB type LOBs, the data may be any object that supports the buffer
+        protocol and it is written without being copied to bytes first.
+        """
+        self._check_open()
+        self._lob._check_not_bfile()
+        value = self._lob._check_value_to_write(data)
+        await self._discard_pending_read()
+        await self._impl.write(value, self._pos)
+        return self._written(value)
@@ -69,6 +69,7 @@ class PoolParams(ConnectParams):
         soda_metadata_cache: bool | None = None,
         ping_interval: int | None = None,
         ping_timeout: int | None = None,
+        create_concurrency: int | None = None,
         user: str | None = None,
         proxy_user: str | None = None,
         password: str | None = None,
@@ -98,6 +99,8 @@ class PoolParams(ConnectParams):
         mode: oracledb.AuthMode | None = None,
         disable_oob: bool | None = None,
         stmtcachesize: int | None = None,
+        result_cache_size: int | None = None,
+        adaptive_stmtcache: bool | None = None,
         edition: str | None = None,
         tag: str | None = None,
         matchanytag: bool | None = None,
@@ -196,6 +199,14 @@ class PoolParams(ConnectParams):
           acquire()
           (default: 5000)
 
+        - ``create_concurrency``: the maximum number of connections that the
+          pool creates at the same time when it grows, such as when it is first
+          created with a non-zero min value. Creating connections in parallel
+          reduces the time taken for the pool to reach its minimum size when
+          establishing each connection is slow. This value is only used in
+          python-oracledb Thin mode
+          (default: 1)
+
         - ``user``: the name of the database user to connect to
           (default: None)
 
@@ -342,6 +353,23 @@ class PoolParams(ConnectParams):
           (default: :attr:`oracledb.defaults.stmtcachesize
           <Defaults.stmtcachesize>`)
 
+        - ``result_cache_size``: the maximum size, in bytes, of the client-side
+          query result cache that is used in python-oracledb Thin mode. The
+          default value of 0 disables the cache. Rows are only cached for
+          queries executed by cursors that have a non-zero
+          Cursor.result_cache_ttl value. Cached rows are not discarded when the
+          data in the database changes. Connections acquired from a pool share
+          the cache of the pool
+          (default: 0)
+
+        - ``adaptive_stmtcache``: a boolean indicating whether the statement
+          cache used in python-oracledb Thin mode may grow beyond stmtcachesize
+          while statements are frequently being evicted from it and requested
+          again. The cache grows up to half of the maximum number of open
+          cursors permitted by the database and shrinks back to stmtcachesize
+          after the connection has not been used for some time
+          (default: False)
+
         - ``edition``: edition to use for the connection. This parameter cannot
           be used simultaneously with the cclass parameter
           (default: None)
@@ -505,6 +533,7 @@ class PoolParams(ConnectParams):
             f"soda_metadata_cache={self.soda_metadata_cache!r}, "
             f"ping_interval={self.ping_interval!r}, "
             f"ping_timeout={self.ping_timeout!r}, "
+            f"create_concurrency={self.create_concurrency!r}, "
             f"user={self.user!r}, "
             f"proxy_user={self.proxy_user!r}, "
             f"host={self.host!r}, "
@@ -530,6 +559,8 @@ class PoolParams(ConnectParams):
             f"mode={self.mode!r}, "
             f"disable_oob={self.disable_oob!r}, "
             f"stmtcachesize={self.stmtcachesize!r}, "
+            f"result_cache_size={self.result_cache_size!r}, "
+            f"adaptive_stmtcache={self.adaptive_stmtcache!r}, "
             f"edition={self.edition!r}, "
             f"tag={self.tag!r}, "
             f"matchanytag={self.matchanytag!r}, "
@@ -566,6 +597,17 @@ class PoolParams(ConnectParams):
         """
         return self._impl.connectiontype
 
+    @property
+    def create_concurrency(self) -> int:
+        """
+        The maximum number of connections that the pool creates at the same
+        time when it grows, such as when it is first created with a non-zero
+        min value. Creating connections in parallel reduces the time taken for
+        the pool to reach its minimum size when establishing each connection is
+        slow. This value is only used in python-oracledb Thin mode.
+        """
+        return self._impl.create_concurrency
+
     @property
     def getmode(self) -> oracledb.PoolGetMode:
         """
@@ -705,6 +747,7 @@ class PoolParams(ConnectParams):
         soda_metadata_cache: bool | None = None,
         ping_interval: int | None = None,
         ping_timeout: int | None = None,
+        create_concurrency: int | None = None,
         user: str | None = None,
         proxy_user: str | None = None,
         password: str | None = None,
@@ -734,6 +777,8 @@ class PoolParams(ConnectParams):
         mode: oracledb.AuthMode | None = None,
         disable_oob: bool | None = None,
         stmtcachesize: int | None = None,
+        result_cache_size: int | None = None,
+        adaptive_stmtcache: bool | None = None,
         edition: str | None = None,
         tag: str | None = None,
         matchanytag: bool | None = None,
@@ -818,6 +863,13 @@ class PoolParams(ConnectParams):
           the database before being discarded and replaced during a call to
           acquire()
 
+        - ``create_concurrency``: the maximum number of connections that the
+          pool creates at the same time when it grows, such as when it is first
+          created with a non-zero min value. Creating connections in parallel
+          reduces the time taken for the pool to reach its minimum size when
+          establishing each connection is slow. This value is only used in
+          python-oracledb Thin mode
+
         - ``user``: the name of the database user to connect to
 
         - ``proxy_user``: the name of the proxy user to connect to. If this
@@ -934,6 +986,21 @@ class PoolParams(ConnectParams):
 
         - ``stmtcachesize``: the size of the statement cache
 
+        - ``result_cache_size``: the maximum size, in bytes, of the client-side
+          query result cache that is used in python-oracledb Thin mode. The
+          default value of 0 disables the cache. Rows are only cached for
+          queries executed by cursors that have a non-zero
+          Cursor.result_cache_ttl value. Cached rows are not discarded when the
+          data in the database changes. Connections acquired from a pool share
+          the cache of the pool
+
+        - ``adaptive_stmtcache``: a boolean indicating whether the statement
+          cache used in python-oracledb Thin mode may grow beyond stmtcachesize
+          while statements are frequently being evicted from it and requested
+          again. The cache grows up to half of the maximum number of open
+          cursors permitted by the database and shrinks back to stmtcachesize
+          after the connection has not been used for some time
+
         - ``edition``: edition to use for the connection. This parameter cannot
           be used simultaneously with the cclass parameter
 
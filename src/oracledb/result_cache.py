@@ -0,0 +1,103 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# result_cache.py
+#
+# Contains the ResultCache class used for managing the client-side query
+# result cache of a connection or connection pool.
+# -----------------------------------------------------------------------------
+
+from .base import BaseMetaClass
+
+
+class ResultCache(metaclass=BaseMetaClass):
+    def __repr__(self):
+        typ = self.__class__
+        return (
+            f"<{typ._public_name} size={self.size} "
+            f"max_size={self.max_size}>"
+        )
+
+    @classmethod
+    def _from_impl(cls, impl):
+        cache = cls.__new__(cls)
+        cache._impl = impl
+        return cache
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache. This can be called from the
+        callback of a :ref:`CQN subscription <cqn>` in order to ensure that
+        changes made to the tables used by cached queries become visible
+        before the time to live of the entries has expired.
+        """
+        self._impl.clear()
+
+    @property
+    def hits(self) -> int:
+        """
+        This read-only attribute returns the number of times that the rows of
+        a query were returned from the cache.
+        """
+        return self._impl.hits
+
+    def invalidate(self, statement: str) -> None:
+        """
+        Removes all entries for the given statement from the cache, regardless
+        of the bind values that were used when the statement was executed.
+        """
+        self._impl.invalidate(statement.strip())
+
+    @property
+    def max_size(self) -> int:
+        """
+        This read-only attribute returns the maximum size, in bytes, of the
+        cache.
+        """
+        return self._impl.max_size
+
+    @property
+    def misses(self) -> int:
+        """
+        This read-only attribute returns the number of times that a query
+        which could have been returned from the cache had to be executed
+        because no unexpired entry was found.
+        """
+        return self._impl.misses
+
+    @property
+    def num_entries(self) -> int:
+        """
+        This read-only attribute returns the number of entries in the cache.
+        """
+        return self._impl.get_num_entries()
+
+    @property
+    def size(self) -> int:
+        """
+        This read-only attribute returns the estimated size, in bytes, of the
+        rows stored in the cache.
+        """
+        return self._impl.size
@@ -26,7 +26,8 @@
 # soda.py
 #
 # Contains the classes for managing Simple Oracle Document Access (SODA):
-# SodaDatabase, SodaCollection, SodaDocument, SodaDocCursor and SodaOperation.
+# SodaDatabase, SodaCollection, SodaDocument, SodaDocCursor and SodaOperation
+# along with the equivalent classes used with asyncio.
 # -----------------------------------------------------------------------------
 
 from __future__ import annotations
@@ -39,7 +40,7 @@ from .base import BaseMetaClass
 from . import errors
 
 
-class SodaDatabase(metaclass=BaseMetaClass):
+class BaseSodaDatabase(metaclass=BaseMetaClass):
     def __repr__(self):
         cls_name = self.__class__._public_name
         return f"<{cls_name} on {self._conn!r}>"
@@ -68,37 +69,6 @@ class SodaDatabase(metaclass=BaseMetaClass):
             content_bytes = json.dumps(content).encode()
         return self._impl.create_document(content_bytes, key, media_type)
 
-    def createCollection(
-        self,
-        name: str,
-        metadata: str | dict | None = None,
-        mapMode: bool = False,
-    ) -> SodaCollection:
-        """
-        Creates a SODA collection with the given name and returns a new SODA
-        collection object. If you try to create a collection, and a collection
-        with the same name and metadata already exists, then that existing
-        collection is opened without error.
-
-        If ``metadata`` is specified, it is expected to be a string containing
-        valid JSON or a dictionary that will be transformed into a JSON string.
-        This JSON permits you to specify the configuration of the collection
-        including storage options; specifying the presence or absence of
-        columns for creation timestamp, last modified timestamp and version;
-        whether the collection can store only JSON documents; and methods of
-        key and version generation. The default metadata creates a collection
-        that only supports JSON documents and uses system generated keys.
-
-        If the ``mapMode`` parameter is set to *True*, the new collection is
-        mapped to an existing table instead of creating a table. If a
-        collection is created in this way, dropping the collection will not
-        drop the existing table either.
-        """
-        if metadata is not None and not isinstance(metadata, str):
-            metadata = json.dumps(metadata)
-        collection_impl = self._impl.create_collection(name, metadata, mapMode)
-        return SodaCollection._from_impl(self, collection_impl)
-
     def createDocument(
         self,
         content: Any,
@@ -131,6 +101,39 @@ class SodaDatabase(metaclass=BaseMetaClass):
         doc_impl = self._create_doc_impl(content, key, mediaType)
         return SodaDocument._from_impl(doc_impl)
 
+
+class SodaDatabase(BaseSodaDatabase):
+    def createCollection(
+        self,
+        name: str,
+        metadata: str | dict | None = None,
+        mapMode: bool = False,
+    ) -> SodaCollection:
+        """
+        Creates a SODA collection with the given name and returns a new SODA
+        collection object. If you try to create a collection, and a collection
+        with the same name and metadata already exists, then that existing
+        collection is opened without error.
+
+        If ``metadata`` is specified, it is expected to be a string containing
+        valid JSON or a dictionary that will be transformed into a JSON string.
+        This JSON permits you to specify the configuration of the collection
+        including storage options; specifying the presence or absence of
+        columns for creation timestamp, last modified timestamp and version;
+        whether the collection can store only JSON documents; and methods of
+        key and version generation. The default metadata creates a collection
+        that only supports JSON documents and uses system generated keys.
+
+        If the ``mapMode`` parameter is set to *True*, the new collection is
+        mapped to an existing table instead of creating a table. If a
+        collection is created in this way, dropping the collection will not
+        drop the existing table either.
+        """
+        if metadata is not None and not isinstance(metadata, str):
+            metadata = json.dumps(metadata)
+        collection_impl = self._impl.create_collection(name, metadata, mapMode)
+        return SodaCollection._from_impl(self, collection_impl)
+
     def getCollectionNames(
         self, startName: str | None = None, limit: int = 0
     ) -> list[str]:
@@ -158,7 +161,68 @@ class SodaDatabase(metaclass=BaseMetaClass):
             return SodaCollection._from_impl(self, collection_impl)
 
 
-class SodaCollection(metaclass=BaseMetaClass):
+class AsyncSodaDatabase(BaseSodaDatabase):
+    async def createCollection(
+        self,
+        name: str,
+        metadata: str | dict | None = None,
+        mapMode: bool = False,
+    ) -> AsyncSodaCollection:
+        """
+        Creates a SODA collection with the given name and returns a new SODA
+        collection object. If you try to create a collection, and a collection
+        with the same name and metadata already exists, then that existing
+        collection is opened without error.
+
+        If ``metadata`` is specified, it is expected to be a string containing
+        valid JSON or a dictionary that will be transformed into a JSON string.
+        This JSON permits you to specify the configuration of the collection
+        including storage options; specifying the presence or absence of
+        columns for creation timestamp, last modified timestamp and version;
+        whether the collection can store only JSON documents; and methods of
+        key and version generation. The default metadata creates a collection
+        that only supports JSON documents and uses system generated keys.
+
+        If the ``mapMode`` parameter is set to *True*, the new collection is
+        mapped to an existing table instead of creating a table. If a
+        collection is created in this way, dropping the collection will not
+        drop the existing table either.
+        """
+        if metadata is not None and not isinstance(metadata, str):
+            metadata = json.dumps(metadata)
+        collection_impl = await self._impl.create_collection(
+            name, metadata, mapMode
+        )
+        return AsyncSodaCollection._from_impl(self, collection_impl)
+
+    async def getCollectionNames(
+        self, startName: str | None = None, limit: int = 0
+    ) -> list[str]:
+        """
+        Returns a list of the names of collections in the database that match
+        the criteria, in alphabetical order.
+
+        If the ``startName`` parameter is specified, the list of names returned
+        will start with this value and also contain any names that fall after
+        this value in alphabetical order.
+
+        If the ``limit`` parameter is specified and is non-zero, the number of
+        collection names returned will be limited to this value.
+        """
+        return await self._impl.get_collection_names(startName, limit)
+
+    async def openCollection(self, name: str) -> AsyncSodaCollection:
+        """
+        Opens an existing collection with the given name and returns a new SODA
+        collection object. If a collection with that name does not exist,
+        *None* is returned.
+        """
+        collection_impl = await self._impl.open_collection(name)
+        if collection_impl is not None:
+            return AsyncSodaCollection._from_impl(self, collection_impl)
+
+
+class BaseSodaCollection(metaclass=BaseMetaClass):
     @classmethod
     def _from_impl(cls, db, impl):
         coll = cls.__new__(cls)
@@ -171,6 +235,23 @@ class SodaCollection(metaclass=BaseMetaClass):
             return arg._impl
         return self._db._create_doc_impl(arg)
 
+    @property
+    def metadata(self) -> dict:
+        """
+        This read-only attribute returns a dictionary containing the metadata
+        that was used to create the collection.
+        """
+        return json.loads(self._impl.get_metadata())
+
+    @property
+    def name(self) -> str:
+        """
+        This read-only attribute returns the name of the collection.
+        """
+        return self._impl.name
+
+
+class SodaCollection(BaseSodaCollection):
     def createIndex(self, spec: dict | str) -> None:
         """
         Creates an index on a SODA collection.
@@ -316,21 +397,6 @@ class SodaCollection(metaclass=BaseMetaClass):
         """
         return [json.loads(s) for s in self._impl.list_indexes()]
 
-    @property
-    def metadata(self) -> dict:
-        """
-        This read-only attribute returns a dictionary containing the metadata
-        that was used to create the collection.
-        """
-        return json.loads(self._impl.get_metadata())
-
-    @property
-    def name(self) -> str:
-        """
-        This read-only attribute returns the name of the collection.
-        """
-        return self._impl.name
-
     def save(self, doc: Any) -> None:
         """
         Saves a document into the collection. This method is equivalent to
@@ -377,6 +443,190 @@ class SodaCollection(metaclass=BaseMetaClass):
         self._impl.truncate()
 
 
+class AsyncSodaCollection(BaseSodaCollection):
+    async def createIndex(self, spec: dict | str) -> None:
+        """
+        Creates an index on a SODA collection.
+
+        The ``spec`` parameter is expected to be a dictionary or a JSON-encoded
+        string.
+
+        Note that a commit should be performed before attempting to create an
+        index.
+        """
+        if isinstance(spec, dict):
+            spec = json.dumps(spec)
+        elif not isinstance(spec, str):
+            raise TypeError("expecting a dictionary or string")
+        await self._impl.create_index(spec)
+
+    async def drop(self) -> bool:
+        """
+        Drops the collection from the database, if it exists. Note that if the
+        collection was created with ``mapMode`` set to *True*, the underlying
+        table will not be dropped.
+
+        A boolean value is returned indicating if the collection was actually
+        dropped.
+        """
+        return await self._impl.drop()
+
+    async def dropIndex(self, name: str, force: bool = False) -> bool:
+        """
+        Drops the index with the specified name, if it exists.
+
+        The force parameter, if set to *True*, can be used to force the
+        dropping of an index that the underlying Oracle Database domain index
+        does not normally permit. This is only applicable to spatial and JSON
+        search indexes.
+
+        A boolean value is returned indicating if the index was actually
+        dropped.
+        """
+        return await self._impl.drop_index(name, force)
+
+    def find(self) -> AsyncSodaOperation:
+        """
+        Begins an operation that will act upon documents in the collection. It
+        creates and returns an AsyncSodaOperation object which is used to
+        specify the criteria and the operation that will be performed on the
+        documents that match that criteria.
+        """
+        return AsyncSodaOperation(self)
+
+    async def getDataGuide(self) -> SodaDocument:
+        """
+        Returns a SODA document object containing property names, data types,
+        and lengths inferred from the JSON documents in the collection. It can
+        be useful for exploring the schema of a collection. Note that this
+        method is only supported for JSON-only collections where a JSON search
+        index has been created with the ‘dataguide’ option enabled. If there
+        are no documents in the collection, *None* is returned.
+        """
+        doc_impl = await self._impl.get_data_guide()
+        if doc_impl is not None:
+            return SodaDocument._from_impl(doc_impl)
+
+    async def insertMany(self, docs: list) -> None:
+        """
+        Inserts a list of documents into the collection at one time. Each of
+        the input documents can be a dictionary or list or an existing SODA
+        document object. All of the documents are inserted with a single
+        round-trip to the database.
+        """
+        doc_impls = [self._process_doc_arg(d) for d in docs]
+        await self._impl.insert_many(doc_impls, hint=None, return_docs=False)
+
+    async def insertManyAndGet(
+        self, docs: list, hint: str | None = None
+    ) -> list[SodaDocument]:
+        """
+        Similar to :meth:`AsyncSodaCollection.insertMany()`, this method
+        inserts a list of documents into the collection at one time. The only
+        difference is that it returns a list of SODA Document objects. Note
+        that for performance reasons the returned documents do not contain the
+        content.
+
+        The ``hint`` parameter, if specified, supplies a hint to the database
+        when processing the SODA operation. This is expected to be a string in
+        the same format as SQL hints but without any comment characters, for
+        example hint="MONITOR". While you could use this to pass any SQL hint,
+        the hints MONITOR (turn on monitoring) and NO_MONITOR (turn off
+        monitoring) are the most useful.
+        """
+        doc_impls = [self._process_doc_arg(d) for d in docs]
+        if hint is not None and not isinstance(hint, str):
+            raise TypeError("expecting a string")
+        return_doc_impls = await self._impl.insert_many(
+            doc_impls, hint, return_docs=True
+        )
+        return [SodaDocument._from_impl(i) for i in return_doc_impls]
+
+    async def insertOne(self, doc: Any) -> None:
+        """
+        Inserts a given document into the collection. The input document can be
+        a dictionary or list or an existing SODA document object.
+        """
+        doc_impl = self._process_doc_arg(doc)
+        await self._impl.insert_one(doc_impl, hint=None, return_doc=False)
+
+    async def insertOneAndGet(
+        self, doc: Any, hint: str | None = None
+    ) -> SodaDocument:
+        """
+        Similar to :meth:`~AsyncSodaCollection.insertOne()`, this method
+        inserts a given document into the collection. The only difference is
+        that it returns a SODA Document object. Note that for performance
+        reasons the returned document does not contain the content.
+
+        The ``hint`` parameter, if specified, supplies a hint to the database
+        when processing the SODA operation. This is expected to be a string in
+        the same format as SQL hints but without any comment characters, for
+        example hint="MONITOR". While you could use this to pass any SQL hint,
+        the hints MONITOR (turn on monitoring) and NO_MONITOR (turn off
+        monitoring) are the most useful.
+        """
+        doc_impl = self._process_doc_arg(doc)
+        if hint is not None and not isinstance(hint, str):
+            raise TypeError("expecting a string")
+        return_doc_impl = await self._impl.insert_one(
+            doc_impl, hint, return_doc=True
+        )
+        return SodaDocument._from_impl(return_doc_impl)
+
+    async def listIndexes(self) -> list:
+        """
+        Returns a list of specifications for the indexes found on the
+        collection.
+
+        This method is not currently supported.
+        """
+        return [json.loads(s) for s in await self._impl.list_indexes()]
+
+    async def save(self, doc: Any) -> None:
+        """
+        Saves a document into the collection. This method is equivalent to
+        :meth:`~AsyncSodaCollection.insertOne()` except that if
+        client-assigned keys are used, and the document with the specified key
+        already exists in the collection, it will be replaced with the input
+        document.
+        """
+        doc_impl = self._process_doc_arg(doc)
+        await self._impl.save(doc_impl, hint=None, return_doc=False)
+
+    async def saveAndGet(
+        self, doc: Any, hint: str | None = None
+    ) -> SodaDocument:
+        """
+        Saves a document into the collection. This method is equivalent to
+        :meth:`~AsyncSodaCollection.insertOneAndGet()` except that if
+        client-assigned keys are used, and the document with the specified key
+        already exists in the collection, it will be replaced with the input
+        document.
+
+        The ``hint`` parameter, if specified, supplies a hint to the database
+        when processing the SODA operation. This is expected to be a string in
+        the same format as SQL hints but without any comment characters, for
+        example hint="MONITOR". While you could use this to pass any SQL hint,
+        the hints MONITOR (turn on monitoring) and NO_MONITOR (turn off
+        monitoring) are the most useful.
+        """
+        doc_impl = self._process_doc_arg(doc)
+        if hint is not None and not isinstance(hint, str):
+            raise TypeError("expecting a string")
+        return_doc_impl = await self._impl.save(
+            doc_impl, hint, return_doc=True
+        )
+        return SodaDocument._from_impl(return_doc_impl)
+
+    async def truncate(self) -> None:
+        """
+        Removes all of the documents in the collection, similarly to what is
+        done for rows in a table by the TRUNCATE TABLE statement.
+        """
+        await self._impl.truncate()
+
+
 class SodaDocument(metaclass=BaseMetaClass):
     @classmethod
     def _from_impl(cls, impl):
@@ -470,18 +720,7 @@ class SodaDocument(metaclass=BaseMetaClass):
         return self._impl.get_version()
 
 
-class SodaDocCursor(metaclass=BaseMetaClass):
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._impl is None:
-            errors._raise_err(errors.ERR_CURSOR_NOT_OPEN)
-        doc_impl = self._impl.get_next_doc()
-        if doc_impl is not None:
-            return SodaDocument._from_impl(doc_impl)
-        raise StopIteration
-
+class BaseSodaDocCursor(metaclass=BaseMetaClass):
     @classmethod
     def _from_impl(cls, impl):
         cursor = cls.__new__(cls)
@@ -500,8 +739,34 @@ class SodaDocCursor(metaclass=BaseMetaClass):
         self._impl = None
 
 
-class SodaOperation(metaclass=BaseMetaClass):
-    def __init__(self, collection: SodaCollection) -> None:
+class SodaDocCursor(BaseSodaDocCursor):
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._impl is None:
+            errors._raise_err(errors.ERR_CURSOR_NOT_OPEN)
+        doc_impl = self._impl.get_next_doc()
+        if doc_impl is not None:
+            return SodaDocument._from_impl(doc_impl)
+        raise StopIteration
+
+
+class AsyncSodaDocCursor(BaseSodaDocCursor):
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._impl is None:
+            errors._raise_err(errors.ERR_CURSOR_NOT_OPEN)
+        doc_impl = await self._impl.get_next_doc()
+        if doc_impl is not None:
+            return SodaDocument._from_impl(doc_impl)
+        raise StopAsyncIteration
+
+
+class BaseSodaOperation(metaclass=BaseMetaClass):
+    def __init__(self, collection: BaseSodaCollection) -> None:
         self._collection = collection
         self._key = None
         self._keys = None
@@ -513,15 +778,6 @@ class SodaOperation(metaclass=BaseMetaClass):
         self._fetch_array_size = None
         self._lock = False
 
-    def count(self) -> int:
-        """
-        Returns a count of the number of documents in the collection that match
-        the criteria. If :meth:`~SodaOperation.skip()` or
-        :meth:`~SodaOperation.limit()` were called on this object, an
-        exception is raised.
-        """
-        return self._collection._impl.get_count(self)
-
     def fetchArraySize(self, value: int) -> Self:
         """
         This is a tuning method to specify the number of documents that are
@@ -564,30 +820,6 @@ class SodaOperation(metaclass=BaseMetaClass):
             raise TypeError("expecting string or dictionary")
         return self
 
-    def getCursor(self) -> SodaDocCursor:
-        """
-        Returns a SodaDocCursor object that can be used to iterate over the
-        documents that match the criteria.
-        """
-        impl = self._collection._impl.get_cursor(self)
-        return SodaDocCursor._from_impl(impl)
-
-    def getDocuments(self) -> list[SodaDocument]:
-        """
-        Returns a list of SodaDocument objects that match the criteria.
-        """
-        return [d for d in self.getCursor()]
-
-    def getOne(self) -> SodaDocument | None:
-        """
-        Returns a single SodaDocument object that matches the criteria. Note
-        that if multiple documents match the criteria only the first one is
-        returned.
-        """
-        doc_impl = self._collection._impl.get_one(self)
-        if doc_impl is not None:
-            return SodaDocument._from_impl(doc_impl)
-
     def hint(self, value: str) -> Self:
         """
         Specifies a hint that will be provided to the SODA operation when it is
@@ -679,6 +911,72 @@ class SodaOperation(metaclass=BaseMetaClass):
         self._limit = value
         return self
 
+    def skip(self, value: int) -> Self:
+        """
+        Specifies the number of documents that match the other criteria that
+        will be skipped. This method is only usable for read operations such as
+        :meth:`~SodaOperation.getOne()`, :meth:`~SodaOperation.getCursor()`,
+        and :meth:`~SodaOperation.getDocuments()`. For write operations, any
+        value set using this method is ignored.
+
+        As a convenience, the SodaOperation object is returned so that further
+        criteria can be specified by chaining methods together.
+        """
+        if not isinstance(value, int) or value < 0:
+            raise TypeError("expecting integer >= 0")
+        self._skip = value
+        return self
+
+    def version(self, value: str) -> Self:
+        """
+        Specifies that documents with the specified version should be returned.
+        Typically this is used with :meth:`~SodaOperation.key()` to implement
+        optimistic locking, so that the write operation called later does not
+        affect a document that someone else has modified.
+
+        As a convenience, the SodaOperation object is returned so that further
+        criteria can be specified by chaining methods together.
+        """
+        if not isinstance(value, str):
+            raise TypeError("expecting string")
+        self._version = value
+        return self
+
+
+class SodaOperation(BaseSodaOperation):
+    def count(self) -> int:
+        """
+        Returns a count of the number of documents in the collection that match
+        the criteria. If :meth:`~SodaOperation.skip()` or
+        :meth:`~SodaOperation.limit()` were called on this object, an
+        exception is raised.
+        """
+        return self._collection._impl.get_count(self)
+
+    def getCursor(self) -> SodaDocCursor:
+        """
+        Returns a SodaDocCursor object that can be used to iterate over the
+        documents that match the criteria.
+        """
+        impl = self._collection._impl.get_cursor(self)
+        return SodaDocCursor._from_impl(impl)
+
+    def getDocuments(self) -> list[SodaDocument]:
+        """
+        Returns a list of SodaDocument objects that match the criteria.
+        """
+        return [d for d in self.getCursor()]
+
+    def getOne(self) -> SodaDocument | None:
+        """
+        Returns a single SodaDocument object that matches the criteria. Note
+        that if multiple documents match the criteria only the first one is
+        returned.
+        """
+        doc_impl = self._collection._impl.get_one(self)
+        if doc_impl is not None:
+            return SodaDocument._from_impl(doc_impl)
+
     def remove(self) -> int:
         """
         Removes all of the documents in the collection that match the criteria.
@@ -712,35 +1010,77 @@ class SodaOperation(metaclass=BaseMetaClass):
         return_doc_impl = self._collection._impl.replace_one(
             self, doc_impl, return_doc=True
         )
-        return SodaDocument._from_impl(return_doc_impl)
+        if return_doc_impl is not None:
+            return SodaDocument._from_impl(return_doc_impl)
 
-    def skip(self, value: int) -> Self:
+
+class AsyncSodaOperation(BaseSodaOperation):
+    async def count(self) -> int:
         """
-        Specifies the number of documents that match the other criteria that
-        will be skipped. This method is only usable for read operations such as
-        :meth:`~SodaOperation.getOne()`, :meth:`~SodaOperation.getCursor()`,
-        and :meth:`~SodaOperation.getDocuments()`. For write operations, any
-        value set using this method is ignored.
+        Returns a count of the number of documents in the collection that match
+        the criteria. If :meth:`~AsyncSodaOperation.skip()` or
+        :meth:`~AsyncSodaOperation.limit()` were called on this object, an
+        exception is raised.
+        """
+        return await self._collection._impl.get_count(self)
 
-        As a convenience, the SodaOperation object is returned so that further
-        criteria can be specified by chaining methods together.
+    async def getCursor(self) -> AsyncSodaDocCursor:
         """
-        if not isinstance(value, int) or value < 0:
-            raise TypeError("expecting integer >= 0")
-        self._skip = value
-        return self
+        Returns an AsyncSodaDocCursor object that can be used to iterate over
+        the documents that match the criteria.
+        """
+        impl = await self._collection._impl.get_cursor(self)
+        return AsyncSodaDocCursor._from_impl(impl)
 
-    def version(self, value: str) -> Self:
+    async def getDocuments(self) -> list[SodaDocument]:
         """
-        Specifies that documents with the specified version should be returned.
-        Typically this is used with :meth:`~SodaOperation.key()` to implement
-        optimistic locking, so that the write operation called later does not
-        affect a document that someone else has modified.
+        Returns a list of SodaDocument objects that match the criteria.
+        """
+        return [d async for d in await self.getCursor()]
 
-        As a convenience, the SodaOperation object is returned so that further
-        criteria can be specified by chaining methods together.
+    async def getOne(self) -> SodaDocument | None:
         """
-        if not isinstance(value, str):
-            raise TypeError("expecting string")
-        self._version = value
-        return self
+        Returns a single SodaDocument object that matches the criteria. Note
+        that if multiple documents match the criteria only the first one is
+        returned.
+        """
+        doc_impl = await self._collection._impl.get_one(self)
+        if doc_impl is not None:
+            return SodaDocument._from_impl(doc_impl)
+
+    async def remove(self) -> int:
+        """
+        Removes all of the documents in the collection that match the criteria.
+        The number of documents that have been removed is returned.
+        """
+        return await self._collection._impl.remove(self)
+
+    async def replaceOne(self, doc: Any) -> bool:
+        """
+        Replaces a single document in the collection with the specified
+        document. The input document can be a dictionary or list or an existing
+        SODA document object. A boolean indicating if a document was replaced
+        or not is returned.
+
+        Currently, the method :meth:`~AsyncSodaOperation.key()` must be called
+        before this method can be called.
+        """
+        doc_impl = self._collection._process_doc_arg(doc)
+        return await self._collection._impl.replace_one(
+            self, doc_impl, return_doc=False
+        )
+
+    async def replaceOneAndGet(self, doc: Any) -> SodaDocument:
+        """
+        Similar to :meth:`~AsyncSodaOperation.replaceOne()`, this method
+        replaces a single document in the collection with the specified
+        document. The only difference is that it returns a SodaDocument object.
+        Note that for performance reasons the returned document does not
+        contain the content. If no document was replaced, *None* is returned.
+        """
+        doc_impl = self._collection._process_doc_arg(doc)
+        return_doc_impl = await self._collection._impl.replace_one(
+            self, doc_impl, return_doc=True
+        )
+        if return_doc_impl is not None:
+            return SodaDocument._from_impl(return_doc_impl)
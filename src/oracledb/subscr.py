@@ -25,7 +25,7 @@
 # -----------------------------------------------------------------------------
 # subscr.py
 #
-# Contains the Subscription class and Message classes used for managing
+# Contains the Subscription classes and Message classes used for managing
 # subscriptions to database events and the messages that are sent when those
 # events are detected.
 # -----------------------------------------------------------------------------
@@ -36,9 +36,9 @@ from .base import BaseMetaClass
 from . import base_impl, connection, errors
 
 
-class Subscription(metaclass=BaseMetaClass):
+class BaseSubscription(metaclass=BaseMetaClass):
     def __repr__(self):
-        return f"<oracledb.Subscription on {self.connection!r}>"
+        return f"<{self._public_name} on {self.connection!r}>"
 
     @classmethod
     def _from_impl(cls, impl):
@@ -138,6 +138,26 @@ class Subscription(metaclass=BaseMetaClass):
         """
         return self._impl.qos
 
+    @property
+    def timeout(self) -> int:
+        """
+        This read-only attribute returns the timeout (in seconds) that was
+        specified when the subscription was created. A value of *0* indicates
+        that there is no timeout.
+        """
+        return self._impl.timeout
+
+    def _verify_can_register_query(self, args: list | dict | None) -> None:
+        """
+        Internal method used for verifying that a query can be registered.
+        """
+        if args is not None and not isinstance(args, (list, dict)):
+            raise TypeError("expecting args to be a dictionary or list")
+        if self._impl.namespace == base_impl.SUBSCR_NAMESPACE_AQ:
+            errors._raise_err(errors.ERR_REGISTER_QUERY_ON_AQ_SUBSCR)
+
+
+class Subscription(BaseSubscription):
     def registerquery(
         self, statement: str, args: list | dict | None = None
     ) -> int:
@@ -151,24 +171,48 @@ class Subscription(metaclass=BaseMetaClass):
         then the ID for the registered query is returned; otherwise, *None* is
         returned.
         """
-        if args is not None and not isinstance(args, (list, dict)):
-            raise TypeError("expecting args to be a dictionary or list")
-        if self._impl.namespace == base_impl.SUBSCR_NAMESPACE_AQ:
-            errors._raise_err(errors.ERR_REGISTER_QUERY_ON_AQ_SUBSCR)
+        self._verify_can_register_query(args)
         return self._impl.register_query(statement, args)
 
-    @property
-    def timeout(self) -> int:
+
+class AsyncSubscription(BaseSubscription):
+    @classmethod
+    def _from_impl(cls, impl):
+        subscr = super()._from_impl(impl)
+        subscr._messages_impl = impl
+        return subscr
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> "Message":
+        if self._messages_impl is None:
+            raise StopAsyncIteration
+        message = await self._messages_impl.get_message()
+        if message is None:
+            self._messages_impl = None
+            raise StopAsyncIteration
+        return message
+
+    async def registerquery(
+        self, statement: str, args: list | dict | None = None
+    ) -> int:
         """
-        This read-only attribute returns the timeout (in seconds) that was
-        specified when the subscription was created. A value of *0* indicates
-        that there is no timeout.
+        Registers the query for subsequent notification when tables referenced
+        by the query are changed. This behaves similarly to
+        :meth:`AsyncCursor.execute()` but only queries are permitted and the
+        ``args`` parameter, if specified, must be a sequence or dictionary. If
+        the ``qos`` parameter included the flag
+        :data:`oracledb.SUBSCR_QOS_QUERY` when the subscription was created,
+        then the ID for the registered query is returned; otherwise, *None* is
+        returned.
         """
-        return self._impl.timeout
+        self._verify_can_register_query(args)
+        return await self._impl.register_query(statement, args)
 
 
 class Message(metaclass=BaseMetaClass):
-    def __init__(self, subscription: Subscription) -> None:
+    def __init__(self, subscription: BaseSubscription) -> None:
         self._subscription = subscription
         self._consumer_name = None
         self._dbname = None
@@ -256,7 +300,7 @@ class Message(metaclass=BaseMetaClass):
         return self._registered
 
     @property
-    def subscription(self) -> Subscription:
+    def subscription(self) -> BaseSubscription:
         """
         This read-only attribute returns the subscription object for which this
         notification was generated.
@@ -100,6 +100,14 @@ from .base_impl cimport (
     VectorDecoder,
     VectorEncoder,
 )
+from .arrow_impl cimport (
+    ArrowArrayImpl,
+    ArrowType,
+    NANOARROW_TYPE_DOUBLE,
+    NANOARROW_TYPE_FLOAT,
+    NANOARROW_TYPE_INT8,
+    NANOARROW_TYPE_UINT8,
+)
 from libc.string cimport memchr, memcpy, memset
 
 include "impl/thick/odpi.pxd"
@@ -38,12 +38,13 @@ cimport cpython.ref
 
 from libc.stdint cimport int8_t, int16_t, int32_t, int64_t
 from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
-from libc.string cimport memcpy, memset
+from libc.string cimport memcpy, memmove, memset
 from cpython cimport array
 
 import array
 import asyncio
 import base64
+import bisect
 import collections
 import datetime
 import decimal
@@ -52,6 +53,7 @@ import hashlib
 import inspect
 import json
 import os
+import queue
 import socket
 import re
 import secrets
@@ -95,6 +97,10 @@ from .base_impl cimport (
     BaseLobImpl,
     BaseParser,
     BasePoolImpl,
+    BaseSodaCollImpl,
+    BaseSodaDbImpl,
+    BaseSodaDocCursorImpl,
+    BaseSodaDocImpl,
     BaseSubscrImpl,
     BaseVarImpl,
     BatchLoadManager,
@@ -133,6 +139,7 @@ from .base_impl cimport (
     EVENT_DEREG,
     EVENT_OBJCHANGE,
     EVENT_QUERYCHANGE,
+    FetchIntoBuffer,
     GrowableBuffer,
     PY_TYPE_NUM_FLOAT,
     PY_TYPE_NUM_INT,
@@ -188,6 +195,7 @@ from .base_impl cimport (
     PY_TYPE_MESSAGE_ROW,
     PY_TYPE_MESSAGE_TABLE,
     PY_TYPE_TIMEDELTA,
+    ResultCacheImpl,
     SecretValueImpl,
     SUBSCR_NAMESPACE_AQ,
     SUBSCR_QOS_DEREG_NFY,
@@ -214,6 +222,10 @@ from .base_impl import (
     DB_TYPE_BINARY_INTEGER,
     DB_TYPE_CURSOR,
     DB_TYPE_INTERVAL_DS,
+    DB_TYPE_JSON,
+    DB_TYPE_LONG,
+    DB_TYPE_LONG_NVARCHAR,
+    DB_TYPE_LONG_RAW,
     DB_TYPE_NUMBER,
     DB_TYPE_OBJECT,
     DB_TYPE_XMLTYPE,
@@ -269,5 +281,6 @@ include "impl/thin/var.pyx"
 include "impl/thin/dbobject.pyx"
 include "impl/thin/dbobject_cache.pyx"
 include "impl/thin/lob.pyx"
+include "impl/thin/soda.pyx"
 include "impl/thin/pool.pyx"
 include "impl/thin/end_user_security_context.pyx"
@@ -91,10 +91,14 @@ oracledb.defaults.thick_mode_dsn_passthrough = False
 def pytest_ignore_collect(collection_path, config):
     """
     Informs pytest to completely ignore files in directories that contain code
-    that is only capable of being run by particular Python versions.
+    that is only capable of being run by particular Python versions. The
+    performance suite is also ignored unless its directory is explicitly
+    specified.
     """
     if "py314" in collection_path.parts and sys.version_info < (3, 14):
         return True
+    if collection_path.name == "perf" and collection_path.is_dir():
+        return True
     return False
 
 
@@ -1037,24 +1041,42 @@ def skip_unless_vectors_supported(test_env):
 
 
 @pytest.fixture
-def soda_db(conn, test_env, skip_unless_thick_mode):
+def soda_db(conn, test_env):
     """
     Return the SODA database object.
     """
     message = "not supported with this client/server combination"
     if not test_env.has_server_version(18):
         pytest.skip(message)
-    if test_env.has_server_version(20, 1):
-        if not test_env.has_client_version(20, 1):
+    if test_env.use_thick_mode:
+        if test_env.has_server_version(20, 1):
+            if not test_env.has_client_version(20, 1):
+                pytest.skip(message)
+        if (
+            test_env.has_client_version(23, 3)
+            and platform.system() == "Darwin"
+        ):
             pytest.skip(message)
-    if test_env.has_client_version(23, 3) and platform.system() == "Darwin":
-        pytest.skip(message)
     soda_db = conn.getSodaDatabase()
     for name in soda_db.getCollectionNames():
         soda_db.openCollection(name).drop()
     return soda_db
 
 
+@pytest.fixture
+async def async_soda_db(async_conn, test_env, skip_unless_thin_mode):
+    """
+    Return the SODA database object using asyncio.
+    """
+    if not test_env.has_server_version(18):
+        pytest.skip("not supported with this server")
+    soda_db = async_conn.getSodaDatabase()
+    for name in await soda_db.getCollectionNames():
+        coll = await soda_db.openCollection(name)
+        await coll.drop()
+    return soda_db
+
+
 @pytest.fixture(scope="session")
 def test_env(pytestconfig):
     """
@@ -0,0 +1,98 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# Starts the stand-in server used by the performance suite and provides the
+# fixtures used by the benchmarks. If pytest-benchmark is not installed, a
+# minimal replacement for its benchmark fixture is used instead.
+# -----------------------------------------------------------------------------
+
+import pytest
+
+from runner import Benchmark
+from stand_in_server import StandInServer
+
+
+class BenchmarkFallback:
+    """
+    Provides the benchmark fixture and reports its results when the
+    pytest-benchmark plugin is not available.
+    """
+
+    def __init__(self):
+        self.results = []
+
+    @pytest.fixture
+    def benchmark(self, request):
+        benchmark = Benchmark()
+        yield benchmark
+        if benchmark.stats is not None:
+            self.results.append((request.node.name, benchmark.stats))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.results:
+            terminalreporter.write_sep("-", "benchmark results")
+            for name, stats in self.results:
+                terminalreporter.write_line(
+                    f"{name:<16} min {stats['min'] * 1000:10.3f} ms  "
+                    f"median {stats['median'] * 1000:10.3f} ms  "
+                    f"rounds {stats['rounds']}"
+                )
+
+
+def pytest_configure(config):
+    if not config.pluginmanager.hasplugin("benchmark"):
+        config.pluginmanager.register(BenchmarkFallback(), "perf-benchmark")
+
+
+@pytest.fixture
+def perf_conn(stand_in):
+    conn = stand_in.connect()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def pipelining_conn(pipelining_stand_in):
+    conn = pipelining_stand_in.connect()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def pipelining_stand_in():
+    with StandInServer(pipelining=True) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def stand_in():
+    with StandInServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def tls_stand_in():
+    with StandInServer(tls=True) as server:
+        yield server
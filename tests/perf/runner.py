@@ -0,0 +1,225 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# runner.py
+#
+# Runs the performance suite without requiring pytest or pytest-benchmark and
+# optionally saves the results to a JSON file or compares them with the
+# results saved by an earlier run (of the same or a different release).
+#
+# Usage: python tests/perf/runner.py [-k FILTER] [--rounds N]
+#                                    [--json FILE] [--compare FILE]
+# -----------------------------------------------------------------------------
+
+import argparse
+import glob
+import importlib
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import oracledb
+from stand_in_server import StandInServer
+
+
+class Benchmark:
+    """
+    Minimal implementation of the benchmark fixture provided by
+    pytest-benchmark. It is used by the standalone runner and by the pytest
+    suite when pytest-benchmark is not installed.
+    """
+
+    def __init__(self, rounds=10, warmup_rounds=1):
+        self.rounds = rounds
+        self.warmup_rounds = warmup_rounds
+        self.timings = []
+
+    def __call__(self, func, *args, **kwargs):
+        return self.pedantic(
+            func,
+            args,
+            kwargs,
+            rounds=self.rounds,
+            warmup_rounds=self.warmup_rounds,
+        )
+
+    def pedantic(
+        self,
+        target,
+        args=(),
+        kwargs=None,
+        setup=None,
+        rounds=1,
+        warmup_rounds=0,
+        iterations=1,
+    ):
+        if kwargs is None:
+            kwargs = {}
+        for i in range(warmup_rounds + rounds):
+            if setup is not None:
+                result = setup()
+                if result is not None:
+                    args, kwargs = result
+            start_time = time.perf_counter()
+            for j in range(iterations):
+                result = target(*args, **kwargs)
+            elapsed = (time.perf_counter() - start_time) / iterations
+            if i >= warmup_rounds:
+                self.timings.append(elapsed)
+        return result
+
+    @property
+    def stats(self):
+        if not self.timings:
+            return None
+        return dict(
+            min=min(self.timings),
+            max=max(self.timings),
+            mean=statistics.mean(self.timings),
+            median=statistics.median(self.timings),
+            stddev=(
+                statistics.stdev(self.timings)
+                if len(self.timings) > 1
+                else 0.0
+            ),
+            rounds=len(self.timings),
+        )
+
+
+def get_benchmarks(name_filter=None):
+    """
+    Returns the benchmark functions found in the modules in this directory,
+    in the order in which they are defined.
+    """
+    dir_name = os.path.dirname(os.path.abspath(__file__))
+    benchmarks = []
+    pattern = os.path.join(dir_name, "test_perf_*.py")
+    for file_name in sorted(glob.glob(pattern)):
+        module_name = os.path.splitext(os.path.basename(file_name))[0]
+        module = importlib.import_module(module_name)
+        funcs = [
+            func
+            for name, func in inspect.getmembers(module, inspect.isfunction)
+            if name.startswith("test_perf_") and func.__module__ == module_name
+        ]
+        funcs.sort(key=lambda f: f.__code__.co_firstlineno)
+        for func in funcs:
+            if name_filter is None or name_filter in func.__name__:
+                benchmarks.append(func)
+    return benchmarks
+
+
+def run_benchmark(func, server, pipelining_server, tls_server, rounds):
+    """
+    Runs a single benchmark function, supplying it with the fixtures it
+    requires, and returns its statistics.
+    """
+    benchmark = Benchmark(rounds)
+    kwargs = {}
+    conn = None
+    for name in inspect.signature(func).parameters:
+        if name == "benchmark":
+            kwargs[name] = benchmark
+        elif name == "stand_in":
+            kwargs[name] = server
+        elif name == "perf_conn":
+            kwargs[name] = conn = server.connect()
+        elif name == "pipelining_stand_in":
+            kwargs[name] = pipelining_server
+        elif name == "pipelining_conn":
+            kwargs[name] = conn = pipelining_server.connect()
+        elif name == "tls_stand_in":
+            kwargs[name] = tls_server
+        else:
+            raise Exception(f"{func.__name__}: unsupported fixture {name}")
+    try:
+        func(**kwargs)
+    finally:
+        if conn is not None:
+            conn.close()
+    return benchmark.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the python-oracledb performance suite."
+    )
+    parser.add_argument(
+        "-k", dest="name_filter", help="only run benchmarks matching FILTER"
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=10,
+        help="number of timed rounds for each benchmark (default: 10)",
+    )
+    parser.add_argument("--json", help="save the results to FILE")
+    parser.add_argument(
+        "--compare", help="compare the results with those saved in FILE"
+    )
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["benchmarks"]
+
+    results = {}
+    with (
+        StandInServer() as server,
+        StandInServer(pipelining=True) as pipelining_server,
+        StandInServer(tls=True) as tls_server,
+    ):
+        for func in get_benchmarks(args.name_filter):
+            stats = results[func.__name__] = run_benchmark(
+                func, server, pipelining_server, tls_server, args.rounds
+            )
+            line = (
+                f"{func.__name__:<16} {stats['min'] * 1000:10.3f} ms "
+                f"{stats['median'] * 1000:10.3f} ms"
+            )
+            prev_stats = baseline.get(func.__name__)
+            if prev_stats is not None:
+                change = stats["median"] / prev_stats["median"] - 1
+                line += f" {change:+8.1%}"
+            print(line, " ", inspect.getdoc(func))
+
+    if args.json is not None:
+        data = dict(
+            oracledb_version=oracledb.__version__,
+            python_version=platform.python_version(),
+            platform=platform.platform(),
+            benchmarks=results,
+        )
+        with open(args.json, "w") as f:
+            json.dump(data, f, indent=4)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1396 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# stand_in_server.py
+#
+# A minimal local stand-in for Oracle Database used by the performance suite.
+# It implements just enough of the server side of the network protocol for the
+# thin driver to connect, authenticate and run the registered statements. The
+# responses for each registered statement are encoded once and then replayed
+# byte for byte, so that the time spent by the stand-in is negligible and
+# constant across releases of python-oracledb.
+# -----------------------------------------------------------------------------
+
+import array
+import datetime
+import decimal
+import hashlib
+import os
+import secrets
+import select
+import socket
+import ssl
+import struct
+import tempfile
+import threading
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+import oracledb
+
+# packet types
+TNS_PACKET_TYPE_CONNECT = 1
+TNS_PACKET_TYPE_ACCEPT = 2
+TNS_PACKET_TYPE_DATA = 6
+TNS_PACKET_TYPE_MARKER = 12
+
+# data flags
+TNS_DATA_FLAGS_EOF = 0x0040
+TNS_DATA_FLAGS_END_OF_REQUEST = 0x0800
+TNS_DATA_FLAGS_END_OF_RESPONSE = 0x2000
+
+# message types
+TNS_MSG_TYPE_PROTOCOL = 1
+TNS_MSG_TYPE_DATA_TYPES = 2
+TNS_MSG_TYPE_FUNCTION = 3
+TNS_MSG_TYPE_ERROR = 4
+TNS_MSG_TYPE_ROW_HEADER = 6
+TNS_MSG_TYPE_ROW_DATA = 7
+TNS_MSG_TYPE_PARAMETER = 8
+TNS_MSG_TYPE_STATUS = 9
+TNS_MSG_TYPE_DESCRIBE_INFO = 16
+TNS_MSG_TYPE_PIGGYBACK = 17
+TNS_MSG_TYPE_OAC = 13
+TNS_MSG_TYPE_END_OF_RESPONSE = 29
+
+# function codes
+TNS_FUNC_AUTH_PHASE_ONE = 118
+TNS_FUNC_AUTH_PHASE_TWO = 115
+TNS_FUNC_CLOSE_CURSORS = 105
+TNS_FUNC_COMMIT = 14
+TNS_FUNC_DIRECT_PATH_LOAD_STREAM = 129
+TNS_FUNC_DIRECT_PATH_OP = 130
+TNS_FUNC_DIRECT_PATH_PREPARE = 128
+TNS_FUNC_EXECUTE = 94
+TNS_FUNC_FETCH = 5
+TNS_FUNC_LOGOFF = 9
+TNS_FUNC_PING = 147
+TNS_FUNC_PIPELINE_BEGIN = 199
+TNS_FUNC_PIPELINE_END = 200
+TNS_FUNC_REEXECUTE = 4
+TNS_FUNC_REEXECUTE_AND_FETCH = 78
+TNS_FUNC_ROLLBACK = 15
+TNS_FUNC_NOTIFY = 187
+TNS_FUNC_SUBSCRIBE = 125
+
+# execute options
+TNS_EXEC_OPTION_PARSE = 0x01
+TNS_EXEC_OPTION_EXECUTE = 0x20
+TNS_EXEC_OPTION_FETCH = 0x40
+
+# direct path keyword indices
+TNS_DPP_KW_INDEX_OBJECT_NAME = 1
+TNS_DPP_KW_INDEX_SCHEMA_NAME = 3
+TNS_DPP_KW_INDEX_COLUMN_NAME = 4
+TNS_DPP_OUT_INDEX_CURSOR = 3
+
+# miscellaneous protocol constants
+TNS_VERSION = 318
+TNS_VERSION_END_OF_RESPONSE = 319
+TNS_ACCEPT_FLAG_HAS_END_OF_RESPONSE = 0x02000000
+TNS_CCAP_FIELD_VERSION = 7
+TNS_CCAP_FIELD_VERSION_23_4 = 24
+TNS_CCAP_MAX = 55
+TNS_RCAP_TTC = 6
+TNS_RCAP_TTC_32K = 0x04
+TNS_RCAP_MAX = 11
+TNS_CHARSET_UTF8 = 873
+TNS_CHARSET_UTF16 = 2000
+TNS_VERIFIER_TYPE_11G = 0xB152
+TNS_LONG_LENGTH_INDICATOR = 254
+TNS_NULL_LENGTH_INDICATOR = 255
+TNS_MAX_SHORT_LENGTH = 252
+TNS_CHUNK_SIZE = 32767
+TNS_ERR_NO_DATA_FOUND = 1403
+TNS_VECTOR_MAGIC_BYTE = 0xDB
+TNS_VECTOR_FLAGS = 0x0012
+PACKET_HEADER_SIZE = 8
+
+# subscription constants
+TNS_SUBSCR_OP_REGISTER = 1
+TNS_SUBSCR_NOTIFICATION_VERSION = 1
+TNS_SUBSCR_EVENT_OBJCHANGE = 6
+
+# Oracle type numbers and the (type number, character set form, buffer size)
+# sent in the metadata for each of the supported database types
+ORA_TYPE_NUM_JSON = 119
+ORA_TYPE_NUM_VECTOR = 127
+TYPE_INFO = {
+    oracledb.DB_TYPE_VARCHAR: (1, 1, None),
+    oracledb.DB_TYPE_NUMBER: (2, 0, 22),
+    oracledb.DB_TYPE_DATE: (12, 0, 7),
+    oracledb.DB_TYPE_RAW: (23, 0, None),
+    oracledb.DB_TYPE_BINARY_FLOAT: (100, 0, 4),
+    oracledb.DB_TYPE_BINARY_DOUBLE: (101, 0, 8),
+    oracledb.DB_TYPE_JSON: (ORA_TYPE_NUM_JSON, 0, 8132),
+    oracledb.DB_TYPE_VECTOR: (ORA_TYPE_NUM_VECTOR, 0, 8132),
+    oracledb.DB_TYPE_TIMESTAMP: (180, 0, 11),
+    oracledb.DB_TYPE_BOOLEAN: (252, 0, 4),
+}
+
+# time to wait for a continuation packet when a request fills a packet
+CONTINUATION_WAIT = 0.1
+
+
+class StandInError(Exception):
+    pass
+
+
+def encode_binary_double(value: float) -> bytes:
+    """
+    Encodes a float in the format used by the database for BINARY_DOUBLE.
+    """
+    data = bytearray(struct.pack(">d", value))
+    if data[0] & 0x80 == 0:
+        data[0] |= 0x80
+    else:
+        data = bytearray(~b & 0xFF for b in data)
+    return bytes(data)
+
+
+def encode_binary_float(value: float) -> bytes:
+    """
+    Encodes a float in the format used by the database for BINARY_FLOAT.
+    """
+    data = bytearray(struct.pack(">f", value))
+    if data[0] & 0x80 == 0:
+        data[0] |= 0x80
+    else:
+        data = bytearray(~b & 0xFF for b in data)
+    return bytes(data)
+
+
+def encode_date(value: datetime.date) -> bytes:
+    """
+    Encodes a date or datetime in the format used by the database for DATE.
+    """
+    data = bytearray(7)
+    data[0] = value.year // 100 + 100
+    data[1] = value.year % 100 + 100
+    data[2] = value.month
+    data[3] = value.day
+    if isinstance(value, datetime.datetime):
+        data[4] = value.hour + 1
+        data[5] = value.minute + 1
+        data[6] = value.second + 1
+    else:
+        data[4] = data[5] = data[6] = 1
+    return bytes(data)
+
+
+def encode_number(value) -> bytes:
+    """
+    Encodes an integer, float or decimal in the format used by the database
+    for NUMBER.
+    """
+    sign, digits, exponent = decimal.Decimal(str(value)).as_tuple()
+    digits = list(digits)
+    while digits and digits[0] == 0:
+        digits.pop(0)
+    while digits and digits[-1] == 0:
+        digits.pop()
+        exponent += 1
+    if not digits:
+        return b"\x80"
+    decimal_point_index = len(digits) + exponent
+    if decimal_point_index % 2 == 1:
+        digits.insert(0, 0)
+        decimal_point_index += 1
+    if len(digits) % 2 == 1:
+        digits.append(0)
+    exponent_on_wire = decimal_point_index // 2 + 192
+    if sign:
+        exponent_on_wire = ~exponent_on_wire & 0xFF
+    data = bytearray([exponent_on_wire])
+    for i in range(0, len(digits), 2):
+        pair = digits[i] * 10 + digits[i + 1]
+        data.append(101 - pair if sign else pair + 1)
+    if sign and len(digits) < 40:
+        data.append(102)
+    return bytes(data)
+
+
+def encode_timestamp(value: datetime.datetime) -> bytes:
+    """
+    Encodes a datetime in the format used by the database for TIMESTAMP.
+    """
+    return encode_date(value) + struct.pack(">I", value.microsecond * 1000)
+
+
+def encode_vector(value: array.array) -> bytes:
+    """
+    Encodes an array in the format used by the database for dense VECTOR
+    values.
+    """
+    if value.typecode == "f":
+        vector_format = oracledb.VECTOR_FORMAT_FLOAT32
+        values = b"".join(encode_binary_float(v) for v in value)
+    elif value.typecode == "d":
+        vector_format = oracledb.VECTOR_FORMAT_FLOAT64
+        values = b"".join(encode_binary_double(v) for v in value)
+    elif value.typecode == "b":
+        vector_format = oracledb.VECTOR_FORMAT_INT8
+        values = value.tobytes()
+    else:
+        raise StandInError(f"unsupported vector type code {value.typecode}")
+    header = struct.pack(
+        ">BBHBI",
+        TNS_VECTOR_MAGIC_BYTE,
+        0,
+        TNS_VECTOR_FLAGS,
+        int(vector_format),
+        len(value),
+    )
+    return header + bytes(8) + values
+
+
+class Buffer(bytearray):
+    """
+    Buffer used for building responses. The methods mirror the ones found in
+    the WriteBuffer class of the thin driver.
+    """
+
+    def write_bytes(self, value):
+        if value is None:
+            self.append(0)
+        elif len(value) <= TNS_MAX_SHORT_LENGTH:
+            self.append(len(value))
+            self.extend(value)
+        else:
+            self.append(TNS_LONG_LENGTH_INDICATOR)
+            for offset in range(0, len(value), TNS_CHUNK_SIZE):
+                chunk = value[offset : offset + TNS_CHUNK_SIZE]
+                self.write_ub4(len(chunk))
+                self.extend(chunk)
+            self.write_ub4(0)
+
+    def write_bytes_with_length(self, value):
+        if value is None:
+            self.write_ub4(0)
+        else:
+            self.write_ub4(len(value))
+            self.write_bytes(value)
+
+    def write_str_with_length(self, value):
+        self.write_bytes_with_length(None if value is None else value.encode())
+
+    def write_ub(self, value):
+        if value == 0:
+            self.append(0)
+        else:
+            num_bytes = (value.bit_length() + 7) // 8
+            self.append(num_bytes)
+            self.extend(value.to_bytes(num_bytes, "big"))
+
+    write_ub2 = write_ub4 = write_ub8 = write_ub
+
+    def write_uint8(self, value):
+        self.append(value)
+
+    def write_uint16be(self, value):
+        self.extend(struct.pack(">H", value))
+
+    def write_uint16le(self, value):
+        self.extend(struct.pack("<H", value))
+
+    def write_uint32be(self, value):
+        self.extend(struct.pack(">I", value))
+
+
+class Reader:
+    """
+    Reader used for parsing requests. The methods mirror the ones found in the
+    ReadBuffer class of the thin driver.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read_raw(self, num_bytes):
+        data = self.data[self.pos : self.pos + num_bytes]
+        if len(data) < num_bytes:
+            raise StandInError("unexpected end of request")
+        self.pos += num_bytes
+        return bytes(data)
+
+    def read_uint8(self):
+        return self.read_raw(1)[0]
+
+    def read_ub(self):
+        num_bytes = self.read_uint8() & 0x7F
+        if num_bytes == 0:
+            return 0
+        return int.from_bytes(self.read_raw(num_bytes), "big")
+
+    read_ub2 = read_ub4 = read_ub8 = read_ub
+
+    def read_bytes(self):
+        num_bytes = self.read_uint8()
+        if num_bytes in (0, TNS_NULL_LENGTH_INDICATOR):
+            return None
+        elif num_bytes != TNS_LONG_LENGTH_INDICATOR:
+            return self.read_raw(num_bytes)
+        chunks = []
+        while True:
+            chunk_len = self.read_ub4()
+            if chunk_len == 0:
+                break
+            chunks.append(self.read_raw(chunk_len))
+        return b"".join(chunks)
+
+    def read_bytes_with_length(self):
+        if self.read_ub4() == 0:
+            return None
+        return self.read_bytes()
+
+    def read_str_with_length(self):
+        value = self.read_bytes_with_length()
+        if value is not None:
+            return value.decode()
+
+
+class Column:
+    """
+    Describes a column returned by a query or found in a table used for direct
+    path loads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dbtype: oracledb.DbType,
+        *,
+        size: int = 0,
+        precision: int = 0,
+        scale: int = 0,
+        vector_dimensions: int = 0,
+        vector_format: int = oracledb.VECTOR_FORMAT_FLOAT32,
+    ):
+        if dbtype not in TYPE_INFO:
+            raise StandInError(f"unsupported type {dbtype.name}")
+        self.name = name
+        self.dbtype = dbtype
+        self.ora_type_num, self.csfrm, buffer_size = TYPE_INFO[dbtype]
+        if dbtype is oracledb.DB_TYPE_NUMBER and precision == scale == 0:
+            scale = -127
+        self.precision = precision
+        self.scale = scale
+        self.max_size = size
+        if buffer_size is None:
+            buffer_size = size * 4 if self.csfrm else size
+        self.buffer_size = buffer_size
+        self.vector_dimensions = vector_dimensions
+        self.vector_format = int(vector_format) if vector_dimensions else 0
+
+    def encode_value(self, value) -> bytes:
+        """
+        Returns the encoded value of the column as it is sent in row data.
+        """
+        buf = Buffer()
+        if self.ora_type_num in (ORA_TYPE_NUM_JSON, ORA_TYPE_NUM_VECTOR):
+            if value is None:
+                buf.write_ub4(0)
+                return bytes(buf)
+            if self.ora_type_num == ORA_TYPE_NUM_VECTOR:
+                value = encode_vector(value)
+            buf.write_ub4(len(value))
+            buf.write_ub8(len(value))
+            buf.write_ub4(len(value))
+            buf.write_bytes(value)
+            buf.write_bytes(bytes(40))
+            return bytes(buf)
+        if value is None:
+            buf.write_bytes(None)
+        elif self.dbtype is oracledb.DB_TYPE_VARCHAR:
+            buf.write_bytes(value.encode())
+        elif self.dbtype is oracledb.DB_TYPE_NUMBER:
+            buf.write_bytes(encode_number(value))
+        elif self.dbtype is oracledb.DB_TYPE_DATE:
+            buf.write_bytes(encode_date(value))
+        elif self.dbtype is oracledb.DB_TYPE_TIMESTAMP:
+            buf.write_bytes(encode_timestamp(value))
+        elif self.dbtype is oracledb.DB_TYPE_BINARY_DOUBLE:
+            buf.write_bytes(encode_binary_double(value))
+        elif self.dbtype is oracledb.DB_TYPE_BINARY_FLOAT:
+            buf.write_bytes(encode_binary_float(value))
+        elif self.dbtype is oracledb.DB_TYPE_BOOLEAN:
+            buf.write_bytes(b"\x01\x01" if value else b"\x00")
+        else:
+            buf.write_bytes(value)
+        return bytes(buf)
+
+    def write_metadata(self, buf: Buffer, position: int) -> None:
+        """
+        Writes the metadata for the column in the format used by the database
+        when describing a query or a table.
+        """
+        buf.write_uint8(self.ora_type_num)
+        buf.write_uint8(0)  # flags
+        buf.write_uint8(self.precision & 0xFF)
+        buf.write_uint8(self.scale & 0xFF)
+        buf.write_ub4(self.buffer_size)
+        buf.write_ub4(0)  # max number of array elements
+        buf.write_ub8(0)  # cont flags
+        buf.write_bytes_with_length(None)  # OID
+        buf.write_ub2(0)  # version
+        buf.write_ub2(TNS_CHARSET_UTF8 if self.csfrm else 0)
+        buf.write_uint8(self.csfrm)
+        buf.write_ub4(self.max_size)
+        buf.write_ub4(0)  # oaccolid
+        buf.write_uint8(1)  # nulls allowed
+        buf.write_uint8(0)  # v7 length of name
+        buf.write_str_with_length(self.name)
+        buf.write_str_with_length(None)  # schema
+        buf.write_str_with_length(None)  # type name
+        buf.write_ub2(position)
+        buf.write_ub4(0)  # UDS flags
+        buf.write_str_with_length(None)  # domain schema
+        buf.write_str_with_length(None)  # domain name
+        buf.write_ub4(0)  # number of annotations
+        buf.write_ub4(self.vector_dimensions)
+        buf.write_uint8(self.vector_format)
+        buf.write_uint8(0)  # vector flags
+
+
+class Statement:
+    """
+    A statement registered with the stand-in server. For queries, the rows are
+    encoded once when the statement is registered and the encoded responses
+    are cached as they are requested.
+    """
+
+    def __init__(self, sql, columns=None, rows=None):
+        self.sql = sql
+        self.columns = columns
+        self.is_query = columns is not None
+        self.requires_define = False
+        self.encoded_rows = []
+        self.responses = {}
+        if self.is_query:
+            self.requires_define = any(
+                c.ora_type_num in (ORA_TYPE_NUM_JSON, ORA_TYPE_NUM_VECTOR)
+                for c in columns
+            )
+            for row in rows:
+                data = bytearray([TNS_MSG_TYPE_ROW_DATA])
+                for column, value in zip(columns, row):
+                    data += column.encode_value(value)
+                self.encoded_rows.append(bytes(data))
+            self.describe_info = self._get_describe_info()
+
+    def _get_describe_info(self):
+        """
+        Returns the describe information for the query.
+        """
+        buf = Buffer()
+        buf.write_uint8(TNS_MSG_TYPE_DESCRIBE_INFO)
+        buf.write_bytes(None)
+        buf.write_ub4(sum(c.buffer_size for c in self.columns))
+        buf.write_ub4(len(self.columns))
+        if self.columns:
+            buf.write_uint8(0)
+        for i, column in enumerate(self.columns):
+            column.write_metadata(buf, i + 1)
+        buf.write_bytes_with_length(None)  # current date
+        buf.write_ub4(0)  # dcbflag
+        buf.write_ub4(0)  # dcbmdbz
+        buf.write_ub4(0)  # dcbmnpr
+        buf.write_ub4(0)  # dcbmxpr
+        buf.write_bytes_with_length(None)  # dcbqcky
+        return bytes(buf)
+
+    def get_rows(self, start_pos, end_pos):
+        """
+        Returns the row data for the given range of rows. This is cached so
+        that each subsequent execution simply replays the same bytes.
+        """
+        key = (start_pos, end_pos)
+        data = self.responses.get(key)
+        if data is None:
+            buf = Buffer()
+            if end_pos > start_pos:
+                buf.write_uint8(TNS_MSG_TYPE_ROW_HEADER)
+                buf.write_uint8(0)  # flags
+                buf.write_ub2(0)  # num requests
+                buf.write_ub4(0)  # iteration number
+                buf.write_ub4(0)  # num iters
+                buf.write_ub2(0)  # buffer length
+                buf.write_ub4(0)  # bit vector
+                buf.write_ub4(0)  # rxhrid
+                buf.extend(b"".join(self.encoded_rows[start_pos:end_pos]))
+            data = self.responses[key] = bytes(buf)
+        return data
+
+
+class Cursor:
+    """
+    An open cursor on one of the connections to the stand-in server.
+    """
+
+    def __init__(self, cursor_id, statement):
+        self.cursor_id = cursor_id
+        self.statement = statement
+        self.pos = 0
+
+
+class Connection:
+    """
+    The server side of a connection to the stand-in server.
+    """
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.partial = bytearray()
+        self.large_sdu = False
+        self.sdu = 8192
+        self.cursors = {}
+        self.cursors_by_sql = {}
+        self.next_cursor_id = 1
+        self.combo_key = None
+        self.password_hash = None
+        self.session_key_part_a = None
+        self.client_id = None
+        self.send_lock = threading.Lock()
+
+    def _add_cursor(self, statement):
+        """
+        Returns a new cursor for the given statement.
+        """
+        cursor = Cursor(self.next_cursor_id, statement)
+        self.next_cursor_id += 1
+        self.cursors[cursor.cursor_id] = cursor
+        return cursor
+
+    def _accept(self):
+        """
+        Processes the connect packet and sends the accept packet.
+        """
+        packet_type, packet = self._read_packet()
+        if packet_type != TNS_PACKET_TYPE_CONNECT:
+            raise StandInError(f"expecting connect packet, got {packet_type}")
+        (connect_data_len,) = struct.unpack(">H", packet[24:26])
+        if connect_data_len > len(packet) - 74:
+            self._read_packet()
+        (self.sdu,) = struct.unpack(">I", packet[58:62])
+        body = bytearray(37)
+        if self.server.pipelining:
+            struct.pack_into(">HH", body, 0, TNS_VERSION_END_OF_RESPONSE, 0)
+            struct.pack_into(
+                ">I", body, 33, TNS_ACCEPT_FLAG_HAS_END_OF_RESPONSE
+            )
+        else:
+            struct.pack_into(">HH", body, 0, TNS_VERSION, 0)
+        struct.pack_into(">I", body, 24, self.sdu)
+        header = struct.pack(
+            ">HHBBH", len(body) + 8, 0, TNS_PACKET_TYPE_ACCEPT, 0, 0
+        )
+        self.sock.sendall(header + body)
+        self.large_sdu = True
+
+    def _get_error(self, cursor_id=0, rowcount=0, num=0, message=None):
+        """
+        Returns an error message (which also marks the end of the response).
+        """
+        buf = Buffer()
+        buf.write_uint8(TNS_MSG_TYPE_ERROR)
+        buf.write_ub4(0)  # end of call status
+        buf.write_ub2(0)  # end to end seq#
+        buf.write_ub4(0)  # current row number
+        buf.write_ub2(0)  # error number
+        buf.write_ub2(0)  # array elem error
+        buf.write_ub2(0)  # array elem error
+        buf.write_ub2(cursor_id)
+        buf.write_ub2(0)  # error position
+        buf.extend(bytes(6))  # sql type, fatal, flags, options, UPI, flags
+        buf.write_ub4(0)  # rowid (rba)
+        buf.write_ub2(0)  # rowid (partition id)
+        buf.write_uint8(0)
+        buf.write_ub4(0)  # rowid (block num)
+        buf.write_ub2(0)  # rowid (slot num)
+        buf.write_ub4(0)  # OS error
+        buf.write_uint8(0)  # statement number
+        buf.write_uint8(0)  # call number
+        buf.write_ub2(0)  # padding
+        buf.write_ub4(0)  # success iters
+        buf.write_ub4(0)  # oerrdd
+        buf.write_ub2(0)  # batch error codes
+        buf.write_ub4(0)  # batch error offsets
+        buf.write_ub2(0)  # batch error messages
+        buf.write_ub4(num)
+        buf.write_ub8(rowcount)
+        buf.write_ub4(0)  # sql type
+        buf.write_ub4(0)  # server checksum
+        if num != 0:
+            buf.write_bytes(message.encode())
+        return bytes(buf)
+
+    def _get_parameters(self, pairs):
+        """
+        Returns a parameter message containing the given key/value pairs
+        followed by a status message.
+        """
+        buf = Buffer()
+        buf.write_uint8(TNS_MSG_TYPE_PARAMETER)
+        buf.write_ub2(len(pairs))
+        for key, value, flags in pairs:
+            buf.write_str_with_length(key)
+            buf.write_str_with_length(value)
+            buf.write_ub4(flags)
+        return bytes(buf) + self._get_status()
+
+    def _get_status(self):
+        """
+        Returns a status message (which also marks the end of the response).
+        """
+        buf = Buffer()
+        buf.write_uint8(TNS_MSG_TYPE_STATUS)
+        buf.write_ub4(0)  # call status
+        buf.write_ub2(0)  # end to end seq#
+        return bytes(buf)
+
+    def _process_auth(self, reader, function_code):
+        """
+        Processes the two phases of authentication using the 11g verifier.
+        """
+        reader.read_uint8()  # pointer (authusr)
+        user_len = reader.read_ub4()
+        reader.read_ub4()  # authentication mode
+        reader.read_uint8()  # pointer (authivl)
+        num_pairs = reader.read_ub4()
+        reader.read_uint8()  # pointer (authovl)
+        reader.read_uint8()  # pointer (authovln)
+        if user_len > 0:
+            reader.read_bytes()
+        client_data = {}
+        for i in range(num_pairs):
+            key = reader.read_str_with_length()
+            value = reader.read_str_with_length()
+            reader.read_ub4()  # flags
+            client_data[key] = value
+        if function_code == TNS_FUNC_AUTH_PHASE_ONE:
+            verifier_data = secrets.token_bytes(10)
+            self.password_hash = hashlib.sha1(
+                self.server.password.encode() + verifier_data
+            ).digest() + bytes(4)
+            self.session_key_part_a = secrets.token_bytes(48)
+            encoded_key = _encrypt(self.password_hash, self.session_key_part_a)
+            pairs = [
+                ("AUTH_SESSKEY", encoded_key.hex().upper(), 0),
+                (
+                    "AUTH_VFR_DATA",
+                    verifier_data.hex().upper(),
+                    TNS_VERIFIER_TYPE_11G,
+                ),
+            ]
+            return self._get_parameters(pairs)
+        encoded_key = bytes.fromhex(client_data["AUTH_SESSKEY"])
+        part_b = _decrypt(self.password_hash, encoded_key)
+        part_a = self.session_key_part_a
+        b = bytes(part_a[i] ^ part_b[i] for i in range(16, 40))
+        combo_key = hashlib.md5(b[:16]).digest() + hashlib.md5(b[16:]).digest()
+        self.combo_key = combo_key[:24]
+        encrypted_password = bytes.fromhex(client_data["AUTH_PASSWORD"])
+        password = _decrypt(self.combo_key, encrypted_password)[16:]
+        password = password[: len(password) - password[-1]]
+        if password.decode() != self.server.password:
+            return self._get_error(
+                num=1017,
+                message="ORA-01017: invalid credential or not authorized; "
+                "logon denied",
+            )
+        response = _encrypt(
+            self.combo_key, secrets.token_bytes(16) + b"SERVER_TO_CLIENT"
+        )
+        version_num = (23 << 24) | (26 << 16)
+        pairs = [
+            ("AUTH_SVR_RESPONSE", response.hex().upper(), 0),
+            ("AUTH_VERSION_NO", str(version_num), 0),
+            ("AUTH_SESSION_ID", "1", 0),
+            ("AUTH_SERIAL_NUM", "1", 0),
+            ("AUTH_MAX_OPEN_CURSORS", "1000", 0),
+            ("AUTH_MAX_IDEN_LENGTH", "128", 0),
+            ("AUTH_SC_SERVICE_NAME", "STANDIN", 0),
+            ("AUTH_INSTANCENAME", "STANDIN", 0),
+            ("AUTH_SC_DBUNIQUE_NAME", "STANDIN", 0),
+        ]
+        return self._get_parameters(pairs)
+
+    def _process_direct_path_prepare(self, reader):
+        """
+        Processes a direct path prepare request by returning the metadata for
+        the requested columns of the table.
+        """
+        reader.read_ub4()  # op code
+        reader.read_uint8()  # pointer (keyword parameters)
+        num_keywords = reader.read_ub4()
+        reader.read_uint8()  # pointer (input array)
+        reader.read_ub2()  # input array length
+        reader.read_raw(6)  # pointers
+        schema_name = table_name = None
+        column_names = []
+        for i in range(num_keywords):
+            reader.read_ub2()  # text length
+            reader.read_ub2()  # binary length
+            value = reader.read_bytes().decode()
+            index = reader.read_ub2()
+            if index == TNS_DPP_KW_INDEX_SCHEMA_NAME:
+                schema_name = value
+            elif index == TNS_DPP_KW_INDEX_OBJECT_NAME:
+                table_name = value
+            elif index == TNS_DPP_KW_INDEX_COLUMN_NAME:
+                column_names.append(value)
+        key = (schema_name.upper(), table_name.upper())
+        table = self.server.tables.get(key)
+        if table is None:
+            return self._get_error(
+                num=942, message="ORA-00942: table or view does not exist"
+            )
+        columns = [table[name.upper()] for name in column_names]
+        buf = Buffer()
+        buf.write_uint8(TNS_MSG_TYPE_PARAMETER)
+        buf.write_ub4(len(columns))
+        for i, column in enumerate(columns):
+            column.write_metadata(buf, i + 1)
+        buf.write_ub2(0)  # number of parameters
+        buf.write_ub2(TNS_DPP_OUT_INDEX_CURSOR + 1)
+        for i in range(TNS_DPP_OUT_INDEX_CURSOR):
+            buf.write_ub4(0)
+        buf.write_ub4(self.next_cursor_id)
+        self.next_cursor_id += 1
+        return bytes(buf) + self._get_status()
+
+    def _process_execute(self, reader):
+        """
+        Processes a full execute request.
+        """
+        options = reader.read_ub4()
+        cursor_id = reader.read_ub4()
+        reader.read_uint8()  # pointer (cursor id)
+        reader.read_ub4()  # SQL length
+        reader.read_uint8()  # pointer (vector)
+        reader.read_ub4()  # al8i4 array length
+        reader.read_raw(2)  # pointers (al8o4, al8o4l)
+        reader.read_ub4()  # prefetch buffer size
+        num_iters = reader.read_ub4()
+        reader.read_ub4()  # maximum long size
+        reader.read_uint8()  # pointer (binds)
+        reader.read_ub4()  # number of binds
+        reader.read_raw(5)  # pointers
+        reader.read_uint8()  # pointer (al8doac)
+        reader.read_ub4()  # number of defines
+        reader.read_ub4()  # registration id (lsb)
+        reader.read_raw(3)  # pointers
+        reader.read_ub4()  # al8blvl
+        reader.read_uint8()  # pointer (al8dnam)
+        reader.read_ub4()  # al8dnaml
+        reader.read_ub4()  # registration id (msb)
+        reader.read_uint8()  # pointer (al8pidmlrc)
+        reader.read_ub4()  # al8pidmlrcbl
+        reader.read_uint8()  # pointer (al8pidmlrcl)
+        reader.read_uint8()  # pointer (al8sqlsig)
+        reader.read_ub4()  # SQL signature length
+        reader.read_uint8()  # pointer (SQL ID)
+        reader.read_ub4()  # allocated size of SQL ID
+        reader.read_uint8()  # pointer (length of SQL ID)
+        reader.read_uint8()  # pointer (chunk ids)
+        reader.read_ub4()  # number of chunk ids
+        if options & TNS_EXEC_OPTION_PARSE:
+            sql = reader.read_bytes().decode()
+            reader.read_ub4()  # al8i4[0] parse
+            statement = self.server.statements.get(sql)
+            if statement is None:
+                return self._get_error(
+                    num=942, message="ORA-00942: table or view does not exist"
+                )
+            cursor = self.cursors.get(cursor_id)
+            if cursor is None:
+                cursor = self._add_cursor(statement)
+        else:
+            reader.read_ub4()  # al8i4[0] parse
+            cursor = self.cursors[cursor_id]
+            statement = cursor.statement
+        num_execs = reader.read_ub4()  # al8i4[1] execution count
+        if not statement.is_query:
+            return self._get_error(cursor.cursor_id, rowcount=num_execs)
+        response = b""
+        if options & TNS_EXEC_OPTION_PARSE:
+            response = statement.describe_info
+        if options & TNS_EXEC_OPTION_EXECUTE:
+            cursor.pos = 0
+        if options & TNS_EXEC_OPTION_FETCH and not statement.requires_define:
+            return response + self._get_rows(cursor, num_iters)
+        return response + self._get_error(cursor.cursor_id, cursor.pos)
+
+    def _get_rows(self, cursor, num_rows):
+        """
+        Returns the requested number of rows from the cursor.
+        """
+        statement = cursor.statement
+        end_pos = min(cursor.pos + num_rows, len(statement.encoded_rows))
+        response = statement.get_rows(cursor.pos, end_pos)
+        cursor.pos = end_pos
+        if cursor.pos < len(statement.encoded_rows):
+            return response + self._get_error(cursor.cursor_id, cursor.pos)
+        return response + self._get_error(
+            cursor.cursor_id,
+            cursor.pos,
+            num=TNS_ERR_NO_DATA_FOUND,
+            message="ORA-01403: no data found",
+        )
+
+    def _process_notify(self, reader):
+        """
+        Processes the request sent by the connection used for receiving
+        notifications. The start of the stream of notifications is sent back
+        and the notifications themselves are sent by the server when they are
+        generated.
+        """
+        reader.read_ub4()  # client id length
+        self.client_id = reader.read_bytes()
+        with self.server.lock:
+            self.server.notification_connections[self.client_id] = self
+            self.server.notification_connections_changed.notify_all()
+        self._send_response(bytes([TNS_MSG_TYPE_OAC]), end_of_response=False)
+
+    def _process_subscribe(self, reader):
+        """
+        Processes a request to register or unregister a subscription. Client
+        ids are retained for as long as a registration or a connection for
+        receiving notifications uses them.
+        """
+        opcode = reader.read_uint8()
+        reader.read_ub4()  # mode
+        has_user = reader.read_uint8()
+        reader.read_ub4()  # user length
+        has_client_id = reader.read_uint8()
+        reader.read_ub4()  # client id length
+        reader.read_uint8()  # pointer (registration)
+        reader.read_ub4()  # number of registrations
+        reader.read_ub2()  # raw presentation
+        reader.read_ub2()  # version for client notification
+        reader.read_raw(4)  # pointers (out attributes)
+        reader.read_raw(5)  # pointers (instances, client id)
+        reader.read_ub4()  # client id length
+        reader.read_uint8()  # pointer (client id length)
+        if has_user:
+            reader.read_bytes()
+        client_id = None
+        if has_client_id:
+            client_id = reader.read_bytes()
+        namespace = reader.read_ub4()
+        reader.read_bytes_with_length()  # name
+        for i in range(9):
+            reader.read_ub4()  # context, payload type, qos, timeout, etc.
+        reader.read_uint8()  # grouping class
+        reader.read_ub4()  # grouping value
+        reader.read_uint8()  # grouping type
+        reader.read_ub4()  # grouping start time
+        reader.read_ub4()  # grouping repeat count
+        registration_id = reader.read_ub8()
+        with self.server.lock:
+            if opcode == TNS_SUBSCR_OP_REGISTER:
+                registration_id = self.server.next_registration_id
+                self.server.next_registration_id += 1
+                if client_id is None:
+                    client_id = secrets.token_hex(8).encode()
+                self.server.registrations[registration_id] = (
+                    client_id,
+                    namespace,
+                )
+            else:
+                self.server.registrations.pop(registration_id, None)
+        buf = Buffer()
+        buf.write_uint8(TNS_MSG_TYPE_PARAMETER)
+        buf.write_ub4(1)  # number of values
+        buf.write_ub4(0)  # out parameters
+        buf.write_ub4(registration_id)
+        buf.write_ub4(1)  # number of values
+        buf.write_ub8(registration_id)
+        buf.write_bytes_with_length(None)  # subscriber name
+        buf.write_ub4(0)  # number of database instances
+        buf.write_ub4(0)  # number of listener addresses
+        buf.write_bytes_with_length(client_id)
+        return bytes(buf) + self._get_status()
+
+    def _process_request(self, payload):
+        """
+        Processes a single request and returns the response to send back.
+        """
+        reader = Reader(payload)
+        message_type = reader.read_uint8()
+        if message_type == TNS_MSG_TYPE_PROTOCOL:
+            return self._get_protocol_info()
+        elif message_type == TNS_MSG_TYPE_DATA_TYPES:
+            return bytes([TNS_MSG_TYPE_DATA_TYPES, 0, 0])
+        while message_type == TNS_MSG_TYPE_PIGGYBACK:
+            function_code = reader.read_uint8()
+            reader.read_uint8()  # sequence number
+            reader.read_ub8()  # token number
+            if function_code == TNS_FUNC_PIPELINE_BEGIN:
+                reader.read_ub2()  # error set ID
+                reader.read_uint8()  # error set mode
+                reader.read_uint8()  # pipeline mode
+            elif function_code == TNS_FUNC_CLOSE_CURSORS:
+                reader.read_uint8()  # pointer
+                for i in range(reader.read_ub4()):
+                    cursor = self.cursors.pop(reader.read_ub4(), None)
+            else:
+                raise StandInError(f"unsupported piggyback {function_code}")
+            message_type = reader.read_uint8()
+        if message_type != TNS_MSG_TYPE_FUNCTION:
+            raise StandInError(f"unsupported message type {message_type}")
+        function_code = reader.read_uint8()
+        reader.read_uint8()  # sequence number
+        reader.read_ub8()  # token number
+        if function_code in (TNS_FUNC_AUTH_PHASE_ONE, TNS_FUNC_AUTH_PHASE_TWO):
+            return self._process_auth(reader, function_code)
+        elif function_code == TNS_FUNC_EXECUTE:
+            return self._process_execute(reader)
+        elif function_code in (
+            TNS_FUNC_REEXECUTE,
+            TNS_FUNC_REEXECUTE_AND_FETCH,
+        ):
+            cursor = self.cursors[reader.read_ub4()]
+            num_iters = reader.read_ub4()
+            if not cursor.statement.is_query:
+                return self._get_error(cursor.cursor_id, num_iters)
+            cursor.pos = 0
+            if function_code == TNS_FUNC_REEXECUTE:
+                return self._get_error(cursor.cursor_id)
+            return self._get_rows(cursor, num_iters)
+        elif function_code == TNS_FUNC_FETCH:
+            cursor = self.cursors[reader.read_ub4()]
+            return self._get_rows(cursor, reader.read_ub4())
+        elif function_code == TNS_FUNC_DIRECT_PATH_PREPARE:
+            return self._process_direct_path_prepare(reader)
+        elif function_code == TNS_FUNC_SUBSCRIBE:
+            return self._process_subscribe(reader)
+        elif function_code == TNS_FUNC_NOTIFY:
+            return self._process_notify(reader)
+        elif function_code in (
+            TNS_FUNC_DIRECT_PATH_LOAD_STREAM,
+            TNS_FUNC_DIRECT_PATH_OP,
+        ):
+            return bytes([TNS_MSG_TYPE_PARAMETER, 0]) + self._get_status()
+        elif function_code in (
+            TNS_FUNC_COMMIT,
+            TNS_FUNC_ROLLBACK,
+            TNS_FUNC_LOGOFF,
+            TNS_FUNC_PING,
+            TNS_FUNC_PIPELINE_END,
+        ):
+            return self._get_status()
+        return self._get_error(
+            num=3115,
+            message="ORA-03115: unsupported network datatype or "
+            f"representation (function {function_code})",
+        )
+
+    def _get_protocol_info(self):
+        """
+        Returns the response to the protocol request.
+        """
+        fdo = bytearray(11)
+        struct.pack_into(">H", fdo, 9, TNS_CHARSET_UTF16)
+        compile_caps = bytearray(TNS_CCAP_MAX)
+        compile_caps[TNS_CCAP_FIELD_VERSION] = TNS_CCAP_FIELD_VERSION_23_4
+        runtime_caps = bytearray(TNS_RCAP_MAX)
+        runtime_caps[TNS_RCAP_TTC] = TNS_RCAP_TTC_32K
+        buf = Buffer()
+        buf.write_uint8(TNS_MSG_TYPE_PROTOCOL)
+        buf.write_uint8(6)  # protocol version
+        buf.write_uint8(0)
+        buf.extend(b"python-oracledb stand-in\x00")
+        buf.write_uint16le(TNS_CHARSET_UTF8)
+        buf.write_uint8(0)  # server flags
+        buf.write_uint16le(0)  # number of elements
+        buf.write_uint16be(len(fdo))
+        buf.extend(fdo)
+        buf.write_bytes(bytes(compile_caps))
+        buf.write_bytes(bytes(runtime_caps))
+        return bytes(buf)
+
+    def _read_packet(self, timeout=None):
+        """
+        Reads a packet from the socket and returns its type and contents. If a
+        timeout is specified and no data arrives in that time, None is
+        returned instead.
+        """
+        if (
+            timeout is not None
+            and len(self.partial) == 0
+            and not (
+                isinstance(self.sock, ssl.SSLSocket) and self.sock.pending()
+            )
+        ):
+            readable, _, _ = select.select([self.sock], [], [], timeout)
+            if not readable:
+                return None
+        while True:
+            if len(self.partial) >= PACKET_HEADER_SIZE:
+                if self.large_sdu:
+                    (size,) = struct.unpack(">I", self.partial[:4])
+                else:
+                    (size,) = struct.unpack(">H", self.partial[:2])
+                if len(self.partial) >= size:
+                    packet = bytes(self.partial[:size])
+                    del self.partial[:size]
+                    return packet[4], packet
+            data = self.sock.recv(max(self.sdu, 65536))
+            if not data:
+                raise EOFError()
+            self.partial += data
+
+    def _read_request(self):
+        """
+        Reads a request from the client. Requests that do not fit in a single
+        packet are sent as a series of full packets; as the driver waits for
+        the response before sending anything else, any packet that arrives
+        soon after a full packet is a continuation of the same request. The
+        requests sent as part of a pipeline are marked explicitly instead.
+        """
+        packet_type, packet = self._read_packet()
+        if packet_type != TNS_PACKET_TYPE_DATA:
+            raise StandInError(f"unsupported packet type {packet_type}")
+        (data_flags,) = struct.unpack(">H", packet[8:10])
+        if data_flags & TNS_DATA_FLAGS_EOF:
+            raise EOFError()
+        payload = bytearray(packet[10:])
+        while len(packet) > self.sdu - PACKET_HEADER_SIZE and not (
+            data_flags & TNS_DATA_FLAGS_END_OF_REQUEST
+        ):
+            result = self._read_packet(CONTINUATION_WAIT)
+            if result is None:
+                break
+            packet_type, packet = result
+            (data_flags,) = struct.unpack(">H", packet[8:10])
+            payload += packet[10:]
+        return payload
+
+    def _send_response(self, payload, end_of_response=True):
+        """
+        Sends the response to the client in as many packets as are required.
+        When pipelining is supported, the end of each response is marked
+        explicitly. Notifications are part of a response that never ends.
+        """
+        data_flags = 0
+        end_of_response = end_of_response and self.server.pipelining
+        if end_of_response:
+            payload += bytes([TNS_MSG_TYPE_END_OF_RESPONSE])
+        chunk_size = self.sdu - PACKET_HEADER_SIZE - 2
+        parts = []
+        for offset in range(0, len(payload), chunk_size):
+            chunk = payload[offset : offset + chunk_size]
+            if end_of_response and offset + chunk_size >= len(payload):
+                data_flags = TNS_DATA_FLAGS_END_OF_RESPONSE
+            parts.append(
+                struct.pack(
+                    ">IBBHH",
+                    len(chunk) + PACKET_HEADER_SIZE + 2,
+                    TNS_PACKET_TYPE_DATA,
+                    0,
+                    0,
+                    data_flags,
+                )
+            )
+            parts.append(chunk)
+        with self.send_lock:
+            self.sock.sendall(b"".join(parts))
+
+    def run(self):
+        """
+        Processes requests from the client until it disconnects.
+        """
+        try:
+            if self.server.server_ssl_context is not None:
+                self.sock = self.server.server_ssl_context.wrap_socket(
+                    self.sock, server_side=True
+                )
+            self._accept()
+            while True:
+                response = self._process_request(self._read_request())
+                if response is not None:
+                    self._send_response(response)
+        except (EOFError, OSError):
+            pass
+        finally:
+            if self.client_id is not None:
+                with self.server.lock:
+                    conns = self.server.notification_connections
+                    if conns.get(self.client_id) is self:
+                        del conns[self.client_id]
+            if isinstance(self.sock, ssl.SSLSocket):
+                try:
+                    self.sock.unwrap()
+                except OSError:
+                    pass
+            self.sock.close()
+
+
+class StandInServer:
+    """
+    A stand-in for Oracle Database listening on a local port. Statements and
+    tables must be registered with the server before they are used. If
+    pipelining is enabled, the server behaves like Oracle Database 23ai and
+    marks the end of each response so that requests can be pipelined. If TLS
+    is enabled, connections are made with the tcps protocol using a
+    self-signed certificate generated when the server is created; clients
+    trust it by using the wallet location of the server.
+    """
+
+    def __init__(
+        self,
+        user="perf",
+        password="perf",
+        host="127.0.0.1",
+        pipelining=False,
+        tls=False,
+    ):
+        self.user = user
+        self.password = password
+        self.pipelining = pipelining
+        self.lock = threading.Lock()
+        self.notification_connections_changed = threading.Condition(self.lock)
+        self.registrations = {}
+        self.notification_connections = {}
+        self.next_registration_id = 1
+        self.statements = {}
+        self.tables = {}
+        self.server_ssl_context = None
+        self.wallet_location = None
+        self._sock = socket.create_server((host, 0))
+        self.host, self.port = self._sock.getsockname()[:2]
+        self._thread = None
+        self._wallet_dir = None
+        if tls:
+            self._create_ssl_contexts()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    def _accept_connections(self):
+        """
+        Accepts connections and processes each of them in its own thread.
+        """
+        while True:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                break
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = Connection(self, sock)
+            threading.Thread(target=conn.run, daemon=True).start()
+
+    def _create_ssl_contexts(self):
+        """
+        Generates a self-signed certificate for the host, creates the SSL
+        context used by the server and creates a wallet directory containing
+        the certificate for use by clients connecting to the server.
+        """
+        key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name(
+            [x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, self.host)]
+        )
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(
+                x509.BasicConstraints(ca=True, path_length=None), critical=True
+            )
+            .sign(key, hashes.SHA256())
+        )
+        cert_pem = cert.public_bytes(serialization.Encoding.PEM)
+        key_pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        self._wallet_dir = tempfile.TemporaryDirectory()
+        self.wallet_location = self._wallet_dir.name
+        file_name = os.path.join(self.wallet_location, "server.pem")
+        with open(file_name, "wb") as f:
+            f.write(key_pem + cert_pem)
+        self.server_ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.server_ssl_context.load_cert_chain(file_name)
+        file_name = os.path.join(self.wallet_location, "ewallet.pem")
+        with open(file_name, "wb") as f:
+            f.write(cert_pem)
+
+    def add_dml(self, sql: str) -> None:
+        """
+        Registers a DML statement. The row count returned is the number of
+        rows bound by the client.
+        """
+        self.statements[sql] = Statement(sql)
+
+    def add_query(self, sql: str, columns: list, rows: list) -> None:
+        """
+        Registers a query that returns the given columns and rows.
+        """
+        self.statements[sql] = Statement(sql, columns, rows)
+
+    def add_table(
+        self, schema_name: str, table_name: str, columns: list
+    ) -> None:
+        """
+        Registers a table that can be used for direct path loads.
+        """
+        key = (schema_name.upper(), table_name.upper())
+        self.tables[key] = {c.name.upper(): c for c in columns}
+
+    def connect(self, **kwargs) -> oracledb.Connection:
+        """
+        Returns a connection to the stand-in server.
+        """
+        if self.wallet_location is not None:
+            kwargs.setdefault("wallet_location", self.wallet_location)
+        return oracledb.connect(
+            user=self.user, password=self.password, dsn=self.dsn, **kwargs
+        )
+
+    def connect_async(self, **kwargs) -> oracledb.AsyncConnection:
+        """
+        Returns a coroutine that creates an asynchronous connection to the
+        stand-in server.
+        """
+        if self.wallet_location is not None:
+            kwargs.setdefault("wallet_location", self.wallet_location)
+        return oracledb.connect_async(
+            user=self.user, password=self.password, dsn=self.dsn, **kwargs
+        )
+
+    def deregister(self, registration_id: int) -> None:
+        """
+        Discards the registration of a subscription and sends the notification
+        that informs the client of that fact.
+        """
+        with self.lock:
+            client_id, _ = self.registrations.pop(registration_id)
+        self._send_notification(client_id, registration_id, None)
+
+    def notify(self, registration_id: int, table_name: str) -> None:
+        """
+        Sends a notification for a change made to the given table to the
+        client that registered the subscription.
+        """
+        with self.lock:
+            client_id, _ = self.registrations[registration_id]
+        name = table_name.encode()
+        payload = Buffer()
+        payload.write_uint16be(TNS_SUBSCR_NOTIFICATION_VERSION)
+        payload.write_uint32be(registration_id)
+        payload.write_uint32be(TNS_SUBSCR_EVENT_OBJCHANGE)
+        payload.write_uint16be(len(b"STANDIN"))
+        payload.extend(b"STANDIN")
+        payload.extend(bytes(14))  # transaction id and SCN
+        payload.write_uint16be(1)  # number of tables
+        payload.write_uint32be(oracledb.OPCODE_ALLROWS)
+        payload.write_uint16be(len(name))
+        payload.extend(name)
+        payload.write_uint32be(0)  # object number
+        self._send_notification(client_id, registration_id, bytes(payload))
+
+    def _send_notification(self, client_id, registration_id, payload):
+        """
+        Sends a notification with the given payload to the connection that
+        receives the notifications for the given client id. As the client
+        establishes that connection in the background, it may not yet exist.
+        """
+        conns = self.notification_connections
+        with self.lock:
+            self.notification_connections_changed.wait_for(
+                lambda: client_id in conns, timeout=5
+            )
+            conn = conns[client_id]
+        buf = Buffer()
+        buf.write_ub4(1)  # message type
+        buf.write_ub4(0)  # error code
+        buf.write_ub4(registration_id)
+        buf.write_str_with_length(None)  # queue name
+        buf.write_str_with_length(None)  # consumer name
+        buf.write_bytes_with_length(None)  # message id
+        buf.write_ub4(0)  # number of message properties
+        buf.write_bytes_with_length(None)  # JMS message properties
+        buf.write_ub4(0)  # payload type
+        buf.write_ub4(0)  # payload flags
+        buf.write_ub4(0)  # chunk number
+        buf.write_bytes_with_length(payload)
+        buf.write_bytes_with_length(None)  # DbObject/JSON payload
+        conn._send_response(bytes(buf), end_of_response=False)
+
+    @property
+    def dsn(self) -> str:
+        if self.server_ssl_context is not None:
+            return f"tcps://{self.host}:{self.port}/STANDIN"
+        return f"{self.host}:{self.port}/STANDIN"
+
+    def start(self) -> None:
+        """
+        Starts listening for connections.
+        """
+        self._thread = threading.Thread(
+            target=self._accept_connections, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops listening for connections.
+        """
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.wallet_location is not None:
+            self._wallet_dir.cleanup()
+            self.wallet_location = None
+
+
+def _decrypt(key, encrypted_text):
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(bytes(16))).decryptor()
+    return decryptor.update(encrypted_text) + decryptor.finalize()
+
+
+def _encrypt(key, plain_text):
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(bytes(16))).encryptor()
+    return encryptor.update(plain_text) + encryptor.finalize()
@@ -0,0 +1,258 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+"""
+P1000 - Module for measuring the performance of fetching rows.
+"""
+
+import datetime
+import decimal
+
+import oracledb
+from stand_in_server import Column
+
+NUM_ROWS = 10000
+NUM_COLUMNS = 10
+ARRAY_SIZE = 1000
+
+
+def _fetch_all(conn, sql, arraysize=ARRAY_SIZE):
+    with conn.cursor() as cursor:
+        cursor.arraysize = arraysize
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+def _add_query(stand_in, table_name, dbtype, get_value, **column_args):
+    """
+    Registers a query returning NUM_ROWS rows of NUM_COLUMNS columns of the
+    given type and returns the SQL for the query.
+    """
+    sql = f"select * from {table_name}"
+    columns = [
+        Column(f"C{i + 1}", dbtype, **column_args) for i in range(NUM_COLUMNS)
+    ]
+    rows = [
+        tuple(get_value(i * NUM_COLUMNS + j) for j in range(NUM_COLUMNS))
+        for i in range(NUM_ROWS)
+    ]
+    stand_in.add_query(sql, columns, rows)
+    return sql
+
+
+def test_perf_1000(benchmark, stand_in, perf_conn):
+    "P1000 - fetch integers"
+    sql = _add_query(
+        stand_in,
+        "perf_integers",
+        oracledb.DB_TYPE_NUMBER,
+        lambda i: i * 7919,
+        precision=9,
+        scale=0,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1001(benchmark, stand_in, perf_conn):
+    "P1001 - fetch numbers with a scale"
+    sql = _add_query(
+        stand_in,
+        "perf_decimals",
+        oracledb.DB_TYPE_NUMBER,
+        lambda i: decimal.Decimal(i * 7919) / 100,
+        precision=15,
+        scale=2,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1002(benchmark, stand_in, perf_conn):
+    "P1002 - fetch strings"
+    sql = _add_query(
+        stand_in,
+        "perf_strings",
+        oracledb.DB_TYPE_VARCHAR,
+        lambda i: f"String value {i}",
+        size=30,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1003(benchmark, stand_in, perf_conn):
+    "P1003 - fetch dates"
+    base_date = datetime.datetime(2000, 1, 1)
+    sql = _add_query(
+        stand_in,
+        "perf_dates",
+        oracledb.DB_TYPE_DATE,
+        lambda i: base_date + datetime.timedelta(minutes=i),
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1004(benchmark, stand_in, perf_conn):
+    "P1004 - fetch timestamps"
+    base_date = datetime.datetime(2000, 1, 1)
+    sql = _add_query(
+        stand_in,
+        "perf_timestamps",
+        oracledb.DB_TYPE_TIMESTAMP,
+        lambda i: base_date + datetime.timedelta(seconds=i, microseconds=i),
+        scale=6,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1005(benchmark, stand_in, perf_conn):
+    "P1005 - fetch binary doubles"
+    sql = _add_query(
+        stand_in,
+        "perf_doubles",
+        oracledb.DB_TYPE_BINARY_DOUBLE,
+        lambda i: i / 7,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1006(benchmark, stand_in, perf_conn):
+    "P1006 - fetch binary floats"
+    sql = _add_query(
+        stand_in, "perf_floats", oracledb.DB_TYPE_BINARY_FLOAT, lambda i: i / 4
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1007(benchmark, stand_in, perf_conn):
+    "P1007 - fetch raw values"
+    sql = _add_query(
+        stand_in,
+        "perf_raws",
+        oracledb.DB_TYPE_RAW,
+        lambda i: i.to_bytes(4, "big") * 4,
+        size=16,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1008(benchmark, stand_in, perf_conn):
+    "P1008 - fetch booleans"
+    sql = _add_query(
+        stand_in,
+        "perf_booleans",
+        oracledb.DB_TYPE_BOOLEAN,
+        lambda i: i % 3 == 0,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1009(benchmark, stand_in, perf_conn):
+    "P1009 - fetch nulls"
+    sql = _add_query(
+        stand_in,
+        "perf_nulls",
+        oracledb.DB_TYPE_VARCHAR,
+        lambda i: None,
+        size=30,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1010(benchmark, stand_in, perf_conn):
+    "P1010 - fetch integers using the default array size"
+    sql = _add_query(
+        stand_in,
+        "perf_integers",
+        oracledb.DB_TYPE_NUMBER,
+        lambda i: i,
+        precision=9,
+        scale=0,
+    )
+    rows = benchmark(_fetch_all, perf_conn, sql, oracledb.defaults.arraysize)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1011(benchmark, stand_in, perf_conn):
+    "P1011 - fetch integers using an output type handler"
+
+    def type_handler(cursor, metadata):
+        return cursor.var(str, arraysize=cursor.arraysize)
+
+    sql = _add_query(
+        stand_in,
+        "perf_integers",
+        oracledb.DB_TYPE_NUMBER,
+        lambda i: i,
+        precision=9,
+        scale=0,
+    )
+    perf_conn.outputtypehandler = type_handler
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert rows[1][1] == "11"
+
+
+def test_perf_1012(benchmark, stand_in):
+    "P1012 - fetch wide rows with a large SDU"
+    sql = _add_query(
+        stand_in,
+        "perf_wide_strings",
+        oracledb.DB_TYPE_VARCHAR,
+        lambda i: f"String value {i} ".ljust(200, "x"),
+        size=200,
+    )
+    with stand_in.connect(sdu=2097152) as conn:
+        rows = benchmark(_fetch_all, conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1013(benchmark, stand_in):
+    "P1013 - fetch integers from the client-side result cache"
+    sql = _add_query(
+        stand_in,
+        "perf_integers",
+        oracledb.DB_TYPE_NUMBER,
+        lambda i: i * 7919,
+        precision=9,
+        scale=0,
+    )
+
+    def fetch_all(conn):
+        with conn.cursor() as cursor:
+            cursor.arraysize = ARRAY_SIZE
+            cursor.result_cache_ttl = 3600
+            cursor.execute(sql)
+            return cursor.fetchall()
+
+    with stand_in.connect(result_cache_size=64 * 1024 * 1024) as conn:
+        rows = benchmark(fetch_all, conn)
+    assert len(rows) == NUM_ROWS
@@ -0,0 +1,151 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+
+"""
+P1100 - Module for measuring the performance of binding data with
+executemany().
+"""
+
+import datetime
+
+import oracledb
+from stand_in_server import Column
+
+NUM_ROWS = 10000
+
+
+def _get_rows():
+    base_date = datetime.datetime(2000, 1, 1)
+    return [
+        (
+            i,
+            i / 7,
+            f"String value {i}",
+            base_date + datetime.timedelta(minutes=i),
+            i.to_bytes(4, "big") * 4,
+        )
+        for i in range(NUM_ROWS)
+    ]
+
+
+def _executemany(conn, sql, rows, **kwargs):
+    with conn.cursor() as cursor:
+        cursor.executemany(sql, rows, **kwargs)
+        return cursor.rowcount
+
+
+def test_perf_1100(benchmark, stand_in, perf_conn):
+    "P1100 - executemany() with positional binds"
+    sql = "insert into perf_binds values (:1, :2, :3, :4, :5)"
+    stand_in.add_dml(sql)
+    rowcount = benchmark(_executemany, perf_conn, sql, _get_rows())
+    assert rowcount == NUM_ROWS
+
+
+def test_perf_1101(benchmark, stand_in, perf_conn):
+    "P1101 - executemany() with named binds"
+    sql = (
+        "insert into perf_binds values (:int_val, :float_val, :str_val, "
+        ":date_val, :raw_val)"
+    )
+    stand_in.add_dml(sql)
+    names = ["int_val", "float_val", "str_val", "date_val", "raw_val"]
+    rows = [dict(zip(names, row)) for row in _get_rows()]
+    rowcount = benchmark(_executemany, perf_conn, sql, rows)
+    assert rowcount == NUM_ROWS
+
+
+def test_perf_1102(benchmark, stand_in, perf_conn):
+    "P1102 - executemany() with integer binds"
+    sql = "insert into perf_binds (int_val) values (:1)"
+    stand_in.add_dml(sql)
+    rows = [(i * 7919,) for i in range(NUM_ROWS)]
+    rowcount = benchmark(_executemany, perf_conn, sql, rows)
+    assert rowcount == NUM_ROWS
+
+
+def test_perf_1103(benchmark, stand_in, perf_conn):
+    "P1103 - executemany() with long string binds"
+    sql = "insert into perf_binds (str_val) values (:1)"
+    stand_in.add_dml(sql)
+    rows = [(f"{i:010}" * 100,) for i in range(NUM_ROWS)]
+    rowcount = benchmark(_executemany, perf_conn, sql, rows)
+    assert rowcount == NUM_ROWS
+
+
+def test_perf_1104(benchmark, stand_in, perf_conn):
+    "P1104 - execute() with binds in a loop"
+
+    def execute_all(conn, sql, rows):
+        with conn.cursor() as cursor:
+            for row in rows:
+                cursor.execute(sql, row)
+
+    sql = "insert into perf_binds values (:1, :2, :3, :4, :5)"
+    stand_in.add_dml(sql)
+    benchmark(execute_all, perf_conn, sql, _get_rows()[:500])
+
+
+def test_perf_1105(benchmark, pipelining_stand_in, pipelining_conn):
+    "P1105 - executemany() in batches"
+    sql = "insert into perf_binds values (:1, :2, :3, :4, :5)"
+    pipelining_stand_in.add_dml(sql)
+    rowcount = benchmark(
+        _executemany, pipelining_conn, sql, _get_rows(), batch_size=500
+    )
+    assert rowcount == 500
+
+
+def test_perf_1106(benchmark, pipelining_stand_in, pipelining_conn):
+    "P1106 - executemany() in batches with pipelining"
+    sql = "insert into perf_binds values (:1, :2, :3, :4, :5)"
+    pipelining_stand_in.add_dml(sql)
+    rowcount = benchmark(
+        _executemany,
+        pipelining_conn,
+        sql,
+        _get_rows(),
+        batch_size=500,
+        pipeline_depth=4,
+    )
+    assert rowcount == 500
+
+
+def test_perf_1107(benchmark, stand_in, perf_conn):
+    "P1107 - executemany() with a data frame"
+    query_sql = "select * from perf_binds"
+    columns = [
+        Column("INT_VAL", oracledb.DB_TYPE_NUMBER, precision=9, scale=0),
+        Column("FLOAT_VAL", oracledb.DB_TYPE_BINARY_DOUBLE),
+        Column("STR_VAL", oracledb.DB_TYPE_VARCHAR, size=30),
+        Column("DATE_VAL", oracledb.DB_TYPE_DATE),
+        Column("RAW_VAL", oracledb.DB_TYPE_RAW, size=16),
+    ]
+    stand_in.add_query(query_sql, columns, _get_rows())
+    df = perf_conn.fetch_df_all(query_sql, arraysize=1000)
+    sql = "insert into perf_binds values (:1, :2, :3, :4, :5)"
+    stand_in.add_dml(sql)
+    rowcount = benchmark(_executemany, perf_conn, sql, df)
+    assert rowcount == NUM_ROWS
@@ -0,0 +1,143 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+
+"""
+P1200 - Module for measuring the performance of fetching data frames.
+"""
+
+import array
+import datetime
+import decimal
+
+import oracledb
+from stand_in_server import Column
+
+NUM_ROWS = 10000
+ARRAY_SIZE = 1000
+
+
+def _add_query(stand_in):
+    """
+    Registers a query returning columns of all of the types that are commonly
+    fetched into data frames and returns the SQL for the query.
+    """
+    sql = "select * from perf_data_frame"
+    columns = [
+        Column("INT_VAL", oracledb.DB_TYPE_NUMBER, precision=9, scale=0),
+        Column("NUM_VAL", oracledb.DB_TYPE_NUMBER),
+        Column("DEC_VAL", oracledb.DB_TYPE_NUMBER, precision=15, scale=2),
+        Column("STR_VAL", oracledb.DB_TYPE_VARCHAR, size=30),
+        Column("DATE_VAL", oracledb.DB_TYPE_DATE),
+        Column("TS_VAL", oracledb.DB_TYPE_TIMESTAMP, scale=6),
+        Column("DOUBLE_VAL", oracledb.DB_TYPE_BINARY_DOUBLE),
+        Column("RAW_VAL", oracledb.DB_TYPE_RAW, size=16),
+        Column("BOOL_VAL", oracledb.DB_TYPE_BOOLEAN),
+    ]
+    base_date = datetime.datetime(2000, 1, 1)
+    rows = [
+        (
+            i,
+            i / 8,
+            decimal.Decimal(i * 7919) / 100,
+            f"String value {i}" if i % 10 else None,
+            base_date + datetime.timedelta(minutes=i),
+            base_date + datetime.timedelta(seconds=i, microseconds=i),
+            i / 7,
+            i.to_bytes(4, "big") * 4,
+            i % 3 == 0,
+        )
+        for i in range(NUM_ROWS)
+    ]
+    stand_in.add_query(sql, columns, rows)
+    return sql
+
+
+def test_perf_1200(benchmark, stand_in, perf_conn):
+    "P1200 - fetch_df_all()"
+    sql = _add_query(stand_in)
+    df = benchmark(perf_conn.fetch_df_all, sql, arraysize=ARRAY_SIZE)
+    assert df.num_rows() == NUM_ROWS
+
+
+def test_perf_1201(benchmark, stand_in, perf_conn):
+    "P1201 - fetch_df_all() with decimals"
+    sql = _add_query(stand_in)
+    df = benchmark(
+        perf_conn.fetch_df_all,
+        sql,
+        arraysize=ARRAY_SIZE,
+        fetch_decimals=True,
+    )
+    assert df.num_rows() == NUM_ROWS
+
+
+def test_perf_1202(benchmark, stand_in, perf_conn):
+    "P1202 - fetch_df_batches()"
+
+    def fetch_batches(conn, sql):
+        return list(conn.fetch_df_batches(sql, size=ARRAY_SIZE))
+
+    sql = _add_query(stand_in)
+    batches = benchmark(fetch_batches, perf_conn, sql)
+    assert sum(b.num_rows() for b in batches) == NUM_ROWS
+
+
+def test_perf_1203(benchmark, stand_in, perf_conn):
+    "P1203 - fetch_into() with numeric and date columns"
+
+    def fetch_into(conn, sql, buffers, null_masks):
+        return sum(
+            conn.fetch_into(
+                sql, buffers, null_masks=null_masks, arraysize=ARRAY_SIZE
+            )
+        )
+
+    sql = "select * from perf_numeric_data"
+    columns = [
+        Column("INT_VAL", oracledb.DB_TYPE_NUMBER, precision=9, scale=0),
+        Column("NUM_VAL", oracledb.DB_TYPE_NUMBER),
+        Column("DATE_VAL", oracledb.DB_TYPE_DATE),
+        Column("DOUBLE_VAL", oracledb.DB_TYPE_BINARY_DOUBLE),
+    ]
+    base_date = datetime.datetime(2000, 1, 1)
+    rows = [
+        (
+            i,
+            i / 8 if i % 10 else None,
+            base_date + datetime.timedelta(minutes=i),
+            i / 7,
+        )
+        for i in range(NUM_ROWS)
+    ]
+    stand_in.add_query(sql, columns, rows)
+    buffers = [
+        array.array("q", bytes(NUM_ROWS * 8)),
+        array.array("d", bytes(NUM_ROWS * 8)),
+        array.array("q", bytes(NUM_ROWS * 8)),
+        array.array("d", bytes(NUM_ROWS * 8)),
+    ]
+    null_masks = [None, bytearray(NUM_ROWS), None, None]
+    num_rows = benchmark(fetch_into, perf_conn, sql, buffers, null_masks)
+    assert num_rows == NUM_ROWS
@@ -0,0 +1,115 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+
+"""
+P1300 - Module for measuring the performance of direct path loads.
+"""
+
+import datetime
+import decimal
+
+import oracledb
+import pyarrow
+from stand_in_server import Column
+
+NUM_ROWS = 10000
+SCHEMA_NAME = "PERF"
+TABLE_NAME = "PERF_DIRECT_PATH"
+COLUMNS = [
+    Column("INT_VAL", oracledb.DB_TYPE_NUMBER, precision=9, scale=0),
+    Column("DEC_VAL", oracledb.DB_TYPE_NUMBER, precision=15, scale=2),
+    Column("STR_VAL", oracledb.DB_TYPE_VARCHAR, size=30),
+    Column("DATE_VAL", oracledb.DB_TYPE_DATE),
+    Column("TS_VAL", oracledb.DB_TYPE_TIMESTAMP, scale=6),
+    Column("DOUBLE_VAL", oracledb.DB_TYPE_BINARY_DOUBLE),
+    Column("RAW_VAL", oracledb.DB_TYPE_RAW, size=16),
+]
+COLUMN_NAMES = [c.name for c in COLUMNS]
+
+
+def _get_rows():
+    base_date = datetime.datetime(2000, 1, 1)
+    return [
+        (
+            i,
+            decimal.Decimal(i * 7919) / 100,
+            f"String value {i}",
+            base_date + datetime.timedelta(minutes=i),
+            base_date + datetime.timedelta(seconds=i, microseconds=i),
+            i / 7,
+            i.to_bytes(4, "big") * 4,
+        )
+        for i in range(NUM_ROWS)
+    ]
+
+
+def test_perf_1300(benchmark, stand_in, perf_conn):
+    "P1300 - direct_path_load() with a list of tuples"
+    stand_in.add_table(SCHEMA_NAME, TABLE_NAME, COLUMNS)
+    benchmark(
+        perf_conn.direct_path_load,
+        SCHEMA_NAME,
+        TABLE_NAME,
+        COLUMN_NAMES,
+        _get_rows(),
+    )
+
+
+def test_perf_1301(benchmark, stand_in, perf_conn):
+    "P1301 - direct_path_load() with a PyArrow table"
+    stand_in.add_table(SCHEMA_NAME, TABLE_NAME, COLUMNS)
+    columns = list(zip(*_get_rows()))
+    table = pyarrow.table(
+        [
+            pyarrow.array(columns[0], pyarrow.int64()),
+            pyarrow.array(columns[1], pyarrow.decimal128(15, 2)),
+            pyarrow.array(columns[2], pyarrow.string()),
+            pyarrow.array(columns[3], pyarrow.timestamp("s")),
+            pyarrow.array(columns[4], pyarrow.timestamp("us")),
+            pyarrow.array(columns[5], pyarrow.float64()),
+            pyarrow.array(columns[6], pyarrow.binary()),
+        ],
+        names=COLUMN_NAMES,
+    )
+    benchmark(
+        perf_conn.direct_path_load,
+        SCHEMA_NAME,
+        TABLE_NAME,
+        COLUMN_NAMES,
+        table,
+    )
+
+
+def test_perf_1302(benchmark, stand_in, perf_conn):
+    "P1302 - direct_path_load() in batches"
+    stand_in.add_table(SCHEMA_NAME, TABLE_NAME, COLUMNS)
+    benchmark(
+        perf_conn.direct_path_load,
+        SCHEMA_NAME,
+        TABLE_NAME,
+        COLUMN_NAMES,
+        _get_rows(),
+        batch_size=1000,
+    )
@@ -0,0 +1,120 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+
+"""
+P1400 - Module for measuring the performance of encoding and decoding OSON.
+"""
+
+import datetime
+
+import oracledb
+from stand_in_server import Column
+
+NUM_ROWS = 1000
+NUM_ITERS = 100
+
+
+def _get_document(i):
+    return {
+        "id": i,
+        "name": f"Document {i}",
+        "price": i / 8,
+        "active": i % 2 == 0,
+        "created": datetime.datetime(2000, 1, 1) + datetime.timedelta(days=i),
+        "tags": ["alpha", "beta", "gamma", f"tag {i}"],
+        "dimensions": {"height": 10.5, "width": i, "depth": None},
+        "items": [
+            {"sku": f"SKU-{i}-{j}", "quantity": j, "discount": j / 100}
+            for j in range(10)
+        ],
+    }
+
+
+def test_perf_1400(benchmark, perf_conn):
+    "P1400 - encode OSON"
+
+    def encode_all(conn, docs):
+        return [conn.encode_oson(doc) for doc in docs]
+
+    docs = [_get_document(i) for i in range(NUM_ITERS)]
+    benchmark(encode_all, perf_conn, docs)
+
+
+def test_perf_1401(benchmark, perf_conn):
+    "P1401 - decode OSON"
+
+    def decode_all(conn, images):
+        return [conn.decode_oson(image) for image in images]
+
+    images = [
+        perf_conn.encode_oson(_get_document(i)) for i in range(NUM_ITERS)
+    ]
+    docs = benchmark(decode_all, perf_conn, images)
+    assert docs[1]["id"] == 1
+
+
+def test_perf_1402(benchmark, stand_in, perf_conn):
+    "P1402 - fetch JSON"
+
+    def fetch_all(conn, sql):
+        with conn.cursor() as cursor:
+            cursor.arraysize = 100
+            cursor.execute(sql)
+            return cursor.fetchall()
+
+    sql = "select * from perf_json"
+    images = [perf_conn.encode_oson(_get_document(i)) for i in range(NUM_ROWS)]
+    columns = [Column("JSON_VAL", oracledb.DB_TYPE_JSON)]
+    stand_in.add_query(sql, columns, [(image,) for image in images])
+    rows = benchmark(fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1403(benchmark, stand_in, perf_conn):
+    "P1403 - executemany() with JSON binds"
+
+    def executemany(conn, sql, rows):
+        with conn.cursor() as cursor:
+            cursor.setinputsizes(oracledb.DB_TYPE_JSON)
+            cursor.executemany(sql, rows)
+
+    sql = "insert into perf_json values (:1)"
+    stand_in.add_dml(sql)
+    rows = [(_get_document(i),) for i in range(NUM_ROWS)]
+    benchmark(executemany, perf_conn, sql, rows)
+
+
+def test_perf_1404(benchmark, perf_conn):
+    "P1404 - decode OSON with paths"
+
+    def decode_all(conn, images, paths):
+        return [conn.decode_oson(image, paths) for image in images]
+
+    images = [
+        perf_conn.encode_oson(_get_document(i)) for i in range(NUM_ITERS)
+    ]
+    paths = ["id", "$.items[9].sku"]
+    values = benchmark(decode_all, perf_conn, images, paths)
+    assert values[1] == [1, "SKU-1-9"]
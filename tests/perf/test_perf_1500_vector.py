@@ -0,0 +1,132 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+
+"""
+P1500 - Module for measuring the performance of encoding and decoding
+vectors.
+"""
+
+import array
+
+import oracledb
+import pyarrow
+from stand_in_server import Column
+
+NUM_ROWS = 1000
+NUM_DIMENSIONS = 128
+
+
+def _add_query(stand_in, typecode, vector_format):
+    """
+    Registers a query returning vectors of the given format and returns the
+    SQL for the query.
+    """
+    sql = f"select * from perf_vector_{typecode}"
+    columns = [
+        Column("ID", oracledb.DB_TYPE_NUMBER, precision=9, scale=0),
+        Column(
+            "VECTOR_VAL",
+            oracledb.DB_TYPE_VECTOR,
+            vector_dimensions=NUM_DIMENSIONS,
+            vector_format=vector_format,
+        ),
+    ]
+    rows = [(i, _get_vector(i, typecode)) for i in range(NUM_ROWS)]
+    stand_in.add_query(sql, columns, rows)
+    return sql
+
+
+def _fetch_all(conn, sql):
+    with conn.cursor() as cursor:
+        cursor.arraysize = 100
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+def _get_vector(i, typecode):
+    if typecode == "b":
+        values = [(i + j) % 256 - 128 for j in range(NUM_DIMENSIONS)]
+    else:
+        values = [(i + j) / 64 for j in range(NUM_DIMENSIONS)]
+    return array.array(typecode, values)
+
+
+def test_perf_1500(benchmark, stand_in, perf_conn):
+    "P1500 - fetch float32 vectors"
+    sql = _add_query(stand_in, "f", oracledb.VECTOR_FORMAT_FLOAT32)
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1501(benchmark, stand_in, perf_conn):
+    "P1501 - fetch float64 vectors"
+    sql = _add_query(stand_in, "d", oracledb.VECTOR_FORMAT_FLOAT64)
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1502(benchmark, stand_in, perf_conn):
+    "P1502 - fetch int8 vectors"
+    sql = _add_query(stand_in, "b", oracledb.VECTOR_FORMAT_INT8)
+    rows = benchmark(_fetch_all, perf_conn, sql)
+    assert len(rows) == NUM_ROWS
+
+
+def test_perf_1503(benchmark, stand_in, perf_conn):
+    "P1503 - fetch float32 vectors with fetch_df_all()"
+    sql = _add_query(stand_in, "f", oracledb.VECTOR_FORMAT_FLOAT32)
+    df = benchmark(perf_conn.fetch_df_all, sql, arraysize=100)
+    assert df.num_rows() == NUM_ROWS
+
+
+def test_perf_1504(benchmark, stand_in, perf_conn):
+    "P1504 - executemany() with float32 vector binds"
+
+    def executemany(conn, sql, rows):
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, rows)
+
+    sql = "insert into perf_vector values (:1, :2)"
+    stand_in.add_dml(sql)
+    rows = [(i, _get_vector(i, "f")) for i in range(NUM_ROWS)]
+    benchmark(executemany, perf_conn, sql, rows)
+
+
+def test_perf_1505(benchmark, stand_in, perf_conn):
+    "P1505 - fetch float32 vectors with fetch_df_all() as a fixed size list"
+    sql = _add_query(stand_in, "f", oracledb.VECTOR_FORMAT_FLOAT32)
+    requested_schema = pyarrow.schema(
+        [
+            ("ID", pyarrow.int64()),
+            ("VECTOR_VAL", pyarrow.list_(pyarrow.float32(), NUM_DIMENSIONS)),
+        ]
+    )
+    df = benchmark(
+        perf_conn.fetch_df_all,
+        sql,
+        arraysize=100,
+        requested_schema=requested_schema,
+    )
+    assert df.num_rows() == NUM_ROWS
@@ -0,0 +1,76 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+
+"""
+P1600 - Module for measuring the performance of round trips with asyncio.
+"""
+
+import asyncio
+
+import oracledb
+from stand_in_server import Column
+
+NUM_ITERS = 1000
+
+
+def _run_with_connection(benchmark, stand_in, func, *args):
+    """
+    Creates an event loop and an asynchronous connection to the stand-in
+    server and benchmarks the given coroutine function with them.
+    """
+    loop = asyncio.new_event_loop()
+    conn = loop.run_until_complete(stand_in.connect_async())
+    try:
+        return benchmark(lambda: loop.run_until_complete(func(conn, *args)))
+    finally:
+        loop.run_until_complete(conn.close())
+        loop.close()
+
+
+def test_perf_1600(benchmark, stand_in):
+    "P1600 - ping with asyncio"
+
+    async def ping_all(conn):
+        for i in range(NUM_ITERS):
+            await conn.ping()
+
+    _run_with_connection(benchmark, stand_in, ping_all)
+
+
+def test_perf_1601(benchmark, stand_in):
+    "P1601 - execute single row queries with asyncio"
+
+    async def query_all(conn, sql):
+        with conn.cursor() as cursor:
+            for i in range(NUM_ITERS):
+                await cursor.execute(sql)
+                row = await cursor.fetchone()
+        return row
+
+    sql = "select * from perf_async_single_row"
+    columns = [Column("ID", oracledb.DB_TYPE_NUMBER, precision=9, scale=0)]
+    stand_in.add_query(sql, columns, [(1,)])
+    row = _run_with_connection(benchmark, stand_in, query_all, sql)
+    assert row == (1,)
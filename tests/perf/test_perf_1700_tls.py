@@ -0,0 +1,58 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+
+"""
+P1700 - Module for measuring the performance of establishing connections that
+use TLS.
+"""
+
+import asyncio
+
+NUM_CONNECTIONS = 20
+
+
+def test_perf_1700(benchmark, tls_stand_in):
+    "P1700 - connect and close with TLS"
+
+    def connect_all():
+        for i in range(NUM_CONNECTIONS):
+            tls_stand_in.connect().close()
+
+    benchmark(connect_all)
+
+
+def test_perf_1701(benchmark, tls_stand_in):
+    "P1701 - connect and close with TLS and asyncio"
+
+    async def connect_all():
+        for i in range(NUM_CONNECTIONS):
+            conn = await tls_stand_in.connect_async()
+            await conn.close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(lambda: loop.run_until_complete(connect_all()))
+    finally:
+        loop.close()
@@ -0,0 +1,110 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+"""
+P1800 - Module for measuring the performance of creating subscriptions and
+receiving the notifications sent for them.
+"""
+
+import asyncio
+import threading
+
+NUM_NOTIFICATIONS = 1000
+NUM_SUBSCRIPTIONS = 10
+
+
+def test_perf_1800(benchmark, perf_conn):
+    "P1800 - subscribe and unsubscribe with a shared listener"
+
+    def subscribe_all():
+        subscrs = [
+            perf_conn.subscribe(callback=lambda m: None, client_initiated=True)
+            for i in range(NUM_SUBSCRIPTIONS)
+        ]
+        for subscr in subscrs:
+            perf_conn.unsubscribe(subscr)
+
+    benchmark(subscribe_all)
+
+
+def test_perf_1801(benchmark, perf_conn, stand_in):
+    "P1801 - receive notifications with callbacks"
+    event = threading.Event()
+    counts = {}
+
+    def callback(message):
+        counts[message.subscription.id] += 1
+        if sum(counts.values()) == NUM_NOTIFICATIONS:
+            event.set()
+
+    subscrs = [
+        perf_conn.subscribe(callback=callback, client_initiated=True)
+        for i in range(NUM_SUBSCRIPTIONS)
+    ]
+
+    def notify_all():
+        event.clear()
+        for subscr in subscrs:
+            counts[subscr.id] = 0
+        for i in range(NUM_NOTIFICATIONS):
+            subscr = subscrs[i % NUM_SUBSCRIPTIONS]
+            stand_in.notify(subscr.id, "TESTTEMPTABLE")
+        assert event.wait(10)
+
+    try:
+        benchmark(notify_all)
+    finally:
+        for subscr in subscrs:
+            perf_conn.unsubscribe(subscr)
+
+
+def test_perf_1802(benchmark, stand_in):
+    "P1802 - receive notifications by iterating with asyncio"
+
+    async def receive_all(subscr):
+        num_received = 0
+        async for message in subscr:
+            num_received += 1
+            if num_received == NUM_NOTIFICATIONS:
+                break
+
+    async def notify_all(subscr):
+        task = asyncio.create_task(receive_all(subscr))
+        await asyncio.to_thread(
+            lambda: [
+                stand_in.notify(subscr.id, "TESTTEMPTABLE")
+                for i in range(NUM_NOTIFICATIONS)
+            ]
+        )
+        await asyncio.wait_for(task, 10)
+
+    loop = asyncio.new_event_loop()
+    try:
+        conn = loop.run_until_complete(stand_in.connect_async())
+        subscr = loop.run_until_complete(conn.subscribe())
+        benchmark(lambda: loop.run_until_complete(notify_all(subscr)))
+        loop.run_until_complete(conn.unsubscribe(subscr))
+        loop.run_until_complete(conn.close())
+    finally:
+        loop.close()
@@ -0,0 +1,125 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+"""
+P1900 - Module for measuring the performance of SODA in thin mode.
+"""
+
+import json
+
+import oracledb
+import pytest
+from stand_in_server import Column
+
+NUM_DOCS = 1000
+
+METADATA = {
+    "schemaName": "PERF",
+    "tableName": "PERF_SODA",
+    "keyColumn": {
+        "name": "ID",
+        "sqlType": "VARCHAR2",
+        "maxLength": 255,
+        "assignmentMethod": "UUID",
+    },
+    "contentColumn": {"name": "JSON_DOCUMENT", "sqlType": "JSON"},
+    "versionColumn": {"name": "VERSION", "method": "UUID"},
+    "lastModifiedColumn": {"name": "LAST_MODIFIED"},
+    "creationTimeColumn": {"name": "CREATED_ON"},
+    "readOnly": False,
+}
+
+TIMESTAMP_FORMAT = """'YYYY-MM-DD"T"HH24:MI:SS.FF6"Z"'"""
+
+
+def _get_document(i):
+    return {
+        "id": i,
+        "name": f"Document {i}",
+        "price": i / 8,
+        "tags": ["alpha", "beta", f"tag {i}"],
+    }
+
+
+@pytest.fixture
+def perf_soda_coll(stand_in, perf_conn):
+    sql = (
+        "select json_descriptor\n"
+        "        from user_soda_collections\n"
+        "        where uri_name = :name"
+    )
+    columns = [Column("JSON_DESCRIPTOR", oracledb.DB_TYPE_VARCHAR, size=4000)]
+    stand_in.add_query(sql, columns, [(json.dumps(METADATA),)])
+    return perf_conn.getSodaDatabase().openCollection("PerfSoda")
+
+
+def test_perf_1900(benchmark, stand_in, perf_soda_coll):
+    "P1900 - SODA insertMany()"
+    sql = (
+        'insert into "PERF"."PERF_SODA" '
+        '("ID", "JSON_DOCUMENT", "VERSION", "LAST_MODIFIED", "CREATED_ON")\n'
+        "values (:key, :content, :version, sys_extract_utc(systimestamp), "
+        "sys_extract_utc(systimestamp))"
+    )
+    stand_in.add_dml(sql)
+    docs = [_get_document(i) for i in range(NUM_DOCS)]
+    benchmark(perf_soda_coll.insertMany, docs)
+
+
+def test_perf_1901(benchmark, stand_in, perf_conn, perf_soda_coll):
+    "P1901 - SODA getCursor()"
+
+    def fetch_all(coll):
+        return [d.getContent() for d in coll.find().getCursor()]
+
+    timestamp = "2026-01-01T00:00:00.000000Z"
+    sql = (
+        f'select "ID", "JSON_DOCUMENT", to_char("VERSION"), '
+        f'to_char("LAST_MODIFIED", {TIMESTAMP_FORMAT}), '
+        f'to_char("CREATED_ON", {TIMESTAMP_FORMAT}), null\n'
+        'from "PERF"."PERF_SODA"'
+    )
+    columns = [
+        Column("ID", oracledb.DB_TYPE_VARCHAR, size=255),
+        Column("JSON_DOCUMENT", oracledb.DB_TYPE_JSON),
+        Column("VERSION", oracledb.DB_TYPE_VARCHAR, size=255),
+        Column("LAST_MODIFIED", oracledb.DB_TYPE_VARCHAR, size=40),
+        Column("CREATED_ON", oracledb.DB_TYPE_VARCHAR, size=40),
+        Column("MEDIA_TYPE", oracledb.DB_TYPE_VARCHAR, size=255),
+    ]
+    rows = [
+        (
+            f"{i:032X}",
+            perf_conn.encode_oson(_get_document(i)),
+            f"{i:032X}",
+            timestamp,
+            timestamp,
+            None,
+        )
+        for i in range(NUM_DOCS)
+    ]
+    stand_in.add_query(sql, columns, rows)
+    contents = benchmark(fetch_all, perf_soda_coll)
+    assert len(contents) == NUM_DOCS
+    assert contents[1]["name"] == "Document 1"
@@ -0,0 +1,212 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+"""
+10000 - Module for testing Simple Oracle Document Access (SODA) with asyncio
+"""
+
+import oracledb
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def module_checks(anyio_backend, skip_unless_thin_mode):
+    pass
+
+
+def _normalize_docs(docs):
+    """
+    Remove the embedded OID added in Oracle Database version 23, if found,
+    in order to ease comparison.
+    """
+    for doc in docs:
+        if doc is not None and "_id" in doc:
+            del doc["_id"]
+
+
+async def _get_contents(op):
+    """
+    Returns the normalized content of the documents matching the operation.
+    """
+    contents = [d.getContent() for d in await op.getDocuments()]
+    _normalize_docs(contents)
+    return contents
+
+
+async def test_10000(async_soda_db):
+    "10000 - test creating, opening and dropping collections"
+    names = ["TestAsyncSodaA", "TestAsyncSodaB"]
+    for name in names:
+        coll = await async_soda_db.createCollection(name)
+        assert isinstance(coll, oracledb.AsyncSodaCollection)
+        assert coll.name == name
+    assert await async_soda_db.getCollectionNames() == names
+    assert await async_soda_db.getCollectionNames(limit=1) == names[:1]
+    assert await async_soda_db.getCollectionNames(names[1]) == names[1:]
+    coll = await async_soda_db.openCollection(names[0])
+    assert (
+        coll.metadata
+        == (await async_soda_db.openCollection(names[0])).metadata
+    )
+    assert await coll.drop()
+    assert not await coll.drop()
+    assert await async_soda_db.openCollection(names[0]) is None
+
+
+async def test_10001(async_soda_db, async_conn):
+    "10001 - test inserting and fetching a single document"
+    coll = await async_soda_db.createCollection("TestAsyncSodaInsertOne")
+    content = {"name": "George", "age": 47}
+    doc = await coll.insertOneAndGet(content)
+    assert doc.key is not None
+    assert doc.version is not None
+    await async_conn.commit()
+    fetched_doc = await coll.find().key(doc.key).getOne()
+    assert fetched_doc.key == doc.key
+    assert fetched_doc.version == doc.version
+    fetched_content = fetched_doc.getContent()
+    _normalize_docs([fetched_content])
+    assert fetched_content == content
+    assert await coll.find().key("UNKNOWN").getOne() is None
+    await coll.drop()
+
+
+async def test_10002(async_soda_db, async_conn):
+    "10002 - test inserting many documents"
+    coll = await async_soda_db.createCollection("TestAsyncSodaInsertMany")
+    contents = [{"name": f"Name {i}", "value": i} for i in range(250)]
+    await coll.insertMany(contents)
+    await async_conn.commit()
+    assert await coll.find().count() == len(contents)
+    docs = await coll.insertManyAndGet(contents[:5])
+    assert len(docs) == 5
+    assert len(set(d.key for d in docs)) == 5
+    await async_conn.commit()
+    assert await coll.find().keys([d.key for d in docs]).count() == 5
+    await coll.drop()
+
+
+async def test_10003(async_soda_db, async_conn):
+    "10003 - test filtering, ordering, skipping and limiting documents"
+    coll = await async_soda_db.createCollection("TestAsyncSodaFilter")
+    await coll.insertMany(
+        [{"name": f"Name {i:02}", "value": i} for i in range(20)]
+    )
+    await async_conn.commit()
+    filter_spec = {
+        "value": {"$gte": 5, "$lt": 15},
+        "$orderby": [{"path": "value", "datatype": "number", "order": "desc"}],
+    }
+    op = coll.find().filter(filter_spec)
+    assert await op.count() == 10
+    values = [c["value"] for c in await _get_contents(op)]
+    assert values == list(range(14, 4, -1))
+    op = coll.find().filter(filter_spec).skip(2).limit(3)
+    values = [c["value"] for c in await _get_contents(op)]
+    assert values == [12, 11, 10]
+    op = coll.find().filter({"value": {"$in": [1, 3, 99]}})
+    assert await op.count() == 2
+    op = coll.find().filter({"name": {"$startsWith": "Name 1"}})
+    assert await op.count() == 10
+    op = coll.find().filter({"$or": [{"value": 1}, {"name": "Name 02"}]})
+    assert await op.count() == 2
+    await coll.drop()
+
+
+async def test_10004(async_soda_db, async_conn):
+    "10004 - test iterating over a SODA document cursor"
+    coll = await async_soda_db.createCollection("TestAsyncSodaCursor")
+    await coll.insertMany([{"value": i} for i in range(35)])
+    await async_conn.commit()
+    cursor = await coll.find().fetchArraySize(10).getCursor()
+    assert isinstance(cursor, oracledb.AsyncSodaDocCursor)
+    values = [d.getContent()["value"] async for d in cursor]
+    assert sorted(values) == list(range(35))
+    cursor.close()
+    await coll.drop()
+
+
+async def test_10005(async_soda_db, async_conn):
+    "10005 - test replacing a document"
+    coll = await async_soda_db.createCollection("TestAsyncSodaReplace")
+    doc = await coll.insertOneAndGet({"value": 1})
+    await async_conn.commit()
+    assert await coll.find().key(doc.key).replaceOne({"value": 2})
+    replaced_doc = (
+        await coll.find().key(doc.key).replaceOneAndGet({"value": 3})
+    )
+    assert replaced_doc.key == doc.key
+    assert replaced_doc.version != doc.version
+    content = (await coll.find().key(doc.key).getOne()).getContent()
+    assert content["value"] == 3
+    assert not await coll.find().key("UNKNOWN").replaceOne({"value": 4})
+    await coll.drop()
+
+
+async def test_10006(async_soda_db, async_conn):
+    "10006 - test removing documents and truncating a collection"
+    coll = await async_soda_db.createCollection("TestAsyncSodaRemove")
+    await coll.insertMany([{"value": i} for i in range(10)])
+    await async_conn.commit()
+    assert await coll.find().filter({"value": {"$lt": 4}}).remove() == 4
+    assert await coll.find().count() == 6
+    await coll.truncate()
+    assert await coll.find().count() == 0
+    await coll.drop()
+
+
+async def test_10007(async_soda_db, test_env):
+    "10007 - test invalid operations"
+    coll = await async_soda_db.createCollection("TestAsyncSodaInvalid")
+    with test_env.assert_raises_full_code("DPY-2087"):
+        await coll.find().limit(5).count()
+    with test_env.assert_raises_full_code("DPY-2088"):
+        await coll.find().replaceOne({"value": 1})
+    with test_env.assert_raises_full_code("DPY-2090"):
+        await coll.insertMany([])
+    with test_env.assert_raises_full_code("DPY-2086"):
+        await coll.find().filter("{not json").getOne()
+    with test_env.assert_raises_full_code("DPY-3044"):
+        await coll.find().filter({"value": {"$near": 1}}).getOne()
+    with test_env.assert_raises_full_code("DPY-2091"):
+        await coll.insertOneAndGet({"value": 1}, hint="MONITOR **// x")
+    await coll.drop()
+
+
+async def test_10008(async_soda_db, async_conn):
+    "10008 - test creating documents with non-JSON content"
+    doc = async_soda_db.createDocument({"name": "John"}, key="ABC")
+    assert doc.key == "ABC"
+    assert doc.getContent() == {"name": "John"}
+    doc = async_soda_db.createDocument(b'{"name": "Jane"}')
+    assert doc.getContent() == {"name": "Jane"}
+    assert doc.getContentAsString() == '{"name": "Jane"}'
+    coll = await async_soda_db.createCollection("TestAsyncSodaDocs")
+    doc = await coll.insertOneAndGet(doc)
+    await async_conn.commit()
+    fetched_doc = await coll.find().key(doc.key).getOne()
+    content = fetched_doc.getContent()
+    _normalize_docs([content])
+    assert content == {"name": "Jane"}
+    await coll.drop()
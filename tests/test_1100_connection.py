@@ -1015,3 +1015,32 @@ def test_1164(conn, cursor):
     conn.clear_app_context(namespace)
     cursor.execute(None, namespace=namespace)
     assert cursor.fetchone() == (None, None)
+
+
+def test_1165(skip_unless_thin_mode, test_env):
+    "1165 - test statement cache statistics"
+    conn = test_env.get_connection(stmtcachesize=2)
+    cursor = conn.cursor()
+    sqls = [f"select {i} from dual" for i in range(3)]
+    for sql in sqls + sqls:
+        cursor.execute(sql)
+    cursor.execute(sqls[1])
+    expected_stats = dict(
+        hits=1, misses=6, evictions=4, parses=6, size=2, max_size=2
+    )
+    assert conn.get_statement_cache_stats() == expected_stats
+
+
+def test_1166(skip_unless_thin_mode, test_env):
+    "1166 - test adaptive statement cache grows when statements are evicted"
+    conn = test_env.get_connection(stmtcachesize=2, adaptive_stmtcache=True)
+    cursor = conn.cursor()
+    sqls = [f"select {i} from dual" for i in range(10)]
+    for i in range(50):
+        for sql in sqls:
+            cursor.execute(sql)
+    stats = conn.get_statement_cache_stats()
+    assert stats["max_size"] > 2
+    assert stats["max_size"] <= max(2, conn.max_open_cursors // 2)
+    assert conn.stmtcachesize == stats["max_size"]
+    assert stats["hits"] > 0
@@ -672,3 +672,53 @@ def test_1941(cursor):
         cursor.execute("select JsonClob from TestJsonCols where IntCol = 1")
         (fetched_value,) = cursor.fetchone()
         assert fetched_value == [4, 5, 6]
+
+
+def test_1942(conn):
+    "1942 - test iterating over the chunks of a LOB"
+    for typ in (
+        oracledb.DB_TYPE_BLOB,
+        oracledb.DB_TYPE_CLOB,
+        oracledb.DB_TYPE_NCLOB,
+    ):
+        value = "".join(chr(ord("A") + i % 26) * 1000 for i in range(100))
+        if typ is oracledb.DB_TYPE_BLOB:
+            value = value.encode()
+        lob = conn.createlob(typ, value)
+        chunks = list(lob.iter_chunks(chunk_size=7000))
+        assert len(chunks) == 15
+        assert chunks[0] == value[:7000]
+        assert value[:0].join(chunks) == value
+        chunks = list(lob.iter_chunks(offset=5001, read_ahead=False))
+        assert value[:0].join(chunks) == value[5000:]
+
+
+def test_1943(conn, test_env):
+    "1943 - test reading, writing and seeking with a LOB stream"
+    lob = conn.createlob(oracledb.DB_TYPE_BLOB, b"0123456789" * 1000)
+    with lob.open_stream(chunk_size=4096) as stream:
+        assert stream.chunk_size == 4096
+        assert stream.lob is lob
+        assert stream.read(5) == b"01234"
+        assert stream.tell() == 5
+        assert stream.seek(-3, 2) == 9997
+        assert stream.read() == b"789"
+        assert stream.read() == b""
+        stream.seek(0)
+        assert stream.write(bytearray(b"abc")) == 3
+        assert stream.write(memoryview(b"defghi")[::2]) == 3
+        assert stream.read(4) == b"6789"
+    assert stream.closed
+    with test_env.assert_raises_full_code("DPY-2081"):
+        stream.read()
+    assert lob.read(1, 12) == b"abcdfh6789" + b"01"
+
+
+def test_1944(conn):
+    "1944 - test writing to a LOB from objects supporting the buffer protocol"
+    lob = conn.createlob(oracledb.DB_TYPE_BLOB)
+    data = bytearray(b"x" * 100000)
+    lob.write(data)
+    lob.write(memoryview(b"abcdef")[1:4], 3)
+    assert lob.size() == 100000
+    assert lob.read(1, 7) == b"xxbcdxx"
@@ -591,3 +591,37 @@ def test_2238(cursor):
     assert len(result) == 3
     assert result[0] == "1"
     assert result[2] == "5"
+
+
+def test_2239(cursor):
+    "2239 - fetch numbers at the boundaries of the integer and float paths"
+    values = [
+        "0",
+        "-1",
+        "99",
+        "-100",
+        "999999999999999999",
+        "-999999999999999999",
+        "1000000000000000000",
+        "9007199254740993",
+        "123456789012345678901234567890",
+        "0.1",
+        "-0.25",
+        "1.5e-22",
+        "1.2345678901234e-9",
+        "123456789012345.6",
+        "12345678901234567.8",
+        "1e22",
+        "1e-23",
+        "-1.7976931348e125",
+    ]
+    for value in values:
+        cursor.execute("select :1 from dual", [decimal.Decimal(value)])
+        (fetched_value,) = cursor.fetchone()
+        expected_value = decimal.Decimal(value)
+        if expected_value == expected_value.to_integral_value():
+            assert isinstance(fetched_value, int)
+            assert fetched_value == int(expected_value)
+        else:
+            assert isinstance(fetched_value, float)
+            assert fetched_value == float(expected_value)
@@ -993,3 +993,46 @@ def test_2349(skip_unless_thin_mode, cursor):
     assert obj.NUMBERVALUE == num_val
     assert obj.XMLVALUE is None
     assert obj.STRINGVALUE == str_val
+
+
+def test_2350(skip_unless_thin_mode, conn, round_trip_checker, test_env):
+    "2350 - test type metadata is shared between connections"
+    oracledb.clear_dbobject_type_cache()
+    with test_env.get_connection() as other_conn:
+        other_obj_type = other_conn.gettype("UDT_OBJECT")
+    obj_type = conn.gettype("UDT_OBJECT")
+    assert round_trip_checker.get_value() == 1
+    assert [a.name for a in obj_type.attributes] == [
+        a.name for a in other_obj_type.attributes
+    ]
+    attr = obj_type.attributes[-2]
+    assert attr.name == "SUBOBJECTVALUE"
+    assert attr.type.name == "UDT_SUBOBJECT"
+
+
+def test_2351(skip_unless_thin_mode, conn, test_env, tmp_path):
+    "2351 - test saving and loading the type metadata cache"
+    file_name = str(tmp_path / "types_2351.json")
+    conn.gettype("UDT_OBJECTARRAY")
+    oracledb.save_dbobject_type_cache(file_name)
+    oracledb.clear_dbobject_type_cache()
+    oracledb.load_dbobject_type_cache(file_name)
+    with test_env.get_connection() as other_conn:
+        obj_type = other_conn.gettype("UDT_OBJECTARRAY")
+        assert obj_type.iscollection
+        assert obj_type.element_type.name == "UDT_SUBOBJECT"
+        sub_obj = obj_type.element_type.newobject()
+        sub_obj.SUBNUMBERVALUE = 2351
+        obj = obj_type.newobject([sub_obj])
+        assert obj.getelement(0).SUBNUMBERVALUE == 2351
+
+
+def test_2352(test_env, tmp_path):
+    "2352 - test loading an invalid type metadata cache file"
+    file_name = tmp_path / "types_2352.json"
+    file_name.write_text('{"format": 0}')
+    with test_env.assert_raises_full_code("DPY-2083"):
+        oracledb.load_dbobject_type_cache(str(file_name))
+    file_name.write_text("not JSON")
+    with test_env.assert_raises_full_code("DPY-2083"):
+        oracledb.load_dbobject_type_cache(str(file_name))
@@ -1186,3 +1186,64 @@ def test_2464(test_env, skip_unless_thin_mode):
     pool.close(force=True)
     t.join()
     conn.close()
+
+
+def test_2465(test_env, skip_unless_thin_mode):
+    "2465 - test acquire wait histograms are kept for each cclass"
+    cclass = "cclass2465"
+    pool = test_env.get_pool(min=1, max=2)
+    assert pool.get_acquire_wait_histograms() == {}
+    with pool.acquire(cclass=cclass):
+        pass
+    with pool.acquire(cclass=cclass):
+        pass
+    with pool.acquire():
+        pass
+    histograms = pool.get_acquire_wait_histograms()
+    assert sum(histograms[cclass].values()) == 2
+    assert sum(sum(h.values()) for h in histograms.values()) == 3
+    bounds = list(histograms[cclass])
+    assert bounds == sorted(bounds)
+    assert bounds[-1] == float("inf")
+    pool.close()
+    with test_env.assert_raises_full_code("DPY-1002"):
+        pool.get_acquire_wait_histograms()
+
+
+def test_2466(test_env, skip_unless_thin_mode):
+    "2466 - test wait_until_ready() with parallel connection creation"
+    pool = test_env.get_pool(min=4, max=6, create_concurrency=3)
+    assert pool.wait_until_ready(timeout=30)
+    assert pool.opened >= 4
+    assert not pool.wait_until_ready(min_open=7, timeout=0.1)
+    pool.close()
+    with test_env.assert_raises_full_code("DPY-1002"):
+        pool.wait_until_ready()
+
+
+def test_2467(test_env, skip_unless_thin_mode):
+    "2467 - test wait_until_ready() raises connection creation errors"
+    pool = test_env.get_pool(
+        min=2, max=2, password="invalid_password", create_concurrency=2
+    )
+    with test_env.assert_raises_full_code("ORA-01017"):
+        pool.wait_until_ready(timeout=30)
+    pool.close(force=True)
+
+
+def test_2468(test_env, skip_unless_thin_mode):
+    "2468 - test statement cache statistics are aggregated by the pool"
+    pool = test_env.get_pool(min=1, max=1, stmtcachesize=2)
+    sqls = [f"select {i} from dual" for i in range(3)]
+    for i in range(2):
+        with pool.acquire() as conn:
+            with conn.cursor() as cursor:
+                for sql in sqls:
+                    cursor.execute(sql)
+            conn_stats = conn.get_statement_cache_stats()
+    expected_stats = dict(
+        (key, conn_stats[key])
+        for key in ("hits", "misses", "evictions", "parses")
+    )
+    assert pool.get_statement_cache_stats() == expected_stats
+    pool.close()
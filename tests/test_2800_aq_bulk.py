@@ -229,3 +229,102 @@ def test_2810(conn, queue):
     props = queue.deqMany(len(data) + 1)
     dequeued_data = [p.payload for p in props]
     assert dequeued_data == data
+
+
+def test_2811(conn, queue):
+    "2811 - test iterating over messages with iter_messages()"
+    messages = [conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA]
+    queue.enqmany(messages)
+    conn.commit()
+    with queue.iter_messages(batch_size=5, wait=oracledb.DEQ_NO_WAIT) as it:
+        data = [message.payload.decode() for message in it]
+        assert it.queue is queue
+    assert it.closed
+    conn.commit()
+    assert data == RAW_PAYLOAD_DATA
+    assert queue.deqoptions.wait == oracledb.DEQ_WAIT_FOREVER
+
+
+def test_2812(conn, queue, test_env):
+    "2812 - test iterating over messages with commit enabled"
+    messages = [conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA]
+    queue.enqmany(messages)
+    conn.commit()
+    it = queue.iter_messages(batch_size=4, wait=0, prefetch=2, commit=True)
+    for i, message in enumerate(it):
+        if i == 5:
+            break
+    it.close()
+    conn.rollback()
+    with test_env.get_connection() as other_conn:
+        other_queue = other_conn.queue(RAW_QUEUE_NAME)
+        other_queue.deqoptions.wait = oracledb.DEQ_NO_WAIT
+        messages = other_queue.deqmany(len(RAW_PAYLOAD_DATA))
+        data = [message.payload.decode() for message in messages]
+        other_conn.commit()
+    assert data == RAW_PAYLOAD_DATA[4:]
+
+
+def test_2813(queue, test_env):
+    "2813 - test errors for invalid values for iter_messages()"
+    with test_env.assert_raises_full_code("DPY-2084"):
+        queue.iter_messages(batch_size=0)
+    with test_env.assert_raises_full_code("DPY-2085"):
+        queue.iter_messages(prefetch=-1)
+
+
+def test_2814(conn, queue):
+    "2814 - test closing iter_messages() returns messages not yet returned"
+    messages = [conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA]
+    queue.enqmany(messages)
+    conn.commit()
+    it = queue.iter_messages(batch_size=2, wait=0, prefetch=2)
+    data = []
+    for message in it:
+        data.append(message.payload.decode())
+        if len(data) == 3:
+            break
+    remaining = it.close()
+    assert it.closed
+    assert it.close() == []
+    data.extend(message.payload.decode() for message in remaining)
+    queue.deqoptions.wait = oracledb.DEQ_NO_WAIT
+    data.extend(m.payload.decode() for m in queue.deqmany(100))
+    conn.commit()
+    assert data == RAW_PAYLOAD_DATA
+
+
+def test_2815(conn, queue):
+    "2815 - test closing iter_messages() keeps all prefetched messages"
+    messages = [conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA]
+    queue.enqmany(messages)
+    conn.commit()
+    it = queue.iter_messages(batch_size=3, wait=0, prefetch=3)
+    data = [next(it).payload.decode()]
+    remaining = it.close()
+    assert len(remaining) == len(RAW_PAYLOAD_DATA) - 1
+    data.extend(message.payload.decode() for message in remaining)
+    queue.deqoptions.wait = oracledb.DEQ_NO_WAIT
+    assert queue.deqmany(100) == []
+    conn.commit()
+    assert data == RAW_PAYLOAD_DATA
+
+
+def test_2816(conn, queue, test_env):
+    "2816 - test breaking out of iter_messages() with prefetch and rollback"
+    messages = [conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA]
+    queue.enqmany(messages)
+    conn.commit()
+    with queue.iter_messages(batch_size=2, wait=0, prefetch=2) as it:
+        for i, message in enumerate(it):
+            if i == 2:
+                break
+    assert it.closed
+    conn.rollback()
+    with test_env.get_connection() as other_conn:
+        other_queue = other_conn.queue(RAW_QUEUE_NAME)
+        other_queue.deqoptions.wait = oracledb.DEQ_NO_WAIT
+        messages = other_queue.deqmany(len(RAW_PAYLOAD_DATA))
+        data = [message.payload.decode() for message in messages]
+        other_conn.commit()
+    assert data == RAW_PAYLOAD_DATA
@@ -421,3 +421,33 @@ def test_3014(skip_unless_has_client_23, test_env):
                 name=f"{single_consumer_queue}:SUBSCRIBER",
                 client_initiated=True,
             )
+
+
+def test_3015(skip_unless_has_client_23, cursor, test_env):
+    "3015 - test multiple subscriptions on the same connection"
+    cursor.execute("truncate table TestTempTable")
+    conn = test_env.get_connection(events=True)
+    data = [DMLSubscriptionData(1) for i in range(3)]
+    subs = [
+        conn.subscribe(
+            callback=d.callback_handler,
+            timeout=10,
+            qos=oracledb.SUBSCR_QOS_ROWIDS,
+            client_initiated=True,
+        )
+        for d in data
+    ]
+    for sub in subs:
+        sub.registerquery("select * from TestTempTable")
+    assert len(set(sub.id for sub in subs)) == len(subs)
+    cursor = conn.cursor()
+    cursor.execute("""
+        insert into TestTempTable (IntCol, StringCol1)
+        values (1, 'test')
+        """)
+    conn.commit()
+    for d in data:
+        d.wait_for_messages()
+        assert d.table_operations == [oracledb.OPCODE_INSERT]
+    for sub in subs:
+        conn.unsubscribe(sub)
@@ -656,7 +656,7 @@ def test_3428(soda_db, conn, round_trip_checker, test_env):
     pytest.raises(TypeError, coll.find().fetchArraySize, -1)
 
 
-def test_3429(soda_db, test_env):
+def test_3429(skip_unless_thick_mode, soda_db, test_env):
     "3429 - test getting indexes on a collection"
     test_env.skip_unless_client_version(19, 13)
     coll = soda_db.createCollection("TestSodaListIndexes")
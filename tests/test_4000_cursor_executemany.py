@@ -538,3 +538,49 @@ def test_4034(conn, cursor):
     )
     output_data = [(e.NUMBERVALUE, e.STRINGVALUE) for e in obj.aslist()]
     assert output_data == data
+
+
+@pytest.mark.parametrize("pipeline_depth", [2, 4, 50])
+def test_4035(pipeline_depth, conn, cursor, empty_tab):
+    "4035 - test executemany() with batches pipelined"
+    rows = [(i + 1, f"String for row {i + 1}") for i in range(200)]
+    cursor.executemany(
+        "insert into TestTempTable (IntCol, StringCol1) values (:1, :2)",
+        rows,
+        batch_size=7,
+        pipeline_depth=pipeline_depth,
+    )
+    conn.commit()
+    cursor.execute(
+        "select IntCol, StringCol1 from TestTempTable order by IntCol"
+    )
+    assert cursor.fetchall() == rows
+
+
+def test_4036(cursor, test_env):
+    "4036 - test executemany with invalid pipeline depths"
+    for pipeline_depth in (0, -1, "not valid"):
+        with test_env.assert_raises_full_code("DPY-2092"):
+            cursor.executemany(
+                "insert into TestTempTable (IntCol) values (:1)",
+                [[1], [2]],
+                batch_size=1,
+                pipeline_depth=pipeline_depth,
+            )
+
+
+def test_4037(cursor, empty_tab, test_env):
+    "4037 - test executemany() with batches pipelined (with exception)"
+    rows = (
+        [(n,) for n in range(1, 13)] + [(5,)] + [(n,) for n in range(14, 31)]
+    )
+    with test_env.assert_raises_full_code("ORA-00001"):
+        cursor.executemany(
+            "insert into TestTempTable (IntCol) values (:1)",
+            rows,
+            batch_size=4,
+            pipeline_depth=3,
+        )
+    cursor.execute("select count(*) from TestTempTable")
+    (count,) = cursor.fetchone()
+    assert count == 12
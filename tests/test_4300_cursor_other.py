@@ -27,6 +27,7 @@
 """
 
 import decimal
+import time
 
 import oracledb
 
@@ -1052,3 +1053,178 @@ def test_4372(cursor):
     cursor.parse("select to_clob('some_value') from dual")
     fetch_info = cursor.description[0]
     assert fetch_info.type is oracledb.DB_TYPE_CLOB
+
+
+def test_4373(test_env):
+    "4373 - test same SQL on multiple connections with different bind types"
+    sql = "select :val || ' ' || :other_val from dual"
+    conn1 = test_env.get_connection()
+    conn2 = test_env.get_connection()
+    cursor1 = conn1.cursor()
+    cursor2 = conn2.cursor()
+    cursor1.execute(sql, val=4373, other_val="first")
+    cursor2.execute(sql, val="4373", other_val=1.5)
+    assert cursor1.bindnames() == ["VAL", "OTHER_VAL"]
+    assert cursor2.bindnames() == ["VAL", "OTHER_VAL"]
+    (value,) = cursor1.fetchone()
+    assert value == "4373 first"
+    cursor1.execute(sql, val=4374, other_val="second")
+    (value,) = cursor1.fetchone()
+    assert value == "4374 second"
+    (value,) = cursor2.fetchone()
+    assert value == "4373 1.5"
+
+
+def test_4374(skip_unless_thin_mode, test_env):
+    "4374 - test query results are returned from the result cache"
+    with test_env.get_connection(result_cache_size=1048576) as conn:
+        cursor = conn.cursor()
+        cursor.execute("truncate table TestTempTable")
+        cursor.execute(
+            "insert into TestTempTable (IntCol, StringCol1) values (1, 'a')"
+        )
+        conn.commit()
+        sql = "select IntCol, StringCol1 from TestTempTable"
+        cursor.result_cache_ttl = 60
+        cursor.execute(sql)
+        assert cursor.fetchall() == [(1, "a")]
+        cursor.execute(
+            "insert into TestTempTable (IntCol, StringCol1) values (2, 'b')"
+        )
+        conn.commit()
+        cursor.execute(sql)
+        assert cursor.fetchall() == [(1, "a")]
+        assert cursor.rowcount == 1
+        assert [i.name for i in cursor.description] == ["INTCOL", "STRINGCOL1"]
+        cache = conn.result_cache
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.num_entries == 1
+        cache.invalidate(sql)
+        assert cache.num_entries == 0
+        assert cache.size == 0
+        cursor.execute(sql)
+        assert cursor.fetchall() == [(1, "a"), (2, "b")]
+
+
+def test_4375(skip_unless_thin_mode, test_env):
+    "4375 - test result cache keys include bind values"
+    with test_env.get_connection(result_cache_size=1048576) as conn:
+        cursor = conn.cursor()
+        cursor.result_cache_ttl = 60
+        sql = "select :1 * 2 from dual"
+        for value in (1, 2, 1):
+            cursor.execute(sql, [value])
+            assert cursor.fetchone() == (value * 2,)
+            assert cursor.fetchone() is None
+        cursor.execute(sql, [cursor.var(int)])
+        cursor.fetchall()
+        assert conn.result_cache.hits == 1
+        assert conn.result_cache.misses == 2
+        assert conn.result_cache.num_entries == 2
+
+
+def test_4376(skip_unless_thin_mode, test_env):
+    "4376 - test result cache is not used without a time to live"
+    with test_env.get_connection(result_cache_size=1048576) as conn:
+        cursor = conn.cursor()
+        assert cursor.result_cache_ttl == 0
+        for i in range(2):
+            cursor.execute("select user from dual")
+            cursor.fetchall()
+        assert conn.result_cache.misses == 0
+        assert conn.result_cache.num_entries == 0
+    with test_env.get_connection() as conn:
+        assert conn.result_cache is None
+
+
+def test_4377(skip_unless_thin_mode, test_env):
+    "4377 - test partially fetched and oversized results are not cached"
+    with test_env.get_connection(result_cache_size=1024) as conn:
+        cursor = conn.cursor()
+        cursor.result_cache_ttl = 60
+        sql = "select level from dual connect by level <= 500"
+        cursor.execute(sql)
+        cursor.fetchmany(5)
+        cursor.execute(sql)
+        assert len(cursor.fetchall()) == 500
+        assert conn.result_cache.num_entries == 0
+        assert conn.result_cache.max_size == 1024
+
+
+def test_4378(skip_unless_thin_mode, test_env):
+    "4378 - test result cache expiry and sharing within a pool"
+    pool = test_env.get_pool(min=2, max=2, result_cache_size=1048576)
+    sql = "select 4378 from dual"
+    with pool.acquire() as conn1, pool.acquire() as conn2:
+        for conn in (conn1, conn2):
+            cursor = conn.cursor()
+            cursor.result_cache_ttl = 1
+            cursor.execute(sql)
+            assert cursor.fetchall() == [(4378,)]
+        assert pool.result_cache.hits == 1
+        time.sleep(1.1)
+        cursor.execute(sql)
+        cursor.fetchall()
+        assert pool.result_cache.misses == 2
+    pool.close()
+
+
+def test_4379(skip_unless_thin_mode, test_env):
+    "4379 - test result cache keys include the types of bind values"
+    with test_env.get_connection(result_cache_size=1048576) as conn:
+        cursor = conn.cursor()
+        cursor.result_cache_ttl = 60
+        sql = "select :value from dual"
+        for value in (1, 1.0, True, decimal.Decimal(1)):
+            cursor.execute(sql, value=value)
+            cursor.fetchall()
+        assert conn.result_cache.hits == 0
+        assert conn.result_cache.misses == 4
+        cursor.execute(sql, value=1.0)
+        cursor.fetchall()
+        assert conn.result_cache.hits == 1
+
+
+def test_4380(skip_unless_thin_mode, test_env):
+    "4380 - test result cache is not used while a transaction is in progress"
+    pool = test_env.get_pool(min=2, max=2, result_cache_size=1048576)
+    sql = "select IntCol from TestTempTable order by IntCol"
+    with pool.acquire() as conn1, pool.acquire() as conn2:
+        cursor = conn1.cursor()
+        cursor.execute("truncate table TestTempTable")
+        cursor.execute("insert into TestTempTable (IntCol) values (1)")
+        cursor.result_cache_ttl = 60
+        cursor.execute(sql)
+        assert cursor.fetchall() == [(1,)]
+        conn1.rollback()
+        assert pool.result_cache.num_entries == 0
+        cursor = conn2.cursor()
+        cursor.result_cache_ttl = 60
+        cursor.execute(sql)
+        assert cursor.fetchall() == []
+        assert pool.result_cache.hits == 0
+    pool.close()
+
+
+def test_4381(skip_unless_thin_mode, test_env):
+    "4381 - test result cache keys include the current schema"
+    user = test_env.main_user.upper()
+    proxy_user = test_env.proxy_user.upper()
+    with test_env.get_connection(result_cache_size=1048576) as conn:
+        cursor = conn.cursor()
+        cursor.result_cache_ttl = 60
+        sql = "select sys_context('userenv', 'current_schema') from dual"
+        cursor.execute(sql)
+        assert cursor.fetchall() == [(user,)]
+        conn.current_schema = proxy_user
+        cursor.execute(sql)
+        assert cursor.fetchall() == [(proxy_user,)]
+        conn.current_schema = user
+        cursor.execute(sql)
+        fetch_vars = cursor.fetchvars
+        assert cursor.fetchall() == [(user,)]
+        cursor.execute(sql)
+        assert cursor.fetchall() == [(user,)]
+        assert conn.result_cache.hits == 1
+        assert cursor.fetchvars[0] is not fetch_vars[0]
@@ -475,6 +475,8 @@ def test_4526():
     _test_writable_parameter("events", True)
     _test_writable_parameter("matchanytag", True)
     _test_writable_parameter("mode", oracledb.AUTH_MODE_SYSDBA)
+    _test_writable_parameter("result_cache_size", 1048576)
+    _test_writable_parameter("adaptive_stmtcache", True)
     _test_writable_parameter("shardingkey", [1, 2, 3])
     _test_writable_parameter("stmtcachesize", 25)
     _test_writable_parameter("supershardingkey", [1, 2, 3])
@@ -705,6 +707,8 @@ def test_4539():
         ("mode", oracledb.AUTH_MODE_SYSDBA),
         ("disable_oob", True),
         ("stmtcachesize", 25),
+        ("result_cache_size", 1048576),
+        ("adaptive_stmtcache", True),
         ("edition", "edition_4"),
         ("tag", "tag4"),
         ("matchanytag", True),
@@ -762,6 +766,8 @@ def test_4539():
         ("mode", oracledb.AUTH_MODE_SYSDGD),
         ("disable_oob", False),
         ("stmtcachesize", 35),
+        ("result_cache_size", 2097152),
+        ("adaptive_stmtcache", False),
         ("edition", "edition_new"),
         ("tag", "tag_new"),
         ("matchanytag", False),
@@ -1156,6 +1162,8 @@ def test_4564():
         ("program", "test_program", "test_program"),
         ("purity", "NEW", oracledb.PURITY_NEW),
         ("retry_count", "5", 5),
+        ("result_cache_size", "65536", 65536),
+        ("adaptive_stmtcache", "true", True),
         ("retry_delay", "3", 3),
         ("sdu", "16384", 16384),
         ("ssl_server_cert_dn", "test_dn", "test_dn"),
@@ -1787,6 +1795,8 @@ def test_4583():
         ("mode", oracledb.AUTH_MODE_SYSDBA),
         ("disable_oob", True),
         ("stmtcachesize", 25),
+        ("result_cache_size", 1048576),
+        ("adaptive_stmtcache", True),
         ("edition", "edition_4"),
         ("tag", "tag4"),
         ("matchanytag", True),
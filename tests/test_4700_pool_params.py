@@ -67,6 +67,7 @@ def test_4700():
     _test_writable_parameter("soda_metadata_cache", True)
     _test_writable_parameter("ping_interval", 20)
     _test_writable_parameter("ping_timeout", 3000)
+    _test_writable_parameter("create_concurrency", 4)
 
 
 def test_4701(test_env):
@@ -86,6 +87,7 @@ def test_4701(test_env):
         ("soda_metadata_cache", False),
         ("ping_interval", 50),
         ("ping_timeout", 2500),
+        ("create_concurrency", 3),
         ("user", test_env.main_user),
         ("proxy_user", test_env.proxy_user),
         ("host", "my_host1"),
@@ -111,6 +113,8 @@ def test_4701(test_env):
         ("mode", oracledb.AUTH_MODE_SYSDBA),
         ("disable_oob", True),
         ("stmtcachesize", 25),
+        ("result_cache_size", 1048576),
+        ("adaptive_stmtcache", True),
         ("edition", "edition_4701"),
         ("tag", "tag4701"),
         ("matchanytag", True),
@@ -156,6 +160,7 @@ def test_4702():
         ("min", "3", 3),
         ("ping_interval", "-1", -1),
         ("ping_timeout", "2500", 2500),
+        ("create_concurrency", "4", 4),
         ("homogeneous", "on", True),
         ("homogeneous", "off", False),
         ("timeout", "3000", 3000),
@@ -195,6 +200,7 @@ class DummyConnection(oracledb.Connection):
         ("soda_metadata_cache", True),
         ("ping_interval", 300),
         ("ping_timeout", 6000),
+        ("create_concurrency", 2),
         ("user", "USER_1"),
         ("proxy_user", "PROXY_USER_1"),
         ("password", "dummy_password"),
@@ -224,6 +230,8 @@ class DummyConnection(oracledb.Connection):
         ("mode", oracledb.AUTH_MODE_SYSDBA),
         ("disable_oob", True),
         ("stmtcachesize", 25),
+        ("result_cache_size", 1048576),
+        ("adaptive_stmtcache", True),
         ("edition", "edition_4"),
         ("tag", "tag4"),
         ("matchanytag", True),
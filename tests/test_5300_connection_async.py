@@ -763,3 +763,38 @@ async def test_5361(async_conn, async_cursor):
     async_conn.clear_app_context(namespace)
     await async_cursor.execute(None, namespace=namespace)
     assert await async_cursor.fetchone() == (None, None)
+
+
+def test_5362(test_env):
+    "5362 - test connecting and executing queries with uvloop"
+    uvloop = pytest.importorskip("uvloop")
+
+    async def main():
+        async with test_env.get_connection_async() as conn:
+            with conn.cursor() as cursor:
+                for i in range(5):
+                    await cursor.execute("select :1 from dual", [i])
+                    assert await cursor.fetchone() == (i,)
+            conn.call_timeout = 5000
+            await conn.ping()
+            await asyncio.gather(*[conn.ping() for i in range(5)])
+
+    loop = uvloop.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+async def test_5363(test_env):
+    "5363 - test statement cache statistics"
+    async with test_env.get_connection_async(stmtcachesize=2) as conn:
+        cursor = conn.cursor()
+        sqls = [f"select {i} from dual" for i in range(3)]
+        for sql in sqls + sqls:
+            await cursor.execute(sql)
+        await cursor.execute(sqls[1])
+        expected_stats = dict(
+            hits=1, misses=6, evictions=4, parses=6, size=2, max_size=2
+        )
+        assert conn.get_statement_cache_stats() == expected_stats
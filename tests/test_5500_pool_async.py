@@ -766,3 +766,44 @@ async def test_5550(test_env):
     conn = await pool.acquire()
     await asyncio.gather(waiter(), pool.close(force=True))
     await conn.close()
+
+
+async def test_5551(test_env):
+    "5551 - test acquire wait histograms are kept for each cclass"
+    cclass = "cclass5551"
+    pool = test_env.get_pool_async(min=1, max=2)
+    assert pool.get_acquire_wait_histograms() == {}
+    async with pool.acquire(cclass=cclass):
+        pass
+    async with pool.acquire(cclass=cclass):
+        pass
+    async with pool.acquire():
+        pass
+    histograms = pool.get_acquire_wait_histograms()
+    assert sum(histograms[cclass].values()) == 2
+    assert sum(sum(h.values()) for h in histograms.values()) == 3
+    bounds = list(histograms[cclass])
+    assert bounds == sorted(bounds)
+    assert bounds[-1] == float("inf")
+    await pool.close()
+
+
+async def test_5552(test_env):
+    "5552 - test wait_until_ready() with parallel connection creation"
+    pool = test_env.get_pool_async(min=4, max=6, create_concurrency=3)
+    assert await pool.wait_until_ready(timeout=30)
+    assert pool.opened >= 4
+    assert not await pool.wait_until_ready(min_open=7, timeout=0.1)
+    await pool.close()
+    with test_env.assert_raises_full_code("DPY-1002"):
+        await pool.wait_until_ready()
+
+
+async def test_5553(test_env):
+    "5553 - test wait_until_ready() raises connection creation errors"
+    pool = test_env.get_pool_async(
+        min=2, max=2, password="invalid_password", create_concurrency=2
+    )
+    with test_env.assert_raises_full_code("ORA-01017"):
+        await pool.wait_until_ready(timeout=30)
+    await pool.close(force=True)
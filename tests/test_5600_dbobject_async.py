@@ -655,3 +655,15 @@ async def test_5619(async_conn, async_cursor):
         assert obj.INNER2 is not None
         assert obj.INNER2.ATTR1 is None
         assert obj.INNER2.ATTR2 == value2
+
+
+async def test_5620(async_conn, round_trip_checker_async, test_env):
+    "5620 - test type metadata is shared between connections"
+    oracledb.clear_dbobject_type_cache()
+    async with test_env.get_connection_async() as other_conn:
+        other_obj_type = await other_conn.gettype("UDT_OBJECT")
+    obj_type = await async_conn.gettype("UDT_OBJECT")
+    assert await round_trip_checker_async.get_value_async() == 1
+    assert [a.name for a in obj_type.attributes] == [
+        a.name for a in other_obj_type.attributes
+    ]
@@ -526,3 +526,44 @@ async def test_5727(async_conn, test_env):
             lob.setfilename("not_relevant", "not_relevant")
         with test_env.assert_raises_full_code("DPY-3026"):
             await lob.fileexists()
+
+
+async def test_5728(async_conn):
+    "5728 - test iterating over the chunks of a LOB"
+    for typ in (
+        oracledb.DB_TYPE_BLOB,
+        oracledb.DB_TYPE_CLOB,
+        oracledb.DB_TYPE_NCLOB,
+    ):
+        value = "".join(chr(ord("A") + i % 26) * 1000 for i in range(100))
+        if typ is oracledb.DB_TYPE_BLOB:
+            value = value.encode()
+        lob = await async_conn.createlob(typ, value)
+        chunks = [c async for c in lob.iter_chunks(chunk_size=7000)]
+        assert len(chunks) == 15
+        assert chunks[0] == value[:7000]
+        assert value[:0].join(chunks) == value
+        chunks = [
+            c async for c in lob.iter_chunks(offset=5001, read_ahead=False)
+        ]
+        assert value[:0].join(chunks) == value[5000:]
+
+
+async def test_5729(async_conn, test_env):
+    "5729 - test reading, writing and seeking with a LOB stream"
+    lob = await async_conn.createlob(
+        oracledb.DB_TYPE_BLOB, b"0123456789" * 1000
+    )
+    async with await lob.open_stream(chunk_size=4096) as stream:
+        assert stream.chunk_size == 4096
+        assert await stream.read(5) == b"01234"
+        assert stream.tell() == 5
+        assert await stream.seek(-3, 2) == 9997
+        assert await stream.read() == b"789"
+        await stream.seek(0)
+        assert await stream.write(bytearray(b"abc")) == 3
+        assert await stream.read(4) == b"3456"
+    assert stream.closed
+    with test_env.assert_raises_full_code("DPY-2081"):
+        await stream.read()
+    assert await lob.read(1, 5) == b"abc34"
@@ -483,3 +483,49 @@ async def test_6130(async_conn, async_cursor):
     )
     output_data = [(e.NUMBERVALUE, e.STRINGVALUE) for e in obj.aslist()]
     assert output_data == data
+
+
+@pytest.mark.parametrize("pipeline_depth", [2, 4, 50])
+async def test_6131(pipeline_depth, async_conn, async_cursor, empty_tab):
+    "6131 - test executemany() with batches pipelined"
+    rows = [(i + 1, f"String for row {i + 1}") for i in range(200)]
+    await async_cursor.executemany(
+        "insert into TestTempTable (IntCol, StringCol1) values (:1, :2)",
+        rows,
+        batch_size=7,
+        pipeline_depth=pipeline_depth,
+    )
+    await async_conn.commit()
+    await async_cursor.execute(
+        "select IntCol, StringCol1 from TestTempTable order by IntCol"
+    )
+    assert await async_cursor.fetchall() == rows
+
+
+async def test_6132(async_cursor, empty_tab, test_env):
+    "6132 - test executemany() with batches pipelined (with exception)"
+    rows = (
+        [(n,) for n in range(1, 13)] + [(5,)] + [(n,) for n in range(14, 31)]
+    )
+    with test_env.assert_raises_full_code("ORA-00001"):
+        await async_cursor.executemany(
+            "insert into TestTempTable (IntCol) values (:1)",
+            rows,
+            batch_size=4,
+            pipeline_depth=3,
+        )
+    await async_cursor.execute("select count(*) from TestTempTable")
+    (count,) = await async_cursor.fetchone()
+    assert count == 12
+
+
+async def test_6133(async_cursor, test_env):
+    "6133 - test executemany with invalid pipeline depths"
+    for pipeline_depth in (0, -1, "not valid"):
+        with test_env.assert_raises_full_code("DPY-2092"):
+            await async_cursor.executemany(
+                "insert into TestTempTable (IntCol) values (:1)",
+                [[1], [2]],
+                batch_size=1,
+                pipeline_depth=pipeline_depth,
+            )
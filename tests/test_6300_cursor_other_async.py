@@ -956,3 +956,19 @@ async def test_6356(async_cursor):
     await async_cursor.parse("select to_clob('some_value') from dual")
     fetch_info = async_cursor.description[0]
     assert fetch_info.type is oracledb.DB_TYPE_CLOB
+
+
+async def test_6357(test_env):
+    "6357 - test query results are returned from the result cache"
+    conn = await test_env.get_connection_async(result_cache_size=1048576)
+    async with conn:
+        cursor = conn.cursor()
+        cursor.result_cache_ttl = 60
+        sql = "select :1 * 2 from dual"
+        for value in (1, 2, 1):
+            await cursor.execute(sql, [value])
+            assert await cursor.fetchall() == [(value * 2,)]
+        assert conn.result_cache.hits == 1
+        assert conn.result_cache.misses == 2
+        conn.result_cache.clear()
+        assert conn.result_cache.num_entries == 0
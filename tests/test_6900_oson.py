@@ -109,3 +109,47 @@ def test_6906(conn, cursor):
     (oson_val,) = cursor.fetchone()
     oson_val = conn.decode_oson(oson_val)
     assert oson_val == value
+
+
+def test_6907(conn):
+    "6907 - test decoding oson with paths"
+    value = dict(
+        id=6907,
+        name="Document 6907",
+        items=[dict(sku="A", qty=1), dict(sku="B", qty=2)],
+        dimensions=dict(height=10.5, width=None),
+    )
+    oson = conn.encode_oson(value)
+    paths = [
+        "id",
+        "$.items[1].sku",
+        ("items", -2, "qty"),
+        "dimensions.width",
+        "$.missing",
+        "$.items[5]",
+        "$",
+    ]
+    expected = [6907, "B", 1, None, None, None, value]
+    assert conn.decode_oson(oson, paths) == expected
+
+
+def test_6908(conn, test_env):
+    "6908 - test decoding oson with invalid paths"
+    oson = conn.encode_oson(dict(id=6908))
+    for path in ["$..id", "items[a]", 5, ("id", 1.5)]:
+        with test_env.assert_raises_full_code("DPY-2082"):
+            conn.decode_oson(oson, [path])
+
+
+def test_6909(conn):
+    "6909 - test encoding values that share the same field names"
+    values = [
+        dict(id=1, name="First", tags=[dict(id=2, name="Tag")]),
+        dict(name="Second", id=3, tags=[]),
+        dict(tags=[dict(name="Tag", id=4)], id=5, name="Third"),
+        dict(id=6, name="Fourth"),
+        dict(id=7, name="Fifth", tags=None),
+    ]
+    for value in values:
+        assert conn.decode_oson(conn.encode_oson(value)) == value
+    assert conn.encode_oson(values[0]) == conn.encode_oson(values[0])
@@ -2058,3 +2058,123 @@ def test_8084(conn, cursor):
     fetched_table = pyarrow.table(ora_df)
     assert fetched_table.field("NUMBERCOL").type == dtype
     assert [v.as_py() for v in fetched_table["NUMBERCOL"]] == expected_values
+
+
+def test_8085(skip_unless_thin_mode, conn):
+    "8085 - test fetch_into() with caller supplied buffers"
+    num_rows = 25
+    int_buf = array.array("q", [0] * 10)
+    float_buf = array.array("d", [0] * 10)
+    null_mask = bytearray(10)
+    fetched = []
+    for n in conn.fetch_into(
+        """
+        select
+            level,
+            case when mod(level, 4) != 0 then level / 4 end
+        from dual
+        connect by level <= :1
+        """,
+        [int_buf, float_buf],
+        [num_rows],
+        null_masks=[None, null_mask],
+        arraysize=3,
+    ):
+        for i in range(n):
+            float_value = None if null_mask[i] else float_buf[i]
+            fetched.append((int_buf[i], float_value))
+    expected = [
+        (i, None if i % 4 == 0 else i / 4) for i in range(1, num_rows + 1)
+    ]
+    assert fetched == expected
+
+
+def test_8086(skip_unless_thin_mode, conn):
+    "8086 - test fetch_into() with a date column"
+    buf = array.array("q", [0])
+    (num_rows,) = conn.fetch_into(
+        "select to_date('1970-01-02 03:04:05', 'YYYY-MM-DD HH24:MI:SS') "
+        "from dual",
+        [buf],
+    )
+    assert num_rows == 1
+    assert buf[0] == 97445
+
+
+def test_8087(skip_unless_thin_mode, conn, test_env):
+    "8087 - test fetch_into() with invalid buffers"
+    sql = "select 1, 2 from dual"
+    with test_env.assert_raises_full_code("DPY-2078"):
+        list(conn.fetch_into(sql, [array.array("q", [0])]))
+    with test_env.assert_raises_full_code("DPY-2080"):
+        list(
+            conn.fetch_into(
+                sql, [array.array("q", [0]), array.array("q", [0, 0])]
+            )
+        )
+    with test_env.assert_raises_full_code("DPY-3043"):
+        list(conn.fetch_into(sql, [array.array("u", "a")] * 2))
+    with test_env.assert_raises_full_code("DPY-3038"):
+        list(conn.fetch_into("select 'a' from dual", [array.array("d", [0])]))
+
+
+def test_8088(test_env):
+    "8088 - test fetch_df_parallel() with hash partitions"
+    num_rows = 250
+    pool = test_env.get_pool(min=0, max=3)
+    dfs = list(
+        pool.fetch_df_parallel(
+            """
+            select level as id, 'String ' || level as value
+            from dual
+            connect by level <= :1
+            """,
+            [num_rows],
+            partition_by="id",
+            size=40,
+        )
+    )
+    assert all(df.num_rows() <= 40 for df in dfs)
+    table = pyarrow.concat_tables(pyarrow.table(df) for df in dfs)
+    assert sorted(table["ID"].to_pylist()) == list(range(1, num_rows + 1))
+    assert pool.busy == 0
+    pool.close()
+
+
+def test_8089(test_env):
+    "8089 - test fetch_df_parallel() with ordered explicit partitions"
+    pool = test_env.get_pool(min=0, max=2)
+    sql = """
+        select level as id
+        from dual
+        connect by level <= :upper
+        minus
+        select level
+        from dual
+        connect by level < :lower
+        order by 1"""
+    partitions = [dict(lower=i * 10 + 1, upper=i * 10 + 10) for i in range(5)]
+    dfs = pool.fetch_df_parallel(
+        sql, partitions=partitions, size=3, ordered=True
+    )
+    fetched = [v for df in dfs for v in pyarrow.table(df)["ID"].to_pylist()]
+    assert fetched == list(range(1, 51))
+    dfs = list(
+        pool.fetch_df_parallel(sql, partitions=[dict(lower=2, upper=1)])
+    )
+    assert len(dfs) == 1
+    assert dfs[0].num_rows() == 0
+    with pytest.raises(ValueError):
+        list(pool.fetch_df_parallel(sql))
+    with pytest.raises(ValueError):
+        list(pool.fetch_df_parallel(sql, partitions=[], partition_by="id"))
+    with pytest.raises(ValueError):
+        list(pool.fetch_df_parallel(sql, partitions=partitions, degree=0))
+    with test_env.assert_raises_full_code("ORA-00942"):
+        list(
+            pool.fetch_df_parallel(
+                "select * from missing_table_8089", partitions=[None, None]
+            )
+        )
+    assert pool.busy == 0
+    pool.close()
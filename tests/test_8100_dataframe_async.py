@@ -1801,3 +1801,87 @@ async def test_8171(async_conn, async_cursor):
     fetched_table = pyarrow.table(ora_df)
     assert fetched_table.field("NUMBERCOL").type == dtype
     assert [v.as_py() for v in fetched_table["NUMBERCOL"]] == expected_values
+
+
+async def test_8172(async_conn):
+    "8172 - test fetch_into() with caller supplied buffers"
+    num_rows = 25
+    int_buf = array.array("q", [0] * 10)
+    float_buf = array.array("d", [0] * 10)
+    null_mask = bytearray(10)
+    fetched = []
+    async for n in async_conn.fetch_into(
+        """
+        select
+            level,
+            case when mod(level, 4) != 0 then level / 4 end
+        from dual
+        connect by level <= :1
+        """,
+        [int_buf, float_buf],
+        [num_rows],
+        null_masks=[None, null_mask],
+        arraysize=3,
+    ):
+        for i in range(n):
+            float_value = None if null_mask[i] else float_buf[i]
+            fetched.append((int_buf[i], float_value))
+    expected = [
+        (i, None if i % 4 == 0 else i / 4) for i in range(1, num_rows + 1)
+    ]
+    assert fetched == expected
+
+
+async def test_8173(test_env):
+    "8173 - test fetch_df_parallel() with hash partitions"
+    num_rows = 250
+    pool = test_env.get_pool_async(min=0, max=3)
+    dfs = [
+        df
+        async for df in pool.fetch_df_parallel(
+            """
+            select level as id, 'String ' || level as value
+            from dual
+            connect by level <= :1
+            """,
+            [num_rows],
+            partition_by="id",
+            size=40,
+        )
+    ]
+    assert all(df.num_rows() <= 40 for df in dfs)
+    table = pyarrow.concat_tables(pyarrow.table(df) for df in dfs)
+    assert sorted(table["ID"].to_pylist()) == list(range(1, num_rows + 1))
+    assert pool.busy == 0
+    await pool.close()
+
+
+async def test_8174(test_env):
+    "8174 - test fetch_df_parallel() with ordered explicit partitions"
+    pool = test_env.get_pool_async(min=0, max=2)
+    sql = """
+        select level as id
+        from dual
+        connect by level <= :upper
+        minus
+        select level
+        from dual
+        connect by level < :lower
+        order by 1"""
+    partitions = [dict(lower=i * 10 + 1, upper=i * 10 + 10) for i in range(5)]
+    fetched = []
+    async for df in pool.fetch_df_parallel(
+        sql, partitions=partitions, size=3, ordered=True
+    ):
+        fetched.extend(pyarrow.table(df)["ID"].to_pylist())
+    assert fetched == list(range(1, 51))
+    with pytest.raises(ValueError):
+        async for df in pool.fetch_df_parallel(sql):
+            pass
+    with test_env.assert_raises_full_code("ORA-00942"):
+        async for df in pool.fetch_df_parallel(
+            "select * from missing_table_8174", partitions=[None, None]
+        ):
+            pass
+    assert pool.busy == 0
+    await pool.close()
@@ -188,3 +188,92 @@ async def test_8207(json_queue, async_conn):
         await json_queue.enqmany(["Not", "msgproperties"])
     with pytest.raises(TypeError):
         await json_queue.deqmany("5")
+
+
+async def test_8208(async_conn, queue):
+    "8208 - test iterating over messages with iter_messages()"
+    messages = [
+        async_conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA
+    ]
+    await queue.enqmany(messages)
+    await async_conn.commit()
+    async with queue.iter_messages(batch_size=5, wait=0) as it:
+        data = [message.payload.decode() async for message in it]
+        assert it.queue is queue
+    assert it.closed
+    await async_conn.commit()
+    assert data == RAW_PAYLOAD_DATA
+    assert queue.deqoptions.wait == oracledb.DEQ_WAIT_FOREVER
+
+
+async def test_8209(queue, test_env):
+    "8209 - test errors for invalid values for iter_messages()"
+    with test_env.assert_raises_full_code("DPY-2084"):
+        queue.iter_messages(batch_size=0)
+    with test_env.assert_raises_full_code("DPY-2085"):
+        queue.iter_messages(prefetch=-1)
+
+
+async def test_8210(async_conn, queue):
+    "8210 - test closing iter_messages() returns messages not yet returned"
+    messages = [
+        async_conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA
+    ]
+    await queue.enqmany(messages)
+    await async_conn.commit()
+    it = queue.iter_messages(batch_size=2, wait=0, prefetch=2)
+    data = []
+    async for message in it:
+        data.append(message.payload.decode())
+        if len(data) == 3:
+            break
+    remaining = await it.close()
+    assert it.closed
+    assert await it.close() == []
+    data.extend(message.payload.decode() for message in remaining)
+    queue.deqoptions.wait = oracledb.DEQ_NO_WAIT
+    data.extend(m.payload.decode() for m in await queue.deqmany(100))
+    await async_conn.commit()
+    assert data == RAW_PAYLOAD_DATA
+
+
+async def test_8211(async_conn, queue):
+    "8211 - test closing iter_messages() keeps all prefetched messages"
+    messages = [
+        async_conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA
+    ]
+    await queue.enqmany(messages)
+    await async_conn.commit()
+    it = queue.iter_messages(batch_size=3, wait=0, prefetch=3)
+    data = [(await anext(it)).payload.decode()]
+    remaining = await it.close()
+    assert len(remaining) == len(RAW_PAYLOAD_DATA) - 1
+    data.extend(message.payload.decode() for message in remaining)
+    queue.deqoptions.wait = oracledb.DEQ_NO_WAIT
+    assert await queue.deqmany(100) == []
+    await async_conn.commit()
+    assert data == RAW_PAYLOAD_DATA
+
+
+async def test_8212(async_conn, queue, test_env):
+    "8212 - test breaking out of iter_messages() with prefetch and rollback"
+    messages = [
+        async_conn.msgproperties(payload=data) for data in RAW_PAYLOAD_DATA
+    ]
+    await queue.enqmany(messages)
+    await async_conn.commit()
+    async with queue.iter_messages(batch_size=2, wait=0, prefetch=2) as it:
+        i = 0
+        async for message in it:
+            if i == 2:
+                break
+            i += 1
+    assert it.closed
+    await async_conn.rollback()
+    async with test_env.get_connection_async() as other_conn:
+        other_queue = other_conn.queue(RAW_QUEUE_NAME)
+        other_queue.deqoptions.wait = oracledb.DEQ_NO_WAIT
+        messages = await other_queue.deqmany(len(RAW_PAYLOAD_DATA))
+        data = [message.payload.decode() for message in messages]
+        await other_conn.commit()
+    assert data == RAW_PAYLOAD_DATA
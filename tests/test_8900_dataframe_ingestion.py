@@ -1083,3 +1083,70 @@ def test_8926(test_env, conn, cursor):
     expected_data = test_env.get_data_from_df(df.to_pandas())
     fetched_data = test_env.get_data_from_df(pyarrow.table(odf).to_pandas())
     assert fetched_data == expected_data
+
+
+@pytest.mark.parametrize(
+    "unit, values",
+    [
+        (
+            "s",
+            [
+                datetime.datetime(1, 1, 1),
+                datetime.datetime(1600, 2, 29, 23, 59, 59),
+                datetime.datetime(1969, 12, 31, 12, 30, 15),
+                datetime.datetime(9999, 12, 31, 23, 59, 59),
+            ],
+        ),
+        (
+            "ms",
+            [
+                datetime.datetime(1899, 12, 31, 1, 2, 3, 4000),
+                datetime.datetime(1969, 12, 31, 23, 59, 59, 999000),
+                datetime.datetime(2000, 2, 29, 8, 15),
+                datetime.datetime(2100, 3, 1, 0, 0, 0, 1000),
+            ],
+        ),
+        (
+            "us",
+            [
+                datetime.datetime(1582, 10, 15, 0, 0, 0, 1),
+                datetime.datetime(1969, 12, 31, 23, 59, 59, 999999),
+                datetime.datetime(1970, 1, 1),
+                datetime.datetime(2024, 2, 29, 13, 14, 15, 161718),
+            ],
+        ),
+        (
+            "ns",
+            [
+                datetime.datetime(1700, 1, 1, 6, 0, 0, 5),
+                datetime.datetime(1969, 12, 31, 23, 59, 59, 999999),
+                datetime.datetime(1970, 1, 1, 0, 0, 0, 1),
+                datetime.datetime(2262, 4, 11, 23, 47, 16, 854775),
+            ],
+        ),
+    ],
+)
+def test_8927(unit, values, conn, cursor, empty_tab):
+    "8927 - test ingestion of timestamps around the epoch and leap days"
+    values = values + [None]
+    names = ["Id", "LastUpdated"]
+    arrays = [
+        pyarrow.array(range(len(values)), pyarrow.int64()),
+        pyarrow.array(values, pyarrow.timestamp(unit)),
+    ]
+    df = pyarrow.table(arrays, names)
+    cursor.executemany(
+        """
+        insert into TestDataFrame (Id, LastUpdated)
+        values (:1, :2)
+        """,
+        df,
+    )
+    conn.commit()
+    cursor.execute("""
+        select LastUpdated
+        from TestDataFrame
+        order by Id
+        """)
+    fetched_values = [d for d, in cursor]
+    assert fetched_values == values
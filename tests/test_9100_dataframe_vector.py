@@ -314,3 +314,105 @@ def test_9113(skip_unless_binary_vectors_supported, conn, test_env):
         """)
     fetched_df = pyarrow.table(ora_df).to_pandas()
     assert data == test_env.get_data_from_df(fetched_df)
+
+
+@pytest.mark.parametrize(
+    "vector_format,dtype",
+    [
+        ("float32", pyarrow.float32()),
+        ("float64", pyarrow.float64()),
+        ("int8", pyarrow.int8()),
+    ],
+)
+def test_9114(vector_format, dtype, conn):
+    "9114 - fetch vectors as an Arrow fixed size list"
+    requested_schema = pyarrow.schema([("VEC_COL", pyarrow.list_(dtype, 3))])
+    ora_df = conn.fetch_df_all(
+        f"""
+        select to_vector('[1, 2, 3]', 3, {vector_format}) as vec_col
+        union all
+        select to_vector('[-4, 5, -6]', 3, {vector_format})
+        """,
+        requested_schema=requested_schema,
+    )
+    tab = pyarrow.table(ora_df)
+    assert tab.field("VEC_COL").type == pyarrow.list_(dtype, 3)
+    assert tab["VEC_COL"].to_pylist() == [[1, 2, 3], [-4, 5, -6]]
+
+
+def test_9115(conn):
+    "9115 - fetch vectors with nulls as an Arrow fixed size list"
+    requested_schema = pyarrow.schema(
+        [("VEC_COL", pyarrow.list_(pyarrow.float64(), 2))]
+    )
+    ora_df = conn.fetch_df_all(
+        """
+        select to_vector('[1.5, 2.5]', 2, float64) as vec_col
+        union all
+        select null
+        union all
+        select to_vector('[3.5, 4.5]', 2, float64)
+        """,
+        requested_schema=requested_schema,
+    )
+    values = pyarrow.table(ora_df)["VEC_COL"].combine_chunks()
+    assert values.to_pylist() == [[1.5, 2.5], None, [3.5, 4.5]]
+    matrix = values.values.to_numpy().reshape(-1, 2)
+    assert matrix.shape == (3, 2)
+    assert matrix[2].tolist() == [3.5, 4.5]
+
+
+def test_9116(conn, test_env):
+    "9116 - fixed size list with the wrong number of dimensions"
+    requested_schema = pyarrow.schema(
+        [("VEC_COL", pyarrow.list_(pyarrow.float64(), 2))]
+    )
+    with test_env.assert_raises_full_code("DPY-3038"):
+        conn.fetch_df_all(
+            "select to_vector('[1, 2, 3]', 3, float64) as vec_col",
+            requested_schema=requested_schema,
+        )
+
+
+def test_9117(conn, test_env):
+    "9117 - list with a child type that does not match the vector format"
+    requested_schema = pyarrow.schema(
+        [("VEC_COL", pyarrow.list_(pyarrow.float32()))]
+    )
+    with test_env.assert_raises_full_code("DPY-3038"):
+        conn.fetch_df_all(
+            "select to_vector('[1, 2, 3]', 3, float64) as vec_col",
+            requested_schema=requested_schema,
+        )
+
+
+def test_9118(conn, test_env):
+    "9118 - fixed size list with flexible vector dimensions"
+    requested_schema = pyarrow.schema(
+        [("VEC_COL", pyarrow.list_(pyarrow.float64(), 3))]
+    )
+    with test_env.assert_raises_full_code("DPY-4046"):
+        conn.fetch_df_all(
+            """
+            select to_vector('[1, 2, 3]', 3, float64) as vec_col
+            union all
+            select to_vector('[1, 2]', 2, float64)
+            """,
+            requested_schema=requested_schema,
+        )
+
+
+def test_9119(conn, test_env):
+    "9119 - list with flexible vector formats"
+    requested_schema = pyarrow.schema(
+        [("VEC_COL", pyarrow.list_(pyarrow.float32()))]
+    )
+    with test_env.assert_raises_full_code("DPY-4047"):
+        conn.fetch_df_all(
+            """
+            select to_vector('[34.6, 77.8, 55.9]', 3, float32) as vec_col
+            union all
+            select to_vector('[44, 55, 89]', 3, int8)
+            """,
+            requested_schema=requested_schema,
+        )
@@ -855,3 +855,54 @@ def test_9332(conn):
     tab = pyarrow.table(ora_df)
     assert tab.field("VALUE").type == dtype
     assert [v.as_py() for v in tab["VALUE"]] == expected_values
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        pyarrow.dictionary(pyarrow.int8(), pyarrow.string()),
+        pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        pyarrow.dictionary(pyarrow.uint16(), pyarrow.large_string()),
+    ],
+)
+def test_9333(dtype, conn):
+    "9333 - fetch strings as dictionary-encoded arrays"
+    values = ["OPEN", "CLOSED", None, "OPEN", "PENDING", "OPEN", "CLOSED"]
+    statement = " union all ".join(
+        f"select {i} as id, :{i + 1} as status from dual"
+        for i in range(len(values))
+    )
+    requested_schema = pyarrow.schema(
+        [("ID", pyarrow.int64()), ("STATUS", dtype)]
+    )
+    ora_df = conn.fetch_df_all(
+        statement, values, requested_schema=requested_schema
+    )
+    tab = pyarrow.table(ora_df)
+    assert tab.field("STATUS").type == dtype
+    (chunk,) = tab["STATUS"].chunks
+    assert chunk.dictionary.to_pylist() == ["OPEN", "CLOSED", "PENDING"]
+    assert chunk.to_pylist() == values
+    fetched_values = []
+    for ora_df in conn.fetch_df_batches(
+        statement, values, size=3, requested_schema=requested_schema
+    ):
+        tab = pyarrow.table(ora_df)
+        (chunk,) = tab["STATUS"].chunks
+        assert len(chunk.dictionary) <= 3
+        fetched_values.extend(chunk.to_pylist())
+    assert fetched_values == values
+
+
+def test_9334(test_env, conn):
+    "9334 - dictionary-encoded array with too many distinct values"
+    dtype = pyarrow.dictionary(pyarrow.int8(), pyarrow.string())
+    requested_schema = pyarrow.schema([("VALUE", dtype)])
+    with test_env.assert_raises_full_code("DPY-4043"):
+        conn.fetch_df_all(
+            """
+            select to_char(level) from dual
+            connect by level <= 200
+            """,
+            requested_schema=requested_schema,
+        )
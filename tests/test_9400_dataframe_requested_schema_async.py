@@ -876,3 +876,40 @@ async def test_9432(async_conn):
     tab = pyarrow.table(ora_df)
     assert tab.field("VALUE").type == dtype
     assert [v.as_py() for v in tab["VALUE"]] == expected_values
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        pyarrow.dictionary(pyarrow.int8(), pyarrow.string()),
+        pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        pyarrow.dictionary(pyarrow.uint16(), pyarrow.large_string()),
+    ],
+)
+async def test_9433(dtype, async_conn):
+    "9433 - fetch strings as dictionary-encoded arrays"
+    values = ["OPEN", "CLOSED", None, "OPEN", "PENDING", "OPEN", "CLOSED"]
+    statement = " union all ".join(
+        f"select {i} as id, :{i + 1} as status from dual"
+        for i in range(len(values))
+    )
+    requested_schema = pyarrow.schema(
+        [("ID", pyarrow.int64()), ("STATUS", dtype)]
+    )
+    ora_df = await async_conn.fetch_df_all(
+        statement, values, requested_schema=requested_schema
+    )
+    tab = pyarrow.table(ora_df)
+    assert tab.field("STATUS").type == dtype
+    (chunk,) = tab["STATUS"].chunks
+    assert chunk.dictionary.to_pylist() == ["OPEN", "CLOSED", "PENDING"]
+    assert chunk.to_pylist() == values
+    fetched_values = []
+    async for ora_df in async_conn.fetch_df_batches(
+        statement, values, size=3, requested_schema=requested_schema
+    ):
+        tab = pyarrow.table(ora_df)
+        (chunk,) = tab["STATUS"].chunks
+        assert len(chunk.dictionary) <= 3
+        fetched_values.extend(chunk.to_pylist())
+    assert fetched_values == values
@@ -0,0 +1,142 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+"""
+9500 - Module for testing subscriptions with asyncio
+"""
+
+import asyncio
+
+import oracledb
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def module_checks(anyio_backend, skip_unless_thin_mode, test_env):
+    if test_env.is_on_oracle_cloud:
+        pytest.skip("Oracle Cloud does not support subscriptions currently")
+
+
+async def _get_messages(subscr, num_messages):
+    """
+    Returns the given number of messages received by the subscription.
+    """
+    messages = []
+    async for message in subscr:
+        messages.append(message)
+        if len(messages) == num_messages:
+            break
+    return messages
+
+
+async def test_9500(async_cursor, test_env):
+    "9500 - test iterating over the notifications of a subscription"
+    await async_cursor.execute("truncate table TestTempTable")
+    async with test_env.get_connection_async(events=True) as conn:
+        subscr = await conn.subscribe(timeout=10)
+        await subscr.registerquery("select * from TestTempTable")
+        task = asyncio.create_task(_get_messages(subscr, 1))
+        cursor = conn.cursor()
+        await cursor.execute("""
+            insert into TestTempTable (IntCol, StringCol1)
+            values (1, 'test')
+            """)
+        await conn.commit()
+        (message,) = await asyncio.wait_for(task, 10)
+        assert message.type == oracledb.EVENT_OBJCHANGE
+        assert message.subscription is subscr
+        assert message.registered
+        (table,) = message.tables
+        assert table.name.endswith("TESTTEMPTABLE")
+        await conn.unsubscribe(subscr)
+        async for message in subscr:
+            pytest.fail("no messages expected after unsubscribing")
+
+
+async def test_9501(async_cursor, test_env):
+    "9501 - test subscriptions sharing the same listener"
+    await async_cursor.execute("truncate table TestTempTable")
+    async with test_env.get_connection_async(events=True) as conn:
+        subscrs = [await conn.subscribe(timeout=10) for i in range(3)]
+        tasks = []
+        for subscr in subscrs:
+            await subscr.registerquery("select * from TestTempTable")
+            tasks.append(asyncio.create_task(_get_messages(subscr, 1)))
+        cursor = conn.cursor()
+        await cursor.execute("""
+            insert into TestTempTable (IntCol, StringCol1)
+            values (1, 'test')
+            """)
+        await conn.commit()
+        results = await asyncio.wait_for(asyncio.gather(*tasks), 10)
+        for subscr, (message,) in zip(subscrs, results):
+            assert message.subscription is subscr
+            assert message.type == oracledb.EVENT_OBJCHANGE
+        for subscr in subscrs:
+            await conn.unsubscribe(subscr)
+
+
+async def test_9502(async_cursor, test_env):
+    "9502 - test iteration stops when the subscription is deregistered"
+    await async_cursor.execute("truncate table TestTempTable")
+    async with test_env.get_connection_async(events=True) as conn:
+        subscr = await conn.subscribe(
+            qos=oracledb.SUBSCR_QOS_DEREG_NFY, timeout=10
+        )
+        await subscr.registerquery("select * from TestTempTable")
+        cursor = conn.cursor()
+        await cursor.execute("""
+            insert into TestTempTable (IntCol, StringCol1)
+            values (1, 'test')
+            """)
+        await conn.commit()
+        task = asyncio.create_task(_get_messages(subscr, 2))
+        (message,) = await asyncio.wait_for(task, 10)
+        assert not message.registered
+        with test_env.assert_raises_full_code("DPY-1007"):
+            await conn.unsubscribe(subscr)
+
+
+async def test_9503(async_conn, test_env):
+    "9503 - test registerquery() on an AQ subscription (negative)"
+    subscr = await async_conn.subscribe(
+        namespace=oracledb.SUBSCR_NAMESPACE_AQ, name="TEST_SHARDED_RAW_QUEUE"
+    )
+    with test_env.assert_raises_full_code("DPY-2071"):
+        await subscr.registerquery("select * from TestTempTable")
+    await async_conn.unsubscribe(subscr)
+
+
+async def test_9504(async_conn, test_env):
+    "9504 - test unsubscribing twice (negative)"
+    subscr = await async_conn.subscribe()
+    expected = (
+        "<oracledb.AsyncSubscription on "
+        f"<oracledb.AsyncConnection to {test_env.main_user}@"
+        f"{test_env.connect_string}>>"
+    )
+    assert str(subscr) == expected
+    await async_conn.unsubscribe(subscr)
+    with test_env.assert_raises_full_code("DPY-1007"):
+        await async_conn.unsubscribe(subscr)
@@ -0,0 +1,263 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+"""
+9900 - Module for testing pipelining.
+"""
+
+import oracledb
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def module_checks(skip_unless_thin_mode):
+    pass
+
+
+def test_9900(conn):
+    "9900 - test execute() and fetchall()."
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_execute("insert into TestTempTable (IntCol) values (:1)", [1])
+    pipeline.add_execute(
+        "insert into TestTempTable (IntCol) values (:val)", dict(val=2)
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == [(1,), (2,)]
+
+
+def test_9901(conn):
+    "9901 - test executemany()"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)", [(2,), (3,)]
+    )
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:data)",
+        [{"data": 4}, {"data": 5}],
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == [(2,), (3,), (4,), (5,)]
+
+
+def test_9902(conn):
+    "9902 - test fetchall() with arraysize"
+    data = [(1,), (2,), (3,), (4,)]
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:value)",
+        [{"value": i} for i, in data],
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall(
+        "select IntCol from TestTempTable order by IntCol", arraysize=1
+    )
+    pipeline.add_fetchall(
+        "select IntCol from TestTempTable order by IntCol",
+        arraysize=len(data),
+    )
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == data
+    assert results[-2].rows == data
+
+
+def test_9903(conn):
+    "9903 - test fetchone() and fetchmany()"
+    data = [(i,) for i in range(10)]
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)", data
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchone("select IntCol from TestTempTable order by IntCol")
+    pipeline.add_fetchmany(
+        "select IntCol from TestTempTable order by IntCol", num_rows=7
+    )
+    pipeline.add_fetchone("select :val from dual", {"val": 5})
+    results = conn.run_pipeline(pipeline)
+    assert results[-3].rows == data[:1]
+    assert results[-2].rows == data[:7]
+    assert results[-1].rows == [(5,)]
+
+
+def test_9904(conn):
+    "9904 - test fetchmany() with rowfactory"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        """
+        insert into TestTempTable (IntCol, StringCol1)
+        values (:int, :str)
+        """,
+        [{"int": 29, "str": "Feb"}, {"int": 4, "str": "Monday"}],
+    )
+    pipeline.add_commit()
+
+    def rowfactory(*row):
+        column_names = ["INT", "STRING"]
+        return dict(zip(column_names, row))
+
+    pipeline.add_fetchmany(
+        "select IntCol, StringCol1 from TestTempTable order by IntCol",
+        num_rows=2,
+        rowfactory=rowfactory,
+    )
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == [
+        {"INT": 4, "STRING": "Monday"},
+        {"INT": 29, "STRING": "Feb"},
+    ]
+
+
+def test_9905(conn):
+    "9905 - test callfunc(), return_value and return_type"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_callfunc("func_Test", oracledb.DB_TYPE_NUMBER, ("Yes", 7))
+    kwargs = {"a_String": "Keyword", "a_ExtraAmount": 12}
+    pipeline.add_callfunc(
+        "func_Test", oracledb.DB_TYPE_NUMBER, keyword_parameters=kwargs
+    )
+    pipeline.add_callfunc(
+        "func_Test", oracledb.DB_TYPE_NUMBER, ["Mixed"], {"a_ExtraAmount": 25}
+    )
+    results = conn.run_pipeline(pipeline)
+    assert results[0].return_value == 10
+    assert results[1].return_value == 19
+    assert results[2].return_value == 30
+
+
+def test_9906(conn, cursor):
+    "9906 - test callproc() with parameters and keyword_parameters"
+    in_out_value = cursor.var(oracledb.DB_TYPE_NUMBER)
+    in_out_value.setvalue(0, 8)
+    out_value = cursor.var(oracledb.DB_TYPE_NUMBER)
+    kwargs = dict(a_InOutValue=in_out_value, a_OutValue=out_value)
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_callproc("proc_Test", ["Input_9906"], kwargs)
+    pipeline.add_fetchone("select user from dual")
+    conn.run_pipeline(pipeline)
+    assert in_out_value.getvalue() == 80
+    assert out_value.getvalue() == 10
+
+
+def test_9907(conn):
+    "9907 - test add_commit with transaction_in_progress"
+    assert not conn.transaction_in_progress
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_execute("insert into TestTempTable (IntCol) values (5)")
+    conn.run_pipeline(pipeline)
+    assert conn.transaction_in_progress
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_commit()
+    conn.run_pipeline(pipeline)
+    assert not conn.transaction_in_progress
+
+
+def test_9908(conn):
+    "9908 - test getting an error in the middle of pipeline"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_execute("insert into TestTempTable (IntCol) values (:1)", [5])
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    pipeline.add_execute(
+        "insert into TestTempTable (IntCol) values (9, 'too many values')"
+    )
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = conn.run_pipeline(pipeline, continue_on_error=True)
+    expected_value = [(5,)]
+    assert results[-3].rows == expected_value
+    assert results[-2].error.full_code == "ORA-00913"
+    assert results[-1].rows == expected_value
+
+
+def test_9909(conn):
+    "9909 - test error raised when continue_on_error is False"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_execute("insert into TestTempTable (IntCol) values (:1)", [5])
+    pipeline.add_execute("insert into TestTempTable (IntCol) values (:1)", [5])
+    pipeline.add_commit()
+    with pytest.raises(oracledb.DatabaseError, match="ORA-00001"):
+        conn.run_pipeline(pipeline)
+    with conn.cursor() as cursor:
+        cursor.execute("select user from dual")
+        (user,) = cursor.fetchone()
+        assert user == conn.username.upper()
+
+
+def test_9910(conn):
+    "9910 - test pipeline with clobs"
+    clob = conn.createlob(oracledb.DB_TYPE_CLOB, "Temp CLOB")
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("delete from TestCLOBs")
+    pipeline.add_execute(
+        "insert into TestCLOBs (IntCol, CLOBCol) values (1, :1)", ["CLOB"]
+    )
+    pipeline.add_execute(
+        "insert into TestCLOBs (IntCol, CLOBCol) values (2, :1)", [clob]
+    )
+    pipeline.add_fetchall("select CLOBCol from TestCLOBs order by IntCol")
+    results = conn.run_pipeline(pipeline)
+    assert [lob.read() for lob, in results[-1].rows] == ["CLOB", "Temp CLOB"]
+
+
+def test_9911(conn, cursor):
+    "9911 - test executemany() with PL/SQL"
+    var = cursor.var(int)
+    pipeline = oracledb.create_pipeline()
+    sql = "begin :var := :value; end;"
+    pipeline.add_execute(sql, [var, 5])
+    pipeline.add_executemany(sql, [(var, 10), (var, 15)])
+    conn.run_pipeline(pipeline)
+    assert var.getvalue() == 15
+
+
+def test_9912(conn):
+    "9912 - test a pipeline with many operations"
+    num_ops = 500
+    pipeline = oracledb.create_pipeline()
+    for i in range(num_ops):
+        pipeline.add_fetchone("select :1 from dual", [i])
+    results = conn.run_pipeline(pipeline)
+    assert [r.rows for r in results] == [[(i,)] for i in range(num_ops)]
+
+
+def test_9913(conn, round_trip_checker):
+    "9913 - test pipelining requires a single round trip"
+    if not conn._impl.supports_pipelining():
+        pytest.skip("database does not support pipelining")
+    pipeline = oracledb.create_pipeline()
+    for i in range(5):
+        pipeline.add_fetchone("select :1 from dual", [i])
+    conn.run_pipeline(pipeline)
+    assert round_trip_checker.get_value() == 1
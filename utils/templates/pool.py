@@ -31,10 +31,12 @@
 # # {{ generated_notice }}
 # -----------------------------------------------------------------------------
 
+import asyncio
 import functools
+import queue
 import ssl
 import threading
-from typing import Callable, Type, Any
+from typing import Callable, Iterator, Type, Any
 
 import oracledb
 
@@ -43,7 +45,9 @@ from . import connection as connection_module
 from . import driver_mode
 from . import errors
 from .base import BaseMetaClass
+from .dataframe import DataFrame
 from .pool_params import PoolParams
+from .result_cache import ResultCache
 
 
 class BaseConnectionPool(metaclass=BaseMetaClass):
@@ -90,6 +94,41 @@ class BaseConnectionPool(metaclass=BaseMetaClass):
                     del named_pools.pools[cache_name]
                 raise
 
+    def _get_df_partitions(
+        self,
+        statement: str,
+        parameters: list | tuple | dict | None,
+        partition_by: str | None,
+        partitions: list | None,
+        degree: int | None,
+    ) -> tuple[list, int]:
+        """
+        Returns the list of (statement, parameters) tuples to execute for each
+        of the partitions of a parallel data frame fetch as well as the number
+        of partitions to fetch concurrently.
+        """
+        if not (partition_by is not None) ^ (partitions is not None):
+            raise ValueError(
+                "One of the parameters 'partition_by' or 'partitions' "
+                "is required but not both"
+            )
+        if degree is None:
+            degree = self.max
+        elif not isinstance(degree, int) or degree <= 0:
+            raise ValueError("degree must be a positive integer")
+        if partitions is not None:
+            work = [(statement, p) for p in partitions]
+        else:
+            work = [
+                (
+                    f"select * from ({statement}) "
+                    f"where ora_hash({partition_by}, {degree - 1}) = {i}",
+                    parameters,
+                )
+                for i in range(degree)
+            ]
+        return work, max(1, min(degree, len(work)))
+
     def _verify_open(self) -> None:
         """
         Verifies that the pool is open and able to perform its work.
@@ -97,6 +136,31 @@ class BaseConnectionPool(metaclass=BaseMetaClass):
         if self._impl is None:
             errors._raise_err(errors.ERR_POOL_NOT_OPEN)
 
+    def get_acquire_wait_histograms(self) -> dict:
+        """
+        Returns histograms of the time spent waiting for connections to be
+        acquired from the pool, one for each connection class that has been
+        requested. The return value is a dictionary mapping the connection
+        class (or *None*, if no connection class was used) to a dictionary
+        whose keys are the upper bounds of each bucket in milliseconds and
+        whose values are the number of connections acquired with a wait time
+        that falls within that bucket. The last bucket has an upper bound of
+        infinity.
+        """
+        self._verify_open()
+        return self._impl.get_wait_histograms()
+
+    def get_statement_cache_stats(self) -> dict:
+        """
+        Returns a dictionary containing statistics about the statement caches
+        of all of the connections that have been created by the pool,
+        including those that have since been closed. The keys ``hits``,
+        ``misses``, ``evictions`` and ``parses`` have the same meaning as for
+        :meth:`Connection.get_statement_cache_stats()`.
+        """
+        self._verify_open()
+        return self._impl.get_statement_cache_stats()
+
     @property
     def busy(self) -> int:
         """
@@ -255,6 +319,19 @@ class BaseConnectionPool(metaclass=BaseMetaClass):
     def ping_interval(self, value: int) -> None:
         self._impl.set_ping_interval(value)
 
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """
+        This read-only attribute returns the client-side query result cache
+        shared by the connections in the pool. The value is *None* if the
+        ``result_cache_size`` parameter was not set when the pool was created.
+        The cache is only available in python-oracledb Thin mode.
+        """
+        self._verify_open()
+        impl = self._impl.get_result_cache()
+        if impl is not None:
+            return ResultCache._from_impl(impl)
+
     @property
     def soda_metadata_cache(self) -> bool:
         """
@@ -465,6 +542,125 @@ class ConnectionPool(BaseConnectionPool):
         self._impl.drop(connection._impl)
         connection._impl = None
 
+    def fetch_df_parallel(
+        self,
+        statement: str,
+        parameters: list | tuple | dict | None = None,
+        *,
+        partition_by: str | None = None,
+        partitions: list | None = None,
+        degree: int | None = None,
+        size: int | None = None,
+        ordered: bool = False,
+        fetch_decimals: bool | None = None,
+        requested_schema: Any = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Executes the SQL query ``statement`` as a number of partitions which
+        are fetched concurrently, each on its own connection acquired from the
+        pool, and returns an iterator yielding the rows of all partitions as
+        :ref:`DataFrame <oracledataframeobj>` objects. An empty DataFrame is
+        returned if there are no rows available.
+
+        Exactly one of the ``partitions`` and ``partition_by`` parameters must
+        be specified. The ``partitions`` parameter is a list of bind variable
+        sets; each set is bound to ``statement`` to fetch one partition, for
+        example when ``statement`` contains ``where rowid between :1 and :2``
+        and the ROWID ranges were calculated using the DBMS_PARALLEL_EXECUTE
+        package. The ``partition_by`` parameter is a SQL expression that uses
+        the columns of the query; the rows are split into ``degree``
+        partitions by hashing the value of the expression with ``ORA_HASH()``.
+        In that case ``parameters`` is bound to the statement for each
+        partition.
+
+        The ``degree`` parameter is the number of partitions fetched
+        concurrently. It defaults to the maximum size of the pool.
+
+        The ``size`` parameter controls the number of records in each
+        DataFrame, as with :meth:`Connection.fetch_df_batches()`. If it is not
+        specified, a single DataFrame is returned for each partition.
+
+        If the ``ordered`` parameter is *False* (the default), DataFrames are
+        returned as soon as they are fetched from any partition. If it is
+        *True*, all of the DataFrames of the first partition are returned
+        before those of the second partition, and so on. Note that in that case
+        the DataFrames of later partitions are retained in memory until they
+        are returned.
+
+        The ``fetch_decimals`` and ``requested_schema`` parameters are the same
+        as for :meth:`Connection.fetch_df_batches()`.
+        """
+        self._verify_open()
+        work, degree = self._get_df_partitions(
+            statement, parameters, partition_by, partitions, degree
+        )
+        tasks = queue.SimpleQueue()
+        for task in enumerate(work):
+            tasks.put(task)
+        if ordered:
+            results = [queue.Queue(maxsize=2) for _ in work]
+        else:
+            results = [queue.Queue(maxsize=2 * degree)] * len(work)
+        stop_event = threading.Event()
+
+        def fetch_partitions():
+            while not stop_event.is_set():
+                try:
+                    partition_num, (sql, params) = tasks.get_nowait()
+                except queue.Empty:
+                    break
+                result_queue = results[partition_num]
+                try:
+                    with self.acquire() as conn:
+                        for df in conn.fetch_df_batches(
+                            sql,
+                            params,
+                            size,
+                            fetch_decimals=fetch_decimals,
+                            requested_schema=requested_schema,
+                        ):
+                            if stop_event.is_set():
+                                return
+                            result_queue.put(df)
+                except Exception as e:
+                    result_queue.put(e)
+                    return
+                result_queue.put(None)
+
+        threads = [
+            threading.Thread(target=fetch_partitions, daemon=True)
+            for _ in range(degree)
+        ]
+        for thread in threads:
+            thread.start()
+        empty_df = None
+        returned = False
+        try:
+            for result_queue in results[: len(work) if ordered else 1]:
+                num_remaining = 1 if ordered else len(work)
+                while num_remaining > 0:
+                    result = result_queue.get()
+                    if result is None:
+                        num_remaining -= 1
+                    elif isinstance(result, Exception):
+                        raise result
+                    elif result.num_rows() == 0:
+                        if empty_df is None:
+                            empty_df = result
+                    else:
+                        returned = True
+                        yield result
+            if not returned and empty_df is not None:
+                yield empty_df
+        finally:
+            stop_event.set()
+            for thread in threads:
+                while thread.is_alive():
+                    for result_queue in results:
+                        while not result_queue.empty():
+                            result_queue.get_nowait()
+                    thread.join(0.01)
+
     def reconfigure(
         self,
         min: int | None = None,
@@ -589,6 +785,28 @@ class ConnectionPool(BaseConnectionPool):
         self._impl.return_connection(connection._impl)
         connection._impl = None
 
+    def wait_until_ready(
+        self, min_open: int | None = None, timeout: float | None = None
+    ) -> bool:
+        """
+        Waits until the pool has at least ``min_open`` open connections. This
+        can be used, for example, by a readiness probe to hold back work until
+        a newly created pool has grown to its minimum size. If ``min_open`` is
+        *None*, the value of :attr:`min` is used.
+
+        The ``timeout`` parameter is the maximum length of time (in seconds)
+        to wait. If it is *None*, the wait is not limited.
+
+        Returns *True* if the pool has the requested number of open
+        connections or *False* if the timeout expired first. If the pool
+        stops creating connections because a connection could not be created,
+        the exception raised when creating the connection is raised instead.
+        """
+        self._verify_open()
+        if min_open is None:
+            min_open = self.min
+        return self._impl.wait_until_ready(min_open, timeout)
+
 
 def _pool_factory(
     f: Callable[..., ConnectionPool],
@@ -760,6 +978,120 @@ class AsyncConnectionPool(BaseConnectionPool):
         await self._impl.drop(connection._impl)
         connection._impl = None
 
+    async def fetch_df_parallel(
+        self,
+        statement: str,
+        parameters: list | tuple | dict | None = None,
+        *,
+        partition_by: str | None = None,
+        partitions: list | None = None,
+        degree: int | None = None,
+        size: int | None = None,
+        ordered: bool = False,
+        fetch_decimals: bool | None = None,
+        requested_schema: Any = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Executes the SQL query ``statement`` as a number of partitions which
+        are fetched concurrently, each on its own connection acquired from the
+        pool, and returns an iterator yielding the rows of all partitions as
+        :ref:`DataFrame <oracledataframeobj>` objects. An empty DataFrame is
+        returned if there are no rows available.
+
+        Exactly one of the ``partitions`` and ``partition_by`` parameters must
+        be specified. The ``partitions`` parameter is a list of bind variable
+        sets; each set is bound to ``statement`` to fetch one partition, for
+        example when ``statement`` contains ``where rowid between :1 and :2``
+        and the ROWID ranges were calculated using the DBMS_PARALLEL_EXECUTE
+        package. The ``partition_by`` parameter is a SQL expression that uses
+        the columns of the query; the rows are split into ``degree``
+        partitions by hashing the value of the expression with ``ORA_HASH()``.
+        In that case ``parameters`` is bound to the statement for each
+        partition.
+
+        The ``degree`` parameter is the number of partitions fetched
+        concurrently. It defaults to the maximum size of the pool.
+
+        The ``size`` parameter controls the number of records in each
+        DataFrame, as with :meth:`Connection.fetch_df_batches()`. If it is not
+        specified, a single DataFrame is returned for each partition.
+
+        If the ``ordered`` parameter is *False* (the default), DataFrames are
+        returned as soon as they are fetched from any partition. If it is
+        *True*, all of the DataFrames of the first partition are returned
+        before those of the second partition, and so on. Note that in that case
+        the DataFrames of later partitions are retained in memory until they
+        are returned.
+
+        The ``fetch_decimals`` and ``requested_schema`` parameters are the same
+        as for :meth:`Connection.fetch_df_batches()`.
+        """
+        self._verify_open()
+        work, degree = self._get_df_partitions(
+            statement, parameters, partition_by, partitions, degree
+        )
+        tasks = asyncio.Queue()
+        for task in enumerate(work):
+            tasks.put_nowait(task)
+        if ordered:
+            results = [asyncio.Queue(maxsize=2) for _ in work]
+        else:
+            results = [asyncio.Queue(maxsize=2 * degree)] * len(work)
+
+        stop_event = asyncio.Event()
+
+        async def fetch_partitions():
+            while not stop_event.is_set() and not tasks.empty():
+                partition_num, (sql, params) = tasks.get_nowait()
+                result_queue = results[partition_num]
+                try:
+                    async with self.acquire() as conn:
+                        async for df in conn.fetch_df_batches(
+                            sql,
+                            params,
+                            size,
+                            fetch_decimals=fetch_decimals,
+                            requested_schema=requested_schema,
+                        ):
+                            if stop_event.is_set():
+                                return
+                            await result_queue.put(df)
+                except Exception as e:
+                    await result_queue.put(e)
+                    return
+                await result_queue.put(None)
+
+        workers = [
+            asyncio.create_task(fetch_partitions()) for _ in range(degree)
+        ]
+        empty_df = None
+        returned = False
+        try:
+            for result_queue in results[: len(work) if ordered else 1]:
+                num_remaining = 1 if ordered else len(work)
+                while num_remaining > 0:
+                    result = await result_queue.get()
+                    if result is None:
+                        num_remaining -= 1
+                    elif isinstance(result, Exception):
+                        raise result
+                    elif result.num_rows() == 0:
+                        if empty_df is None:
+                            empty_df = result
+                    else:
+                        returned = True
+                        yield result
+            if not returned and empty_df is not None:
+                yield empty_df
+        finally:
+            stop_event.set()
+            pending = workers
+            while pending:
+                for result_queue in results:
+                    while not result_queue.empty():
+                        result_queue.get_nowait()
+                _, pending = await asyncio.wait(pending, timeout=0.01)
+
     async def release(
         self,
         connection: "connection_module.AsyncConnection",
@@ -786,6 +1118,28 @@ class AsyncConnectionPool(BaseConnectionPool):
         await self._impl.return_connection(connection._impl)
         connection._impl = None
 
+    async def wait_until_ready(
+        self, min_open: int | None = None, timeout: float | None = None
+    ) -> bool:
+        """
+        Waits until the pool has at least ``min_open`` open connections. This
+        can be used, for example, by a readiness probe to hold back work until
+        a newly created pool has grown to its minimum size. If ``min_open`` is
+        *None*, the value of :attr:`min` is used.
+
+        The ``timeout`` parameter is the maximum length of time (in seconds)
+        to wait. If it is *None*, the wait is not limited.
+
+        Returns *True* if the pool has the requested number of open
+        connections or *False* if the timeout expired first. If the pool
+        stops creating connections because a connection could not be created,
+        the exception raised when creating the connection is raised instead.
+        """
+        self._verify_open()
+        if min_open is None:
+            min_open = self.min
+        return await self._impl.wait_until_ready(min_open, timeout)
+
 
 def _async_pool_factory(
     f: Callable[..., AsyncConnectionPool],